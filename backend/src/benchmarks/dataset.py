@@ -0,0 +1,193 @@
+"""Benchmark dataset
+
+Seeds an organization hierarchy, users and reference data for the benchmarks
+and lets the DatasetGenerator of generator.py add `incidents` incidents with
+their workflows, events, comments, files and notifications, and rebuild the
+projections. A few incidents in known states are added first for the
+workflow endpoints. Returns the context the endpoint benchmarks are run
+with: the users to act as and the ids to put in the urls.
+"""
+
+import os
+
+from django.conf import settings
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+
+from .generator import DatasetGenerator, HISTORIES, BATCH_SIZE
+from ..common.models import Category, Channel, District
+from ..custom_auth.models import User, Profile, Organization, Division, UserLevel
+from ..events.models import Event
+from ..file_upload.models import UploadSession
+from ..file_upload.services import save_incident_file
+from ..incidents.models import Recipient, CannedResponse, StatusType, SeverityType, EscalateExternalWorkflow, \
+    RequestInformationWorkflow
+from ..incidents.permissions import *
+from ..notifications.models import Notification
+
+# password of the benchmark manager, for the login endpoint
+PASSWORD = "benchmark"
+
+DISTRICT_COUNT = 25
+USERS_PER_DIVISION = 4
+
+# the incidents the workflow endpoints act on, by context key
+FIXED_INCIDENTS = (
+    ("new_incident_id", StatusType.NEW),
+    ("verified_incident_id", StatusType.VERIFIED),
+    ("pending_incident_id", StatusType.ACTION_PENDING),
+    ("information_incident_id", StatusType.INFORMATION_REQUESTED),
+    ("closed_incident_id", StatusType.CLOSED),
+)
+
+MANAGER_PERMISSIONS = (
+    CAN_MANAGE_INCIDENT, CAN_REVIEW_INCIDENTS, CAN_REVIEW_ALL_INCIDENTS, CAN_RUN_WORKFLOW,
+    CAN_VERIFY_INCIDENT, CAN_CLOSE_INCIDENT, CAN_CHANGE_ASSIGNEE, CAN_ESCALATE_INCIDENT,
+    CAN_ESCALATE_EXTERNAL, CAN_INVALIDATE_INCIDENT, CAN_REOPEN_INCIDENT,
+    CAN_ACTION_OVER_CURRENT_ASSIGNEE, CAN_VIEW_REPORTS,
+)
+
+
+def create_role(name, codenames):
+    role = Group.objects.create(name=name)
+    role.permissions.set(Permission.objects.filter(codename__in=codenames))
+    return role
+
+
+def create_users(prefix, count, organization, division, level):
+    """ bulk created users with their profiles, the profile signal doesn't run for bulk inserts """
+    usernames = ["%s-%d" % (prefix, i) for i in range(count)]
+    User.objects.bulk_create([
+        User(username=username, first_name=prefix, last_name=str(i), password="!")
+        for i, username in enumerate(usernames)
+    ], batch_size=BATCH_SIZE)
+
+    users = list(User.objects.filter(username__in=usernames))
+    Profile.objects.bulk_create([
+        Profile(user=user, organization=organization, division=division, level=level) for user in users
+    ], batch_size=BATCH_SIZE)
+    return users
+
+
+def seed_hierarchy(context):
+    ec = Organization.objects.create(code="EC", displayName="Election Commission")
+    police = Organization.objects.create(code="police", displayName="Sri Lanka Police")
+
+    manager_role = create_role("benchmark-manager", MANAGER_PERMISSIONS)
+    officer_role = create_role("benchmark-officer", (CAN_REVIEW_INCIDENTS, CAN_RUN_WORKFLOW, CAN_MANAGE_INCIDENT))
+    police_role = create_role("benchmark-police", (CAN_REVIEW_INCIDENTS, CAN_REVIEW_OWN_INCIDENTS))
+
+    director = UserLevel.objects.create(code="director", displayName="Director", organization=ec, role=manager_role)
+    manager = UserLevel.objects.create(code="manager", displayName="Manager", organization=ec,
+                                       role=manager_role, parent=director)
+    officer = UserLevel.objects.create(code="officer", displayName="Officer", organization=ec,
+                                       role=officer_role, parent=manager)
+    guest = UserLevel.objects.create(code="guest", displayName="Guest", organization=ec, parent=officer)
+    police_officer = UserLevel.objects.create(code="police-officer", displayName="Police Officer",
+                                              organization=police, role=police_role)
+
+    hq = Division.objects.create(code="ec-hq", organization=ec, division_type="HQ", name="Head Office",
+                                 is_default_division=True, is_hq=True)
+    police_hq = Division.objects.create(code="police-hq", organization=police, division_type="HQ",
+                                        name="Police Headquarters", is_hq=True)
+
+    context["users"] = {
+        "manager": create_users("benchmark-manager", 1, ec, hq, manager)[0],
+        "guest": create_users("guest", 1, ec, hq, guest)[0],
+    }
+    User.objects.filter(id=context["users"]["guest"].id).update(username="guest")
+    context["users"]["manager"].set_password(PASSWORD)
+    context["users"]["manager"].save(update_fields=["password"])
+    context["password"] = PASSWORD
+
+    assignees = create_users("director", 2, ec, hq, director)
+    assignees += create_users("hq-manager", USERS_PER_DIVISION, ec, hq, manager)
+    for i in range(DISTRICT_COUNT):
+        district = Division.objects.create(code="ec-d%02d" % i, organization=ec, division_type="DISTRICT",
+                                           name="District Office %02d" % i)
+        assignees += create_users("d%02d-officer" % i, USERS_PER_DIVISION, ec, district, officer)
+
+    context["assignees"] = assignees
+    context["police_users"] = create_users("police", USERS_PER_DIVISION, police, police_hq, police_officer)
+    context["organization_id"] = police.id
+
+
+def seed_reference_data(context):
+    context["categories"] = [
+        Category.objects.get_or_create(code="benchmark-%d" % i, defaults={
+            "top_category": "Category %d" % (i // 4), "sub_category": "Subcategory %d" % i,
+            "sn_top_category": "-", "sn_sub_category": "-", "tm_top_category": "-", "tm_sub_category": "-",
+        })[0].id
+        for i in range(20)
+    ]
+    context["channels"] = [
+        Channel.objects.get_or_create(name=name)[0].id for name in ("Web", "SMS", "Call", "Email", "Walk-in")
+    ]
+    context["districts"] = ["D%02d" % i for i in range(DISTRICT_COUNT)]
+    District.objects.bulk_create([
+        District(code=code, name="District %s" % code, province="-", sn_name="-", sn_province="-",
+                 tm_name="-", tm_province="-")
+        for code in context["districts"] if not District.objects.filter(code=code).exists()
+    ])
+    context["canned_response_id"] = CannedResponse.objects.create(
+        title="Received", message="We have received your request").id
+
+
+def seed_fixed_incidents(context, generator):
+    """ the incidents the workflow endpoints act on, assigned to the manager.
+        Their contents are fixed and they have no comments or files, so the
+        query counts of their requests don't depend on the seed.
+    """
+    manager = context["users"]["manager"]
+    fields = {
+        "title": "Ballot boxes moved",
+        "description": "Ballot boxes were moved from the polling station before counting",
+        "category": str(context["categories"][0]),
+        "infoChannel": str(context["channels"][0]),
+        "district": context["districts"][0],
+        "current_severity": SeverityType.HIGH.name,
+        "assignee": manager,
+    }
+    incidents = {}
+    for key, status in FIXED_INCIDENTS:
+        incidents[key] = generator.insert_chunk(1, HISTORIES[status][0], attachments=False, **fields)[0]
+        context[key] = incidents[key].id
+
+    context["incident_id"] = context["pending_incident_id"]
+    context["incident_ref_id"] = incidents["pending_incident_id"].refId
+    context["reporter_id"] = incidents["new_incident_id"].reporter.id
+
+    context["escalation_event_id"] = Event.objects.filter(
+        incident_id=context["pending_incident_id"],
+        refered_model_type=ContentType.objects.get_for_model(EscalateExternalWorkflow)).values_list(
+        "id", flat=True).first()
+    context["information_event_id"] = Event.objects.filter(
+        incident_id=context["information_incident_id"],
+        refered_model_type=ContentType.objects.get_for_model(RequestInformationWorkflow)).values_list(
+        "id", flat=True).first()
+    context["notification_id"] = Notification.objects.filter(send_to=manager).values_list("id", flat=True).first()
+
+
+def seed_files(context):
+    """ one stored file and an unfinished upload, MEDIA_ROOT should point to a scratch directory """
+    os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
+    content = ContentFile(b"benchmark evidence\n" * 4096, name="evidence.txt")
+    context["file_id"] = save_incident_file(context["incident_id"], content).id
+    context["upload_id"] = UploadSession.objects.create(
+        incident_id=context["incident_id"], original_name="photo.jpg", size=1024).id
+    context["recipient_id"] = Recipient.objects.create(name="Recipient").id
+
+
+def seed_dataset(incidents=1000, seed=1) -> dict:
+    """ seeds the benchmark data and returns the benchmark context """
+    context = {"dataset": {"incidents": incidents, "seed": seed}}
+
+    seed_hierarchy(context)
+    seed_reference_data(context)
+    generator = DatasetGenerator(seed)
+    seed_fixed_incidents(context, generator)
+    generator.generate(max(incidents, 10) - len(FIXED_INCIDENTS))
+    seed_files(context)
+
+    return context
@@ -0,0 +1,265 @@
+"""Benchmarked endpoints
+
+One Endpoint per request the benchmarks make. Every url in src/urls.py has
+at least one, either run or skipped with a reason; `get_uncovered_routes`
+lists the ones that were forgotten. Values that depend on the seeded data
+(ids, users) are given as functions of the benchmark context.
+"""
+
+import io
+import re
+from urllib.parse import urlencode
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import URLPattern
+from django.utils import timezone
+
+from ..file_upload.services import start_upload, append_upload_chunk
+from ..reporting.jobs import request_report, store_report
+from ..reporting.models import ReportJob, ReportJobStatus
+from ..reporting.pdf import render_pdf
+from ..reporting.services import get_summary_report_parameters
+
+# not part of the api
+EXCLUDED_ROUTES = ("admin/", "static/(.+)")
+
+ROUTE_PARAMETER = re.compile(r"<(?:\w+:)?(\w+)>")
+
+UPLOAD_CONTENT = b"0123456789abcdef" * 1024
+
+
+def ctx(key):
+    """ a value taken from the benchmark context """
+    return lambda context: context[key]
+
+
+def resolve(value, context):
+    if callable(value):
+        return value(context)
+    if isinstance(value, dict):
+        return {key: resolve(item, context) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve(item, context) for item in value]
+    return value
+
+
+class Endpoint:
+    """ a request to benchmark. `route` is the route string of the url
+        pattern, `kwargs` fill in its parameters. `setup` runs before the
+        measured request (in the same rolled back transaction) and returns
+        extra context for it.
+    """
+
+    def __init__(self, route, method="get", name=None, kwargs=None, params=None, data=None,
+                 format="json", headers=None, user="manager", setup=None, skip=None, expect_error=None):
+        self.route = route
+        self.method = method
+        self.name = name or "%s %s" % (method.upper(), route)
+        self.kwargs = kwargs or {}
+        self.params = params or {}
+        self.data = data
+        self.format = format
+        self.headers = headers or {}
+        self.user = user
+        self.setup = setup
+        # reason the endpoint isn't run
+        self.skip = skip
+        # reason the endpoint is known to fail, an error status isn't a violation then
+        self.expect_error = expect_error
+
+    def get_url(self, context) -> str:
+        kwargs = resolve(self.kwargs, context)
+        url = "/" + ROUTE_PARAMETER.sub(lambda match: str(kwargs[match.group(1)]), self.route)
+        params = resolve(self.params, context)
+        if params:
+            url += "?" + urlencode(params)
+        return url
+
+    def request(self, client, context, **extra):
+        """ makes the request with the given (api) test client """
+        extra.update(self.headers)
+        if self.method == "get":
+            return client.get(self.get_url(context), **extra)
+
+        data = resolve(self.data, context)
+        if self.format is None:
+            # raw body
+            return client.generic(self.method.upper(), self.get_url(context), data,
+                                  "application/octet-stream", **extra)
+        return getattr(client, self.method)(self.get_url(context), data, format=self.format, **extra)
+
+
+def workflow(name, incident, data, **kwargs):
+    return Endpoint("incidents/<uuid:incident_id>/workflow/<str:workflow>", "post",
+                    name="POST incidents/<uuid:incident_id>/workflow/" + name,
+                    kwargs={"incident_id": ctx(incident), "workflow": name}, data=data, **kwargs)
+
+
+def get_incident_data(context):
+    return {
+        "title": "Benchmark incident",
+        "description": "Ballot boxes were moved before counting started",
+        "showRecipient": "NO",
+        "infoChannel": str(context["channels"][0]),
+        "category": str(context["categories"][0]),
+        "district": context["districts"][0],
+        "severity": "LOW",
+    }
+
+
+def get_upload_files(context):
+    return {"files[]": [SimpleUploadedFile("evidence.txt", UPLOAD_CONTENT)]}
+
+
+def make_staff(context):
+    """ /metrics is staff only without INSTRUMENTATION_METRICS_TOKEN """
+    get_user_model().objects.filter(id=context["users"]["manager"].id).update(is_staff=True)
+    return {}
+
+
+def start_complete_upload(context):
+    session = start_upload(context["incident_id"], "evidence.txt", len(UPLOAD_CONTENT))
+    append_upload_chunk(session.id, 0, io.BytesIO(UPLOAD_CONTENT), len(UPLOAD_CONTENT))
+    return {"complete_upload_id": session.id}
+
+
+def create_report_job(context):
+    parameters = get_summary_report_parameters(REPORT_JOB_DATA)
+    return {"report_job_id": request_report(parameters, context["users"]["manager"]).id}
+
+
+def create_rendered_report_job(context):
+    job_id = create_report_job(context)["report_job_id"]
+    ReportJob.objects.filter(id=job_id).update(
+        status=ReportJobStatus.DONE.name, file=store_report(render_pdf("<p>Benchmark report</p>")),
+        finished_date=timezone.now())
+    return {"report_job_id": job_id}
+
+
+REFERENCE_DATA_ROUTES = (
+    "categories/", "channels/", "districts/", "provinces/", "gndivisions/", "wards/", "pollingstations/",
+    "pollingdivisions/", "policestations/", "policedivisions/", "dsdivisions/", "politicalparties/",
+)
+
+REPORT_PARAMS = {"start_date": "2020-01-01T00:00:00", "end_date": "2030-01-01T00:00:00"}
+REPORT_JOB_DATA = dict(REPORT_PARAMS, report="status_wise_summary_report", complain="true")
+
+ENDPOINTS = [
+    Endpoint("", user=None),
+    Endpoint("auth-jwt/", "post", user=None,
+             data={"username": ctx("manager_username"), "password": ctx("password")}),
+    Endpoint("auth-jwt-refresh/", "post", user=None, data={"token": ctx("manager_token")}),
+] + [
+    Endpoint(route) for route in REFERENCE_DATA_ROUTES
+] + [
+    Endpoint("gndivisions/", name="GET gndivisions/ (gzip)", headers={"HTTP_ACCEPT_ENCODING": "gzip"}),
+    Endpoint("reference-data/"),
+    Endpoint("reference-data/", name="GET reference-data/ (public)", user=None),
+    Endpoint("institutions/"),
+    Endpoint("institutions/", name="GET institutions/ (search)", params={"q": "ministry of"}),
+    Endpoint("incidents/"),
+    Endpoint("incidents/", name="GET incidents/ (search)", params={"q": "polling station"}),
+    Endpoint("incidents/", name="GET incidents/ (cursor)", params={"cursor": "", "count": "true"}),
+    Endpoint("incidents/", name="GET incidents/ (filtered)",
+             params={"status": "ACTION_PENDING", "organization": "police", "severity": "HIGH"}),
+    Endpoint("incidents/", name="GET incidents/ (export)", params={"export": "csv", "show_closed": "true"}),
+    Endpoint("incidents/", "post", data=get_incident_data),
+    Endpoint("incidents/sms", "post", data={"telephone": "0771234567", "description": "SMS complaint"}),
+    Endpoint("incidents/<uuid:incident_id>", kwargs={"incident_id": ctx("incident_id")}),
+    Endpoint("incidents/<uuid:incident_id>", "put", kwargs={"incident_id": ctx("incident_id")},
+             data=lambda context: dict(get_incident_data(context), title="Updated benchmark incident")),
+    Endpoint("incidents/<uuid:incident_id>/events", kwargs={"incident_id": ctx("incident_id")}),
+    Endpoint("incidents/<uuid:incident_id>/events/trail", kwargs={"incident_id": ctx("incident_id")}),
+    Endpoint("incidents/<uuid:incident_id>/comment", kwargs={"incident_id": ctx("incident_id")}),
+    Endpoint("incidents/<uuid:incident_id>/comment", "post", kwargs={"incident_id": ctx("incident_id")},
+             data={"comment": "Police were informed", "isOutcome": False, "incident": ctx("incident_id")}),
+    Endpoint("incidents/<uuid:incident_id>/attach_media", "post", kwargs={"incident_id": ctx("incident_id")},
+             data={"file_id_set": [ctx("file_id")]}),
+    Endpoint("reporters/<uuid:reporter_id>", kwargs={"reporter_id": ctx("reporter_id")}),
+    Endpoint("reporters/<uuid:reporter_id>", "put", kwargs={"reporter_id": ctx("reporter_id")},
+             data={"name": "Updated reporter", "mobile": "0771234567"}),
+    Endpoint("recipients/", "post", data={"name": "Benchmark recipient", "mobile": "0771234567"}),
+    Endpoint("recipients/<uuid:recipient_id>", kwargs={"recipient_id": ctx("recipient_id")}),
+    Endpoint("recipients/<uuid:recipient_id>", "put", kwargs={"recipient_id": ctx("recipient_id")},
+             data={"name": "Updated recipient"}),
+    Endpoint("incidents/<uuid:incident_id>/files", kwargs={"incident_id": ctx("incident_id")}),
+    Endpoint("incidents/<uuid:incident_id>/files", "post", kwargs={"incident_id": ctx("incident_id")},
+             data=get_upload_files, format="multipart"),
+    Endpoint("incidents/files/download/<str:file_id>", kwargs={"file_id": ctx("file_id")}),
+    Endpoint("incidents/<uuid:incident_id>/uploads", "post", kwargs={"incident_id": ctx("incident_id")},
+             data={"fileName": "photo.jpg", "size": 1024}),
+    Endpoint("uploads/<uuid:upload_id>", kwargs={"upload_id": ctx("upload_id")}),
+    Endpoint("uploads/<uuid:upload_id>", "put", kwargs={"upload_id": ctx("upload_id")},
+             headers={"HTTP_UPLOAD_OFFSET": "0"}, data=UPLOAD_CONTENT[:1024], format=None),
+    Endpoint("uploads/<uuid:upload_id>/finalize", "post", kwargs={"upload_id": ctx("complete_upload_id")},
+             setup=start_complete_upload),
+    Endpoint("users/"),
+    Endpoint("entities/", expect_error="groups are no longer linked to organizations"),
+    Endpoint("organizations/<int:organization_id>", kwargs={"organization_id": ctx("organization_id")}),
+
+    workflow("verify", "new_incident_id", {"comment": "verified", "proof": True}),
+    workflow("invalidate", "new_incident_id", {"comment": "duplicate"}),
+    workflow("escalate", "verified_incident_id", {"comment": "needs a director", "responseTime": "12"}),
+    workflow("assign", "verified_incident_id", {"assignee": lambda context: context["assignees"][0].id}),
+    workflow("request-action", "verified_incident_id", {
+        "entity": {"isInternalUser": True, "name": lambda context: context["police_users"][0].id},
+        "comment": "please attend",
+    }),
+    workflow("request-information", "verified_incident_id", {"comment": "which polling station?"}),
+    workflow("close", "verified_incident_id", {
+        "details": {"remark": "resolved", "assignee": "", "entities": "", "departments": "", "individuals": ""},
+    }),
+    workflow("complete-action", "pending_incident_id",
+             {"comment": "attended", "start_event": ctx("escalation_event_id")}),
+    workflow("provide-information", "information_incident_id",
+             {"comment": "polling station 12", "start_event": ctx("information_event_id")}),
+    workflow("reopen", "closed_incident_id", {"comment": "still happening"}),
+    workflow("send_canned_response", "incident_id", {"id": ctx("canned_response_id")}),
+
+    Endpoint("reports/", name="GET reports/ (category)",
+             params=dict(REPORT_PARAMS, report="category_wise_summary_report", complain="true")),
+    Endpoint("reports/", name="GET reports/ (status)",
+             params=dict(REPORT_PARAMS, report="status_wise_summary_report", complain="true")),
+    Endpoint("reports/jobs", "post", data=REPORT_JOB_DATA),
+    Endpoint("reports/jobs/<uuid:job_id>", kwargs={"job_id": ctx("report_job_id")}, setup=create_report_job),
+    Endpoint("reports/jobs/<uuid:job_id>/download", kwargs={"job_id": ctx("report_job_id")},
+             setup=create_rendered_report_job),
+    # against the StubPdfService started by the runners
+    Endpoint("pdfgen/", name="GET pdfgen/ (daily, cached)",
+             params={"template_type": "daily_category", "language": "english"}),
+    Endpoint("pdfgen/", name="GET pdfgen/ (time filter)",
+             params={"template_type": "daily_category_with_timefilter", "language": "english",
+                     "startTime": "2020-01-01 00:00", "endTime": "2030-01-01 00:00"}),
+    Endpoint("incidents/test", skip="debug view, the sql is written for mysql"),
+    Endpoint("incidents/auto-escalate", skip="the view is disabled and returns no response"),
+    Endpoint("notifications"),
+    Endpoint("notifications/<uuid:notification_id>/read", kwargs={"notification_id": ctx("notification_id")}),
+    Endpoint("canned_response/"),
+    Endpoint("metrics", setup=make_staff),
+
+    Endpoint("public/incidents/", user=None, params={"refId": ctx("incident_ref_id")}),
+    Endpoint("public/incidents/", "post", user=None, skip="needs the external recaptcha service"),
+    Endpoint("public/reporters/<uuid:reporter_id>", "put", user=None, kwargs={"reporter_id": ctx("reporter_id")},
+             data={"name": "Updated reporter", "mobile": "0771234567"}),
+    Endpoint("public/incidents/<uuid:incident_id>/attach_media", "post", user=None,
+             kwargs={"incident_id": ctx("incident_id")}, data={"file_id_set": [ctx("file_id")]}),
+    Endpoint("public/reporter/get_incident", "post", user=None, data={"unique_id": "0000"},
+             expect_error="reporters have no unique_id to look up"),
+    Endpoint("public/incidents/<uuid:incident_id>/workflow/<str:workflow>", "post", user=None,
+             name="POST public/incidents/<uuid:incident_id>/workflow/provide-information",
+             kwargs={"incident_id": ctx("information_incident_id"), "workflow": "provide-information"},
+             data={"comment": "polling station 12", "start_event": ctx("information_event_id")}),
+]
+
+
+def get_routes(patterns) -> set:
+    return {
+        str(pattern.pattern) for pattern in patterns
+        if isinstance(pattern, URLPattern) and str(pattern.pattern) not in EXCLUDED_ROUTES
+    }
+
+
+def get_uncovered_routes(patterns, endpoints=ENDPOINTS) -> list:
+    """ routes of the url patterns without a benchmark """
+    return sorted(get_routes(patterns) - {endpoint.route for endpoint in endpoints})
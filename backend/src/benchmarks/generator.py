@@ -0,0 +1,492 @@
+"""Synthetic incident dataset
+
+Builds on the reference data of seeddata/ (categories, channels, districts
+and the organizations, divisions and users of users.json) to generate
+incidents the way they pile up in production: skewed over channels,
+categories, districts and assignees, spread over the last `days` days, each
+with the workflow history, status rows and event trail of its current
+status, plus comments, attached files and notifications.
+
+Rows are bulk inserted, a chunk of incidents per transaction, and the
+projections the signals would have kept (workloads, rollups, search index)
+are rebuilt at the end. Every random choice, ids included, comes from one
+random.Random, so a seed gives the same dataset on the same reference data.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import random
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils import timezone
+
+from ..common.models import Category, Channel, District
+from ..custom_auth.models import User, Profile, Division, UserLevel
+from ..events.models import Event, EventAction
+from ..file_upload.models import File, FileBlob
+from ..file_upload.services import acquire_blob, get_extension
+from ..incidents.models import (
+    Incident, Reporter, IncidentStatus, IncidentComment, PublicIncidentStatus, StatusType, SeverityType,
+    LanguageType, IncidentType, VerifyWorkflow, InvalidateWorkflow, EscalateExternalWorkflow,
+    CompleteActionWorkflow, RequestInformationWorkflow, CloseWorkflow, get_public_status_reply
+)
+from ..incidents.search import rebuild_search_index
+from ..incidents.services import reserve_refId_numbers, rebuild_user_workloads, REFID_FORMAT
+from ..notifications.models import Notification, NotificationType
+from ..reporting.rollups import rebuild_daily_rollups
+
+SEEDDATA_DIR = os.path.join(settings.BASE_DIR, "seeddata")
+FIXTURES = ("province", "district", "gn", "police", "category", "channel", "politicalparty", "segment", "users")
+
+BATCH_SIZE = 500
+CHUNK_SIZE = 5000
+
+STATUS_WEIGHTS = (
+    (StatusType.NEW, 20),
+    (StatusType.VERIFIED, 10),
+    (StatusType.ACTION_PENDING, 15),
+    (StatusType.ACTION_TAKEN, 10),
+    (StatusType.INFORMATION_REQUESTED, 5),
+    (StatusType.CLOSED, 35),
+    (StatusType.INVALIDATED, 5),
+)
+SEVERITY_WEIGHTS = ((SeverityType.LOW, 50), (SeverityType.MEDIUM, 35), (SeverityType.HIGH, 15))
+LANGUAGE_WEIGHTS = ((LanguageType.SINHALA, 65), (LanguageType.TAMIL, 25), (LanguageType.ENGLISH, 10))
+INCIDENT_TYPE_WEIGHTS = ((IncidentType.COMPLAINT, 85), (IncidentType.INQUIRY, 15))
+COMMENT_COUNT_WEIGHTS = ((0, 45), (1, 25), (2, 15), (3, 10), (6, 5))
+FILE_COUNT_WEIGHTS = ((0, 80), (1, 15), (3, 5))
+
+# the workflows that lead to each status, one history is picked per incident
+HISTORIES = {
+    StatusType.NEW: ((),),
+    StatusType.VERIFIED: ((VerifyWorkflow,),),
+    StatusType.ACTION_PENDING: ((VerifyWorkflow, EscalateExternalWorkflow),),
+    StatusType.ACTION_TAKEN: ((VerifyWorkflow, EscalateExternalWorkflow, CompleteActionWorkflow),),
+    StatusType.INFORMATION_REQUESTED: ((VerifyWorkflow, RequestInformationWorkflow),),
+    StatusType.CLOSED: ((VerifyWorkflow, CloseWorkflow),
+                        (VerifyWorkflow, EscalateExternalWorkflow, CompleteActionWorkflow, CloseWorkflow)),
+    StatusType.INVALIDATED: ((InvalidateWorkflow,),),
+}
+WORKFLOW_STATUS = {
+    VerifyWorkflow: StatusType.VERIFIED,
+    InvalidateWorkflow: StatusType.INVALIDATED,
+    EscalateExternalWorkflow: StatusType.ACTION_PENDING,
+    CompleteActionWorkflow: StatusType.ACTION_TAKEN,
+    RequestInformationWorkflow: StatusType.INFORMATION_REQUESTED,
+    CloseWorkflow: StatusType.CLOSED,
+}
+# completions refer to the workflow they complete, so they are inserted last
+WORKFLOW_MODELS = (VerifyWorkflow, InvalidateWorkflow, EscalateExternalWorkflow, RequestInformationWorkflow,
+                   CloseWorkflow, CompleteActionWorkflow)
+
+# mean hours between two steps of a history
+STEP_HOURS = 30
+# notifications older than this have been read
+READ_AFTER = timedelta(days=7)
+# distinct attachments, files share their blobs like repeated uploads do
+BLOB_COUNT = 20
+
+WORDS = (
+    "polling station ballot box voter list campaign poster cutout rally violence threat vehicle police "
+    "officer village road notice complaint election office candidate party meeting bribe transport "
+    "damage delay queue identity card counting centre staff loudspeaker leaflet temple school night"
+).split()
+FIRST_NAMES = "Nimal Kamala Suresh Fathima Ravi Dilani Mohamed Chaminda Priya Kumar Anoma Tharindu".split()
+LAST_NAMES = "Perera Silva Fernando Bandara Rajapaksha Kumarasinghe Jayawardena Nadarajah Ismail".split()
+COMMENTS = (
+    "Called the complainant", "Informed the police station", "Site visited by the officer",
+    "Waiting for a response", "Posters were removed", "Complainant could not be reached",
+    "Forwarded to the district office", "Follow up next week",
+)
+
+
+def skewed_weights(count):
+    """ zipf like weights, a few values are picked most of the time """
+    return [1 / (rank + 1) for rank in range(count)]
+
+
+def choose(rng, weighted):
+    return rng.choices([value for value, _ in weighted], [weight for _, weight in weighted])[0]
+
+
+@contextmanager
+def backdated(*models):
+    """ lets bulk inserts of the given models keep the dates set on the
+        objects instead of auto_now / auto_now_add
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for model in models for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def bulk_insert(model, objects):
+    """ bulk_create that also sets the auto ids, which django doesn't return
+        for mysql and sqlite. Rows are read back in insert order, nothing
+        else should insert into the table meanwhile.
+    """
+    last_id = model.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+    model.objects.bulk_create(objects, batch_size=BATCH_SIZE)
+    ids = model.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)
+    for obj, pk in zip(objects, ids):
+        obj.pk = pk
+
+
+def load_fixtures():
+    call_command("loaddata", *[os.path.join(SEEDDATA_DIR, "%s.json" % name) for name in FIXTURES])
+
+
+def create_staff(users_per_division, rng) -> int:
+    """ adds users to every division, spread over the levels below the
+        leadership of its organization. Returns the number of users created.
+    """
+    created = 0
+    for division in Division.objects.select_related("organization").order_by("id"):
+        levels = list(UserLevel.objects.filter(organization_id=division.organization_id, parent__isnull=False)
+                      .exclude(code="guest").order_by("id"))
+        if not levels:
+            continue
+
+        usernames = ["%s-%d" % (division.code, i) for i in range(users_per_division)]
+        existing = set(User.objects.filter(username__in=usernames).values_list("username", flat=True))
+        usernames = [username for username in usernames if username not in existing]
+        User.objects.bulk_create([
+            User(username=username, first_name=rng.choice(FIRST_NAMES), last_name=rng.choice(LAST_NAMES),
+                 password="!")
+            for username in usernames
+        ], batch_size=BATCH_SIZE)
+
+        # the profile signal doesn't run for bulk inserts
+        Profile.objects.bulk_create([
+            Profile(user=user, organization_id=division.organization_id, division=division,
+                    level=levels[i % len(levels)])
+            for i, user in enumerate(User.objects.filter(username__in=usernames).order_by("id"))
+        ], batch_size=BATCH_SIZE)
+        created += len(usernames)
+
+    return created
+
+
+class DatasetGenerator:
+    """ generates incidents on top of the reference data in the database """
+
+    def __init__(self, seed=1, days=365, end_date=None):
+        self.rng = random.Random(seed)
+        self.days = days
+        self.end_date = end_date or timezone.now()
+        self.load_reference_data()
+        self.blobs = []
+
+    def load_reference_data(self):
+        rng = self.rng
+        self.categories = list(Category.objects.order_by("id").values_list("id", "sub_category"))
+        self.channels = [str(pk) for pk in Channel.objects.order_by("id").values_list("id", flat=True)]
+        self.districts = list(District.objects.order_by("code").values_list("code", "name", "province"))
+
+        default_division = Division.objects.filter(is_default_division=True).first()
+        # the guest user stands for the public, it doesn't work on incidents
+        profiles = Profile.objects.filter(division__isnull=False, user__is_active=True) \
+            .exclude(user__username="guest").select_related("user", "division__organization").order_by("user_id")
+        self.internal_users = []
+        self.external_users = []
+        for profile in profiles:
+            is_internal = default_division is not None and \
+                profile.division.organization_id == default_division.organization_id
+            (self.internal_users if is_internal else self.external_users).append(profile)
+
+        if not (self.categories and self.channels and self.districts and self.internal_users):
+            raise ValueError("Reference data is missing, load the seeddata fixtures first")
+        if not self.external_users:
+            self.external_users = self.internal_users
+
+        self.profiles = {profile.user_id: profile for profile in self.internal_users + self.external_users}
+        self.organization_code = default_division.organization.code.upper()
+        self.content_types = {
+            model: ContentType.objects.get_for_model(model)
+            for model in WORKFLOW_MODELS + (IncidentComment, File)
+        }
+
+        # shuffled before weighting, so which values are common depends on the seed
+        for values in (self.categories, self.channels, self.districts, self.internal_users, self.external_users):
+            rng.shuffle(values)
+        self.category_weights = skewed_weights(len(self.categories))
+        self.channel_weights = skewed_weights(len(self.channels))
+        self.district_weights = skewed_weights(len(self.districts))
+        self.internal_weights = skewed_weights(len(self.internal_users))
+        self.external_weights = skewed_weights(len(self.external_users))
+
+    def new_id(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def pick_internal(self) -> Profile:
+        return self.rng.choices(self.internal_users, self.internal_weights)[0]
+
+    def pick_external(self) -> Profile:
+        return self.rng.choices(self.external_users, self.external_weights)[0]
+
+    def pick_created_date(self):
+        # busier towards the end of the period, during the day
+        days_ago = self.days * (1 - self.rng.betavariate(3, 1))
+        date = self.end_date - timedelta(days=days_ago)
+        return min(date.replace(hour=min(int(self.rng.triangular(6, 23, 13)), 23)), self.end_date)
+
+    def next_step_date(self, date):
+        return min(date + timedelta(hours=self.rng.expovariate(1 / STEP_HOURS)), self.end_date)
+
+    def create_blobs(self):
+        """ the stored contents of the generated attachments """
+        for i in range(BLOB_COUNT):
+            content = ("generated evidence %d\n" % i).encode() * self.rng.randint(16, 4096)
+            name = "evidence-%d.%s" % (i, self.rng.choice(("jpg", "png", "pdf", "docx")))
+
+            def store(blob_name):
+                if not default_storage.exists(blob_name):
+                    default_storage.save(blob_name, ContentFile(content))
+
+            with transaction.atomic():
+                blob = acquire_blob(hashlib.sha256(content).hexdigest(), len(content), store)
+            self.blobs.append((blob, name))
+
+    def generate(self, count, chunk_size=CHUNK_SIZE, stdout=None) -> int:
+        """ inserts `count` incidents and rebuilds the projections, returns
+            the number of incidents created
+        """
+        if not self.blobs:
+            self.create_blobs()
+
+        created = 0
+        while created < count:
+            created += len(self.insert_chunk(min(chunk_size, count - created)))
+            if stdout is not None:
+                stdout.write("Created %d of %d incidents" % (created, count))
+
+        rebuild_user_workloads()
+        rebuild_daily_rollups()
+        rebuild_search_index()
+        return created
+
+    def build_incident(self, **fields) -> Incident:
+        rng = self.rng
+        category, sub_category = rng.choices(self.categories, self.category_weights)[0]
+        district, district_name, province = rng.choices(self.districts, self.district_weights)[0]
+        created_date = self.pick_created_date()
+
+        reporter = Reporter(
+            id=self.new_id(), name="%s %s" % (rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)),
+            mobile="07%08d" % rng.randrange(10 ** 8), district=district,
+            created_date=created_date, updated_date=created_date)
+        incident = Incident(
+            id=self.new_id(),
+            title=("%s - %s" % (sub_category, district_name))[:200],
+            description=" ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 80))),
+            category=str(category),
+            infoChannel=rng.choices(self.channels, self.channel_weights)[0],
+            district=district,
+            province=province,
+            language=choose(rng, LANGUAGE_WEIGHTS).name,
+            incidentType=choose(rng, INCIDENT_TYPE_WEIGHTS).name,
+            current_severity=choose(rng, SEVERITY_WEIGHTS).name,
+            current_status=StatusType.NEW.name,
+            reporter=reporter,
+            created_by=self.pick_internal().user,
+            assignee=self.pick_internal().user,
+            occured_date=created_date - timedelta(hours=rng.randint(0, 72)),
+            due_date=created_date + timedelta(hours=12),
+            created_date=created_date,
+            updated_date=created_date,
+        )
+        for name, value in fields.items():
+            setattr(incident, name, value)
+        return incident
+
+    def assign_refIds(self, incidents):
+        by_year = collections.defaultdict(list)
+        for incident in incidents:
+            by_year[incident.created_date.year].append(incident)
+
+        for year, year_incidents in sorted(by_year.items()):
+            numbers = reserve_refId_numbers(self.organization_code, len(year_incidents), year)
+            for incident, number in zip(year_incidents, numbers):
+                incident.refId = REFID_FORMAT % (self.organization_code, year, number)
+
+    def insert_chunk(self, count, history=None, attachments=True, **fields) -> list:
+        """ inserts `count` incidents in one transaction, each with the
+            history of a random status unless one is given. `fields` replace
+            generated incident values, without `attachments` the incidents
+            get no comments or files. Returns the incidents.
+        """
+        with transaction.atomic(), backdated(Reporter, Incident, IncidentStatus, IncidentComment, File,
+                                              Event, Notification, *WORKFLOW_MODELS):
+            return self.insert_incidents(count, history, attachments, fields)
+
+    def insert_incidents(self, count, history, attachments, fields) -> list:
+        rng = self.rng
+        incidents = [self.build_incident(**fields) for _ in range(count)]
+        self.assign_refIds(incidents)
+
+        histories = [history if history is not None else rng.choice(HISTORIES[choose(rng, STATUS_WEIGHTS)])
+                     for _ in incidents]
+        statuses = []
+        workflows = {model: [] for model in WORKFLOW_MODELS}
+        links = []
+        escalations = {}
+        notifications = []
+        public_statuses = []
+        for incident, history in zip(incidents, histories):
+            statuses.append(IncidentStatus(incident=incident, current_status=StatusType.NEW.name,
+                                           approved=True, created_date=incident.created_date))
+            notifications.append(Notification(
+                id=self.new_id(), notification_type=NotificationType.INCIDENT_ASSIGNED.name,
+                send_to=incident.assignee, actioned_by=incident.created_by, incident=incident,
+                created_date=incident.created_date))
+
+            date = incident.created_date
+            for model in history:
+                date = self.next_step_date(date)
+                workflows[model].append(self.build_workflow(model, incident, date, links, escalations))
+                statuses.append(IncidentStatus(incident=incident, current_status=WORKFLOW_STATUS[model].name,
+                                               previous_status=incident.current_status, approved=True,
+                                               created_date=date))
+                incident.current_status = WORKFLOW_STATUS[model].name
+                incident.updated_date = date
+
+            if incident.current_status == StatusType.CLOSED.name:
+                notifications.append(Notification(
+                    id=self.new_id(), notification_type=NotificationType.INCIDENT_CLOSED.name,
+                    send_to=incident.created_by, actioned_by=incident.assignee, incident=incident,
+                    created_date=incident.updated_date))
+
+            close_comment = workflows[CloseWorkflow][-1].comment \
+                if incident.current_status == StatusType.CLOSED.name else None
+            reply, messages = get_public_status_reply(incident.current_status, False, close_comment)
+            public_statuses.append(PublicIncidentStatus(incident=incident, refId=incident.refId, reply=reply,
+                                                        messages=json.dumps(messages)))
+
+        for notification in notifications:
+            notification.is_read = notification.created_date < self.end_date - READ_AFTER
+
+        Reporter.objects.bulk_create([incident.reporter for incident in incidents], batch_size=BATCH_SIZE)
+        Incident.objects.bulk_create(incidents, batch_size=BATCH_SIZE)
+        IncidentStatus.objects.bulk_create(statuses, batch_size=BATCH_SIZE)
+        Incident.linked_individuals.through.objects.bulk_create(links, batch_size=BATCH_SIZE)
+        Notification.objects.bulk_create(notifications, batch_size=BATCH_SIZE)
+        PublicIncidentStatus.objects.bulk_create(public_statuses, batch_size=BATCH_SIZE)
+
+        for model in WORKFLOW_MODELS:
+            if model is CompleteActionWorkflow:
+                for workflow in workflows[model]:
+                    workflow.initiated_workflow_id = workflow.initiated_workflow.pk
+            bulk_insert(model, workflows[model])
+
+        comments, files = self.build_attachments(incidents) if attachments else ([], [])
+        bulk_insert(IncidentComment, comments)
+        bulk_insert(File, files)
+        for blob_id, references in collections.Counter(file.blob_id for file in files).items():
+            FileBlob.objects.filter(id=blob_id).update(ref_count=F("ref_count") + references)
+
+        Event.objects.bulk_create(self.build_events(incidents, workflows, comments, files), batch_size=BATCH_SIZE)
+        return incidents
+
+    def build_workflow(self, model, incident, date, links, escalations):
+        """ the workflow row of one step, run by the assignee. `links` and
+            `escalations` (by incident id) collect the referrals
+        """
+        rng = self.rng
+        user = incident.assignee
+        if model is VerifyWorkflow:
+            incident.proof = rng.random() < 0.6
+            return VerifyWorkflow(incident=incident, actioned_user=user, comment=rng.choice(COMMENTS),
+                                  has_proof=incident.proof, created_date=date)
+        if model is InvalidateWorkflow:
+            return InvalidateWorkflow(incident=incident, actioned_user=user, comment="Duplicate request",
+                                      created_date=date)
+        if model is EscalateExternalWorkflow:
+            escalated = self.pick_external()
+            for user_id in {user.id, escalated.user_id}:
+                links.append(Incident.linked_individuals.through(incident_id=incident.id, user_id=user_id))
+            incident.last_assigned_from = str(self.profiles[user.id].division)
+            incident.last_assigned_to = str(escalated.division)
+            escalations[incident.id] = EscalateExternalWorkflow(
+                incident=incident, actioned_user=user, escalated_user=escalated.user, is_internal_user=True,
+                comment="Please attend", created_date=date)
+            return escalations[incident.id]
+        if model is CompleteActionWorkflow:
+            escalation = escalations[incident.id]
+            escalation.is_action_completed = True
+            incident.last_assigned_from = incident.last_assigned_to = None
+            return CompleteActionWorkflow(incident=incident, actioned_user=escalation.escalated_user,
+                                          initiated_workflow=escalation, comment=rng.choice(COMMENTS),
+                                          created_date=date)
+        if model is RequestInformationWorkflow:
+            return RequestInformationWorkflow(incident=incident, actioned_user=user,
+                                              comment="Which polling station?", created_date=date)
+        return CloseWorkflow(incident=incident, actioned_user=user, comment=rng.choice(COMMENTS), assignees="",
+                             entities="", departments="", individuals="", created_date=date)
+
+    def build_attachments(self, incidents):
+        """ comments and files, added between the creation and the last step """
+        rng = self.rng
+        comments = []
+        files = []
+        for incident in incidents:
+            span = (incident.updated_date - incident.created_date).total_seconds()
+            for _ in range(choose(rng, COMMENT_COUNT_WEIGHTS)):
+                comments.append(IncidentComment(
+                    incident=incident, user=incident.assignee, body=rng.choice(COMMENTS),
+                    created_date=incident.created_date + timedelta(seconds=rng.uniform(0, span))))
+            for _ in range(choose(rng, FILE_COUNT_WEIGHTS)):
+                blob, name = rng.choice(self.blobs)
+                files.append(File(file=blob.file.name, original_name=name, extension=get_extension(name),
+                                  incident=incident, blob=blob, created_date=incident.created_date))
+        return comments, files
+
+    def build_events(self, incidents, workflows, comments, files) -> list:
+        """ the event trail: creation, workflows, comments and attachments """
+        events = [
+            Event(id=self.new_id(), action=EventAction.CREATED.name, initiator=incident.created_by,
+                  incident=incident, created_date=incident.created_date)
+            for incident in incidents
+        ]
+
+        escalation_events = {}
+        for model in WORKFLOW_MODELS:
+            for workflow in workflows[model]:
+                event = Event(id=self.new_id(), action=EventAction.WORKFLOW_ACTIONED.name,
+                              initiator=workflow.actioned_user, incident=workflow.incident,
+                              refered_model_type=self.content_types[model], reference_id=workflow.pk,
+                              created_date=workflow.created_date)
+                if model is EscalateExternalWorkflow:
+                    escalation_events[workflow.pk] = event
+                elif model is CompleteActionWorkflow:
+                    event.linked_event = escalation_events[workflow.initiated_workflow_id]
+                events.append(event)
+
+        for action, model, attachments in ((EventAction.COMMENTED, IncidentComment, comments),
+                                           (EventAction.MEDIA_ATTACHED, File, files)):
+            for attachment in attachments:
+                events.append(Event(
+                    id=self.new_id(), action=action.name, incident=attachment.incident,
+                    initiator=getattr(attachment, "user", None) or attachment.incident.assignee,
+                    refered_model_type=self.content_types[model], reference_id=attachment.pk,
+                    created_date=attachment.created_date))
+
+        return events
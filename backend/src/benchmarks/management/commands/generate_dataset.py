@@ -0,0 +1,48 @@
+import random
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ...generator import DatasetGenerator, CHUNK_SIZE, load_fixtures, create_staff
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic incidents with their workflow histories on top of the seeddata fixtures"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--incidents", type=int, default=10000)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--days", type=int, default=365, help="spread the incidents over this many days")
+        parser.add_argument("--end-date", help="YYYY-MM-DD, the last day of the period, today by default. "
+                                                "Fix it to get the same dataset on another day")
+        parser.add_argument("--users-per-division", type=int, default=5,
+                            help="staff users added to every division before generating")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                            help="incidents inserted per transaction")
+        parser.add_argument("--load-fixtures", action="store_true",
+                            help="load the seeddata fixtures first, for an empty database")
+
+    def handle(self, *args, **options):
+        end_date = None
+        if options["end_date"]:
+            try:
+                end_date = timezone.make_aware(datetime.combine(
+                    datetime.strptime(options["end_date"], "%Y-%m-%d").date(), time.max))
+            except ValueError:
+                raise CommandError("Invalid end date, expected YYYY-MM-DD")
+
+        if options["load_fixtures"]:
+            load_fixtures()
+
+        if options["users_per_division"]:
+            users = create_staff(options["users_per_division"], random.Random(options["seed"]))
+            self.stdout.write("Created %d user(s)" % users)
+
+        try:
+            generator = DatasetGenerator(options["seed"], options["days"], end_date)
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        created = generator.generate(options["incidents"], options["chunk_size"], stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS("Generated %d incident(s)" % created))
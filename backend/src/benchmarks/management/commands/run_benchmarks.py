@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_databases, teardown_databases, setup_test_environment, \
+    teardown_test_environment, override_settings
+
+from ...dataset import seed_dataset
+from ....reporting.pdf_stub import StubPdfService
+from ...runner import run_benchmarks, check_budgets, get_budgets, load_budgets, write_budgets, write_report
+
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(__file__), "..", "..", "budgets.json")
+
+
+class Command(BaseCommand):
+    help = "Run every api endpoint against a seeded test database and check query (and time and memory) budgets"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--incidents", type=int, default=200000)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--budgets", default=os.path.normpath(DEFAULT_BUDGETS))
+        parser.add_argument("--report", help="write a json report to this file")
+        parser.add_argument("--update-budgets", action="store_true",
+                            help="write the budgets from this run instead of checking them")
+        parser.add_argument("--check-times", action="store_true",
+                            help="also check times and memory, on the machine the budgets were recorded on")
+        parser.add_argument("--keepdb", action="store_true")
+
+    def handle(self, *args, **options):
+        media_root = tempfile.mkdtemp()
+        # test settings (allowed hosts, in memory email) for the test client
+        setup_test_environment()
+        old_config = setup_databases(verbosity=1, interactive=False, keepdb=options["keepdb"])
+        try:
+            with StubPdfService() as pdf_service, \
+                    override_settings(MEDIA_ROOT=media_root, PDF_SERVICE_ENDPOINT=pdf_service.endpoint):
+                self.stdout.write("Seeding %d incidents" % options["incidents"])
+                context = seed_dataset(options["incidents"], options["seed"])
+                results = run_benchmarks(context, repeat=options["repeat"], stdout=self.stdout)
+        finally:
+            teardown_databases(old_config, verbosity=1, keepdb=options["keepdb"])
+            teardown_test_environment()
+            shutil.rmtree(media_root, ignore_errors=True)
+
+        if options["update_budgets"]:
+            write_budgets(options["budgets"], get_budgets(results), context["dataset"])
+            self.stdout.write(self.style.SUCCESS("Wrote budgets to %s" % options["budgets"]))
+
+        # with fresh budgets this only reports the failed requests
+        violations = check_budgets(results, load_budgets(options["budgets"]), options["check_times"])
+
+        if options["report"]:
+            write_report(options["report"], results, violations, context["dataset"])
+
+        if violations:
+            for violation in violations:
+                self.stderr.write(violation)
+            raise CommandError("%d budget violation(s)" % len(violations))
+
+        self.stdout.write(self.style.SUCCESS("%d endpoint(s) within budget" % len(results)))
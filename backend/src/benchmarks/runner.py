@@ -0,0 +1,203 @@
+"""Endpoint benchmark runner
+
+Every request runs in a transaction that is rolled back afterwards, so the
+workflow endpoints see the same seeded data on every run and the runs can
+be repeated. Per endpoint the runner records the number of queries, the
+median wall time and the peak memory allocated while handling the request,
+and `check_budgets` compares those with the committed budgets.json.
+"""
+
+import json
+import math
+import time
+import statistics
+import tracemalloc
+
+from django.db import connection, transaction, reset_queries
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_jwt.settings import api_settings
+
+from .endpoints import ENDPOINTS
+
+# headroom given when budgets are written from a run. A request that is the
+# first of its day inserts a rollup row (savepoint, insert, release)
+QUERY_HEADROOM = 3
+TIME_HEADROOM = 0.5
+MEMORY_HEADROOM = 0.25
+
+
+def get_token(user) -> str:
+    return api_settings.JWT_ENCODE_HANDLER(api_settings.JWT_PAYLOAD_HANDLER(user))
+
+
+def get_credentials(context, user_key) -> dict:
+    if user_key is None:
+        return {}
+    return {"HTTP_AUTHORIZATION": "JWT " + get_token(context["users"][user_key])}
+
+
+def read_content(response):
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+def measure(client, endpoint, context):
+    """ one request, returns (status code, query count, seconds, error) """
+    error = None
+    status_code = None
+    query_count = 0
+    elapsed = 0
+    try:
+        with transaction.atomic():
+            request_context = dict(context)
+            if endpoint.setup is not None:
+                request_context.update(endpoint.setup(request_context))
+            credentials = get_credentials(request_context, endpoint.user)
+
+            # the query log is bounded, a full one would hide the new queries
+            reset_queries()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = endpoint.request(client, request_context, **credentials)
+                read_content(response)
+                elapsed = time.perf_counter() - started
+
+            status_code = response.status_code
+            query_count = len(queries)
+            transaction.set_rollback(True)
+    except Exception as e:
+        # the test client re-raises what the view didn't handle
+        error = "%s: %s" % (type(e).__name__, e)
+
+    return status_code, query_count, elapsed, error
+
+
+def run_endpoint(client, endpoint, context, repeat=5, measure_memory=True) -> dict:
+    result = {"name": endpoint.name, "method": endpoint.method.upper(), "route": endpoint.route}
+    if endpoint.skip:
+        result["skipped"] = endpoint.skip
+        return result
+
+    # the first run warms up caches and imports
+    measure(client, endpoint, context)
+
+    timings = []
+    for _ in range(max(repeat, 1)):
+        status_code, query_count, elapsed, error = measure(client, endpoint, context)
+        timings.append(elapsed)
+
+    result.update({
+        "status": status_code,
+        "queries": query_count,
+        "time_ms": round(statistics.median(timings) * 1000, 3),
+    })
+    if error:
+        result["error"] = error
+    if endpoint.expect_error:
+        result["expected_error"] = endpoint.expect_error
+
+    if measure_memory:
+        # tracing slows everything down, so memory gets a run of its own
+        tracemalloc.start()
+        try:
+            measure(client, endpoint, context)
+            result["memory_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def run_benchmarks(context, endpoints=ENDPOINTS, repeat=5, measure_memory=True, stdout=None) -> list:
+    context = dict(context)
+    context["manager_username"] = context["users"]["manager"].username
+    context["manager_token"] = get_token(context["users"]["manager"])
+
+    client = APIClient()
+    results = []
+    for endpoint in endpoints:
+        result = run_endpoint(client, endpoint, context, repeat, measure_memory)
+        results.append(result)
+        if stdout is not None:
+            stdout.write(format_result(result))
+    return results
+
+
+def format_result(result) -> str:
+    if "skipped" in result:
+        return "%-70s skipped, %s" % (result["name"], result["skipped"])
+    return "%-70s %4s %4d queries %10.2f ms %12s" % (
+        result["name"], result["status"], result["queries"], result["time_ms"],
+        "%.1f KiB" % result["memory_kb"] if "memory_kb" in result else "")
+
+
+def check_budgets(results, budgets, check_times=False) -> list:
+    """ violations of the budgets, one message per exceeded budget. Times
+        and memory depend on the machine, they are only checked with
+        `check_times`.
+    """
+    violations = []
+    for result in results:
+        name = result["name"]
+        if "skipped" in result:
+            continue
+
+        if "expected_error" not in result:
+            if "error" in result:
+                violations.append("%s: %s" % (name, result["error"]))
+            elif result["status"] >= 400:
+                violations.append("%s: status %d" % (name, result["status"]))
+
+        budget = budgets.get(name)
+        if budget is None:
+            violations.append("%s: no budget" % name)
+            continue
+
+        if result["queries"] > budget["queries"]:
+            violations.append("%s: %d queries, budget %d" % (name, result["queries"], budget["queries"]))
+        if not check_times:
+            continue
+        if result["time_ms"] > budget["time_ms"]:
+            violations.append("%s: %.2f ms, budget %.2f ms" % (name, result["time_ms"], budget["time_ms"]))
+        if "memory_kb" in result and result["memory_kb"] > budget["memory_kb"]:
+            violations.append("%s: %.1f KiB, budget %.1f KiB" % (name, result["memory_kb"], budget["memory_kb"]))
+
+    return violations
+
+
+def get_budgets(results) -> dict:
+    """ budgets for the measured results with some headroom """
+    return {
+        result["name"]: {
+            "queries": result["queries"] + QUERY_HEADROOM,
+            "time_ms": math.ceil(result["time_ms"] * (1 + TIME_HEADROOM)),
+            "memory_kb": math.ceil(result.get("memory_kb", 0) * (1 + MEMORY_HEADROOM)),
+        }
+        for result in results if "skipped" not in result
+    }
+
+
+def load_budgets(path) -> dict:
+    with open(path) as fp:
+        return json.load(fp)["endpoints"]
+
+
+def write_budgets(path, budgets, dataset):
+    with open(path, "w") as fp:
+        json.dump({"dataset": dataset, "endpoints": budgets}, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+
+
+def write_report(path, results, violations, dataset):
+    with open(path, "w") as fp:
+        json.dump({
+            "date": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "dataset": dataset,
+            "endpoints": results,
+            "violations": violations,
+        }, fp, indent=2)
+        fp.write("\n")
@@ -0,0 +1,83 @@
+import random
+import shutil
+import tempfile
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from .dataset import seed_dataset
+from .generator import DatasetGenerator, load_fixtures, create_staff, WORKFLOW_MODELS
+from .endpoints import get_uncovered_routes
+from .runner import run_benchmarks, check_budgets, load_budgets
+from .management.commands.run_benchmarks import DEFAULT_BUDGETS
+from ..events.models import Event, EventAction
+from ..file_upload.models import File, FileBlob
+from ..incidents.models import Incident, IncidentStatus, CompleteActionWorkflow
+from ..reporting.pdf_stub import StubPdfService
+from ..urls import urlpatterns
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class EndpointBudgetTest(TestCase):
+    """ query counts don't depend on the number of incidents, so the
+        committed budgets hold for a small dataset too. Times and memory
+        are only checked by `run_benchmarks --check-times`.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def tearDown(self):
+        # counts and statuses cached by the requests belong to this dataset
+        cache.clear()
+
+    def test_every_route_is_benchmarked(self):
+        self.assertEqual(get_uncovered_routes(urlpatterns), [])
+
+    def test_endpoints_within_query_budgets(self):
+        context = seed_dataset(incidents=60)
+        with StubPdfService() as pdf_service, self.settings(PDF_SERVICE_ENDPOINT=pdf_service.endpoint):
+            results = run_benchmarks(context, repeat=1, measure_memory=False)
+
+        violations = check_budgets(results, load_budgets(DEFAULT_BUDGETS))
+        self.assertEqual(violations, [])
+
+    def test_times_are_checked_on_request(self):
+        results = [{"name": "GET incidents/", "status": 200, "queries": 4, "time_ms": 900.0, "memory_kb": 10}]
+        budgets = {"GET incidents/": {"queries": 5, "time_ms": 100, "memory_kb": 100}}
+        self.assertEqual(check_budgets(results, budgets), [])
+        self.assertEqual(check_budgets(results, budgets, check_times=True),
+                         ["GET incidents/: 900.00 ms, budget 100.00 ms"])
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class DatasetGeneratorTest(TestCase):
+
+    def setUp(self):
+        load_fixtures()
+        create_staff(2, random.Random(1))
+
+    def test_generated_histories_are_complete(self):
+        created = DatasetGenerator(seed=3, days=30).generate(300, chunk_size=120)
+        self.assertEqual(created, 300)
+        self.assertEqual(Incident.objects.filter(refId__isnull=True).count(), 0)
+        self.assertEqual(Event.objects.filter(action=EventAction.CREATED.name).count(), 300)
+
+        # the last status row of every incident is its current status
+        last_statuses = {}
+        for incident_id, status in IncidentStatus.objects.order_by("id").values_list("incident_id", "current_status"):
+            last_statuses[incident_id] = status
+        self.assertEqual(last_statuses, dict(Incident.objects.values_list("id", "current_status")))
+
+        for model in WORKFLOW_MODELS:
+            self.assertEqual(
+                Event.objects.filter(refered_model_type=ContentType.objects.get_for_model(model)).count(),
+                model.objects.count())
+        self.assertEqual(Event.objects.filter(linked_event__isnull=False).count(),
+                         CompleteActionWorkflow.objects.count())
+        self.assertEqual(sum(FileBlob.objects.values_list("ref_count", flat=True)), File.objects.count())
@@ -0,0 +1,134 @@
+"""Process local caches of category metadata and of the reference data
+responses, see custom_auth/caches.py
+
+The reference lists (categories, districts, ...) are requested on every
+frontend load and rarely change. Their responses are rendered once per
+process and version of their table, along with gzip (and brotli, when it
+is installed) encoded copies, and served with an ETag so a client holding
+the current list gets a 304. The versions are kept in the django cache,
+edits made through one worker only reach the others when it is shared
+(CACHE_REDIS_URL).
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from ..custom_auth.caches import get_cache_version, bump_cache_version
+from ..renderer import CustomJSONRenderer
+
+CATEGORIES_VERSION_KEY = "common:categories:version"
+
+_lock = threading.Lock()
+_categories = ()
+_categories_version = None
+
+
+def get_categories() -> tuple:
+    """ all categories in id order. Shared instances, treat them as read only. """
+    global _categories, _categories_version
+
+    version = get_cache_version(CATEGORIES_VERSION_KEY)
+    if version != _categories_version:
+        with _lock:
+            if version != _categories_version:
+                from .models import Category
+
+                _categories = tuple(Category.objects.order_by("id"))
+                _categories_version = version
+
+    return _categories
+
+
+def invalidate_categories():
+    global _categories_version
+
+    _categories_version = None
+    transaction.on_commit(lambda: bump_cache_version(CATEGORIES_VERSION_KEY))
+
+
+ReferencePayload = namedtuple("ReferencePayload", "version etag content gzip brotli")
+
+_reference_payloads = {}
+
+
+def get_reference_version_key(model) -> str:
+    return "common:reference:%s:version" % model._meta.label_lower
+
+def get_reference_version(model) -> str:
+    return get_cache_version(get_reference_version_key(model))
+
+def invalidate_reference_data(model):
+    transaction.on_commit(lambda: bump_cache_version(get_reference_version_key(model)))
+
+
+def render_reference_payload(version, data) -> ReferencePayload:
+    content = CustomJSONRenderer().render(data)
+    return ReferencePayload(
+        version=version,
+        # of the content, every process serving the same data sends the same one
+        etag='"%s"' % hashlib.sha256(content).hexdigest()[:32],
+        content=content,
+        gzip=gzip.compress(content, compresslevel=9, mtime=0),
+        brotli=brotli.compress(content) if brotli is not None else None,
+    )
+
+def get_reference_payload(key, version, get_data) -> ReferencePayload:
+    """ the rendered response cached as `key`, rendered again from
+        `get_data()` when it was rendered for another version
+    """
+    payload = _reference_payloads.get(key)
+    if payload is None or payload.version != version:
+        with _lock:
+            payload = _reference_payloads.get(key)
+            if payload is None or payload.version != version:
+                payload = render_reference_payload(version, get_data())
+                _reference_payloads[key] = payload
+    return payload
+
+def get_accepted_encodings(request) -> set:
+    encodings = set()
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        encoding, _, parameters = part.partition(";")
+        parameters = parameters.replace(" ", "")
+        try:
+            quality = float(parameters[2:]) if parameters.startswith("q=") else 1
+        except ValueError:
+            quality = 1
+        if quality > 0:
+            encodings.add(encoding.strip().lower())
+    return encodings
+
+def get_reference_response(request, payload: ReferencePayload, public=True) -> HttpResponse:
+    """ the payload in the best encoding the client accepts, or a 304 when it has it already """
+    response = get_conditional_response(request, etag=payload.etag)
+    if response is None:
+        accepted = get_accepted_encodings(request)
+        if payload.brotli is not None and "br" in accepted:
+            response = HttpResponse(payload.brotli, content_type="application/json")
+            response["Content-Encoding"] = "br"
+        elif "gzip" in accepted:
+            response = HttpResponse(payload.gzip, content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(payload.content, content_type="application/json")
+        response["Content-Length"] = str(len(response.content))
+
+    response["ETag"] = payload.etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if public:
+        patch_cache_control(response, public=True, max_age=settings.REFERENCE_DATA_MAX_AGE, must_revalidate=True)
+    else:
+        patch_cache_control(response, private=True, max_age=settings.REFERENCE_DATA_MAX_AGE, must_revalidate=True)
+    return response
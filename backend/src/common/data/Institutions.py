@@ -1,10052 +0,0 @@
-institutions = {
-    "1" : {
-        "code": "1",
-        "id": 1,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Defense",
-        "sn_name": "\u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-1" : {
-        "code": "1-1",
-        "id": 2,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Office of the chief of defence staff",
-        "sn_name": "\u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0db8\u0dcf\u0dab\u0dca\u0da9\u0dbd\u0dd2\u0d9a \u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1\u0dd3 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b8a\u0bb4\u0bbf\u0baf\u0bb0\u0bcd\u0b95\u0bb3\u0bbf\u0ba9\u0bcd \u0ba4\u0bb2\u0bc8\u0bb5\u0bb0\u0bbf\u0ba9\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-2":{
-        "code": "1-2",
-        "id": 3,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Sri Lanka Army",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dba\u0dd4\u0daf\u0dca\u0db0 \u0dc4\u0db8\u0dd4\u0daf\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb0\u0bbe\u0ba3\u0bc1\u0bb5\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-3":{
-        "code": "1-3",
-        "id": 4,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Sri Lanka Navy",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db1\u0dcf\u0dc0\u0dd2\u0d9a \u0dc4\u0db8\u0dd4\u0daf\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0b9f\u0bb1\u0bcd\u0baa\u0b9f\u0bc8",
-        "status": "true"
-    },
-    "1-4":{
-        "code": "1-4",
-        "id": 5,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Sri Lanka Air Force",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9c\u0dd4\u0dc0\u0db1\u0dca \u0dc4\u0db8\u0dd4\u0daf\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb5\u0bbf\u0bae\u0bbe\u0ba9\u0baa\u0bcd\u0baa\u0b9f\u0bc8",
-        "status": "true"
-    },
-    "1-5":{
-        "code": "1-5",
-        "id": 6,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Sri Lanka Police",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0ddc\u0dbd\u0dd3\u0dc3\u0dd2\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0bbe\u0bb5\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "1-6":{
-        "code": "1-6",
-        "id": 7,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Department of Civil Security",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dd2\u0dc0\u0dd2\u0dbd\u0dca \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bbf\u0bb5\u0bbf\u0bb2\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "1-7":{
-        "code": "1-7",
-        "id": 8,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "State Intelligence Service",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dbb\u0dc4\u0dc3\u0dca \u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dc3\u0dda\u0dc0\u0dba",
-        "tm_name": "\u0bae\u0bbe\u0ba8\u0bbf\u0bb2 \u0baa\u0bc1\u0bb2\u0ba9\u0bbe\u0baf\u0bcd\u0bb5\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8",
-        "status": "true"
-    },
-    "1-8":{
-        "code": "1-8",
-        "id": 9,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Rana Viru Sewa Authority",
-        "sn_name": "\u0dbb\u0dab\u0dc0\u0dd2\u0dbb\u0dd4 \u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0bb0\u0bbe\u0ba3\u0bbe \u0bb5\u0bbf\u0bb0\u0bc1 \u0b9a\u0bc7\u0bb5\u0bbe \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-9":{
-        "code": "1-9",
-        "id": 10,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Sir John Kothalawala Defence University",
-        "sn_name": "\u0dc3\u0dbb\u0dca \u0da2\u0ddd\u0db1\u0dca \u0d9a\u0ddc\u0dad\u0dbd\u0dcf\u0dc0\u0dbd \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc0\u0dd2\u0dc2\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b9a\u0bb0\u0bcd \u0b9c\u0bbe\u0ba9\u0bcd \u0b95\u0bcb\u0ba4\u0bcd\u0ba4\u0bb2\u0bb5\u0bbe\u0bb2\u0bbe \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0baa\u0bb2\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-10":{
-        "code": "1-10",
-        "id": 11,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Defence Services Command and Staff College",
-        "sn_name": "\u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0dab \u0dc4\u0dcf \u0db8\u0dcf\u0dab\u0dca\u0da9\u0dbd\u0dd2\u0d9a \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bb3\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0bbe\u0bb3\u0bb0\u0bcd\u0b95\u0bb3\u0bcd \u0b95\u0bb2\u0bcd\u0bb2\u0bc2\u0bb0\u0bbf",
-        "status": "true"
-    },
-    "1-11":{
-        "code": "1-11",
-        "id": 12,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Defence Service School",
-        "sn_name": "\u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0db4\u0dcf\u0dc3\u0dbd",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8 \u0baa\u0bb3\u0bcd\u0bb3\u0bbf",
-        "status": "true"
-    },
-    "1-12":{
-        "code": "1-12",
-        "id": 13,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Cadet Corps",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc1\u0dd2\u0dc2\u0dca\u200d\u0dba\u0db7\u0da7 \u0db6\u0dbd\u0d9a\u0dcf\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bc7\u0b9f\u0b9f\u0bcd \u0b95\u0bbe\u0bb0\u0bcd\u0baa\u0bcd\u0bb8\u0bcd",
-        "status": "true"
-    },
-    "1-13":{
-        "code": "1-13",
-        "id": 14,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Defence Fund",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0ba8\u0bbf\u0ba4\u0bbf",
-        "status": "true"
-    },
-    "1-14":{
-        "code": "1-14",
-        "id": 15,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Center for Defence Research and Development",
-        "sn_name": "\u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc4\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bae\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-15":{
-        "code": "1-15",
-        "id": 16,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Institute of Defense Studies",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0dba\u0db1\u0dba \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b86\u0baf\u0bcd\u0bb5\u0bc1\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-16":{
-        "code": "1-16",
-        "id": 17,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Department of Coast Guard",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd9\u0dbb\u0dc5\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bb2\u0bcb\u0bb0 \u0b95\u0bbe\u0bb5\u0bb2\u0bcd\u0baa\u0b9f\u0bc8 \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "1-17":{
-        "code": "1-17",
-        "id": 18,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Lanka Logistics Limited",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0dbd\u0ddc\u0da2\u0dd2\u0dc3\u0dca\u0da7\u0dd2\u0d9a\u0dca\u0dc3\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb2\u0bbe\u0b9c\u0bbf\u0bb8\u0bcd\u0b9f\u0bbf\u0b95\u0bcd\u0bb8\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "1-18":{
-        "code": "1-18",
-        "id": 19,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Rakna Security Lanka Limited",
-        "sn_name": "\u0dbb\u0d9a\u0dca\u0db1\u0dcf \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dbd\u0d82\u0d9a\u0dcf \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb0\u0b95\u0bcd\u0ba9\u0bbe \u0b9a\u0bc6\u0b95\u0bcd\u0baf\u0bc2\u0bb0\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "1-19":{
-        "code": "1-19",
-        "id": 20,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Dangerous Drugs Control Board",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0db1\u0dca\u0dad\u0dbb\u0dcf\u0dba\u0d9a\u0dcf\u0dbb \u0d96\u0dc2\u0db0 \u0db4\u0dcf\u0dbd\u0d9a \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b86\u0baa\u0ba4\u0bcd\u0ba4\u0bbe\u0ba9 \u0bae\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bc1\u0b95\u0bb3\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0baa\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-20":{
-        "code": "1-20",
-        "id": 21,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Department of Immigration and Emigration",
-        "sn_name": "\u0d86\u0d9c\u0db8\u0db1 \u0dc4\u0dcf \u0dc0\u0dd2\u0d9c\u0db8\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0b9f\u0bbf\u0bb5\u0bb0\u0bb5\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0b9f\u0bbf\u0bb5\u0bb0\u0bb5\u0bc1 \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "1-21":{
-        "code": "1-21",
-        "id": 22,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Department of Registration of Persons",
-        "sn_name": "\u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dba\u0dd2\u0db1\u0dca \u0dbd\u0dd2\u0dba\u0dcf\u0db4\u0daf\u0dd2\u0d82\u0da0\u0dd2 \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0baa\u0bb0\u0bcd\u0b95\u0bb3\u0bbf\u0ba9\u0bcd \u0baa\u0ba4\u0bbf\u0bb5\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "1-22":{
-        "code": "1-22",
-        "id": 23,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Media Center",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0dcf\u0db0\u0dca\u200d\u0dba \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b8a\u0b9f\u0b95 \u0bae\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-23":{
-        "code": "1-23",
-        "id": 24,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Secretariat for NGOs",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db1\u0ddc\u0dc0\u0db1 \u0dc3\u0d82\u0dc0\u0dd2\u0db0\u0dcf\u0db1 \u0dc3\u200d\u0db3\u0dc4\u0dcf \u0dc0\u0db1 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0ba9\u0bcd\u0ba9\u0bbe\u0bb0\u0bcd\u0bb5 \u0ba4\u0bca\u0ba3\u0bcd\u0b9f\u0bc1 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-24":{
-        "code": "1-24",
-        "id": 25,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Telecommunications Regulatory Commission of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2 \u0dc3\u0d82\u0daf\u0dda\u0dc1 \u0db1\u0dd2\u0dba\u0dcf\u0db8\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0baf\u0bbf\u0ba9\u0bcd \u0ba4\u0bca\u0bb2\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0b9f\u0bb0\u0bcd\u0baa\u0bc1 \u0b92\u0bb4\u0bc1\u0b99\u0bcd\u0b95\u0bc1\u0bae\u0bc1\u0bb1\u0bc8 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-25":{
-        "code": "1-25",
-        "id": 26,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Information and Communication Technology Agency and its affiliates",
-        "sn_name": "\u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dc4\u0dcf \u0dc3\u0d82\u0db1\u0dd2\u0dc0\u0dda\u0daf\u0db1 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0db1\u0dd2\u0dba\u0ddd\u0da2\u0dd2\u0dad\u0dcf\u0dba\u0dad\u0db1\u0dba \u0dc4\u0dcf \u0d8a\u0da7 \u0d85\u0db1\u0dd4\u0db6\u0daf\u0dca\u0db0\u0dd2\u0dad \u0d86\u0dba\u0dad\u0db1",
-        "tm_name": "\u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0b9f\u0bb0\u0bcd\u0baa\u0bc1 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "1-26":{
-        "code": "1-26",
-        "id": 27,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Sri Lanka Computer Emergency Response Team",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dbb\u0dd2\u0d9d\u0db1\u0d9a \u0dc4\u0daf\u0dd2\u0dc3\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0da0\u0dcf\u0dbb \u0dc3\u0d82\u0dc3\u0daf\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0ba3\u0bbf\u0ba9\u0bbf \u0b85\u0bb5\u0b9a\u0bb0\u0b95\u0bbe\u0bb2 \u0baa\u0ba4\u0bbf\u0bb2\u0bcd \u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "1-27":{
-        "code": "1-27",
-        "id": 28,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Council for Disaster Management",
-        "sn_name": "\u0dc0\u0dca\u200d\u0dba\u0dc3\u0db1 \u0d9a\u0dc5\u0db8\u0dab\u0dcf\u0d9a\u0dbb\u0dab\u0dba \u0dc3\u0db3\u0dc4\u0dcf \u0dc0\u0dd6 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc7\u0bb0\u0bbf\u0b9f\u0bb0\u0bcd \u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bb5\u0bc1\u0ba9\u0bcd\u0b9a\u0bbf\u0bb2\u0bcd",
-        "status": "true"
-    },
-    "1-28":{
-        "code": "1-28",
-        "id": 29,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Disaster Management Center",
-        "sn_name": "\u0d86\u0db4\u0daf\u0dcf \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0baa\u0bc7\u0bb0\u0bbf\u0b9f\u0bb0\u0bcd \u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bae\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-29":{
-        "code": "1-29",
-        "id": 30,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Disaster Relief Service Center",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d86\u0db4\u0daf\u0dcf \u0dc3\u0dc4\u0db1 \u0dc3\u0dda\u0dc0\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bc7\u0bb0\u0bbf\u0b9f\u0bb0\u0bcd \u0ba8\u0bbf\u0bb5\u0bbe\u0bb0\u0ba3 \u0b9a\u0bc7\u0bb5\u0bc8 \u0bae\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "1-30":{
-        "code": "1-30",
-        "id": 31,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "Department of Meteorology",
-        "sn_name": "\u0d9a\u0dcf\u0dbd\u0d9c\u0dd4\u0dab \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0bbe\u0ba9\u0bbf\u0bb2\u0bc8 \u0b86\u0baf\u0bcd\u0bb5\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "1-31":{
-        "code": "1-31",
-        "id": 32,
-        "institute_type": "GOV",
-        "mother_org": 1,
-        "name": "National Building Research Organization",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9c\u0ddc\u0da9\u0db1\u0dd0\u0d9c\u0dd2\u0dbd\u0dd2 \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc3\u0d82\u0dc0\u0dd2\u0db0\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0b9f\u0bcd\u0b9f\u0bbf\u0b9f \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0b85\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1",
-        "status": "true"
-    },
-    "2": {
-        "code": "2",
-        "id": 33,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Finance Economic and Policy Development",
-        "sn_name": "\u0db8\u0dd4\u0daf\u0dbd\u0dca \u0d86\u0dbb\u0dca\u0dae\u0dd2\u0d9a \u0dc3\u0dc4 \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd2 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba8\u0bbf\u0ba4\u0bbf \u0baa\u0bca\u0bb0\u0bc1\u0bb3\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bca\u0bb3\u0bcd\u0b95\u0bc8 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "2-1":{
-        "code": "2-1",
-        "id": 34,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of National Planning",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dca\u200d\u0dbb\u0db8 \u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-2":{
-        "code": "2-2",
-        "id": 35,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "General Treasury",
-        "sn_name": "\u0db8\u0dc4\u0dcf \u0db7\u0dcf\u0dab\u0dca\u0da9\u0dcf\u0d9c\u0dcf\u0dbb\u0dba",
-        "tm_name": "\u0baa\u0bca\u0ba4\u0bc1 \u0b95\u0bb0\u0bc1\u0bb5\u0bc2\u0bb2\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-3":{
-        "code": "2-3",
-        "id": 36,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Fiscal Policy",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db8\u0dd6\u0dbd\u0dca\u200d\u0dba \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0ba4\u0bbf\u0b95\u0bcd \u0b95\u0bca\u0bb3\u0bcd\u0b95\u0bc8 \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-4":{
-        "code": "2-4",
-        "id": 37,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of National Budget",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0dba\u0dc0\u0dd0\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0b9f\u0bcd\u0b9c\u0bc6\u0b9f\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-5":{
-        "code": "2-5",
-        "id": 38,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Management Services",
-        "sn_name": "\u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-6":{
-        "code": "2-6",
-        "id": 39,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Public Enterprises",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc0\u0dca\u200d\u0dba\u0dc0\u0dc3\u0dcf\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0ba4\u0bc1 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bbf\u0ba9\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-7":{
-        "code": "2-7",
-        "id": 40,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of External Resources",
-        "sn_name": "\u0dc0\u0dd2\u0daf\u0dda\u0dc1 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb3\u0bbf \u0bb5\u0bb3\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-8":{
-        "code": "2-8",
-        "id": 41,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Public Finance",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db8\u0dd4\u0daf\u0dbd\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0ba4\u0bc1 \u0ba8\u0bbf\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-9":{
-        "code": "2-9",
-        "id": 42,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Treasury Operations",
-        "sn_name": "\u0db7\u0dcf\u0dab\u0dca\u0da9\u0dcf\u0d9c\u0dcf\u0dbb \u0db8\u0dd9\u0dc4\u0dd9\u0dba\u0dd4\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bb0\u0bc1\u0bb5\u0bc2\u0bb2 \u0b9a\u0bc6\u0baf\u0bb2\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-10":{
-        "code": "2-10",
-        "id": 43,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of State Accounts",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0d9c\u0dd2\u0dab\u0dd4\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba8\u0bbf\u0bb2 \u0b95\u0ba3\u0b95\u0bcd\u0b95\u0bc1\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-11":{
-        "code": "2-11",
-        "id": 44,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Trade and Investment Policy",
-        "sn_name": "\u0dc0\u0dd9\u0dc5\u0db3 \u0dc4\u0dcf \u0d86\u0dba\u0ddd\u0da2\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bae\u0bc1\u0ba4\u0bb2\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0b95\u0bca\u0bb3\u0bcd\u0b95\u0bc8 \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-12":{
-        "code": "2-12",
-        "id": 45,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Development Finance",
-        "sn_name": "\u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dd6\u0dbd\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-13":{
-        "code": "2-13",
-        "id": 46,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Information Technology Management",
-        "sn_name": "\u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-14":{
-        "code": "2-14",
-        "id": 47,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Comptroller General's Office",
-        "sn_name": "\u0d9a\u0ddc\u0db8\u0dca\u0da7\u0dca\u200d\u0dbb\u0ddd\u0dbd\u0dbb\u0dca \u0da2\u0db1\u0dbb\u0dcf\u0dbd\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b95\u0bae\u0bcd\u0baa\u0bcd\u0bb0\u0bcb\u0bb2\u0bb0\u0bcd \u0b9c\u0bc6\u0ba9\u0bb0\u0bb2\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-15":{
-        "code": "2-15",
-        "id": 48,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Legal Affairs",
-        "sn_name": "\u0db1\u0dd3\u0dad\u0dd2 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0b9f\u0bcd\u0b9f \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-16":{
-        "code": "2-16",
-        "id": 49,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Project Management and Monitoring",
-        "sn_name": "\u0dc0\u0dca\u200d\u0dba\u0dcf\u0db4\u0dd8\u0dad\u0dd2 \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0dc4\u0dcf \u0d85\u0db0\u0dd3\u0d9a\u0dca\u0dc2\u0dab \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0b9f\u0bcd\u0b9f \u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0ba3\u0bcd\u0b95\u0bbe\u0ba3\u0bbf\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-17":{
-        "code": "2-17",
-        "id": 50,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Management Audit",
-        "sn_name": "\u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0dc0\u0dd2\u0d9c\u0dab\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0ba4\u0ba3\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-18":{
-        "code": "2-18",
-        "id": 51,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Inland Revenue",
-        "sn_name": "\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0d86\u0daf\u0dcf\u0dba\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bb0\u0bc1\u0bb5\u0bbe\u0baf\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-19":{
-        "code": "2-19",
-        "id": 52,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Sri Lanka Custom",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0dda\u0d9c\u0dd4\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb5\u0bbf\u0bb0\u0bc1\u0baa\u0bcd\u0baa\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-20":{
-        "code": "2-20",
-        "id": 53,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Import & Export",
-        "sn_name": "\u0d86\u0db1\u0dba\u0db1 \u0dc4\u0dcf \u0d85\u0db4\u0db1\u0dba\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b87\u0bb1\u0b95\u0bcd\u0b95\u0bc1\u0bae\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8f\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0ba4\u0bbf \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-21":{
-        "code": "2-21",
-        "id": 54,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Excise",
-        "sn_name": "\u0dc3\u0dd4\u0dbb\u0dcf\u0db6\u0daf\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bbe\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-22":{
-        "code": "2-22",
-        "id": 55,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Census and Statistics",
-        "sn_name": "\u0da2\u0db1 \u0dc4\u0dcf \u0dc3\u0d82\u0d9b\u0dca\u200d\u0dba\u0dcf\u0dbd\u0dda\u0d9b\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0b95\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bca\u0b95\u0bc8 \u0b95\u0ba3\u0b95\u0bcd\u0b95\u0bc6\u0b9f\u0bc1\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bc1\u0bb3\u0bcd\u0bb3\u0bbf\u0bb5\u0bbf\u0bb5\u0bb0\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-23":{
-        "code": "2-23",
-        "id": 56,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Valuation",
-        "sn_name": "\u0dad\u0d9a\u0dca\u0dc3\u0dda\u0dbb\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0ba4\u0bbf\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-24":{
-        "code": "2-24",
-        "id": 57,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Registrar Companies",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u200d\u0dbb\u0dd9\u0da2\u0dd2\u0dc3\u0dca\u0da7\u0dca\u200d\u0dbb\u0dcf\u0dbb\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bbf\u0bb5\u0bbe\u0bb3\u0bb0\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-25":{
-        "code": "2-25",
-        "id": 58,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Welfare Benefit Board",
-        "sn_name": "\u0dc3\u0dd4\u0db7\u0dc3\u0dcf\u0db0\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0dbd\u0dcf\u0db7 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba8\u0bb2 \u0ba8\u0ba9\u0bcd\u0bae\u0bc8 \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-26":{
-        "code": "2-26",
-        "id": 59,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Department of Commerce",
-        "sn_name": "\u0dc0\u0dcf\u0dab\u0dd2\u0da2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0ba3\u0bbf\u0b95\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-27":{
-        "code": "2-27",
-        "id": 60,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Central Bank of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db8\u0dc4 \u0db6\u0dd0\u0d82\u0d9a\u0dd4\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bb5\u0b99\u0bcd\u0b95\u0bbf",
-        "status": "true"
-    },
-    "2-28":{
-        "code": "2-28",
-        "id": 61,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Securities and Exchange Commission of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dd4\u0dbb\u0dd0\u0d9a\u0dd4\u0db8\u0dca \u0db4\u0dad\u0dca \u0dc4\u0dcf \u0dc0\u0dd2\u0db1\u0dd2\u0db8\u0dba \u0d9a\u0ddc\u0db8\u0dd2\u0dc3\u0db8",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0baf\u0bbf\u0ba9\u0bcd \u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bb0\u0bbf\u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0ba9\u0bc8 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-29":{
-        "code": "2-29",
-        "id": 62,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Insurance Board of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0baf\u0bbf\u0ba9\u0bcd \u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-30":{
-        "code": "2-30",
-        "id": 63,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Credit Information Bureau",
-        "sn_name": "\u0dab\u0dba \u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0b9f\u0ba9\u0bcd \u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-31":{
-        "code": "2-31",
-        "id": 64,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "National Operations Room",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0dd9\u0dc4\u0dd9\u0dba\u0dd4\u0db8\u0dca \u0db8\u0dd0\u0daf\u0dd2\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bc6\u0baf\u0bb2\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b85\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "2-32":{
-        "code": "2-32",
-        "id": 65,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Public Service Mutual Provident Association",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0db1\u0dca\u200d\u0dba\u0dd9\u0db1\u0dca\u200d\u0dba \u0d85\u0dbb\u0dca\u0dae\u0dc3\u0dcf\u0db0\u0d9a \u0dc3\u0d82\u0d9c\u0db8\u0dba",
-        "tm_name": "\u0baa\u0bca\u0ba4\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8 \u0baa\u0bb0\u0bb8\u0bcd\u0baa\u0bb0 \u0bb5\u0bb0\u0bc1\u0b99\u0bcd\u0b95\u0bbe\u0bb2 \u0bb5\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0b99\u0bcd\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-33":{
-        "code": "2-33",
-        "id": 66,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Lady Lahore Fund",
-        "sn_name": "\u0dbd\u0ddd\u0dc4\u0ddd\u0dbb\u0dca \u0d86\u0dbb\u0dca\u0dba\u0dcf \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0bb2\u0bc7\u0b9f\u0bbf \u0bb2\u0bbe\u0b95\u0bc2\u0bb0\u0bcd \u0ba8\u0bbf\u0ba4\u0bbf",
-        "status": "true"
-    },
-    "2-34":{
-        "code": "2-34",
-        "id": 67,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Tax Appeals Commission",
-        "sn_name": "\u0db6\u0daf\u0dd4 \u0d85\u0db7\u0dd2\u0dba\u0dcf\u0da0\u0db1\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb0\u0bbf \u0bae\u0bc7\u0bb2\u0bcd\u0bae\u0bc1\u0bb1\u0bc8\u0baf\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-35":{
-        "code": "2-35",
-        "id": 68,
-        "institute_type": "\"\u0bb5\u0bc7\u0bb2\u0bc8\u0ba8\u0bbf\u0bb1\u0bc1\u0ba4\u0bcd\u0ba4\u0bae\u0bcd",
-        "mother_org": 0,
-        "name": " \u0dc3\u0dd2\u0dc0\u0dd2\u0dbd\u0dca \u0d9a\u0dbd\u0db6\u0dbd \u0dc4\u0dcf \u0dad\u0dca\u200d\u0dbb\u0dc3\u0dca\u0dad\u0dc0\u0dcf\u0daf\u0dba \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd\"",
-        "sn_name": "\"\u0dc0\u0dbb\u0dca\u0da2\u0db1",
-        "tm_name": " \u0d9a\u0ddd\u0dbd\u0dcf\u0dc4\u0dbd",
-        "status": "true"
-    },
-    "2-36":{
-        "code": "2-36",
-        "id": 69,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Sri Lanka Accounting and Auditing Standards Monitoring Board",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9c\u0dd2\u0dab\u0dd4\u0db8\u0dca \u0dc4\u0dcf \u0dc0\u0dd2\u0d9c\u0dab\u0db1 \u0db4\u0dca\u200d\u0dbb\u0db8\u0dd2\u0dad\u0dd2 \u0dc3\u0db8\u0dd3\u0d9a\u0dca\u0dc2\u0dab \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0ba3\u0b95\u0bcd\u0b95\u0bbf\u0baf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0ba3\u0bbf\u0b95\u0bcd\u0b95\u0bc8 \u0ba4\u0bb0 \u0b95\u0ba3\u0bcd\u0b95\u0bbe\u0ba3\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-37":{
-        "code": "2-37",
-        "id": 70,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Public Utilities Commission of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db8\u0dc4\u0da2\u0db1 \u0d8b\u0db4\u0dba\u0ddd\u0d9c\u0dd3\u0dad\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0baf\u0bbf\u0ba9\u0bcd \u0baa\u0bca\u0ba4\u0bc1 \u0baa\u0baf\u0ba9\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-38":{
-        "code": "2-38",
-        "id": 71,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Institute of Policy Studies",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd2 \u0d85\u0db0\u0dca\u200d\u0dba\u0dba\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b95\u0bca\u0bb3\u0bcd\u0b95\u0bc8 \u0b86\u0baf\u0bcd\u0bb5\u0bc1\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-39":{
-        "code": "2-39",
-        "id": 72,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Sustainable Development Council",
-        "sn_name": "\u0dad\u0dd2\u0dbb\u0dc3\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bbe\u0ba9 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "2-40":{
-        "code": "2-40",
-        "id": 73,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Hotel Developers (Lanka) PLC",
-        "sn_name": "\u0dc4\u0ddc\u0da7\u0dd9\u0dbd\u0dca \u0da9\u0dd2\u0dc0\u0dbd\u0db4\u0dbb\u0dca\u0dc3\u0dca (\u0dbd\u0d82\u0d9a\u0dcf) \u0db4\u0dde\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a \u0dc3\u0db8\u0dcf\u0d9c\u0db8 (PQ143)",
-        "tm_name": "\u0bb9\u0bcb\u0b9f\u0bcd\u0b9f\u0bb2\u0bcd \u0b9f\u0bc6\u0bb5\u0bb2\u0baa\u0bcd\u0baa\u0bb0\u0bcd\u0b95\u0bb3\u0bcd (\u0bb2\u0b99\u0bcd\u0b95\u0bbe) \u0baa\u0bbf.\u0b8e\u0bb2\u0bcd.\u0b9a\u0bbf.",
-        "status": "true"
-    },
-    "2-41":{
-        "code": "2-41",
-        "id": 74,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "National Lottery Board",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dbd\u0ddc\u0dad\u0dbb\u0dd0\u0dba\u0dd2 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb2\u0bbe\u0b9f\u0bcd\u0b9f\u0bb0\u0bbf \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-42":{
-        "code": "2-42",
-        "id": 75,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Development Lottery Board",
-        "sn_name": "\u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dbd\u0ddc\u0dad\u0dbb\u0dd0\u0dba\u0dd2 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0bb2\u0bbe\u0b9f\u0bcd\u0b9f\u0bb0\u0bbf \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-43":{
-        "code": "2-43",
-        "id": 76,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "All State Bank and their subsidiaries and related institutions",
-        "sn_name": "\u0dc3\u0dd2\u0dba\u0dbd\u0dd4\u0db8 \u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db6\u0dd0\u0d82\u0d9a\u0dd4 \u0dc4\u0dcf \u0d92\u0dc0\u0dcf\u0dba\u0dda \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc4\u0dcf \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0d86\u0dba\u0dad\u0db1",
-        "tm_name": "\u0b85\u0ba9\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1 \u0bb8\u0bcd\u0b9f\u0bc7\u0b9f\u0bcd \u0bb5\u0b99\u0bcd\u0b95\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0bb5\u0bb1\u0bcd\u0bb1\u0bbf\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0b9f\u0bb0\u0bcd\u0baa\u0bc1\u0b9f\u0bc8\u0baf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "2-44":{
-        "code": "2-44",
-        "id": 77,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Sri Lanka Export Credit Insurance Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d85\u0db4\u0db1\u0dba\u0db1 \u0dab\u0dba \u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b8f\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0ba4\u0bbf \u0b95\u0b9f\u0ba9\u0bcd \u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0b95\u0bcd \u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-45":{
-        "code": "2-45",
-        "id": 78,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "National Insurance Trust Fund",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0db7\u0dcf\u0dbb \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0b85\u0bb1\u0b95\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bb3\u0bc8 \u0ba8\u0bbf\u0ba4\u0bbf",
-        "status": "true"
-    },
-    "2-46":{
-        "code": "2-46",
-        "id": 79,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Sri Lanka Insurance Corporation and its subsidiaries and affiliated companies",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0 \u0dc4\u0dcf \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc3\u0dc4 \u0d85\u0db1\u0dd4\u0db6\u0daf\u0dca\u0db0 \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0b95\u0bcd \u0b95\u0bb4\u0b95\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0ba8\u0bcd\u0ba4 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "2-47":{
-        "code": "2-47",
-        "id": 80,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "Employees' Trust Fund Board",
-        "sn_name": "\u0dc3\u0dda\u0dc0\u0dcf \u0db1\u0dd2\u0dba\u0dd4\u0d9a\u0dca\u0dad\u0dd2\u0d9a\u0dba\u0dd2\u0db1\u0dca\u0d9c\u0dda \u0db7\u0dbb\u0d9a\u0dcf\u0dbb \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b8a\u0bb4\u0bbf\u0baf\u0bb0\u0bcd\u0b95\u0bb3\u0bbf\u0ba9\u0bcd \u0b85\u0bb1\u0b95\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bb3\u0bc8 \u0ba8\u0bbf\u0ba4\u0bbf \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "2-48":{
-        "code": "2-48",
-        "id": 81,
-        "institute_type": "GOV",
-        "mother_org": 33,
-        "name": "State Resources Management Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba8\u0bbf\u0bb2 \u0bb5\u0bb3 \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3": {
-        "code": "3",
-        "id": 82,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Buddha Sasana Cultural and Religious Affairs",
-        "sn_name": "\u0db6\u0dd4\u0daf\u0dca\u0db0\u0dc1\u0dcf\u0dc3\u0db1 \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0dc4\u0dcf \u0d86\u0d9c\u0db8\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0b9a\u0bbe\u0b9a\u0ba9\u0b87 \u0b95\u0bb2\u0bbe\u0b9a\u0bbe\u0bb0 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bae\u0baf \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bb0",
-        "status": "true"
-    },
-    "3-1":{
-        "code": "3-1",
-        "id": 83,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of Buddhist Affairs",
-        "sn_name": "\u0db6\u0dde\u0daf\u0dca\u0db0 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0baa\u0bcc\u0ba4\u0bcd\u0ba4 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-2":{
-        "code": "3-2",
-        "id": 84,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Buddha Sasana Fund",
-        "sn_name": "\u0db6\u0dd4\u0daf\u0dca\u0db0 \u0dc1\u0dcf\u0dc3\u0db1 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0b9a\u0bbe\u0b9a\u0ba9 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-3":{
-        "code": "3-3",
-        "id": 85,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Buddhist Renaissance Fund",
-        "sn_name": "\u0db6\u0dde\u0daf\u0dca\u0db0 \u0db4\u0dd4\u0db1\u0dbb\u0dd4\u0daf \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0baa\u0bcc\u0ba4\u0bcd\u0ba4 \u0bae\u0bb1\u0bc1\u0bae\u0bb2\u0bb0\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-4":{
-        "code": "3-4",
-        "id": 86,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "International Buddhist Centers",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dca\u200d\u0dba\u0db1\u0dca\u0dad\u0dbb \u0db6\u0dde\u0daf\u0dca\u0db0 \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1",
-        "tm_name": "\u0b9a\u0bbe;\u0bb5\u0ba4\u0bc7\u0b9a \u0baa\u0bcc\u0ba4\u0bcd\u0ba4 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0b99\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "3-5":{
-        "code": "3-5",
-        "id": 87,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of Hindu Religious and Cultural Affairs",
-        "sn_name": "\u0dc4\u0dd2\u0db1\u0dca\u0daf\u0dd4 \u0d86\u0d9c\u0db8\u0dd2\u0d9a \u0dc4\u0dcf \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b87\u0ba8\u0bcd\u0ba4\u0bc1 \u0bae\u0ba4\u0b87 \u0baa\u0ba3\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-6":{
-        "code": "3-6",
-        "id": 88,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of Christian Religious Affairs",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd2\u0dc3\u0dca\u0dad\u0dd2\u0dba\u0dcf\u0db1\u0dd2 \u0d86\u0d9c\u0db8\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bbf\u0bb1\u0bbf\u0ba4\u0bcd\u0ba4\u0bb5 \u0bae\u0ba4 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-7":{
-        "code": "3-7",
-        "id": 89,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of Muslim Religious and Cultural Affairs",
-        "sn_name": "\u0db8\u0dd4\u0dc3\u0dca\u0dbd\u0dd2\u0db8\u0dca \u0d86\u0d9c\u0db8\u0dd2\u0d9a \u0dc4\u0dcf \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0bc1\u0bb8\u0bcd\u0bb2\u0bbf\u0bae\u0bcd \u0b9a\u0bae\u0baf \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-8":{
-        "code": "3-8",
-        "id": 90,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of Cultural Affairs",
-        "sn_name": "\u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bbe\u0b9a\u0bbe\u0bb0 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-9":{
-        "code": "3-9",
-        "id": 91,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of National Museums",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dde\u0dad\u0dd4\u0d9a\u0dcf\u0d9c\u0dcf\u0dbb \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc2\u0ba4\u0ba9\u0b9a\u0bbe\u0bb2\u0bc8\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-10":{
-        "code": "3-10",
-        "id": 92,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of Archeology",
-        "sn_name": "\u0db4\u0dd4\u0dbb\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0bb2\u0bcd\u0baa\u0bca\u0bb0\u0bc1\u0bb3\u0bbf\u0baf\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-11":{
-        "code": "3-11",
-        "id": 93,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Tower Hall Theater Foundation",
-        "sn_name": "\u0da7\u0dc0\u0dbb\u0dca\u0dc4\u0ddd\u0dbd\u0dca \u0dbb\u0d9f\u0dc4\u0dbd \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "\u0b9f\u0bb5\u0bbe;\u0bb9\u0bcb\u0bb2\u0bcd \u0bae\u0ba3\u0bcd\u0b9f\u0baa \u0ba4\u0bbf\u0baf\u0bc7\u0b9f\u0bcd\u0b9f\u0bbe; \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-12":{
-        "code": "3-12",
-        "id": 94,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Public Performance Board",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dc3\u0dd2\u0daf\u0dca\u0db0 \u0dbb\u0dd0\u0d9c\u0dd4\u0db8\u0dca \u0db4\u0dcf\u0dbd\u0d9a \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0b95\u0bbf\u0bb0\u0b99\u0bcd\u0b95 \u0b85\u0bb0\u0b99\u0bcd\u0b95\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0b95\u0bc8\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "3-13":{
-        "code": "3-13",
-        "id": 95,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "National Arts Council",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dbd\u0dcf \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bb2\u0bc8 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-14":{
-        "code": "3-14",
-        "id": 96,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Gramodaya Folk Art Center",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0ddd\u0daf\u0dba \u0da2\u0db1\u0d9a\u0dbd\u0dcf \u0d9a\u0dda\u0db1\u0dca\u0daf\u0dca\u200d\u0dbb\u0dba",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0bcb\u0ba4\u0baf \u0b9c\u0ba9\u0b95\u0bb2\u0bbe \u0b95\u0bc7\u0ba8\u0bcd\u0ba4\u0bbf\u0bb0\u0baf",
-        "status": "true"
-    },
-    "3-15":{
-        "code": "3-15",
-        "id": 97,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Our Village",
-        "sn_name": "\u0d85\u0db4\u0dda \u0d9c\u0db8",
-        "tm_name": "\u0b85\u0baa\u0bc7 \u0b95\u0bae",
-        "status": "true"
-    },
-    "3-16":{
-        "code": "3-16",
-        "id": 98,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Department of National Archives",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dbd\u0dda\u0d9b\u0db1\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bc1\u0bb5\u0b9f\u0bbf\u0b95\u0bcd\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-17":{
-        "code": "3-17",
-        "id": 99,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Central Cultural Fund",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0b95\u0bb2\u0bbe\u0b9a\u0bbe\u0bb0 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-18":{
-        "code": "3-18",
-        "id": 100,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "National Film Corporation",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0da0\u0dd2\u0dad\u0dca\u200d\u0dbb\u0db4\u0da7\u0dd2 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bbf\u0bb0\u0bc8\u0baa\u0bcd\u0baa\u0b9f\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-19":{
-        "code": "3-19",
-        "id": 101,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Galle Heritage Foundation",
-        "sn_name": "\u0d9c\u0dcf\u0dbd\u0dd4 \u0d8b\u0dbb\u0dd4\u0db8\u0dba \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "\u0b95\u0bbe\u0bb2\u0bbf \u0bae\u0bb0\u0baa\u0bc1\u0bb0\u0bbf\u0bae\u0bc8 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "3-20":{
-        "code": "3-20",
-        "id": 102,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "Sri Lanka Foundation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "\u0b95\u0bbe\u0bb2\u0bbf \u0b89\u0bb0\u0bbf\u0bae\u0bc8 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "GOV":{
-        "code": "GOV",
-        "id": 103,
-        "institute_type": "S.W.R.D. Bandaranayake National Memorial Foundatio",
-        "mother_org": 3,
-        "name": "\u0b8e\u0bb8\u0bcd.\u0b9f\u0baa\u0bcd.\u0b86\u0bb0\u0bcd.\u0b9f\u0bbf.\u0baa\u0ba3\u0bcd\u0b9f\u0bbe\u0bb0\u0ba8\u0bbe\u0baf\u0b95\u0bcd\u0b95 \u0b9e\u0bbe\u0baa\u0b95\u0bbe\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "sn_name": "\"\u0d91\u0dc3\u0dca.\u0da9\u0dca\u0db6\u0dca",
-        "tm_name": "\u0d86\u0dbb\u0dca.\u0da9\u0dd3. \u0db6\u0dab\u0dca\u0da9\u0dcf\u0dbb\u0db1\u0dcf\u0dba\u0d9a \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0db1\u0dd4\u0dc3\u0dca\u0db8\u0dbb\u0dab \u0db4\u0daf\u0db1\u0db8\"",
-        "status": "true"
-    },
-    "3-22":{
-        "code": "3-22",
-        "id": 104,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "National Performing Arts Center (Nelum Pokuna)",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dcf\u0dc3\u0d82\u0d9c\u0dd2\u0d9a \u0d9a\u0dbd\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba(\u0db1\u0dd9\u0dbd\u0dd4\u0db8\u0dca \u0db4\u0ddc\u0d9a\u0dd4\u0dab)",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc1\u0ba3\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd (\u0ba8\u0bc6\u0bb2\u0bc1\u0bae\u0bcd \u0baa\u0bca\u0b95\u0bcd\u0b95\u0bc1\u0ba3)",
-        "status": "true"
-    },
-    "3-23":{
-        "code": "3-23",
-        "id": 105,
-        "institute_type": "GOV",
-        "mother_org": 82,
-        "name": "JR. Jayawardena Center",
-        "sn_name": "\u0da2\u0dda.\u0d86\u0dbb\u0dca. \u0da2\u0dba\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d9a\u0dda\u0db1\u0dca\u0daf\u0dca\u200d\u0dbb\u0dba",
-        "tm_name": "\u0b9c\u0bc7\u0b85\u0bb0\u0bcd\u0bb7\u0bb0.\u0b9c\u0baf\u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0ba9 \u0b95\u0bc7\u0ba8\u0bcd\u0ba4\u0bbf\u0bb0 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4": {
-        "code": "4",
-        "id": 106,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Urban Development Water Supply and Housing Facilities",
-        "sn_name": "\u0db1\u0dcf\u0d9c\u0dbb\u0dd2\u0d9a \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0da2\u0dbd \u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca ",
-        "tm_name": "\u0ba8\u0b95\u0bb0 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bc0\u0bb0\u0bcd\u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bc0\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0bb5\u0b9a\u0ba4\u0bbf\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "4-1":{
-        "code": "4-1",
-        "id": 107,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Urban Development Authority",
-        "sn_name": "\u0db1\u0dcf\u0d9c\u0dbb\u0dd2\u0d9a \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba8\u0b95\u0bb0 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "4-2":{
-        "code": "4-2",
-        "id": 108,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Sri Lanka Land Reclamation and Development Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d89\u0da9\u0db8\u0dca \u0d9c\u0ddc\u0da9\u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0dc4\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1\u0dba \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0bbe\u0ba3\u0bbf \u0ba8\u0bbf\u0bb0\u0bae\u0bcd\u0baa\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae ; \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-3":{
-        "code": "4-3",
-        "id": 109,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Department of National Physical Planning",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db7\u0dde\u0dad\u0dd2\u0d9a \u0dc3\u0dd0\u0dbd\u0dc3\u0dd4\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf\u0baa\u0bcd \u0baa\u0bcc\u0ba4\u0bc0\u0b95\u0ba4\u0bcd \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-4":{
-        "code": "4-4",
-        "id": 110,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "National Water Supply and Drainage Board",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0da2\u0dbd \u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0da2\u0dbd\u0dcf\u0db4\u0dc0\u0dc4\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc0h;\u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0b9f\u0bbf\u0b95\u0bbe\u0bb2\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "4-5":{
-        "code": "4-5",
-        "id": 111,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Department of National Community Supply",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dca\u200d\u0dbb\u0da2\u0dcf \u0dc3\u0dd0\u0db4\u0dba\u0dd4\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bae\u0bc1\u0ba4\u0bbe\u0baf \u0ba8\u0bc0\u0bb0\u0bcd\u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae",
-        "status": "true"
-    },
-    "4-6":{
-        "code": "4-6",
-        "id": 112,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Urban Settlement Development Authority",
-        "sn_name": "\u0db1\u0dcf\u0d9c\u0dbb\u0dd2\u0d9a \u0da2\u0db1\u0dcf\u0dc0\u0dcf\u0dc3 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba8\u0b95\u0bb0\u0b95\u0bcd \u0b95\u0bc1\u0b9f\u0bbf\u0baf\u0bbf\u0bb0\u0bc1\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "4-7":{
-        "code": "4-7",
-        "id": 113,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "National Housing Development Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bc0\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "4-8":{
-        "code": "4-8",
-        "id": 114,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Condominium Management Authority (Common Amenities Board)",
-        "sn_name": "\u0dc3\u0dc4\u0dcf\u0db0\u0dd2\u0db4\u0dad\u0dca\u200d\u0dba \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba(\u0db4\u0ddc\u0daf\u0dd4 \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba)",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1 \u0b86\u0ba4\u0ba9 \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8(\u0baa\u0bca\u0ba4\u0bc1 \u0bb5\u0b9a\u0ba4\u0bbf\u0b95\u0bb3 ;\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "4-9":{
-        "code": "4-9",
-        "id": 115,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Housing Planning and Building Center and its subsidiaries and affiliates",
-        "sn_name": "\u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc3\u0dd0\u0dbd\u0dc3\u0dd4\u0db8\u0dca \u0dc3\u0dc4 \u0d9c\u0ddc\u0da9\u0db1\u0dd0\u0d9c\u0dd2\u0dbd\u0dd2 \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba \u0dc4\u0dcf \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc4\u0dcf \u0d85\u0db1\u0dd4\u0db6\u0daf\u0dca\u0db0 \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0bb5\u0bc0\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bc1\u0bae\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bbf\u0b9f \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba8\u0bbf\u0bb0\u0bcd\u0bb5\u0bbe\u0b95\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0ba8\u0bcd\u0ba4 \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf \u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-10":{
-        "code": "4-10",
-        "id": 116,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Building Materials Corporation Limited",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d9c\u0ddc\u0da9\u0db1\u0dd0\u0d9c\u0dd2\u0dbd\u0dd2 \u0daf\u0dca\u200d\u0dbb\u0dc0\u0dca\u200d\u0dba \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb0\u0bc8. \u0b95\u0b9f\u0bcd\u0b9f\u0bbf\u0b9f\u0baa\u0bcd \u0baa\u0bca\u0bb0\u0bc1\u0b9f\u0bcd\u0b95\u0bb3\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae",
-        "status": "true"
-    },
-    "4-11":{
-        "code": "4-11",
-        "id": 117,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Department of Buildings",
-        "sn_name": "\u0d9c\u0ddc\u0da9\u0db1\u0dd0\u0d9c\u0dd2\u0dbd\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bcd\u0b9f\u0bbf\u0b9f\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-12":{
-        "code": "4-12",
-        "id": 118,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Department of Government Factories",
-        "sn_name": "\u0dbb\u0da2\u0dba\u0dda \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc1\u0dcf\u0dbd\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a\u0bbe\u0b99\u0bcd\u0b95\u0ba4\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb1\u0bcd\u0b9a\u0bbe\u0bb2\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-13":{
-        "code": "4-13",
-        "id": 119,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Construction Industry Development Authority",
-        "sn_name": "\u0d89\u0daf\u0dd2\u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dca \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba8\u0bbf\u0bb0\u0bcd\u0bae\u0bbe\u0ba3\u0b95\u0bcd \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "4-14":{
-        "code": "4-14",
-        "id": 120,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "State Engineering Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bb2\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-15":{
-        "code": "4-15",
-        "id": 121,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "State Development and Construction Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0db1\u0dd2\u0dbb\u0dca\u0db8\u0dcf\u0dab \u0db1\u0dd3\u0dad\u0dd2\u0d9c\u0dad \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b87 \u0ba8\u0bbf\u0bb0\u0bcd\u0bae\u0bbe\u0ba3\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "4-16":{
-        "code": "4-16",
-        "id": 122,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "National Institute of Machinery",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dba\u0db1\u0dca\u0dad\u0dca\u200d\u0dbb\u0ddd\u0db4\u0d9a\u0dbb\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "N \u0ba4 \u0b9a p \u0baf \u0b89 \u0baa \u0b95 \u0bb0 \u0ba3 \u0b99\u0bc2 ; \u0b95 \u0bb3 ; \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bca\u0bb1\u0bbf\u0ba4\u0bcd\u0ba4\u0bca\u0b95\u0bc1\u0ba4\u0bbf\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bbe\u0ba3\u0bcd\u0bae\u0bc8",
-        "status": "true"
-    },
-    "4-17":{
-        "code": "4-17",
-        "id": 123,
-        "institute_type": "GOV",
-        "mother_org": 106,
-        "name": "Ocean View Development (Private) Limited",
-        "sn_name": "\u0d95\u0dc2\u0db1\u0dca \u0dc0\u0dd2\u0dc0\u0dca \u0da9\u0dd2\u0dc0\u0dbd\u0ddc\u0db4\u0dca\u0db8\u0db1\u0dca\u0da7\u0dca (\u0db4\u0dca\u200d\u0dbb\u0dba\u0dd2\u0dc0\u0da7\u0dca) \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0b93\u0bb7\u0ba9\u0bcd \u0bb5\u0bbf\u0bb5\u0bcd \u0b9f\u0bbf\u0bb5\u0bb2\u0baa\u0bcd\u0baa\u0bc6\u0ba3\u0bcd\u0b9f\u0bcd \u0baa\u0bbf\u0bb1\u0bc8\u0bb5\u0bc7\u0b9f\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "5": {
-        "code": "5",
-        "id": 124,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Justice Human Rights & Legal Reforms",
-        "sn_name": "\u0d85\u0db0\u0dd2\u0d9a\u0dbb\u0dab \u0db8\u0dcf\u0db1\u0dc0 \u0dc4\u0dd2\u0db8\u0dd2\u0d9a\u0db8\u0dca \u0dc4\u0dcf \u0db1\u0dd3\u0dad\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dbb\u0dab \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba8\u0bc0\u0ba4\u0bbf \u0bae\u0ba9\u0bbf\u0ba4 \u0b89\u0bb0\u0bbf\u0bae\u0bc8\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0b9f\u0bcd\u0b9f \u0bae\u0bb1\u0bc1\u0b9a\u0bc0\u0bb0\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "5-1":{
-        "code": "5-1",
-        "id": 125,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Attorney General's Department",
-        "sn_name": "\u0db1\u0dd3\u0dad\u0dd2\u0db4\u0dad\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0b9f\u0bcd\u0b9f\u0bae\u0bbe \u0b85\u0ba4\u0bbf\u0baa\u0bbe; \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-2":{
-        "code": "5-2",
-        "id": 126,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Department of Legal Draftsman",
-        "sn_name": "\u0db1\u0dd3\u0dad\u0dd2 \u0d9a\u0dd9\u0da7\u0dd4\u0db8\u0dca\u0db4\u0dad\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0b9f\u0bcd\u0b9f \u0bb5\u0bb0\u0bc8\u0b9e\u0bbe; \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-3":{
-        "code": "5-3",
-        "id": 127,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Debt Relief Board",
-        "sn_name": "\u0dab\u0dba \u0dc3\u0dc4\u0db1\u0daf\u0dcf\u0dba\u0d9a \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dd3\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0ba9\u0bcd \u0ba8\u0bbf\u0bb5\u0bbe\u0bb0\u0ba3 \u0b9a\u0baa\u0bc8\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-4":{
-        "code": "5-4",
-        "id": 128,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Government Analyst's Department",
-        "sn_name": "\u0dbb\u0da2\u0dba\u0dda \u0dbb\u0dc3 \u0db4\u0dbb\u0dd3\u0d9a\u0dca\u0dc2\u0d9a \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a\u0bbe\u0b99\u0bcd\u0b95 \u0b87\u0bb0\u0b9a\u0bbe\u0baf\u0ba9\u0baa\u0bcd \u0baa\u0b95\u0bc1\u0baa\u0bcd\u0baa\u0bbe\u0baf\u0bcd\u0bb5\u0bbe\u0bb3\u0bbe; \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-5":{
-        "code": "5-5",
-        "id": 129,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Office of the Registrar of the Supreme Court",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dda\u0dc2\u0dca\u0da8\u0dcf\u0db0\u0dd2\u0d9a\u0dbb\u0dab\u0dba\u0dda \u0dbb\u0dd9\u0da2\u0dd2\u0dc3\u0dca\u0da7\u0dca\u200d\u0dbb\u0dcf\u0dbb\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b89\u0baf\u0bbe;\u0ba8\u0bc0\u0ba4\u0bbf\u0bae\u0ba9\u0bcd\u0bb1\u0baa\u0bcd \u0baa\u0ba4\u0bbf\u0bb5\u0bbe\u0bb3\u0bbe; \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-6":{
-        "code": "5-6",
-        "id": 130,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Law Commission of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db1\u0dd3\u0dad\u0dd2 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b9a\u0b9f\u0bcd\u0b9f \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "5-7":{
-        "code": "5-7",
-        "id": 131,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Superior Court Complex Management Board",
-        "sn_name": "\u0d8b\u0db4\u0dbb\u0dd2\u0db8\u0dcf\u0db0\u0dd2\u0d9a\u0dbb\u0dab \u0dc3\u0d82\u0d9a\u0dd3\u0dbb\u0dca\u0dab \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b89\u0baf\u0bbe; \u0ba8\u0bc0\u0ba4\u0bbf\u0bae\u0ba9\u0bcd\u0bb1\u0b95\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bbf\u0b9f\u0ba4\u0bcd\u0ba4\u0bca\u0b95\u0bc1\u0ba4\u0bbf \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "5-8":{
-        "code": "5-8",
-        "id": 132,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Sri Lanka Laws Aid Commission",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db1\u0dd3\u0dad\u0dd2 \u0d86\u0db0\u0dcf\u0dbb \u0d9a\u0ddc\u0db8\u0dd2\u0dc3\u0db8",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b9a\u0b9f\u0bcd\u0b9f \u0b89\u0ba4\u0bb5\u0bbf \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "5-9":{
-        "code": "5-9",
-        "id": 133,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Mediation Boards Commission",
-        "sn_name": "\u0dc3\u0db8\u0dae \u0db8\u0dab\u0dca\u0da9\u0dbd \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf\u0bb8\u0bcd\u0ba4 \u0b9a\u0baa\u0bc8\u0b95\u0bb3\u0bcd \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "5-10":{
-        "code": "5-10",
-        "id": 134,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Legal Education Council",
-        "sn_name": "\u0db1\u0dd3\u0dad\u0dd2 \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0b9f\u0bcd\u0b9f\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "5-11":{
-        "code": "5-11",
-        "id": 135,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Department of Public Trustee",
-        "sn_name": "\u0db8\u0dc4\u0dcf \u0db7\u0dcf\u0dbb\u0d9a\u0dcf\u0dbb \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0bae\u0bcd\u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0baa\u0bcd \u0baa\u0bca\u0bb1\u0bc1\u0baa\u0bcd\u0baa\u0bbe\u0bb3\u0bbe; \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-12":{
-        "code": "5-12",
-        "id": 136,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Sri Lanka Commercial Settlement Center",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dcf\u0dab\u0dd2\u0da2 \u0dc3\u0db8\u0dae \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb5\u0bbe\u0ba3\u0bbf\u0baa \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf\u0bb8\u0bcd\u0ba4 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-13":{
-        "code": "5-13",
-        "id": 137,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Sri Lanka International Arbitration Center (Guarantee) Limited",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d89\u0db1\u0dca\u0da7\u0dbb\u0dca\u0db1\u0dd0\u0dc2\u0db1\u0dbd\u0dca \u0d86\u0dbb\u0dca\u0db6\u0dd2\u0da7\u0dca\u200d\u0dbb\u0dda\u0dc2\u0db1\u0dca \u0dc3\u0dd9\u0db1\u0dca\u0da7\u0dbb\u0dca (\u0d9c\u0dbb\u0db1\u0dca\u0da7\u0dd2) \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b87\u0ba9\u0bcd\u0b9f\u0ba8\u0bb7\u0ba9\u0bb2\u0bcd \u0b86\u0bb0\u0bcd\u0baa\u0bbf\u0b9f\u0bc7\u0bb7\u0ba9\u0bcd \u0b9a\u0bc6\u0ba9\u0bcd\u0bb0\u0bb0\u0bcd (\u0b95\u0bb0\u0ba9\u0bcd\u0b9f\u0bbf) \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "5-14":{
-        "code": "5-14",
-        "id": 138,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Department of Prisons",
-        "sn_name": "\u0db6\u0db1\u0dca\u0db0\u0db1\u0dcf\u0d9c\u0dcf\u0dbb \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bc8\u0b9a\u0bcd\u0b9a\u0bbe\u0bb2\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-15":{
-        "code": "5-15",
-        "id": 139,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Department of Community Based Corrections",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0da2\u0dcf \u0db4\u0dcf\u0daf\u0d9a \u0dc0\u0dd2\u0dc1\u0ddd\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0b85\u0b9f\u0bbf\u0baa\u0bcd\u0baa\u0b9f\u0bc8\u0baf\u0bbf\u0bb2\u0bbe\u0ba9 \u0b9a\u0bc0h;\u0ba4\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-16":{
-        "code": "5-16",
-        "id": 140,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Youth Correctional Training School",
-        "sn_name": "\u0dad\u0dbb\u0dd4\u0dab \u0dc0\u0dd2\u0dc1\u0ddd\u0db0\u0db1 \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0db4\u0dcf\u0dc3\u0dd0\u0dbd",
-        "tm_name": "\u0b87\u0bb3\u0ba8\u0bcd\u0ba4\u0bb5\u0bb1\u0bbe\u0bb3\u0bbf\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf\u0baa\u0bcd \u0baa\u0bbe\u0b9f\u0b9a\u0bbe\u0bb2\u0bc8\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "5-17":{
-        "code": "5-17",
-        "id": 141,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Office of the Commissioner General of Rehabilitation",
-        "sn_name": "\u0db4\u0dd4\u0db1\u0dbb\u0dd4\u0dad\u0dca\u0dae\u0dcf\u0db4\u0db1 \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0da2\u0db1\u0dbb\u0dcf\u0dbd\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0bc1\u0ba9\u0bbe;\u0bb5\u0bbe\u0bb4\u0bcd\u0bb5\u0bb3\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bbe\u0bb3\u0bbe; \u0ba8\u0bbe\u0baf\u0b95\u0bae\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-18":{
-        "code": "5-18",
-        "id": 142,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Office for National Unity and Reconciliation",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db8\u0d9c\u0dd2\u0dba \u0dc4\u0dcf \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0dc3\u0db1\u0dca\u0db0\u0dcf\u0db1\u0dba \u0dc3\u0db3\u0dc4\u0dcf \u0dc0\u0db1 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b92\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b92\u0bb0\u0bc1\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd (\u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bbf\u0ba9\u0bcd \u0baa\u0ba3\u0bbf\u0b95\u0bb3\u0bc8\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb1\u0bcd\u0baa\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0ba4\u0bb1\u0bcd\u0b95\u0bbe\u0ba9 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0b86\u0b95\u0bc1\u0bae\u0bcd)",
-        "status": "true"
-    },
-    "5-19":{
-        "code": "5-19",
-        "id": 143,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Office of Missing Persons",
-        "sn_name": "\u0d85\u0dad\u0dd4\u0dbb\u0dd4\u0daf\u0dc4\u0db1\u0dca \u0dc0\u0dd6 \u0dad\u0dd0\u0db1\u0dd0\u0dad\u0dca\u0dad\u0db1\u0dca \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0db3 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b95\u0bbe\u0ba3\u0bbe\u0bae\u0bb2\u0bcd\u0baa\u0bcb\u0ba9\u0bcb\u0bb0\u0bcd \u0b86\u0b9f\u0bcd\u0b95\u0bb3\u0bcd \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "5-20":{
-        "code": "5-20",
-        "id": 144,
-        "institute_type": "GOV",
-        "mother_org": 124,
-        "name": "Office for Reparations",
-        "sn_name": "\u0dc4\u0dcf\u0db1\u0dd2\u0db4\u0dd6\u0dbb\u0dca\u0dab \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb4\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "6": {
-        "code": "6",
-        "id": 145,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Community Empowerment and Estate Infrastructure Development",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0da2\u0dcf \u0dc3\u0dc0\u0dd2\u0db6\u0dbd\u0d9c\u0dd0\u0db1\u0dca\u0dc0\u0dd3\u0db8\u0dca \u0dc3\u0dc4 \u0dc0\u0dad\u0dd4 \u0dba\u0da7\u0dd2\u0dad\u0dbd \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 ",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0bb5\u0bb2\u0bc1\u0bb5\u0bc2\u0b9f\u0bcd\u0b9f\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0b89\u0b9f\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0bb5\u0b9a\u0ba4\u0bbf\u0b95\u0bb3\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "6-1":{
-        "code": "6-1",
-        "id": 146,
-        "institute_type": "GOV",
-        "mother_org": 145,
-        "name": "New Village Authority for Plantation Zone",
-        "sn_name": "\u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0d9a\u0dbd\u0dcf\u0db4\u0dba \u0dc3\u0db3\u0dc4\u0dcf \u0dc0\u0dd6 \u0db1\u0dc0 \u0d9c\u0db8\u0dca\u0db8\u0dcf\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0bb5\u0bb2\u0baf\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0baa\u0bc1\u0ba4\u0bbf\u0baf \u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "6-2":{
-        "code": "6-2",
-        "id": 147,
-        "institute_type": "GOV",
-        "mother_org": 145,
-        "name": "Estate sector self employment cycle fund",
-        "sn_name": "\u0dc0\u0dad\u0dd4 \u0d85\u0d82\u0dc1\u0dba\u0dda \u0dc3\u0dca\u0dc0\u0dba\u0d82 \u0dbb\u0dd0\u0d9a\u0dd2\u0dba\u0dcf \u0da0\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0dba \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0bb5\u0bb2\u0baf\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0baa\u0bc1\u0ba4\u0bbf\u0baf \u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "6-3":{
-        "code": "6-3",
-        "id": 148,
-        "institute_type": "GOV",
-        "mother_org": 145,
-        "name": "Plantation Human Development Trust",
-        "sn_name": "\u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0db8\u0dcf\u0db1\u0dc0 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db7\u0dcf\u0dbb\u0dba",
-        "tm_name": "\u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0bae\u0ba9\u0bbf\u0ba4 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bae\u0bcd\u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0baa\u0bcd\u0baa\u0bca\u0bb1\u0bc1\u0baa\u0bcd\u0baa\u0bc1",
-        "status": "true"
-    },
-    "6-4":{
-        "code": "6-4",
-        "id": 149,
-        "institute_type": "GOV",
-        "mother_org": 145,
-        "name": "Saumyamoorthy Thondaman Memorial Foundation",
-        "sn_name": "\u0dc3\u0dde\u0db8\u0dca\u200d\u0dba\u0db8\u0dd6\u0dbb\u0dca\u0dad\u0dd2 \u0dad\u0ddc\u0dab\u0dca\u0da9\u0db8\u0dcf\u0db1\u0dca \u0d85\u0db1\u0dd4\u0dc3\u0dca\u0db8\u0dbb\u0dab \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "\u0b9a\u0bcc\u0bae\u0bbf\u0baf\u0bae\u0bc2h;\u0ba4\u0bcd\u0ba4\u0bbf \u0ba4\u0bca\u0ba3\u0bcd\u0b9f\u0bae\u0bbe\u0ba9\u0bcd \u0b9e\u0bbe\u0baa\u0b95\u0bbe\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "6-5":{
-        "code": "6-5",
-        "id": 150,
-        "institute_type": "GOV",
-        "mother_org": 145,
-        "name": "Resettlement Authority",
-        "sn_name": "\u0db1\u0dd0\u0dc0\u0dad \u0db4\u0daf\u0dd2\u0d82\u0da0\u0dd2 \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0bae\u0bc0\u0bb3\u0bcd\u0b95\u0bc1\u0b9f\u0bbf\u0baf\u0bc7\u0bb1\u0bcd\u0bb1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "6-6":{
-        "code": "6-6",
-        "id": 151,
-        "institute_type": "GOV",
-        "mother_org": 145,
-        "name": "Grama Shakthi Bureau",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8 \u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbe\u0bae \u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "7": {
-        "code": "7",
-        "id": 152,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Foreign Relations",
-        "sn_name": "\u0dc0\u0dd2\u0daf\u0dda\u0dc1 \u0dc3\u0db6\u0db3\u0dad\u0dcf \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bb5\u0bcc\u0bbf\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b89\u0bb1\u0bb5\u0bc1\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "7-1":{
-        "code": "7-1",
-        "id": 153,
-        "institute_type": "GOV",
-        "mother_org": 152,
-        "name": "Diplomatic Missions in abroad",
-        "sn_name": "\u0dc0\u0dd2\u0daf\u0dda\u0dc1\u0d9c\u0dad \u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0daf\u0dd6\u0dad \u0db8\u0dab\u0dca\u0da9\u0dbd",
-        "tm_name": "\u0bb5\u0bc6\u0bb3\u0bbf\u0ba8\u0bbe\u0b9f\u0bc1\u0b95\u0bb3\u0bbf\u0bb2\u0bc1\u0bb3\u0bcd\u0bb3 \u0ba4\u0bc2 \u0ba4\u0bb0\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0b95\u0bcd \u0b95\u0bc1\u0bb4\u0bc1\u0b95\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "7-2":{
-        "code": "7-2",
-        "id": 154,
-        "institute_type": "GOV",
-        "mother_org": 152,
-        "name": "Lakshman Kadirgamar Institute for International Relations and Strategic Studies",
-        "sn_name": "\u0dbd\u0d9a\u0dca\u0dc2\u0dca\u0db8\u0db1\u0dca \u0d9a\u0daf\u0dd2\u0dbb\u0dca\u0d9c\u0dcf\u0db8\u0dbb\u0dca \u0da2\u0dcf\u0dad\u0dca\u200d\u0dba\u0db1\u0dca\u0dad\u0dbb \u0dc3\u0db6\u0db3\u0dad\u0dcf \u0dc4\u0dcf \u0d9a\u0dca\u200d\u0dbb\u0db8\u0ddd\u0db4\u0dcf\u0dba \u0d85\u0db0\u0dca\u200d\u0dba\u0dba\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bb2\u0b95\u0bcd\u0bb8\u0bcd\u0bae\u0ba9\u0bcd \u0b95\u0ba4\u0bbfh;\u0b95\u0bbe\u0bae\u0bbe; \u0b9a\u0bbe;\u0bb5\u0ba4\u0bc7\u0b9a \u0b89\u0bb1\u0bb5\u0bc2\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bbf\u0bb1\u0bae\u0bc1\u0bb1\u0bc8 \u0b95\u0bb1\u0bcd\u0b95\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "7-3":{
-        "code": "7-3",
-        "id": 155,
-        "institute_type": "GOV",
-        "mother_org": 152,
-        "name": "National Oceanic Affairs Committee Secretariat",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db8\u0dd4\u0daf\u0dca\u200d\u0dbb \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d9a\u0dcf\u0dbb\u0d9a \u0dc3\u0db7\u0dcf \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf\u0b95\u0bcd \u0b95\u0b9f\u0bb2\u0bcd\u0b9a\u0bbe\u0bb0\u0bcd \u0ba8\u0b9f\u0bb5\u0b9f\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb1\u0bcd\u0b95\u0bc1\u0bb4\u0bc1\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8": {
-        "code": "8",
-        "id": 156,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Skills Development Employment and Labour Relations",
-        "sn_name": "\u0db1\u0dd2\u0db4\u0dd4\u0db1\u0dad\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dbb\u0dd0\u0d9a\u0dd3\u0dbb\u0d9a\u0dca\u0dc2\u0dcf \u0dc4\u0dcf \u0d9a\u0db8\u0dca\u0d9a\u0dbb\u0dd4 \u0dc3\u0db6\u0daf\u0dad\u0dcf ",
-        "tm_name": "\u0ba4\u0bbf\u0bb1\u0ba9\u0bcd \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bc7\u0bb2\u0bc8\u0bb5\u0bbe\u0baf\u0bcd\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bbe\u0bb3\u0bb0\u0bcd \u0b89\u0bb1\u0bb5\u0bc1\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-1":{
-        "code": "8-1",
-        "id": 157,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Tertiary and Vocational Education Commission",
-        "sn_name": "\u0dad\u0dd8\u0dad\u0dd3\u0dba\u0dd2\u0d9a \u0dc4\u0dcf \u0dc0\u0dd8\u0dad\u0dca\u0dad\u0dd3\u0dba \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc2\u0ba9\u0bcd\u0bb1\u0bbe\u0bae\u0bcd\u0ba8\u0bbf\u0bb2\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbe\u0bb4\u0bcd\u0b95\u0bcd\u0b95\u0bc8\u0ba4\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb1\u0bcd\u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "8-2":{
-        "code": "8-2",
-        "id": 158,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Vocational Training Authority of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd8\u0dad\u0dca\u0dad\u0dd3\u0dba \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba4\u0bca\u0bb4\u0bbf\u0bb1\u0bcd\u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "8-3":{
-        "code": "8-3",
-        "id": 159,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "National Apprentice & Industrial Training Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d86\u0db0\u0dd4\u0db1\u0dd2\u0d9a\u0dad\u0dca\u0dc0 \u0dc4\u0dcf \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0baf\u0bbf\u0bb2\u0bc1\u0ba8\u0bbe;\u0b87 \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb1\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "8-4":{
-        "code": "8-4",
-        "id": 160,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Skills Development Fund Limited",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0db1\u0dd2\u0db4\u0dd4\u0dab\u0dad\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0ba4\u0bbf\u0bb1\u0ba9\u0bcd\u0b95\u0bb3\u0bcd; \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-5":{
-        "code": "8-5",
-        "id": 161,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Ceylon German Technical Training Institute",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0da2\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dd4 \u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0d85\u0db7\u0dca\u200d\u0dba\u0dcf\u0dc3 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 - \u0b9c\u0bcb;\u0bae\u0ba9\u0bbf \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0baa\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-6":{
-        "code": "8-6",
-        "id": 162,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Sri Lanka Institute of Printing",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db8\u0dd4\u0daf\u0dca\u200d\u0dbb\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b85\u0b9a\u0bcd\u0b9a\u0b95 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-7":{
-        "code": "8-7",
-        "id": 163,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "National Institute of Technical Education",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-8":{
-        "code": "8-8",
-        "id": 164,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Department of Technical Education and Training",
-        "sn_name": "\u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc4\u0dcf \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-9":{
-        "code": "8-9",
-        "id": 165,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Department of Labor",
-        "sn_name": "\u0d9a\u0db8\u0dca\u0d9a\u0dbb\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-10":{
-        "code": "8-10",
-        "id": 166,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "National Institute of Labor Studies",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc1\u0dca\u200d\u0dbb\u0db8 \u0d85\u0db0\u0dca\u200d\u0dba\u0dba\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bca\u0bb4\u0bbf\u0bb1\u0bcd \u0b95\u0bb1\u0bcd\u0b95\u0bc8\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-11":{
-        "code": "8-11",
-        "id": 167,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Employees Provident Fund",
-        "sn_name": "\u0dc3\u0dda\u0dc0\u0d9a \u0d85\u0dbb\u0dca\u0dae\u0dc3\u0dcf\u0db0\u0d9a \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b8a\u0bb4\u0bbf\u0baf\u0bbe; \u0b9a\u0bc7\u0bae\u0bb2\u0bbe\u0baa \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-12":{
-        "code": "8-12",
-        "id": 168,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "National Institute of Occupational Safety and Health",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dd8\u0dad\u0dca\u0dad\u0dd3\u0dba \u0dc3\u0dd4\u0dbb\u0d9a\u0dca\u0dc2\u0dd2\u0dad\u0dad\u0dcf \u0dc3\u0dc4 \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-13":{
-        "code": "8-13",
-        "id": 169,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Office of the Commissioner for Workmen's Compensation",
-        "sn_name": "\u0d9a\u0db8\u0dca\u0d9a\u0dbb\u0dd4 \u0dc0\u0db1\u0dca\u0daf\u0dd2 \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bbe\u0bb3\u0bbe; \u0ba8\u0b9f\u0bcd\u0b9f\u0b88\u0b9f\u0bcd\u0b9f\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bbe\u0bb3\u0bbe; \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-14":{
-        "code": "8-14",
-        "id": 170,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Shrama Vasana Fund",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0db8 \u0dc0\u0dcf\u0dc3\u0db1\u0dcf \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b9a\u0bbf\u0bb0\u0bae \u0bb5\u0bbe\u0b9a\u0ba9\u0bbe \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-15":{
-        "code": "8-15",
-        "id": 171,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Department of Manpower and Employment",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd2\u0dc3\u0dca\u0db6\u0dbd \u0dc4\u0dcf \u0dbb\u0dd0\u0d9a\u0dd3\u0dbb\u0d9a\u0dca\u0dc2\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0ba9\u0bbf\u0ba4\u0bb5\u0bb2\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-16":{
-        "code": "8-16",
-        "id": 172,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Sri Lanka Job Net Ltd",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0dd0\u0d9a\u0dd2\u0dba\u0dcf \u0db4\u0dd2\u0dba\u0dc3",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb0\u0bc6\u0b95\u0bcd\u0b95\u0bbf\u0baf\u0bbe \u0baa\u0bbf\u0baf\u0bb8",
-        "status": "true"
-    },
-    "8-17":{
-        "code": "8-17",
-        "id": 173,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Sri Lanka Bureau of Foreign Employment",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd2\u0daf\u0dda\u0dc1 \u0dc3\u0dda\u0dc0\u0dcf \u0db1\u0dd2\u0dba\u0dd4\u0d9a\u0dca\u0dad\u0dd2 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb5\u0bc6\u0bb3\u0bbf\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bc7\u0bb2\u0bc8\u0bb5\u0bbe\u0baf\u0bcd\u0baa\u0bcd\u0baa\u0bc1\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "8-18":{
-        "code": "8-18",
-        "id": 174,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "Sri Lanka Foreign Employment Agency",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd2\u0daf\u0dda\u0dc1 \u0dbb\u0dd0\u0d9a\u0dd2\u0dba\u0dcf \u0db1\u0dd2\u0dba\u0ddd\u0da2\u0dd2\u0dad\u0dcf\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb5\u0bc6\u0bb3\u0bbf\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bc7\u0bb2\u0bc8\u0bb5\u0bbe\u0baf\u0bcd\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bc1\u0b95\u0bb5\u0bb0\u0bbe\u0ba3\u0bcd\u0bae\u0bc8",
-        "status": "true"
-    },
-    "8-19":{
-        "code": "8-19",
-        "id": 175,
-        "institute_type": "GOV",
-        "mother_org": 156,
-        "name": "National Productivity Secretariat",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db5\u0dbd\u0daf\u0dcf\u0dba\u0dd2\u0dad\u0dcf \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd\u0ba4\u0bbf\u0bb1\u0ba9\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae",
-        "status": "true"
-    },
-    "9": {
-        "code": "9",
-        "id": 176,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Fisheries and Aquatic Resources",
-        "sn_name": "\u0db0\u0dd3\u0dc0\u0dbb \u0dc4\u0dcf \u0da2\u0dbd\u0da2 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0b9f\u0bb1\u0bcd\u0bb1\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0bc0\u0bb0\u0b95 \u0bb5\u0bb3\u0bae\u0bc2\u0bb2\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "9-1":{
-        "code": "9-1",
-        "id": 177,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "Department of Fisheries and Aquatic Resources",
-        "sn_name": "\u0db0\u0dd3\u0dc0\u0dbb \u0dc3\u0dc4 \u0da2\u0dbd\u0da2 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bb1\u0bcd\u0bb1\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0bc0\u0bb0\u0b95 \u0bb5\u0bb3\u0bae\u0bc2\u0bb2\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "9-2":{
-        "code": "9-2",
-        "id": 178,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "National Aquaculture Development Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0da2\u0dbd\u0da2\u0dd3\u0dc0\u0dd3 \u0dc0\u0d9c\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc0h; \u0b89\u0baf\u0bbf\u0bb0\u0bbf\u0ba9 \u0bb5\u0bb3\u0bbe;\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "9-3":{
-        "code": "9-3",
-        "id": 179,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "Ceylon Fisheries Harbor Corporation",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0db0\u0dd3\u0dc0\u0dbb \u0dc0\u0dbb\u0dcf\u0dba \u0db1\u0dd3\u0dad\u0dd2\u0d9c\u0dad \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0b9f\u0bb1\u0bcd\u0bb1\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8\u0bae\u0bc1\u0b95\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "9-4":{
-        "code": "9-4",
-        "id": 180,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "The Seanor Foundation",
-        "sn_name": "\u0dc3\u0dd3/\u0dc3. \u0dc3\u0dd3\u0db1\u0ddd\u0dbb\u0dca \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b9a\u0bc0-\u0ba8\u0bcbh; \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "9-5":{
-        "code": "9-5",
-        "id": 181,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "Ceylon Fisheries Corporation",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0db0\u0dd3\u0dc0\u0dbb \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0b9f\u0bb1\u0bcd\u0bb1\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "9-6":{
-        "code": "9-6",
-        "id": 182,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "National Aquatic Resources Research and Development Institute",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0da2\u0dbd\u0da2 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc4\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc0\u0bb0\u0b95 \u0bb5\u0bb3\u0bae\u0bc2\u0bb2\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf\u0b87 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "9-7":{
-        "code": "9-7",
-        "id": 183,
-        "institute_type": "GOV",
-        "mother_org": 176,
-        "name": "North C Limited",
-        "sn_name": "\u0db1\u0ddd\u0dbb\u0dca\u0dad\u0dca \u0dc3\u0dd3 \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0ba8\u0bcb\u0bb0\u0bcd\u0ba4\u0bcd \u0b9a\u0bbf \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "10":{
-        "code": "10",
-        "id": 184,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Women & Child Affairs and Social Security",
-        "sn_name": "\u0d9a\u0dcf\u0db1\u0dca\u0dad\u0dcf \u0dc5\u0db8\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0dc3\u0dc4 \u0dc3\u0db8\u0dcf\u0da2 \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bae\u0b95\u0bb3\u0bbf\u0bb0\u0bcd \u0b9a\u0bbf\u0bb1\u0bc1\u0bb5\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bae\u0bc2\u0b95 \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "10-1":{
-        "code": "10-1",
-        "id": 185,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Sri Lanka Women's Bureau",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9a\u0dcf\u0db1\u0dca\u0dad\u0dcf \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0b95\u0bb3\u0bbf \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-2":{
-        "code": "10-2",
-        "id": 186,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Committee on Women",
-        "sn_name": "\u0d9a\u0dcf\u0db1\u0dca\u0dad\u0dcf\u0dc0\u0db1\u0dca \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0db8\u0dd2\u0da7\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0b95\u0bb3\u0bbf \u0ba4\u0bca\u0b9f\u0bbe;\u0baa\u0bbe\u0ba9 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "10-3":{
-        "code": "10-3",
-        "id": 187,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Department of Probation and Child Care Services",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0ba9\u0bcd\u0ba8\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bbf\u0bb1\u0bc1\u0bb5\u0bbe \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0b9a\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-4":{
-        "code": "10-4",
-        "id": 188,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Child Protection Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bbf\u0bb1\u0bc1\u0bb5\u0bbe \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "10-5":{
-        "code": "10-5",
-        "id": 189,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Children's Secretariat",
-        "sn_name": "\u0dc5\u0db8\u0dcf \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bc1\u0bb5\u0bbe \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-6":{
-        "code": "10-6",
-        "id": 190,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Institute of Social Development",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bae\u0bc2\u0b95 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-7":{
-        "code": "10-7",
-        "id": 191,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Department of Samurdhi Development",
-        "sn_name": "\u0dc3\u0db8\u0dd8\u0daf\u0dca\u0db0\u0dd2 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-8":{
-        "code": "10-8",
-        "id": 192,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Rural Development Training and Research Institute",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0dc4\u0dcf \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbe\u0bae \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b87 \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-9":{
-        "code": "10-9",
-        "id": 193,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Department of Social Services",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-10":{
-        "code": "10-10",
-        "id": 194,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Council for Elders and National Secretariat for Elders",
-        "sn_name": "\u0dc0\u0dd0\u0da9\u0dd2\u0dc4\u0dd2\u0da7\u0dd2 \u0dad\u0dd0\u0db1\u0dd0\u0dad\u0dca\u0dad\u0db1\u0dca \u0dc3\u0daf\u0dc4\u0dcf \u0dc0\u0db1 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db7\u0dcf\u0dc0 \u0dc3\u0dc4 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dd0\u0da9\u0dd2\u0dc4\u0dd2\u0da7\u0dd2 \u0db8\u0dc4 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0bb5\u0baf\u0ba4\u0bc1 \u0bae\u0bc1\u0ba4\u0bbfh;\u0ba8\u0bcd\u0ba4 \u0b86\u0b9f\u0bcd\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bc1\u0bae\u0bcd \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0baf\u0ba4\u0bc1 \u0bae\u0bc1\u0ba4\u0bbfh;\u0ba8\u0bcd\u0ba4\u0bcbh \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-11":{
-        "code": "10-11",
-        "id": 195,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Secretariat for Persons with Disabilities",
-        "sn_name": "\u0d86\u0db6\u0dcf\u0db0 \u0dc3\u0dc4\u0dd2\u0dad \u0dad\u0dd0\u0db1\u0dd0\u0dad\u0dca\u0dad\u0db1\u0dca \u0dc3\u0daf\u0dc4\u0dcf \u0dc0\u0db1 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0dc4\u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0bb5\u0bb2\u0ba4\u0bc1\u0b95\u0bc1\u0bb1\u0bc8\u0ba8\u0bcd\u0ba4 \u0b86\u0b9f\u0bcd\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bca\u0ba4\u0bc1\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-12":{
-        "code": "10-12",
-        "id": 196,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Council for Persons with Disabilities",
-        "sn_name": "\u0d86\u0db6\u0dcf\u0db0 \u0dc3\u0dc4\u0dd2\u0dad \u0dad\u0dd0\u0db1\u0dd0\u0dad\u0dca\u0dad\u0db1\u0dca \u0dc3\u0daf\u0dc4\u0dcf \u0dc0\u0db1 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0ba4\u0bc1\u0b95\u0bc1\u0bb1\u0bc8\u0ba8\u0bcd\u0ba4 \u0b86\u0b9f\u0bcd\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-13":{
-        "code": "10-13",
-        "id": 197,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "National Trust Fund for Protecting Children",
-        "sn_name": "\u0daf\u0dbb\u0dd4\u0dc0\u0db1\u0dca \u0dc3\u0dd4\u0dbb\u0d9a\u0dd2\u0db8\u0dd4 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db7\u0dcf\u0dbb \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bc1\u0bb5\u0bb0\u0bcd\u0b95\u0bb3\u0bc8\u0baa\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bcb\u0bae\u0bcd \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "10-14":{
-        "code": "10-14",
-        "id": 198,
-        "institute_type": "GOV",
-        "mother_org": 184,
-        "name": "Social Security Board",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2 \u0d86\u0dbb\u0d9a\u0dc2\u0d9a \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95\u0baa\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "11":{
-        "code": "11",
-        "id": 199,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Health and Indigenous Medical Services",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bb5\u0bc8\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "11-1":{
-        "code": "11-1",
-        "id": 200,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Department of Health Services",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-2":{
-        "code": "11-2",
-        "id": 201,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Sri Jayewardenepura General Hospital",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0da2\u0dba\u0dc0\u0dbb\u0dca\u0db0\u0db1\u0db4\u0dd4\u0dbb \u0db8\u0dc4 \u0dbb\u0ddd\u0dc4\u0dbd",
-        "tm_name": "\u0bb8\u0bcd\u0bb0\u0bc0 \u0b9c\u0baf\u0bb5\u0bbe\u0ba4\u0ba9\u0baa\u0bc1\u0bb0 \u0baa\u0bca\u0ba4\u0bc1 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8",
-        "status": "true"
-    },
-    "11-3":{
-        "code": "11-3",
-        "id": 202,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Vijaya Kumaratunga Memorial Hospital",
-        "sn_name": "\u0dc0\u0dd2\u0da2\u0dba \u0d9a\u0dd4\u0db8\u0dcf\u0dbb\u0dab\u0dad\u0dd4\u0d82\u0d9c \u0d85\u0db1\u0dd4\u0dc3\u0dca\u0db8\u0dbb\u0dab \u0dbb\u0ddd\u0dc4\u0dbd",
-        "tm_name": "\u0bb5\u0bbf\u0b9c\u0baf \u0b95\u0bc1\u0bae\u0bbe\u0bb0\u0ba3\u0ba4\u0bc1\u0b99\u0bcd\u0b95 \u0b9e\u0bbe\u0baa\u0b95\u0bbeh;\u0ba4\u0bcd\u0ba4 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8\u0b87 \u0b9a\u0bc0\u0ba4\u0bc1\u0bb5\u0bc8",
-        "status": "true"
-    },
-    "11-4":{
-        "code": "11-4",
-        "id": 203,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "State Pharmaceutical Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0d96\u0dc2\u0db0 \u0db1\u0dd3\u0dad\u0dd2\u0d9c\u0dad \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0bae\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0b95\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-5":{
-        "code": "11-5",
-        "id": 204,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "State Pharmaceutical Manufacturing Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0d96\u0dc2\u0db0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0bae\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bbe\u0b95\u0bcd\u0b95\u0bb2\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-6":{
-        "code": "11-6",
-        "id": 205,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "National Drug Regulatory Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d96\u0dc2\u0db0 \u0db1\u0dd2\u0dba\u0dcf\u0db8\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bae\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bbe\u0b95\u0bcd\u0b95\u0bb2\u0bcd \u0b92\u0bb4\u0bc1\u0b99\u0bcd\u0b95\u0bc1\u0bb1\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0b95\u0bc8 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "11-8":{
-        "code": "11-8",
-        "id": 206,
-        "institute_type": "teaching and government hospitals \ All national",
-        "mother_org": 0,
-        "name": "\u0b9a\u0b95\u0bb2 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bcb\u0ba4\u0ba9\u0bbe \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb1\u0bbf\u0ba4\u0bcd\u0ba4\u0bc1\u0bb0\u0bc8\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b85\u0bb0\u0b9a\u0bbe\u0b99\u0bcd\u0b95 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8\u0b95\u0bb3\u0bcd",
-        "sn_name": "\"\u0dc3\u0dd2\u0dba\u0dbd\u0dd4\u0db8 \u0da2\u0dcf\u0dad\u0dd2\u0d9a",
-        "tm_name": " \u0dc1\u0dd2\u0d9a\u0dca\u0dc2\u0dab \u0dc4\u0dcf \u0dbb\u0da2\u0dba\u0dda \u0dbb\u0ddd\u0dc4\u0dbd\u0dca\"",
-        "status": "true"
-    },
-    "11-8":{
-        "code": "11-8",
-        "id": 207,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "National Health Council",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-9":{
-        "code": "11-9",
-        "id": 208,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Medical Research Institute",
-        "sn_name": "\u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-10":{
-        "code": "11-10",
-        "id": 209,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "National Institute of Health Sciences",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-11":{
-        "code": "11-11",
-        "id": 210,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Ashroff Memorial Hospital",
-        "sn_name": "\u0d85\u0dc2\u0dca\u0dbb\u0ddc\u0dc6\u0dca \u0d85\u0db1\u0dd4\u0dc3\u0dca\u0db8\u0dbb\u0dab \u0dbb\u0ddd\u0dc4\u0dbd",
-        "tm_name": "\u0b85\u0bb7\u0bcd\u0bb0\u0baa\u0bcd \u0b9e\u0bbe\u0baa\u0b95\u0bbeh;\u0ba4\u0bcd\u0ba4 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8",
-        "status": "true"
-    },
-    "11-12":{
-        "code": "11-12",
-        "id": 211,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "School of Medical Laboratory Technology",
-        "sn_name": "\u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dbb\u0dc3\u0dcf\u0dba\u0db1\u0dcf\u0d9c\u0dcf\u0dbb \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0db4\u0dcf\u0dc3\u0dbd",
-        "tm_name": "\u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0b86\u0baf\u0bcd\u0bb5\u0bc2\u0b95\u0bc2\u0b9f \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0baa\u0bcd \u0baa\u0bbe\u0b9f\u0b9a\u0bbe\u0bb2\u0bc8",
-        "status": "true"
-    },
-    "11-13":{
-        "code": "11-13",
-        "id": 212,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Sri Lanka Medical Council",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-14":{
-        "code": "11-14",
-        "id": 213,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Medical Council of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb2\u0bc2 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-15":{
-        "code": "11-15",
-        "id": 214,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "National Health Development Fund",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-16":{
-        "code": "11-16",
-        "id": 215,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Private Medical Council Council",
-        "sn_name": "\u0db4\u0dde\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0d86\u0dba\u0dad\u0db1 \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0ba9\u0bbf\u0baf\u0bbe \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-17":{
-        "code": "11-17",
-        "id": 216,
-        "institute_type": "Leakage and Transplantation \ National Institute of Pediatrics",
-        "mother_org": 0,
-        "name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0bbf\u0bb1\u0bc1\u0ba8\u0bc0\u0bb0\u0b95 \u0b9a\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bc0\u0bb3\u0bcd\u0ba8\u0b9f\u0bc1\u0b95\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "sn_name": "\"\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dd8\u0d9a\u0dca\u0d9a\u0dc0\u0dda\u0daf\u0dd3",
-        "tm_name": " \u0d9a\u0dcf\u0db1\u0dca\u0daf\u0dd4 \u0db4\u0dd9\u0dbb\u0dd3\u0db8 \u0dc4\u0dcf \u0db6\u0daf\u0dca\u0db0 \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0d86\u0dba\u0dad\u0db1\u0dba\"",
-        "status": "true"
-    },
-    "11-18":{
-        "code": "11-18",
-        "id": 217,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Sri Lanka Thriposha Limited",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dad\u0dca\u200d\u0dbb\u0dd3\u0db4\u0ddd\u0dc2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0ba4\u0bbf\u0bb0\u0bbf\u0baa\u0bcb\u0b9a \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "11-19":{
-        "code": "11-19",
-        "id": 218,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "National Authority on Tobacco and Alcohol",
-        "sn_name": "\u0daf\u0dd4\u0db8\u0dca\u0d9a\u0ddc\u0dc5 \u0dc3\u0dc4 \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dcf\u0dbb \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0baa\u0bc1\u0b95\u0bc8\u0baf\u0bbf\u0bb2\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bcb\u0ba4\u0bc8\u0baa\u0bcd\u0baa\u0bca\u0bb0\u0bc1\u0bb3\u0bcd \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "11-20":{
-        "code": "11-20",
-        "id": 219,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Department of Ayurveda",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b86\u0baf\u0bc2h;\u0bb5\u0bc7\u0ba4\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-21":{
-        "code": "11-21",
-        "id": 220,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Sri Lanka Ayurvedic Drugs Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0d96\u0dc2\u0db0 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b86\u0baf\u0bc2\u0bb5\u0bc7\u0ba4 \u0bae\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bc1\u0baa\u0bcd\u0baa\u0bca\u0bb0\u0bc1\u0bb3\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-22":{
-        "code": "11-22",
-        "id": 221,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Ayurvedic Medical Council",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b86\u0baf\u0bc2\u0bb5\u0bc7\u0ba4 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-23":{
-        "code": "11-23",
-        "id": 222,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Board of Ayurveda College and Hospital",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd \u0dc3\u0dc4 \u0dbb\u0ddd\u0dc4\u0dbd\u0dca \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0baf\u0bc2\u0bb5\u0bc7\u0ba4\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb2\u0bc2\u0baf\u0bc2\u0bae\u0bcd \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8\u0b9a\u0bcd \u0b9a\u0baa\u0bc8\u0baf\u0bc2\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-24":{
-        "code": "11-24",
-        "id": 223,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Ayurvedic Teaching and Research Hospitals",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0dc1\u0dd2\u0d9a\u0dca\u0dc2\u0dab \u0dc4\u0dcf \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dbb\u0ddd\u0dc4\u0dbd\u0dca",
-        "tm_name": "\u0b86\u0baf\u0bc2\u0bb5\u0bc7\u0ba4 \u0baa\u0bcb\u0ba4\u0ba9\u0bbe \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8",
-        "status": "true"
-    },
-    "11-25":{
-        "code": "11-25",
-        "id": 224,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Homeopathy Hospital Welisara",
-        "sn_name": "\u0dc4\u0ddd\u0db8\u0dd2\u0dba\u0ddd\u0db4\u0dad\u0dd2 \u0dbb\u0ddd\u0dc4\u0dbd \u0dc0\u0dd0\u0dbd\u0dd2\u0dc3\u0dbb",
-        "tm_name": "\u0bb9\u0bcb\u0bae\u0bbf\u0baf\u0bcb\u0baa\u0ba4\u0bbf \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0ba9\u0bc8\u0b87 \u0bb5\u0bc6\u0bb2\u0bbf\u0b9a\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "11-26":{
-        "code": "11-26",
-        "id": 225,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Homeopathic Medical Council",
-        "sn_name": "\u0dc4\u0ddd\u0db8\u0dd2\u0dba\u0ddd\u0db4\u0dad\u0dd2 \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bcb\u0bae\u0bbf\u0baf\u0bcb\u0baa\u0ba4\u0bbf \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-27":{
-        "code": "11-27",
-        "id": 226,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "1990 Suwaseriya Foundation",
-        "sn_name": "1990 \u0dc3\u0dd4\u0dc0\u0dc3\u0dd0\u0dbb\u0dd2\u0dba \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "1990 \u0b9a\u0bc1\u0bb5\u0b9a\u0bc6\u0bb0\u0bbf\u0baf \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "11-28":{
-        "code": "11-28",
-        "id": 227,
-        "institute_type": "GOV",
-        "mother_org": 199,
-        "name": "Kidney Fund",
-        "sn_name": "\u0dc0\u0d9a\u0dd4\u0d9c\u0da9\u0dd4 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bc1\u0ba8\u0bc0\u0bb0\u0b95 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12":{
-        "code": "12",
-        "id": 228,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Information and Communication Technology",
-        "sn_name": "\u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dc3\u0db1\u0dca\u0db1\u0dd2\u0dc0\u0dda\u0daf\u0db1 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0b9f\u0bb0\u0bcd\u0baa\u0bc1 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-1":{
-        "code": "12-1",
-        "id": 229,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Sri Lanka Telecom and its subsidiaries and affiliated companies",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0da7\u0dd9\u0dbd\u0dd2\u0d9a\u0ddc\u0db8\u0dca \u0dc3\u0db8\u0dcf\u0d9c\u0db8 \u0dc4\u0dcf \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc3\u0dc4 \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0d86\u0dba\u0dad\u0db1",
-        "tm_name": "\u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb0\u0bc6\u0bb2\u0bbf\u0b95\u0bca\u0bae\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0baf\u0bc2\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-2":{
-        "code": "12-2",
-        "id": 230,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Department of Telecommunication",
-        "sn_name": "\u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2 \u0dc3\u0d82\u0daf\u0dda\u0dc1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0bb2\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0b9f\u0bbe\u0baa\u0bc1\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-3":{
-        "code": "12-3",
-        "id": 231,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "All Information Technology Parks",
-        "sn_name": "\u0dc3\u0dd2\u0dba\u0dbd\u0dd4\u0db8 \u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d8b\u0daf\u0dca\u200d\u0dba\u0dcf\u0db1",
-        "tm_name": "\u0b9a\u0b95\u0bb2 \u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0baa\u0bcd \u0baa\u0bc1\u0bb7\u0bc1\u0b99\u0bcd\u0b95\u0bbe\u0b95\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "12-4":{
-        "code": "12-4",
-        "id": 232,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Department of Information",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dc0\u0dd8\u0dad\u0dca\u0dad\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-5":{
-        "code": "12-5",
-        "id": 233,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Sri Lanka Press Council",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dd4\u0dc0\u0dad\u0dca\u0db4\u0dad\u0dca \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0baa\u0bcd \u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bc8\u0baa\u0bcd \u0baa\u0bc7\u0bb0",
-        "status": "true"
-    },
-    "12-6":{
-        "code": "12-6",
-        "id": 234,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Sri Lanka Broadcasting Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9c\u0dd4\u0dc0\u0db1\u0dca \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b92\u0bb2\u0bbf\u0baa\u0bb0\u0baa\u0bcd\u0baa\u0bc1\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-7":{
-        "code": "12-7",
-        "id": 235,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Independent Television Network",
-        "sn_name": "\u0dc3\u0dca\u0dc0\u0dcf\u0db0\u0dd3\u0db1 \u0dbb\u0dd6\u0db4\u0dc0\u0dcf\u0dc4\u0dd2\u0db1\u0dd3 \u0da2\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0baf\u0bbe\u0ba4\u0bc0\u0ba9 \u0ba4\u0bca\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0b8a\u0b9f\u0b95 \u0bb5\u0bb2\u0bc8\u0baf\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1",
-        "status": "true"
-    },
-    "12-8":{
-        "code": "12-8",
-        "id": 236,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Sri Lanka Rupavahini Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0dd6\u0db4\u0dc0\u0dcf\u0dc4\u0dd2\u0db1\u0dd3 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb0\u0bc2\u0baa\u0bb5\u0bbe\u0bb9\u0bbf\u0ba9\u0bbf\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-9":{
-        "code": "12-9",
-        "id": 237,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Associated Newspapers of Ceylon Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0d91\u0d9a\u0dca\u0dc3\u0dad\u0dca \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dd8\u0dad\u0dca\u0dad\u0dd2 \u0db4\u0dad\u0dca\u200d\u0dbb \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b90\u0b95\u0bcd\u0b95\u0bbf\u0baf \u0b9a\u0bc6\u0baf\u0bcd\u0ba4\u0bbf\u0baa\u0bcd \u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "12-10":{
-        "code": "12-10",
-        "id": 238,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Lanka Puwath Ltd",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dd4\u0dc0\u0dad\u0dca \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b9a\u0bc6\u0baf\u0bcd\u0ba4\u0bbf\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-11":{
-        "code": "12-11",
-        "id": 239,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Selacine Rupavahini Institute",
-        "sn_name": "\u0dc3\u0dd0\u0dbd\u0dc3\u0dd2\u0db1\u0dda \u0dbb\u0dd6\u0db4\u0dc0\u0dcf\u0dc4\u0dd2\u0db1\u0dd3 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b9a\u0bc6\u0bb2\u0b9a\u0bbf\u0ba9\u0bc7 \u0bb0\u0bc2\u0baa\u0bb5\u0bbe\u0bb9\u0bbf\u0ba9\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-12":{
-        "code": "12-12",
-        "id": 240,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Mahinda Rajapaksa National Tele Cinema Park",
-        "sn_name": "\u0db8\u0dc4\u0dd2\u0db1\u0dca\u0daf \u0dbb\u0dcf\u0da2\u0db4\u0d9a\u0dca\u0dc2 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0da7\u0dd9\u0dbd\u0dd2 \u0dc3\u0dd2\u0db1\u0db8\u0dcf \u0d8b\u0daf\u0dca\u200d\u0dba\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0bae\u0bb9\u0bbf\u0ba8\u0bcd\u0ba4 \u0bb0\u0bbe\u0b9c\u0baa\u0b95\u0bcd\u0bb8 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb0\u0bc6\u0bb2\u0bbf-\u0b9a\u0bbf\u0ba9\u0bbf\u0bae\u0bbe \u0baa\u0bc1\u0bb7\u0bc1\u0b99\u0bcd\u0b95\u0bbe (\u0bb0\u0ba9\u0bcd\u0bae\u0bbf\u0bb9\u0bbf\u0ba4\u0bc6\u0ba9\u0bcd\u0ba9)",
-        "status": "true"
-    },
-    "12-13":{
-        "code": "12-13",
-        "id": 241,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Right to Information Commission",
-        "sn_name": "\u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0daf\u0dd0\u0db1\u0d9c\u0dd0\u0db1\u0dd3\u0db8\u0dda \u0d85\u0dba\u0dd2\u0dad\u0dd2\u0dc0\u0dcf\u0dc3\u0dd2\u0d9a\u0db8 \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0b85\u0bb1\u0bbf\u0baf\u0bc2\u0bae\u0bcd \u0b89\u0bb0\u0bbf\u0bae\u0bc8\u0b95\u0bb3\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "12-14":{
-        "code": "12-14",
-        "id": 242,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Postal Department",
-        "sn_name": "\u0dad\u0dd0\u0db4\u0dd0\u0dbd\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0baa\u0bbe\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-15":{
-        "code": "12-15",
-        "id": 243,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Department of Government Printing",
-        "sn_name": "\u0dbb\u0da2\u0dba\u0dda \u0db8\u0dd4\u0daf\u0dca\u200d\u0dbb\u0dab \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0b85\u0b9a\u0bcd\u0b9a\u0b95\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "12-16":{
-        "code": "12-16",
-        "id": 244,
-        "institute_type": "GOV",
-        "mother_org": 228,
-        "name": "Sri Lanka Media Training Institute.",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0da2\u0db1\u0db8\u0dcf\u0db0\u0dca\u200d\u0dba \u0d85\u0db7\u0dca\u200d\u0dba\u0dcf\u0dc3 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb5\u0bc6\u0b95\u0bc1\u0b9a\u0ba9 \u0b8a\u0b9f\u0b95\u0baa\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13":{
-        "code": "13",
-        "id": 245,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Higher Education and Technology Innovation",
-        "sn_name": "\u0d8b\u0dc3\u0dc3\u0dca \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0db1\u0dc0\u0ddd\u0dad\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b89\u0baf\u0bb0\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0ba4\u0bca\u0bb4\u0bbf\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0b95\u0bcd\u0b95 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "13-1":{
-        "code": "13-1",
-        "id": 246,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "University Grants Commission",
-        "sn_name": "\u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dcf\u0daf\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb2\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bb4\u0b95 \u0bae\u0bbe\u0ba9\u0bbf\u0baf\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "13-2":{
-        "code": "13-2",
-        "id": 247,
-        "institute_type": "\"All State Universities",
-        "mother_org": 0,
-        "name": "Postgraduate Institutions and other Institutions",
-        "sn_name": "\"\u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dcf\u0daf\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 \u0dba\u0da7\u0dad\u0dda \u0d87\u0dad\u0dd2 \u0dc3\u0dd2\u0dba\u0dbd\u0dd4 \u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd",
-        "tm_name": " \u0db4\u0dc1\u0dca\u0da0\u0dcf\u0dad\u0dca \u0d8b\u0db4\u0dcf\u0db0\u0dd2 \u0d86\u0dba\u0dad\u0db1 \u0dc4\u0dcf \u0d85\u0db1\u0dd9\u0d9a\u0dd4\u0dad\u0dca \u0d86\u0dba\u0dad\u0db1\"",
-        "status": "true"
-    },
-    "13-3":{
-        "code": "13-3",
-        "id": 248,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Buddhasravaka Bhiksu University",
-        "sn_name": "\u0db6\u0dd4\u0daf\u0dca\u0db0\u0dc1\u0dca\u200d\u0dbb\u0dcf\u0dc0\u0d9a \u0db7\u0dd2\u0d9a\u0dca\u0dc2\u0dd6 \u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4 \u0b9a\u0bbf\u0bb0\u0bbe\u0bb5\u0b95\u0bcd\u0b95 \u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc1\u0b95\u0bb3\u0bcd \u0baa\u0bb2\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-4":{
-        "code": "13-4",
-        "id": 249,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Buddhist and Pali University",
-        "sn_name": "\u0db6\u0dde\u0daf\u0dca\u0db0 \u0dc4\u0dcf \u0db4\u0dcf\u0dbd\u0dd2 \u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0bcc\u0ba4\u0bcd\u0ba4 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bbe\u0bb3\u0bbf \u0baa\u0bb2\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-5":{
-        "code": "13-5",
-        "id": 250,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Sri Lanka Institute of Advanced Technological Education",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d8b\u0dc3\u0dc3\u0dca \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b89\u0baf\u0bb0\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-6":{
-        "code": "13-6",
-        "id": 251,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Mahapola Higher Education Scholarship Trust Fund",
-        "sn_name": "\u0db8\u0dc4\u0db4\u0ddc\u0dc5 \u0db7\u0dcf\u0dbb\u0d9a\u0dcf\u0dbb \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0bae\u0b95\u0bbe\u0baa\u0bca\u0bb2 \u0ba8\u0bae\u0bcd\u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0baa\u0bcd\u0baa\u0bca\u0bb1\u0bc1\u0baa\u0bcd\u0baa\u0bc1 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-7":{
-        "code": "13-7",
-        "id": 252,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Institute of Business Management and affiliated institutions",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dca\u200d\u0dba\u0dcf\u0db4\u0dcf\u0dbb \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dcf\u0dbb\u0dd3\u0dad\u0dca\u0dc0 \u0d86\u0dba\u0dad\u0db1\u0dba \u0dc4\u0dcf \u0d85\u0db1\u0dd4\u0db6\u0daf\u0dca\u0db0 \u0d86\u0dba\u0dad\u0db1",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95 \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcb\u0b9f\u0bbf\u0ba3\u0bc8\u0ba8\u0bcd\u0ba4 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-8":{
-        "code": "13-8",
-        "id": 253,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "University of Vocational Technology",
-        "sn_name": "\u0dc0\u0dd8\u0dad\u0dca\u0dad\u0dd3\u0dba \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8\u0b87 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0baa\u0bcd \u0baa\u0bb2\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-9":{
-        "code": "13-9",
-        "id": 254,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Institute of Fisheries and Nautical Engineering (Ocean University)",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db0\u0dd2\u0dc0\u0dbb \u0dc4\u0dcf \u0db1\u0dcf\u0dc0\u0dd2\u0d9a \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0d86\u0dba\u0dad\u0db1\u0dba(\u0dc3\u0dcf\u0d9c\u0dbb \u0dc0\u0dd2\u0dc1\u0dca\u0dc0\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd\u0dba)",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0b9f\u0bb1\u0bcd\u0bb1\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0b9f\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8\u0b9a\u0bbe\u0bb0\u0bcd \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0b9a\u0bae\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0bb0\u0bae\u0bcd\u0b9a\u0bbe\u0bb0\u0bcd \u0baa\u0bb2\u0bcd\u0b95\u0bb2\u0bc8\u0b95\u0bcd\u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-10":{
-        "code": "13-10",
-        "id": 255,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Industrial Technology Institute",
-        "sn_name": "\u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-11":{
-        "code": "13-11",
-        "id": 256,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Sri Lanka Institute of Nano Technology (Pvt) Ltd.",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d89\u0db1\u0dca\u0dc3\u0dca\u0da7\u0dd2\u0da7\u0dd2\u0dba\u0dd4\u0da7\u0dca \u0d94\u0dc6\u0dca \u0db1\u0dd0\u0db1\u0ddd \u0da7\u0dd9\u0d9a\u0dca\u0db1\u0ddc\u0dbd\u0ddc\u0da2\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dba\u0dd2\u0dc0\u0da7\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b87\u0ba9\u0bcd\u0bb8\u0bcd\u0b9f\u0bbf\u0b9f\u0bbf\u0baf\u0bb7\u0bc1\u0b9f\u0bcd \u0b92\u0bb5\u0bcd \u0ba8\u0bc6\u0ba9\u0bcb\u0b9f\u0bc6\u0b95\u0bcd\u0ba9\u0bca\u0bb2\u0bcb\u0b9c\u0bbf \u0baa\u0bbf\u0bb1\u0bc8\u0bb5\u0bc7\u0b9f\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "13-12":{
-        "code": "13-12",
-        "id": 257,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Institute of Fundamental Studies",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0dd6\u0dbd\u0dd2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0dba\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b85\u0b9f\u0bbf\u0baa\u0bcd\u0baa\u0b9f\u0bc8\u0b95\u0bcd \u0b95\u0bb1\u0bcd\u0b95\u0bc8\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-13":{
-        "code": "13-13",
-        "id": 258,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Science Foundation",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf \u0db4\u0daf\u0db1\u0db8",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bbf\u0b9e\u0bcd\u0b9e\u0bbe\u0ba9 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-14":{
-        "code": "13-14",
-        "id": 259,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Science and Technology Commission",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf \u0dc4\u0dcf \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bbf\u0b9e\u0bcd\u0b9e\u0bbe\u0ba9\u0b87 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0bb5\u0bbf\u0baf\u0bb2\u0bcd \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "13-15":{
-        "code": "13-15",
-        "id": 260,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Planetarium",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dc4\u0dbd\u0ddd\u0d9a\u0dcf\u0d9c\u0dcf\u0dbb\u0dba",
-        "tm_name": "\u0b95\u0bcb\u0bb3\u0bcd\u0bae\u0ba3\u0bcd\u0b9f\u0bb2\u0b95\u0bcd \u0b95\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0b95\u0bcd\u0b95\u0bc2\u0b9f\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-16":{
-        "code": "13-16",
-        "id": 261,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Arthur C. Clarke Centre for Modern Technology",
-        "sn_name": "\u0db1\u0dc0\u0dd3\u0db1 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab\u0dc0\u0dda\u0daf\u0dba \u0dc3\u0daf\u0dc4\u0dcf \u0dc0\u0db1 \u0d86\u0dad\u0dbb\u0dca \u0dc3\u0dd3 \u0d9a\u0dca\u0dbd\u0dcf\u0d9a\u0dca \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba8\u0bb5\u0bc0\u0ba9 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0bb5\u0bbf\u0baf\u0bb2\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0b86\u0ba4\u0bbe \u0b9a\u0bbf. \u0b95\u0bbf\u0bb3\u0bbe\u0b95\u0bcd \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-17":{
-        "code": "13-17",
-        "id": 262,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Sri Lanka Accreditation Board for Conformity Assessment",
-        "sn_name": "\u0d85\u0db1\u0dd4\u0d9a\u0dd6\u0dbd\u0dad\u0dcf \u0dad\u0d9a\u0dca\u0dc3\u0dda\u0dbb\u0dd4 \u0db4\u0dd2\u0dbd\u0dd2\u0db6\u0daf \u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd3\u0dad\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b92\u0ba4\u0bcd\u0ba4\u0bbf\u0b9a\u0bc8\u0bb5\u0bc2 \u0bae\u0ba4\u0bbf\u0baa\u0bcd\u0baa\u0bc0\u0b9f\u0bc1 \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b8f\u0bb1\u0bcd\u0bb1\u0b99\u0bcd\u0b95\u0bc0\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8\u0b9a\u0bcd \u0b9a\u0b9f\u0bcd\u0b9f\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-18":{
-        "code": "13-18",
-        "id": 263,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Sri Lanka Standard Institute",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dca\u200d\u0dbb\u0db8\u0dd2\u0dad\u0dd2 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0b95\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bb3\u0bc8\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-19":{
-        "code": "13-19",
-        "id": 264,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Intellectual Property Office of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db6\u0dd4\u0daf\u0dca\u0db0\u0dd2\u0db8\u0dba \u0daf\u0dda\u0db4\u0dbd \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baa\u0bc1\u0bb2\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bca\u0ba4\u0bcd\u0ba4\u0bc1 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-20":{
-        "code": "13-20",
-        "id": 265,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Sri Lanka Inventors\u2019 Commission",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db1\u0dd2\u0db8\u0dd0\u0dba\u0dd4\u0db8\u0dca\u0d9a\u0dbb\u0dd4\u0dc0\u0db1\u0dca\u0d9c\u0dda \u0d9a\u0ddc\u0db8\u0dd2\u0dc3\u0db8",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0b95\u0bcd\u0b95\u0bc1\u0ba8\u0bbe \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "13-21":{
-        "code": "13-21",
-        "id": 266,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Inventors\u2019 Fund",
-        "sn_name": "\u0db1\u0dd2\u0db8\u0dd0\u0dba\u0dd4\u0db8\u0dca\u0d9a\u0dbb\u0dd4\u0dc0\u0db1\u0dca\u0d9c\u0dda \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0b95\u0bcd\u0b95\u0bc1\u0ba8\u0bbe \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-22":{
-        "code": "13-22",
-        "id": 267,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Engineering Research and Development Centre",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc3\u0dc4 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-23":{
-        "code": "13-23",
-        "id": 268,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "National Research Council",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "GOV":{
-        "code": "GOV",
-        "id": 269,
-        "institute_type": "Co-ordinating Secretariat of Science Technology & ",
-        "mother_org": 13,
-        "name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0b87 \u0bb5\u0bbf\u0b9e\u0bcd\u0b9e\u0bbe\u0ba9 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0b95\u0bcd\u0b95\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "sn_name": "\"\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf",
-        "tm_name": " \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0dc4\u0dcf \u0db1\u0dc0\u0ddd\u0dad\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba\"",
-        "status": "true"
-    },
-    "13-25":{
-        "code": "13-25",
-        "id": 270,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Blue Green Growth Secretariat",
-        "sn_name": "\u0db1\u0dd3\u0dbd \u0dc4\u0dbb\u0dd2\u0dad \u0dc0\u0dbb\u0dca\u0db0\u0d9a \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba8\u0bc0\u0bb2\u0baa\u0bcd \u0baa\u0b9a\u0bc1\u0bae\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-26":{
-        "code": "13-26",
-        "id": 271,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Timber-related design centre",
-        "sn_name": "\u0daf\u0dd0\u0dc0 \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0db1\u0dd2\u0dbb\u0dca\u0db8\u0dcf\u0dab \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0bae\u0bb0\u0bae\u0bcd\u0b9a\u0bbe\u0bb0\u0bcd\u0ba8\u0bcd\u0ba4 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-27":{
-        "code": "13-27",
-        "id": 272,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Centre of excellence for Robotic Applications",
-        "sn_name": "\u0dbb\u0ddc\u0db6\u0ddd \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0dc3\u0daf\u0dc4\u0dcf \u0dc0\u0db1 \u0dc0\u0dd2\u0dc1\u0dd2\u0dc2\u0dca\u0da8\u0dad\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0bb0\u0bca\u0baa\u0bcb \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0bb5\u0bbf\u0b9a\u0bc7\u0b9f \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "13-28":{
-        "code": "13-28",
-        "id": 273,
-        "institute_type": "GOV",
-        "mother_org": 245,
-        "name": "Vidatha Centres.",
-        "sn_name": "\u0dc0\u0dd2\u0daf\u0dcf\u0dad\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0bb5\u0bbf\u0ba4\u0bbe\u0ba4\u0bbe \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14":{
-        "code": "14",
-        "id": 274,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Public Administration Home Affairs Provincial Councils & Local Government",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db4\u0dbb\u0dd2\u0db4\u0dcf\u0dbd\u0db1 \u0dc3\u0dca\u0dc0\u0daf\u0dda\u0dc1 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf \u0dc4\u0dcf \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0baa\u0bca\u0ba4\u0bc1 \u0ba8\u0bbf\u0bb0\u0bc1\u0bb5\u0bbe\u0b95\u0bae\u0bcd \u0b89\u0bb3\u0bcd\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b89\u0bb3\u0bcd\u0bb3\u0bc2\u0bb0\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "14-1":{
-        "code": "14-1",
-        "id": 275,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Sri Lanka Institute of Development Administration",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db4\u0dbb\u0dd2\u0db4\u0dcf\u0dbd\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0bb5\u0bbe\u0b95 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14-2":{
-        "code": "14-2",
-        "id": 276,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Distance Learning Centre Ltd.",
-        "sn_name": "\u0da9\u0dd2\u0dc3\u0dca\u0da7\u0db1\u0dca\u0dc3\u0dca \u0dbd\u0dbb\u0dca\u0db1\u0dd2\u0d82 \u0dc3\u0dd9\u0db1\u0dca\u0da7\u0dbb\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0b9f\u0bbf\u0bb8\u0bcd\u0b9f\u0ba9\u0bcd\u0bb8\u0bcd \u0bb2\u0bc7\u0bb0\u0bcd\u0ba9\u0bbf\u0b99\u0bcd \u0b9a\u0bc6\u0ba9\u0bcd\u0b9f\u0bb0\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "14-3":{
-        "code": "14-3",
-        "id": 277,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Department of Pensions",
-        "sn_name": "\u0dc0\u0dd2\u0dc1\u0dca\u200d\u0dbb\u0dcf\u0db8 \u0dc0\u0dd0\u0da7\u0dd4\u0db4\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b93\u0baf\u0bcd\u0bb5\u0bc2\u0bb7\u0ba4\u0bbf\u0baf\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14-4":{
-        "code": "14-4",
-        "id": 278,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Public Service Pensioners\u2019 Trust Fund",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0dc0\u0dd2\u0dc1\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd2\u0d9a\u0dba\u0db1\u0dca\u0d9c\u0dda \u0db7\u0dcf\u0dbb \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0b9a\u0bc7\u0bb5\u0bc8\u0baf\u0bbf\u0ba9\u0bcd \u0b93\u0baf\u0bcd\u0bb5\u0bc2\u0bb7\u0bc1\u0ba4\u0bbf\u0baf\u0bae\u0bcd \u0baa\u0bc6\u0bb1\u0bc1\u0bb5\u0bcbh\u0ba8\u0bae\u0bcd\u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0baa\u0bcd \u0baa\u0bca\u0bb1\u0bc1\u0baa\u0bcd\u0baa\u0bc1 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14-5":{
-        "code": "14-5",
-        "id": 279,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Department of Registrar General",
-        "sn_name": "\u0dbb\u0dd9\u0da2\u0dd2\u0dc3\u0dca\u0da7\u0dca\u200d\u0dbb\u0dcf\u0dbb\u0dca \u0da2\u0db1\u0dbb\u0dcf\u0dbd\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bbf\u0bb5\u0bbe\u0bb3\u0bb0\u0bcd \u0ba8\u0bbe\u0baf\u0b95\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14-6":{
-        "code": "14-6",
-        "id": 280,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Department of Official Languages",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db7\u0dcf\u0dc2\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a\u0b95\u0bb0\u0bc1\u0bae \u0bae\u0bca\u0bb4\u0bbf\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14-7":{
-        "code": "14-7",
-        "id": 281,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Official Languages Commission",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db7\u0dcf\u0dc2\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc3\u0db8",
-        "tm_name": "\u0b85\u0bb0\u0b9a\u0b95\u0bb0\u0bc1\u0bae \u0bae\u0bca\u0bb4\u0bbf\u0b95\u0bb3\u0bcd \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "14-8":{
-        "code": "14-8",
-        "id": 282,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "National Institute of Language Education and Training",
-        "sn_name": "\u0db7\u0dcf\u0dc2\u0dcf \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc4\u0dcf \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4\u0dc0 \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bae\u0bca\u0bb4\u0bbf\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0baa\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "14-9":{
-        "code": "14-9",
-        "id": 283,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "National Council of Sri Lanka for the Development of Human Resources",
-        "sn_name": "\u0db8\u0dcf\u0db1\u0dc0 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1\u0dba \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba9\u0bbf\u0ba4\u0bb5\u0bb3 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "14-10":{
-        "code": "14-10",
-        "id": 284,
-        "institute_type": "GOV",
-        "mother_org": 274,
-        "name": "Local Loans and Development Fund",
-        "sn_name": "\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dab\u0dba \u0dc3\u0dc4 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b89\u0bb3\u0bcd \u0b95\u0b9f\u0ba9\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15":{
-        "code": "15",
-        "id": 285,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Mahaweli Agriculture Irrigation and Rural Development ",
-        "sn_name": "\u0db8\u0dc4\u0dc0\u0dd0\u0dbd\u0dd2 \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0dc4 \u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 ",
-        "tm_name": "\u0bae\u0b95\u0bbe\u0bb5\u0bb2\u0bbf \u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0bbf\u0baf \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "15-1":{
-        "code": "15-1",
-        "id": 286,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Department of Irrigation",
-        "sn_name": "\u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "15-2":{
-        "code": "15-2",
-        "id": 287,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Water Resources Board",
-        "sn_name": "\u0da2\u0dbd \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0bb5\u0bb3 \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-3":{
-        "code": "15-3",
-        "id": 288,
-        "institute_type": "\"Mahaweli Authority of Sri Lanka (major developmen",
-        "mother_org": 0,
-        "name": "\u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bae\u0b95\u0bbe\u0bb5\u0bb2\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8 (\u0bae\u0bca\u0bb0\u0b95\u0bb9\u0b95\u0ba8\u0bcd\u0ba4\u0b87 \u0b95\u0bb3\u0bc1\u0b95\u0b99\u0bcd\u0b95\u0bc8 \u0b89\u0bae\u0bbe\u0b93\u0baf \u0b89\u0bb3\u0bcd\u0bb3\u0bbf\u0b9f\u0bcd\u0b9f \u0b8f\u0ba9\u0bc8\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bbe\u0ba9 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bcd \u0b95\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0b99\u0bcd\u0b95\u0bb3\u0bcd)",
-        "sn_name": "\"\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db8\u0dc4\u0dc0\u0dd0\u0dbd\u0dd2 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba(\u0db8\u0ddc\u0dbb\u0d9c\u0dc4\u0d9a\u0db1\u0dca\u0daf \u0dc3\u0dc4 \u0d9a\u0dc5\u0dd4\u0d9c\u0d9f",
-        "tm_name": " \u0d8b\u0db8\u0dcf \u0d94\u0dba \u0d87\u0dad\u0dd4\u0dbd\u0dd4 \u0d85\u0db1\u0dd9\u0d9a\u0dd4\u0dad\u0dca \u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc0\u0dca\u200d\u0dba\u0dcf\u0db4\u0dd8\u0dad\u0dd2)\"",
-        "status": "true"
-    },
-    "15-4":{
-        "code": "15-4",
-        "id": 289,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Central Engineering Consultancy Bureau and its subsidiaries and affiliated companies",
-        "sn_name": "\u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4\u0db8\u0dba \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dba\u0db1\u0dca \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0d8b\u0db4\u0daf\u0dda\u0dc1\u0d9a \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba \u0dc4\u0dcf \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc4\u0dcf \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0b86\u0bb2\u0bcb\u0b9a\u0ba9\u0bc8\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-5":{
-        "code": "15-5",
-        "id": 290,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Engineering Council of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4\u0dc0\u0dbb\u0dd4\u0db1\u0dca \u0d9c\u0dda \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bbe\u0bb3\u0bb0\u0bcd \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-6":{
-        "code": "15-6",
-        "id": 291,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Department of Agriculture",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-7":{
-        "code": "15-7",
-        "id": 292,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Department of Agrarian Development",
-        "sn_name": "\u0d9c\u0ddc\u0dc0\u0dd2\u0da2\u0db1 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bae\u0ba8\u0bb2 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-8":{
-        "code": "15-8",
-        "id": 293,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "National Fertilizer Secretaria",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0ddc\u0dc4\u0ddc\u0dbb \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b89\u0bb0\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-9":{
-        "code": "15-9",
-        "id": 294,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Agriculture and Agrarian Insurance Board",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0dc4\u0dcf \u0d9c\u0ddc\u0dc0\u0dd2\u0da2\u0db1 \u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bae\u0ba8\u0bb2 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0bb1\u0bc1\u0ba4\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "15-10":{
-        "code": "15-10",
-        "id": 295,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Pulses and Grain Research and Production Authority",
-        "sn_name": "\u0db8\u0dcf\u0d82\u0dc1 \u0db7\u0ddd\u0d9c \u0dc4\u0dcf \u0db0\u0dcf\u0db1\u0dca\u200d\u0dba \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc3\u0dc4 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0baa\u0bc1\u0bb0\u0ba4 \u0ba4\u0bbe\u0ba9\u0bbf\u0baf \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "15-11":{
-        "code": "15-11",
-        "id": 296,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Hector Kobbekaduwa Agrarian Research and Training Institute",
-        "sn_name": "\u0dc4\u0dd9\u0d9a\u0dca\u0da7\u0dbb\u0dca \u0d9a\u0ddc\u0db6\u0dca\u0db6\u0dd1\u0d9a\u0da9\u0dd4\u0dc0 \u0d9c\u0ddc\u0dc0\u0dd2 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0dc4\u0dcf \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bb9\u0bc6\u0b95\u0bcd\u0b9f\u0bbe \u0b95\u0bca\u0baa\u0bcd\u0baa\u0bc7\u0b95\u0b9f\u0bc1\u0bb5 \u0b95\u0bae\u0ba8\u0bb2 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf\u0b87 \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-12":{
-        "code": "15-12",
-        "id": 297,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Sri Lanka Council for Agricultural Research Policy",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd2 \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf\u0b95\u0bcd \u0b95\u0bca\u0bb3\u0bcd\u0b95\u0bc8\u0b95\u0bb3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0ba9 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-13":{
-        "code": "15-13",
-        "id": 298,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Institute of Post-Harvest Technology",
-        "sn_name": "\u0db4\u0dc1\u0dca\u0da0\u0dcf\u0dad\u0dca \u0d85\u0dc3\u0dca\u0dc0\u0db1\u0dd4 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0baa\u0bbf\u0ba9\u0bcd \u0b85\u0bb1\u0bc1\u0bb5\u0b9f\u0bc8\u0ba4\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa\u0bb5\u0bbf\u0baf\u0bb2\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-14":{
-        "code": "15-14",
-        "id": 299,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Paddy Marketing Board",
-        "sn_name": "\u0dc0\u0dd3 \u0d85\u0dbd\u0dd9\u0dc0\u0dd2 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba8\u0bc6\u0bb2\u0bcd \u0b9a\u0ba8\u0bcd\u0ba4\u0bc8\u0baa\u0bcd\u0baa\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bb2\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "15-15":{
-        "code": "15-15",
-        "id": 300,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Ceylon Fertilizer Company Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0ddc\u0dc4\u0ddc\u0dbb \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b9a\u0bbf\u0bb2\u0bcb\u0ba9\u0bcd \u0b89\u0bb0 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "15-16":{
-        "code": "15-16",
-        "id": 301,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Colombo Commercial Fertilizer Company",
-        "sn_name": "\u0d9a\u0ddc\u0dc5\u0db9 \u0d9a\u0ddc\u0db8\u0dbb\u0dca\u0dc2\u0dbd\u0dca \u0db4\u0ddc\u0dc4\u0ddc\u0dbb \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b95\u0bca\u0bb4\u0bc1\u0bae\u0bcd\u0baa\u0bc1 \u0bb5\u0ba3\u0bbf\u0b95 \u0b89\u0bb0 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-17":{
-        "code": "15-17",
-        "id": 302,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Janatha Fertilizer Enterprises Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0da2\u0db1\u0dad\u0dcf \u0dc6\u0dbb\u0dca\u0da7\u0dd2\u0dbd\u0dba\u0dd2\u0dc3\u0dbb\u0dca \u0d91\u0db1\u0dca\u0da7\u0dbb\u0dca\u0db4\u0dca\u200d\u0dbb\u0dba\u0dd2\u0dc3\u0dc3\u0dca",
-        "tm_name": "\u0b9c\u0ba9\u0ba4\u0bbe \u0b89\u0bb0 \u0b8e\u0ba3\u0bcd\u0b9f\u0bb0\u0bcd\u0baa\u0bbf\u0bb0\u0bc8\u0b9a\u0bb8\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "15-18":{
-        "code": "15-18",
-        "id": 303,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "National Agricultural Diversification and Settlement Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0dc0\u0dd2\u0dc0\u0dd2\u0db0\u0dcf\u0d82\u0d9c\u0dd3\u0d9a\u0dbb\u0dab\u0dba \u0dc4\u0dcf \u0da2\u0db1\u0dcf\u0dc0\u0dcf\u0dc3 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0baa\u0bb2\u0bcd\u0bb5\u0b95\u0bc8\u0baa\u0bcd\u0baa\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0b95\u0bc8\u0baf\u0bc2\u0bae\u0bcd\u0b87 \u0b95\u0bc1\u0b9f\u0bbf\u0baf\u0bc7\u0bb1\u0bcd\u0bb1 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8\u0baf\u0bc2\u0bae\u0bcd (\u0bb9\u0ba4\u0baa\u0bbf\u0bae)",
-        "status": "true"
-    },
-    "15-19":{
-        "code": "15-19",
-        "id": 304,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "National Food Promotion Board",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d86\u0dc4\u0dcf\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b89\u0ba3\u0bb5\u0bc2 \u0b8a\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bbf\u0baa\u0bcd\u0baa\u0bc1\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "15-20":{
-        "code": "15-20",
-        "id": 305,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Rural Revival Fund",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0db4\u0dd4\u0dab\u0dbb\u0dca\u0da2\u0dd3\u0dc0\u0db1 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0bbf\u0baf \u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0baf\u0bbf\u0bb0\u0bc1\u0b9f\u0bcd\u0b9f\u0bb2\u0bcd \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-21":{
-        "code": "15-21",
-        "id": 306,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Rural Economic Revival Fund",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0d86\u0dbb\u0dca\u0dae\u0dd2\u0d9a \u0db4\u0dd4\u0dab\u0dbb\u0dca\u0da2\u0dd3\u0dc0\u0db1 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0bbf\u0baf \u0baa\u0bca\u0bb0\u0bc1\u0bb3\u0bbe\u0ba4\u0bbe\u0bb0 \u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0baf\u0bbf\u0bb0\u0bc2\u0b9f\u0bcd\u0b9f\u0bb2\u0bcd \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-22":{
-        "code": "15-22",
-        "id": 307,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Janadiriya Fund (Gramodaya Council Fund)",
-        "sn_name": "\u0da2\u0db1\u0daf\u0dd2\u0dbb\u0dd2\u0dba \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd (\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0ddd\u0daf\u0dba \u0db8\u0dab\u0dca\u0da9\u0dbd \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd)",
-        "tm_name": "\u0b9c\u0ba9\u0ba4\u0bbf\u0bb0\u0bbf\u0baf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd (\u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0bcb\u0ba4\u0baf \u0b9a\u0baa\u0bc8 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd)",
-        "status": "true"
-    },
-    "15-23":{
-        "code": "15-23",
-        "id": 308,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Department of Animal Production and Health",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0bb2\u0bcd\u0ba8\u0b9f\u0bc8 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae",
-        "status": "true"
-    },
-    "15-24":{
-        "code": "15-24",
-        "id": 309,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "National Livestock Development Board and affiliated companies",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dc1\u0dd4 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba \u0dc4\u0dcf \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bbe\u0bb2\u0bcd\u0ba8\u0b9f\u0bc8\u0bb5\u0bb3\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8\u0baf\u0bc2\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "15-25":{
-        "code": "15-25",
-        "id": 310,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Milco (Pvt.) Ltd.",
-        "sn_name": "\u0db8\u0dd2\u0dbd\u0dca\u0d9a\u0ddd (\u0db4\u0dca\u200d\u0dbb\u0dba\u0dd2\u0dc0\u0da7\u0dca) \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bae\u0bbf\u0bb2\u0bcd\u0b95\u0bcb (\u0baa\u0bbf\u0bb1\u0bc8\u0bb5\u0bc7\u0b9f\u0bcd) \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "15-26":{
-        "code": "15-26",
-        "id": 311,
-        "institute_type": "GOV",
-        "mother_org": 286,
-        "name": "Mahaweli Livestock Enterprise Limited",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0db8\u0dc4\u0dc0\u0dd0\u0dbd\u0dd2 \u0dbd\u0dba\u0dd2\u0dc0\u0dca\u0dc3\u0dca\u0da7\u0ddc\u0d9a\u0dca \u0d91\u0db1\u0dca\u0da7\u0dbb\u0dca\u0db4\u0dca\u200d\u0dbb\u0dba\u0dd2\u0dc3\u0dca \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bae\u0b95\u0bbe\u0bb5\u0bb2\u0bbf \u0bb2\u0bc8\u0bb5\u0bcd\u0bb8\u0bcd\u0bb0\u0bca\u0b95\u0bcd \u0b8e\u0ba9\u0bcd\u0bb0\u0baa\u0bbf\u0bb1\u0bc8\u0baf\u0bcd\u0bb8\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "16":{
-        "code": "16",
-        "id": 312,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Internal Trade Food Security and Consumer Welfare",
-        "sn_name": "\u0d85\u0db7\u0dca\u200d\u0dba\u0db1\u0dca\u0dad\u0dbb \u0dc0\u0dd9\u0dc5\u0daf \u0d86\u0dc4\u0dcf\u0dbb \u0dc3\u0dd4\u0dbb\u0d9a\u0dca\u0dc2\u0dd2\u0dad\u0dca\u0dad\u0dcf\u0dc0\u0dba \u0dc3\u0dc4 \u0db4\u0dcf\u0dbb\u0dd2\u0db7\u0ddd\u0d9c\u0dd2\u0d9a \u0dc3\u0dd4\u0db6\u0dc3\u0dcf\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95\u0bae\u0bcd \u0b89\u0ba3\u0bb5\u0bc1\u0baa\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0bc1\u0b95\u0bb0\u0bcd\u0bb5\u0bcb\u0bb0\u0bcd \u0ba8\u0bb2\u0ba9\u0bcb\u0bae\u0bcd\u0baa\u0bc1\u0b95\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "16-1":{
-        "code": "16-1",
-        "id": 313,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Internal Trade Department",
-        "sn_name": "\u0d85\u0db7\u0dca\u200d\u0dba\u0db1\u0dca\u0dad\u0dbb \u0dc0\u0dd9\u0dc5\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0b95 \u0bb5\u0bbe\u0ba4\u0bcd\u0ba4\u0b95\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "16-2":{
-        "code": "16-2",
-        "id": 314,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Consumer Affairs Authority",
-        "sn_name": "\u0db4\u0dcf\u0dbb\u0dd2\u0db7\u0ddd\u0d9c\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba8\u0bc1\u0b95\u0bb0\u0bcd\u0bb5\u0bcb\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "16-3":{
-        "code": "16-3",
-        "id": 315,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Lanka Sathosa Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dad\u0ddc\u0dc3",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b9a\u0ba4\u0bca\u0b9a",
-        "status": "true"
-    },
-    "16-4":{
-        "code": "16-4",
-        "id": 316,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Lanka General Trading Company Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0da2\u0dd9\u0db1\u0dbb\u0dbd\u0dca \u0da7\u0dca\u200d\u0dbb\u0dd9\u0da9\u0dd2\u0d82 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b9c\u0bc6\u0ba9\u0bb0\u0bb2\u0bcd \u0b9f\u0bbf\u0bb0\u0bc7\u0b9f\u0bbf\u0b99\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "16-5":{
-        "code": "16-5",
-        "id": 317,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Co-operative Wholesale Establishment",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dad\u0ddc\u0d9c \u0dc0\u0dd9\u0dc5\u0daf \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc2 \u0bae\u0bca\u0ba4\u0bcd\u0ba4 \u0bb5\u0bbf\u0bb1\u0bcd\u0baa\u0ba9\u0bc8 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "GOV":{
-        "code": "GOV",
-        "id": 318,
-        "institute_type": " Standards and Services\"",
-        "mother_org": 16,
-        "name": "\"Department of Measurement Units",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd4\u0db8\u0dca \u0d92\u0d9a\u0d9a \u0db4\u0dca\u200d\u0dbb\u0db8\u0dd2\u0dad\u0dd2 \u0dc3\u0dc4 \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b85\u0bb3\u0bb5\u0bc2\u0b95\u0bcd\u0b95\u0bc2\u0bb1\u0bc1\u0b95\u0bb3\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bb3\u0bc8\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "16-7":{
-        "code": "16-7",
-        "id": 319,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Department of Co-operative Development (Registrar of Cooperative Societies)",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 (\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0db8\u0dd2\u0dad\u0dd2 \u0dbd\u0dd2\u0dba\u0dcf\u0db4\u0daf\u0dd2\u0d82\u0da0\u0dd2 \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0dbb\u0dd9\u0da2\u0dd2\u0dc3\u0dca\u0da7\u0dca\u200d\u0dbb\u0dcf\u0dbb\u0dca)",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc2 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd (\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc2 \u0b9a\u0b99\u0bcd\u0b95\u0baa\u0bcd \u0baa\u0ba4\u0bbf\u0bb5\u0bbe\u0bb3\u0bbe )",
-        "status": "true"
-    },
-    "16-8":{
-        "code": "16-8",
-        "id": 320,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Co-operative Employees Commission",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0dda\u0dc0\u0d9a \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc2 \u0b8a\u0bb4\u0bbf\u0baf\u0bbe;\u0b95\u0bb3\u0bcd \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "16-9":{
-        "code": "16-9",
-        "id": 321,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "National Institute of Co-operative Development",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc2 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "16-10":{
-        "code": "16-10",
-        "id": 322,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Food Commissioner\u2019s Department",
-        "sn_name": "\u0d86\u0dc4\u0dcf\u0dbb \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b89\u0ba3\u0bb5\u0bc2 \u0b86\u0ba3\u0bc8\u0baf\u0bbe\u0bb3\u0bb0\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "16-11":{
-        "code": "16-11",
-        "id": 323,
-        "institute_type": "GOV",
-        "mother_org": 312,
-        "name": "Divisional Economic Centres",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0d86\u0dbb\u0dca\u0dae\u0dd2\u0d9a \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1",
-        "tm_name": "\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0baa\u0bca\u0bb0\u0bc1\u0bb3\u0bbe\u0ba4\u0bbe\u0bb0 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae",
-        "status": "true"
-    },
-    "17":{
-        "code": "17",
-        "id": 324,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry Of Education",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "17-1":{
-        "code": "17-1",
-        "id": 325,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Department of Educational Publications",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0db4\u0dca\u200d\u0dbb\u0d9a\u0dcf\u0dc1\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0bb5\u0bc6\u0bb3\u0bbf\u0baf\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "17-2":{
-        "code": "17-2",
-        "id": 326,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "National Institute of Education",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "17-3":{
-        "code": "17-3",
-        "id": 327,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Sri Lanka Publication Development Bureau",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9c\u0dca\u200d\u0dbb\u0db1\u0dca\u0dae \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc2\u0bb2\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "17-4":{
-        "code": "17-4",
-        "id": 328,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "National Library and Documentation Services Board",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dd4\u0dc3\u0dca\u0dad\u0d9a\u0dcf\u0dbd \u0dc4\u0dcf \u0db4\u0dca\u200d\u0dbb\u0dbd\u0dda\u0d9b\u0db1 \u0dc3\u0dda\u0dc0\u0dcf \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bc2\u0bb2\u0b95 \u0b86\u0bb5\u0ba3\u0bb5\u0bbe\u0b95\u0bcd\u0b95\u0bb2\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "17-5":{
-        "code": "17-5",
-        "id": 329,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Directorates of Education",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d85\u0db0\u0dca\u200d\u0dba\u0d9a\u0dca\u0dc2 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baa\u0bcd\u0baa\u0bbe\u0bb3\u0bbe \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "17-6":{
-        "code": "17-6",
-        "id": 330,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "National Authority on Teachers Education",
-        "sn_name": "\u0d9c\u0dd4\u0dbb\u0dd4 \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1\u0dba \u0db4\u0dd2\u0dbd\u0dd2\u0db6\u0daf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b86\u0b9a\u0bbf\u0bb0\u0bbf\u0baf\u0bb0\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0ba4\u0bca\u0b9f\u0bb0\u0bcd\u0baa\u0bbe\u0ba9 \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "17-7":{
-        "code": "17-7",
-        "id": 331,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Colleges of Education",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0db4\u0dd3\u0da8",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0baf\u0bbf\u0baf\u0bb1\u0bcd \u0b95\u0bb2\u0bcd\u0bb2\u0bc2\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "17-8":{
-        "code": "17-8",
-        "id": 332,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Teachers\u2019 Colleges",
-        "sn_name": "\u0d9c\u0dd4\u0dbb\u0dd4 \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dbd",
-        "tm_name": "\u0b86\u0b9a\u0bbf\u0bb0\u0bbf\u0baf\u0bb0\u0bcd \u0b95\u0bb2\u0bcd\u0bb2\u0bc2\u0bb0\u0bbf\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "17-9":{
-        "code": "17-9",
-        "id": 333,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Piriven Education Board",
-        "sn_name": "\u0db4\u0dd2\u0dbb\u0dd2\u0dc0\u0dd9\u0db1\u0dca \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0baa\u0bbf\u0bb0\u0bbf\u0bb5\u0ba9\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "17-10":{
-        "code": "17-10",
-        "id": 334,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "Department of Examination",
-        "sn_name": "\u0dc0\u0dd2\u0db7\u0dcf\u0d9c \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0bb0\u0bcd\u0bb5\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "17-11":{
-        "code": "17-11",
-        "id": 335,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "State Printing Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0db8\u0dd4\u0daf\u0dca\u200d\u0dbb\u0dab \u0db1\u0dd3\u0dad\u0dd2\u0d9c\u0dad \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0b85\u0b9a\u0bcd\u0b9a\u0b95\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "17-12":{
-        "code": "17-12",
-        "id": 336,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "UNESCO National Commission of Sri Lanka",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dba\u0dd4\u0db1\u0dd9\u0dc3\u0dca\u0d9a\u0ddd \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0ddc\u0db8\u0dd2\u0dc3\u0db8",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baf\u0bc2\u0ba9\u0bc6\u0bb8\u0bcd\u0b95\u0bcb \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "17-13":{
-        "code": "17-13",
-        "id": 337,
-        "institute_type": "GOV",
-        "mother_org": 324,
-        "name": "National Education Commission.",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf\u0b95\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "18":{
-        "code": "18",
-        "id": 338,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Sports and Youth Affairs",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc4\u0dcf \u0dad\u0dbb\u0dd4\u0dab \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b87\u0bb3\u0bc8\u0b9e\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "18-1":{
-        "code": "18-1",
-        "id": 339,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "Department of Sports Development",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-2":{
-        "code": "18-2",
-        "id": 340,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "Sugathadasa National Sports Complex Authority",
-        "sn_name": "\u0dc3\u0dd4\u0d9c\u0dad\u0daf\u0dcf\u0dc3 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc3\u0d82\u0d9a\u0dd3\u0dbb\u0dca\u0dab \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0ba4\u0ba4\u0bbe\u0b9a \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0ba4\u0bca\u0b95\u0bc1\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "18-3":{
-        "code": "18-3",
-        "id": 341,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "Provincial Sports Complexes",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc3\u0d82\u0d9a\u0dd3\u0dbb\u0dca\u0dab",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bca\u0b95\u0bc1\u0ba4\u0bbf\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "18-4":{
-        "code": "18-4",
-        "id": 342,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Institute of Sports Science",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0b95\u0bb1\u0bcd\u0b95\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-5":{
-        "code": "18-5",
-        "id": 343,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Sports Council",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-6":{
-        "code": "18-6",
-        "id": 344,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "Institute of Sports Medicine",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-7":{
-        "code": "18-7",
-        "id": 345,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "Sri Lanka Anti-doping Agency",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d8b\u0dad\u0dca\u0dad\u0dda\u0da2\u0d9a \u0db8\u0dbb\u0dca\u0daf\u0db1 \u0db1\u0dd2\u0dba\u0ddd\u0da2\u0dca\u200d\u0dba\u0dcf\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8\u0baf\u0bbf\u0ba9\u0bcd \u0b8a\u0b95\u0bcd\u0b95\u0bae\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bc1\u0baa\u0bcd \u0baa\u0bca\u0bb0\u0bc1\u0b9f\u0bcd\u0b95\u0bb3\u0bc8\u0ba4\u0bcd \u0ba4\u0b9f\u0bc1\u0baa\u0bcd\u0baa\u0ba4\u0bb1\u0bcd\u0b95\u0bbe\u0ba9 \u0bae\u0bc1\u0b95\u0bb5\u0bb0\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-8":{
-        "code": "18-8",
-        "id": 346,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Youth Services Council",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dad\u0dbb\u0dd4\u0dab \u0dc3\u0dda\u0dc0\u0dcf \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b87\u0bb3\u0bc8\u0b9e\u0bbe;\u0b95\u0bb3\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-9":{
-        "code": "18-9",
-        "id": 347,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Youth Corps",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dba\u0ddc\u0dc0\u0dd4\u0db1\u0dca \u0dc3\u0dda\u0db1\u0dcf\u0d82\u0d9a\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b87\u0bb3\u0bc8\u0b9e\u0bbe \u0baa\u0b9f\u0bc8\u0baf\u0ba3\u0bbf",
-        "status": "true"
-    },
-    "18-10":{
-        "code": "18-10",
-        "id": 348,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Youth Awards Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dba\u0dde\u0dc0\u0dab \u0dad\u0dd2\u0dc5\u0dd2\u0dab \u0db4\u0dca\u200d\u0dbb\u0daf\u0dcf\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b87\u0bb3\u0bc8\u0b9e\u0bbe \u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bc1\u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "18-11":{
-        "code": "18-11",
-        "id": 349,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Youths Services Co-operative Limited",
-        "sn_name": "\u0dc3\u0dd3/\u0dc3. \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dad\u0dbb\u0dd4\u0dab \u0dc3\u0dda\u0dc0\u0dcf \u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb\u0dba",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b87\u0bb3\u0bc8\u0b9e\u0bbe \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc2",
-        "status": "true"
-    },
-    "18-12":{
-        "code": "18-12",
-        "id": 350,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "National Centre for Leadership Development",
-        "sn_name": "\u0db1\u0dcf\u0dba\u0d9a\u0dad\u0dca\u0dc0 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bb2\u0bc8\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "18-13":{
-        "code": "18-13",
-        "id": 351,
-        "institute_type": "GOV",
-        "mother_org": 338,
-        "name": "Institute of Smart Sri Lanka.",
-        "sn_name": "\u0dc3\u0dca\u0db8\u0dcf\u0dbb\u0dca\u0da7\u0dca \u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bb8\u0bcd\u0bae\u0bbe\u0bb0\u0bcd\u0b9f\u0bcd \u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0bbe",
-        "status": "true"
-    },
-    "19":{
-        "code": "19",
-        "id": 352,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Road and Highways",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0db8\u0dc4\u0dcf\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bb5\u0bc0\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0bc6\u0b9f\u0bc1\u0b9e\u0bcd\u0b9a\u0bbe\u0bb2\u0bc8\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "19-1":{
-        "code": "19-1",
-        "id": 353,
-        "institute_type": "GOV",
-        "mother_org": 352,
-        "name": "Road Development Authority and its Subsidiaries and Associates",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba \u0dc3\u0dc4 \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc4\u0dcf \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0bb5\u0bc0\u0ba4\u0bbf \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8\u0baf\u0bc2\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "19-2":{
-        "code": "19-2",
-        "id": 354,
-        "institute_type": "GOV",
-        "mother_org": 352,
-        "name": "Road Maintenance Trust Fund",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0db1\u0da9\u0dad\u0dca\u0dad\u0dd4 \u0db7\u0dcf\u0dbb \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0bb5\u0bc0\u0ba4\u0bbf \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0ba8\u0bae\u0bcd\u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0baa\u0bcd\u0baa\u0bca\u0bb1\u0bc1\u0baa\u0bcd\u0baa\u0bc1 \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "20":{
-        "code": "20",
-        "id": 355,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Ports and Shipping",
-        "sn_name": "\u0dc0\u0dbb\u0dcf\u0dba \u0dc4\u0dcf \u0db1\u0dcf\u0dc0\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba4\u0bc1\u0bb1\u0bc8\u0bae\u0bc1\u0b95\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1\u0bb1\u0bc8 \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "20-1":{
-        "code": "20-1",
-        "id": 356,
-        "institute_type": "GOV",
-        "mother_org": 355,
-        "name": "Sri Lanka Ports Authority and its Subsidiaries and Associates",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dbb\u0dcf\u0dba \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba \u0dc3\u0dc4 \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc4\u0dcf \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba4\u0bc1\u0bb1\u0bc8\u0bae\u0bc1\u0b95 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8\u0baf\u0bc2\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "20-2":{
-        "code": "20-2",
-        "id": 357,
-        "institute_type": "GOV",
-        "mother_org": 355,
-        "name": "Ceylon Shipping Corporation Ltd. and its Subsidiaries and Associates",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0db1\u0dd0\u0dc0\u0dca \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0 \u0dc3\u0dc4 \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca \u0dc4\u0dcf \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0baa\u0bcd\u0baa\u0bb1\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd \u0b87\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "20-3":{
-        "code": "20-3",
-        "id": 358,
-        "institute_type": "GOV",
-        "mother_org": 355,
-        "name": "Merchant Shipping Secretariat",
-        "sn_name": "\u0dc0\u0dd9\u0dc5\u0daf \u0db1\u0dcf\u0dc0\u0dd2\u0d9a \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0bb5\u0bbe\u0ba3\u0bbf\u0baa \u0b95\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1\u0bb1\u0bc8\u0b9a\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae",
-        "status": "true"
-    },
-    "21":{
-        "code": "21",
-        "id": 359,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Small & Medium Business and Enterprise Development",
-        "sn_name": "\u0d9a\u0dd4\u0da9\u0dcf \u0dc4\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba \u0db4\u0dbb\u0dd2\u0db8\u0dcf\u0dab \u0dc0\u0dca\u200d\u0dba\u0dcf\u0db4\u0dcf\u0dbb \u0dc3\u0dc4 \u0dc0\u0dca\u200d\u0dba\u0dc0\u0dc3\u0dcf\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bbf\u0baf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bb0 \u0b85\u0bb3\u0bb5\u0bbf\u0bb2\u0bbe\u0ba9 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0bae\u0bc1\u0baf\u0bb1\u0bcd\u0b9a\u0bbf \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "21-1":{
-        "code": "21-1",
-        "id": 360,
-        "institute_type": "GOV",
-        "mother_org": 359,
-        "name": "National Enterprise Development Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dca\u200d\u0dba\u0dc0\u0dc3\u0dcf\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0bae\u0bc1\u0baf\u0bb1\u0bcd\u0b9a\u0bbf\u0b95\u0bb3\u0bcd \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "21-2":{
-        "code": "21-2",
-        "id": 361,
-        "institute_type": "GOV",
-        "mother_org": 359,
-        "name": "National Crafts Council",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc1\u0dd2\u0dbd\u0dca\u0db4 \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b85\u0bb0\u0bc1\u0b99\u0bcd\u0b95\u0bb2\u0bc8\u0baa\u0bcd \u0baa\u0bc7\u0bb0\u0bb5\u0bc8",
-        "status": "true"
-    },
-    "21-3":{
-        "code": "21-3",
-        "id": 362,
-        "institute_type": "GOV",
-        "mother_org": 359,
-        "name": "Sri Lanka Handicraft Board (Laksala)",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc4\u0dc3\u0dca\u0dad \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba(\u0dbd\u0d9a\u0dca\u0dc3\u0dbd)",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0bc8\u0bb5\u0bbf\u0ba9\u0bc8\u0b95\u0bcd \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0b9a\u0baa\u0bc8 (\u0bb2\u0b95\u0bcd\u0b9a\u0bb2)",
-        "status": "true"
-    },
-    "21-4":{
-        "code": "21-4",
-        "id": 363,
-        "institute_type": "GOV",
-        "mother_org": 359,
-        "name": "National Design Centre",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0ddd\u0dc3\u0dca\u0dad\u0dbb \u0db8\u0db0\u0dca\u200d\u0dba\u0dc3\u0dca\u0dae\u0dcf\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bb5\u0b9f\u0bbf\u0bb5\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "21-5":{
-        "code": "21-5",
-        "id": 364,
-        "institute_type": "GOV",
-        "mother_org": 359,
-        "name": "Small and Medium Enterprise Venture Capital Company",
-        "sn_name": "\u0d9a\u0dd4\u0da9\u0dcf \u0dc4\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dbb\u0dd2\u0db8\u0dcf\u0dab \u0dc0\u0dca\u200d\u0dba\u0dc0\u0dc3\u0dcf\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0d9c\u0dca\u0db0\u0db1 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bbf\u0baf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bb0 \u0b85\u0bb3\u0bb5\u0bc2 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0bae\u0bc1\u0baf\u0bb1\u0bcd\u0b9a\u0bbf \u0bae\u0bc2\u0bb2\u0ba4\u0ba9\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "21-6":{
-        "code": "21-6",
-        "id": 365,
-        "institute_type": "GOV",
-        "mother_org": 359,
-        "name": "Small and Medium Enterprise Authority",
-        "sn_name": "\u0d9a\u0dd4\u0da9\u0dcf \u0dc4\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba \u0db4\u0dbb\u0dd2\u0db8\u0dcf\u0dab \u0dc0\u0dca\u200d\u0dba\u0dc0\u0dc3\u0dcf\u0dba \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bbf\u0baf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bb0 \u0b85\u0bb3\u0bb5\u0bc2 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0bae\u0bc1\u0baf\u0bb1\u0bcd\u0b9a\u0bbf\u0b95\u0bb3\u0bcd \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "22":{
-        "code": "22",
-        "id": 366,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Industries and Supply Chain Management",
-        "sn_name": "\u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad  \u0dc3\u0dc4 \u0dc3\u0dd0\u0db4\u0dba\u0dd4\u0db8\u0dca \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "22-1":{
-        "code": "22-1",
-        "id": 367,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Ceylon Industrial Development Board",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bb2\u0bbf \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "22-2":{
-        "code": "22-2",
-        "id": 368,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Sri Lanka Institute of Textile and Apparels",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dda\u0dc2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc4\u0dcf \u0d87\u0d9c\u0dbd\u0dd4\u0db8\u0dca \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba8\u0bc6\u0b9a\u0bb5\u0bc2\u0b95\u0bcd \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b86\u0b9f\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0b99\u0bcd\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "22-3":{
-        "code": "22-3",
-        "id": 369,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Department of Textile Industries",
-        "sn_name": "\u0db4\u0dda\u0dc2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0bc6\u0b9a\u0bb5\u0bc2\u0b95\u0bcd \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "22-4":{
-        "code": "22-4",
-        "id": 370,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Kahatagaha Graphite",
-        "sn_name": "\u0d9a\u0dc4\u0da7\u0d9c\u0dc4 \u0d9c\u0dca\u200d\u0dbb\u0dd0\u0dc6\u0dba\u0dd2\u0da7\u0dca",
-        "tm_name": "\u0b95\u0bb9\u0b9f\u0bcd\u0b9f\u0b95\u0bb9 \u0b95\u0bbf\u0bb0\u0bbe\u0baa\u0bc8\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-5":{
-        "code": "22-5",
-        "id": 371,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Leyland Ltd.",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0dbd\u0dda\u0dbd\u0db1\u0dca\u0da9\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb2\u0bc7\u0bb2\u0ba9\u0bcd\u0b9f\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-6":{
-        "code": "22-6",
-        "id": 372,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Ashok Leyland Ltd",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0d85\u0dc1\u0ddd\u0d9a\u0dca \u0dbd\u0dda\u0dbd\u0db1\u0dca\u0da9\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b85\u0b9a\u0bcb\u0b95\u0bcd \u0bb2\u0bc7\u0bb2\u0ba9\u0bcd\u0b9f\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-7":{
-        "code": "22-7",
-        "id": 373,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Cement Ltd",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dd2\u0db8\u0dd9\u0db1\u0dca\u0dad\u0dd2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b9a\u0bc0\u0bae\u0bc6\u0ba8\u0bcd\u0ba4\u0bc1\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "22-8":{
-        "code": "22-8",
-        "id": 374,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Sri Lanka Cement Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dd2\u0db8\u0dd9\u0db1\u0dca\u0dad\u0dd2 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b9a\u0bc0\u0bae\u0bc6\u0ba8\u0bcd\u0ba4\u0bc1\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "22-9":{
-        "code": "22-9",
-        "id": 375,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Textile Mills Emporium Ltd",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0da7\u0dd9\u0d9a\u0dca\u0dc3\u0dca\u0da7\u0dba\u0dd2\u0dbd\u0dca \u0db8\u0dd2\u0dbd\u0dca\u0dc3\u0dca \u0d91\u0db8\u0dca\u0db4\u0ddd\u0dbb\u0dd2\u0dba\u0db8\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb0\u0bc6\u0b95\u0bcd\u0bb8\u0bcd\u0bb0\u0bc8\u0bb2\u0bcd \u0bae\u0bbf\u0bb2\u0bcd\u0bb8\u0bcd \u0b8e\u0bae\u0bcd\u0baa\u0bcbhp\u0baf\u0bae\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-10":{
-        "code": "22-10",
-        "id": 376,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Salusala Ltd.",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dbd\u0dd4\u0dc3\u0dbd \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b9a\u0bb2\u0bc1\u0b9a\u0bb2 \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-11":{
-        "code": "22-11",
-        "id": 377,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "National Paper Corporation Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9a\u0da9\u0daf\u0dcf\u0dc3\u0dd2 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc7\u0bb7\u0ba9\u0bb2\u0bcd \u0baa\u0bc7\u0baa\u0bcd\u0baa\u0bb0\u0bcd \u0b95\u0bbe\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bb0\u0bc7\u0bb7\u0ba9\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "22-12":{
-        "code": "22-12",
-        "id": 378,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Mineral Sands Company",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0d9b\u0db1\u0dd2\u0da2 \u0dc0\u0dd0\u0dbd\u0dd2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bae\u0bbf\u0ba9\u0bb0\u0bb2\u0bcd \u0b9a\u0bbe\u0ba3\u0bcd\u0b9f\u0bcd\u0bb8\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "22-13":{
-        "code": "22-13",
-        "id": 379,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Paranthan Chemicals Ltd.",
-        "sn_name": "\u0db4\u0dbb\u0db1\u0dca\u0dad\u0db1\u0dca \u0d9a\u0dd9\u0db8\u0dd2\u0d9a\u0dbd\u0dca\u0dc3\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0baa\u0bb0\u0ba8\u0ba4\u0ba9\u0bcd \u0b87\u0bb0\u0b9a\u0bbe\u0baf\u0ba9\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "22-14":{
-        "code": "22-14",
-        "id": 380,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Bogala Graphite Lanka Limited",
-        "sn_name": "\u0db6\u0ddd\u0d9c\u0dbd \u0d9c\u0dca\u200d\u0dbb\u0dd0\u0dc6\u0dba\u0dd2\u0da7\u0dca \u0dbd\u0d82\u0d9a\u0dcf \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0baa\u0bcb\u0b95\u0bb2 \u0b95\u0bbf\u0bb0\u0baa\u0bc8\u0b9f\u0bcd \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bcd\u0b9f\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-15":{
-        "code": "22-15",
-        "id": 381,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Lanka Phosphate Company Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0ddc\u0dc3\u0dca\u0db4\u0dda\u0da7\u0dca \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0baa\u0bbe\u0bb8\u0bcd\u0baa\u0bc7\u0b9f\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0bc6\u0ba9\u0bbf \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "22-16":{
-        "code": "22-16",
-        "id": 382,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Ceylon Ceramics Corporation (Brick and Tiles Division)",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dd2\u0d9c\u0db1\u0dca \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0(\u0d9c\u0da9\u0ddc\u0dbd\u0dca \u0dc3\u0dc4 \u0d8b\u0dbd\u0dd4 \u0d85\u0d82\u0dc1\u0dba)",
-        "tm_name": "\u0b9a\u0bbf\u0bb2\u0bcb\u0ba9\u0bcd \u0bae\u0b9f\u0bcd\u0baa\u0bbe\u0ba3\u0bcd\u0b9f \u0b95\u0bbe\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bb0\u0bc7\u0bb7\u0ba9\u0bcd (\u0b9a\u0bc6\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b93\u0b9f\u0bc1\u0b95\u0bb3\u0bcd \u0baa\u0bbf\u0bb0\u0bbf\u0bb5\u0bc1)",
-        "status": "true"
-    },
-    "22-17":{
-        "code": "22-17",
-        "id": 383,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Kahagolle Engineering Services Company Ltd. (KESCO)",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d9a\u0dc4\u0d9c\u0ddc\u0dbd\u0dca\u0dbd \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0dc3\u0dda\u0dc0\u0dcf \u0dc3\u0db8\u0dcf\u0d9c\u0db8 (16541)",
-        "tm_name": "\u0b95\u0bb9\u0b95\u0bcb\u0bb2\u0bcd \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd. (KESCO)",
-        "status": "true"
-    },
-    "22-18":{
-        "code": "22-18",
-        "id": 384,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "BCC (Pvt.) Limited",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0db6\u0dd3.\u0dc3\u0dd3.\u0dc3\u0dd3. \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0baa\u0bbf.\u0b9a\u0bbf.\u0b9a\u0bbf (\u0baa\u0bbf\u0bb0\u0bc8\u0bb5\u0bc7\u0b9f\u0bcd) \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "22-19":{
-        "code": "22-19",
-        "id": 385,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Palmyrah Development Board",
-        "sn_name": "\u0dad\u0dbd\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "Palmyrah Development Board",
-        "status": "true"
-    },
-    "22-20":{
-        "code": "22-20",
-        "id": 386,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Manthai Salt Ltd.",
-        "sn_name": "\u0db8\u0dcf\u0db1\u0dca\u0dad\u0dcf\u0dba\u0dd2 \u0dc3\u0ddd\u0dbd\u0dca\u0da7\u0dca \u0dbd\u0dd2\u0db8\u0dd2\u0da7\u0da9\u0dca",
-        "tm_name": "\u0bae\u0ba8\u0bcd\u0ba4\u0bc8 \u0b9a\u0bbe\u0bb2\u0bcd\u0b9f\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "22-21":{
-        "code": "22-21",
-        "id": 387,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Elephant Pass Saltern",
-        "sn_name": "\u0d85\u0dbd\u0dd2\u0db8\u0d82\u0d9a\u0da9 \u0dbd\u0dd4\u0dab\u0dd4 \u0dbd\u0dda\u0dc0\u0dcf\u0dba",
-        "tm_name": "\u0baf\u0bbe\u0ba9\u0bc8 \u0baa\u0bbe\u0bb8\u0bcd \u0b9a\u0bbe\u0bb2\u0bcd\u0b9f\u0bb0\u0bcd\u0ba9\u0bcd",
-        "status": "true"
-    },
-    "22-22":{
-        "code": "22-22",
-        "id": 388,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "National Gem and Jewellery Authority",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db8\u0dd0\u0dab\u0dd2\u0d9a\u0dca \u0dc3\u0dc4 \u0dc3\u0dca\u0dc0\u0dbb\u0dca\u0dab\u0dcf\u0db7\u0dbb\u0dab \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b87\u0bb0\u0ba4\u0bcd\u0ba4\u0bbf\u0ba9\u0b95\u0bcd\u0b95\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b86\u0baa\u0bb0\u0ba3 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "22-23":{
-        "code": "22-23",
-        "id": 389,
-        "institute_type": "GOV",
-        "mother_org": 366,
-        "name": "Gem and Jewellery Research Institute",
-        "sn_name": "\u0db8\u0dd0\u0dab\u0dd2\u0d9a\u0dca \u0dc3\u0dc4 \u0dc3\u0dca\u0dc0\u0dbb\u0dca\u0dab\u0dcf\u0db7\u0dbb\u0dab \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb0\u0ba4\u0bcd\u0ba4\u0bbf\u0ba9\u0b95\u0bcd\u0b95\u0bb2\u0bcd\u0b87 \u0b86\u0baa\u0bb0\u0ba3 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "23":{
-        "code": "23",
-        "id": 390,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Transport Services Management",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0baa\u0baf\u0ba3\u0bbf\u0b95\u0bb3\u0bcd \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "23-1":{
-        "code": "23-1",
-        "id": 391,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "Department of Sri Lanka Railways",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0daf\u0dd4\u0db8\u0dca\u0dbb\u0dd2\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baa\u0bc1\u0b95\u0bc8\u0baf\u0bbf\u0bb0\u0ba4\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "23-2":{
-        "code": "23-2",
-        "id": 392,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "Sri Lanka Central Transport Board",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0d9c\u0db8\u0db1\u0dcf\u0d9c\u0db8\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "23-3":{
-        "code": "23-3",
-        "id": 393,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "National Transport Medical Institute",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "23-4":{
-        "code": "23-4",
-        "id": 394,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "Department of Motor Traffic",
-        "sn_name": "\u0db8\u0ddd\u0da7\u0dbb\u0dca \u0dbb\u0dae \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bae\u0bcb\u0b9f\u0bcd\u0b9f\u0bbe \u0bb5\u0bbe\u0b95\u0ba9\u0baa\u0bcd \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "23-5":{
-        "code": "23-5",
-        "id": 395,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "National Transport Commission",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d9c\u0db8\u0db1\u0dcf\u0d9c\u0db8\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "23-6":{
-        "code": "23-6",
-        "id": 396,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "Lakdiva Engineering Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d9a\u0dca\u0daf\u0dd2\u0dc0 \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb2\u0b95\u0bcd\u0ba4\u0bbf\u0bb5 \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "23-7":{
-        "code": "23-7",
-        "id": 397,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "Werahara Engineering Services Ltd. (WESCO)",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dc0\u0dda\u0dbb\u0dc4\u0dd0\u0dbb \u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0dc3\u0dda\u0dc0\u0dcf \u0dc3\u0db8\u0dcf\u0d9c\u0db8 (WESCO)",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb5\u0bc7\u0bb0\u0bb9\u0bb0 \u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf (\u0bb1\u0bc1\u0ba8\u0bc1\u0bb3\u0bc1\u0b8a\u0bb4\u0bc1)",
-        "status": "true"
-    },
-    "23-8":{
-        "code": "23-8",
-        "id": 398,
-        "institute_type": "GOV",
-        "mother_org": 390,
-        "name": "National Council on Road Safety",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0dcf\u0dc0 \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc0\u0ba4\u0bbf\u0baa\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0baa\u0bcd \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bae\u0ba9\u0bcd\u0bb1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "24":{
-        "code": "24",
-        "id": 399,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Power and Energy",
-        "sn_name": "\u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0db6\u0dbd \u0dc4\u0dcf \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bae\u0bbf\u0ba9\u0bcd\u0bb5\u0bb2\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0b95\u0bcd\u0ba4\u0bbf\u0bb5\u0bb2\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "24-1":{
-        "code": "24-1",
-        "id": 400,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Ceylon Electricity Board and its subsidiary Companies",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0db6\u0dbd \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba \u0dc3\u0dc4 \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0bbf\u0ba9\u0bcd\u0b9a\u0bbe\u0bb0 \u0b9a\u0baa\u0bc8\u0baf\u0bc2\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcd \u0ba4\u0bc1\u0ba3\u0bc8\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "24-2":{
-        "code": "24-2",
-        "id": 401,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Lanka Electricity Company",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0db6\u0dbd \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0bbf\u0ba9\u0bcd\u0b9a\u0bbe\u0bb0\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "24-3":{
-        "code": "24-3",
-        "id": 402,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Lanka Coal Company (Pvt.) Ltd",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0d9c\u0dbd\u0d85\u0d9c\u0dd4\u0dbb\u0dd4 (\u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a) \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba8\u0bbf\u0bb2\u0b95\u0bcd\u0b95\u0bbep (\u0ba4\u0ba9\u0bbf\u0baf\u0bbe) \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "24-4":{
-        "code": "24-4",
-        "id": 403,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "LTL Holdings (Pvt.) Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d91\u0dbd\u0dca\u0da7\u0dd3\u0d91\u0dbd\u0dca \u0dc4\u0ddd\u0dbd\u0dca\u0da9\u0dd2\u0d82\u0d9c\u0dca\u0dc3\u0dca (\u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a) \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b8e\u0bb2\u0bcdhP\u0b8e\u0bb2\u0bcd \u0bb9\u0bcb\u0bb2\u0bcd\u0b9f\u0bbf\u0b99\u0bcd (\u0ba4\u0ba9\u0bbf\u0baf\u0bbe) \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "24-5":{
-        "code": "24-5",
-        "id": 404,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Sri Lanka Sustainable Energy Authority",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dd4\u0db1\u0dd2\u0dad\u0dca\u200d\u0dba \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba8\u0bbf\u0bb2\u0bc8\u0baa\u0bc6\u0bb1\u0bc1\u0ba4\u0b95\u0bc1 \u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "24-6":{
-        "code": "24-6",
-        "id": 405,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Sri Lanka Atomic Energy Board",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dbb\u0db8\u0dcf\u0dab\u0dd4\u0d9a \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b85\u0ba3\u0bc1\u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "24-7":{
-        "code": "24-7",
-        "id": 406,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Sri Lanka Atomic Energy Regulatory Council",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dbb\u0db8\u0dcf\u0dab\u0dd4\u0d9a \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0db1\u0dd2\u0dba\u0dcf\u0db8\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b85\u0ba3\u0bc1\u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0b92\u0bb4\u0bc1\u0b99\u0bcd\u0b95\u0bc1\u0bb1\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0b95\u0bc8\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "24-8":{
-        "code": "24-8",
-        "id": 407,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Ceylon Petroleum Corporation",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0d9b\u0dab\u0dd2\u0da2 \u0dad\u0dd9\u0dbd\u0dca \u0db1\u0dd3\u0dad\u0dd2\u0d9c\u0dad \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baa\u0bc6\u0bb1\u0bcd\u0bb1\u0bcc\u0bb2\u0bbf\u0baf\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "24-9":{
-        "code": "24-9",
-        "id": 408,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Ceylon Petroleum Storage Terminal Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0d9b\u0dab\u0dd2\u0da2 \u0dad\u0dd9\u0dbd\u0dca \u0d9c\u0db6\u0da9\u0dcf \u0db4\u0dbb\u0dca\u0dba\u0db1\u0dca\u0dad\u0dba",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0baa\u0bc6\u0bb1\u0bcd\u0bb1\u0bcc\u0bb2\u0bbf\u0baf\u0b95\u0bcd \u0b95\u0bb3\u0b9e\u0bcd\u0b9a\u0bbf\u0baf\u0ba4\u0bcd \u0ba4\u0bca\u0b95\u0bc1\u0ba4\u0bbf",
-        "status": "true"
-    },
-    "24-10":{
-        "code": "24-10",
-        "id": 409,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Petroleum Resources Development Secretariat",
-        "sn_name": "\u0d9b\u0dab\u0dd2\u0da2 \u0dad\u0dd9\u0dbd\u0dca \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0baa\u0bc6\u0b9f\u0bcd\u0bb0\u0bcb\u0bb2\u0bbf\u0baf \u0bb5\u0bb3 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "24-11":{
-        "code": "24-11",
-        "id": 410,
-        "institute_type": "GOV",
-        "mother_org": 399,
-        "name": "Polipto Lanka (Pvt.) Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0db4\u0ddc\u0dbd\u0ddc\u0db4\u0dca\u0da7\u0ddd \u0dbd\u0d82\u0d9a\u0dcf (\u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a) \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0baa\u0bca\u0bb2\u0bbf\u0baa\u0bcd\u0bb0\u0bcb \u0bb2\u0b99\u0bcd\u0b95\u0bbe (\u0ba4\u0ba9\u0bbf\u0baf\u0bbe) \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "25":{
-        "code": "25",
-        "id": 411,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Environment and Wildlife Resources",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc3\u0dbb \u0dc0\u0db1\u0da2\u0dd3\u0dc0\u0dd3 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bbe\u0b9f\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0ba9\u0b9a\u0bc0\u0bb5\u0bb0\u0bbe\u0b9a\u0bbf\u0b95\u0bb3\u0bcd \u0bb5\u0bb3\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "25-1":{
-        "code": "25-1",
-        "id": 412,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Department of Forest Conservation",
-        "sn_name": "\u0dc0\u0db1 \u0dc3\u0d82\u200d\u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0ba9\u0baa\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-2":{
-        "code": "25-2",
-        "id": 413,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Central Environmental Authority",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dbb\u0dd2\u0dc3\u0dbb \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bbe\u0b9f\u0bb2\u0bcd \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "25-3":{
-        "code": "25-3",
-        "id": 414,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Geological Survey and Mines Bureau",
-        "sn_name": "\u0db7\u0dd6\u0dc0\u0dd2\u0daf\u0dca\u200d\u0dba\u0dcf \u0dc3\u0db8\u0dd3\u0d9a\u0dca\u0dc2\u0dab \u0dc4\u0dcf \u0db4\u0dad\u0dbd\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba\u0dca",
-        "tm_name": "\u0baa\u0bc1\u0bb5\u0bbf\u0b9a\u0bcd\u0b9a\u0bbep\u0ba4\u0bb5\u0bbf\u0baf\u0bb2\u0bcd \u0b85\u0bb3\u0bb5\u0bc8\u0b87 \u0b9a\u0bc1\u0bb0\u0b99\u0bcd\u0b95\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-4":{
-        "code": "25-4",
-        "id": 415,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "GSMB Technical Services (Pvt.) Ltd",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad GSMB \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab\u0dd2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b9c\u0bbf.\u0b8e\u0bb8\u0bcd.\u0b8e\u0bae\u0bcd.\u0baa\u0bbf \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd (\u0baa\u0bbf\u0bb0\u0bc8\u0bb5\u0bc7\u0b9f\u0bcd) \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "25-5":{
-        "code": "25-5",
-        "id": 416,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "State Timber Corporation",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0daf\u0dd0\u0dc0 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a \u0bae\u0bb0\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-6":{
-        "code": "25-6",
-        "id": 417,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Lanka Timber Plant and Industries",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf \u0da7\u0dd2\u0db8\u0dca\u0db6\u0dbb\u0dca \u0db4\u0dca\u0dbd\u0dcf\u0db1\u0dca\u0da7\u0dca \u0d87\u0db1\u0dca\u0da9\u0dca \u0d89\u0db1\u0dca\u0da9\u0dc3\u0dca\u0da7\u0dca\u200d\u0dbb\u0dd3\u0dc3\u0dca",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0bae\u0bb0 \u0b86\u0bb2\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0b95\u0bb3\u0bcd",
-        "status": "true"
-    },
-    "25-7":{
-        "code": "25-7",
-        "id": 418,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Marine Environment Protection Authority",
-        "sn_name": "\u0dc3\u0db8\u0dd4\u0daf\u0dca\u200d\u0dbb\u0dd3\u0dba \u0db4\u0dbb\u0dd2\u0dc3\u0dbb \u0d86\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b95\u0bb0\u0bc8\u0baf\u0bcb\u0bb0 \u0b9a\u0bc2\u0bb4\u0bb2\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "25-8":{
-        "code": "25-8",
-        "id": 419,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Department of Coast Conservation and Coastal Resource Management",
-        "sn_name": "\u0dc0\u0dd9\u0dbb\u0dc5 \u0dc3\u0d82\u200d\u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0dc4\u0dcf \u0dc0\u0dd9\u0dbb\u0dc5 \u0dc3\u0db8\u0dca\u0db4\u0dad\u0dca \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bb0\u0bc8\u0baf\u0bcb\u0bb0\u0baa\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-9":{
-        "code": "25-9",
-        "id": 420,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Department of National Zoological Gardens",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc3\u0dad\u0dca\u0dc0\u0ddd\u0daf\u0dca\u200d\u0dba\u0dcf\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0bae\u0bbf\u0bb0\u0bc1\u0b95\u0b95\u0bcd\u0b95\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0b9a\u0bcd\u0b9a\u0bbe\u0bb2\u0bc8 \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-10":{
-        "code": "25-10",
-        "id": 421,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Department of National Botanical Gardens",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0d8b\u0daf\u0dca\u0db7\u0dd2\u0dad \u0d8b\u0daf\u0dca\u200d\u0dba\u0dcf\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0ba4\u0bbe\u0bb5\u0bb0\u0baa\u0bcd \u0baa\u0bc1\u0bb7\u0bc1\u0b99\u0bcd\u0b95\u0bbe \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-11":{
-        "code": "25-11",
-        "id": 422,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Department of Wildlife Conservation",
-        "sn_name": "\u0dc0\u0db1\u0da2\u0dd3\u0dc0\u0dd3 \u0dc3\u0d82\u200d\u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb5\u0ba9\u0b9a\u0bc0\u0bb5\u0bb0\u0bbe\u0b9a\u0bbf\u0b95\u0bb3\u0bcd \u0baa\u0bbe\u0ba4\u0bc1\u0b95\u0bbe\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "25-12":{
-        "code": "25-12",
-        "id": 423,
-        "institute_type": "GOV",
-        "mother_org": 411,
-        "name": "Wildlife Trust",
-        "sn_name": "\u0dc0\u0db1\u0da2\u0dd3\u0dc0\u0dd3 \u0db7\u0dcf\u0dbb\u0dba",
-        "tm_name": "\u0bb5\u0ba9\u0b9a\u0bc0\u0bb5\u0bb0\u0bbe\u0b9a\u0bbf\u0b95\u0bb3\u0bcd \u0ba8\u0bae\u0bcd\u0baa\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0baa\u0bcd\u0baa\u0bca\u0bb1\u0bc1\u0baa\u0bcd\u0baa\u0bc1",
-        "status": "true"
-    },
-   "26":{
-        "code": "26",
-        "id": 424,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Land and Land Development",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0dc4\u0dcf \u0d89\u0da9\u0db8\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0bbe\u0ba3\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bbe\u0ba3\u0bbf \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "26-1":{
-        "code": "26-1",
-        "id": 425,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Department of Land Commissioner General",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0da2\u0db1\u0dbb\u0dcf\u0dbd\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0ba3\u0bbf \u0b86\u0ba3\u0bc8\u0baf\u0bbe\u0bb3 \u0ba8\u0bbe\u0baf\u0b95\u0bae\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "26-2":{
-        "code": "26-2",
-        "id": 426,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Land Reform Commission",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dbb\u0dab \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0ba3\u0bbf \u0b9a\u0bc0\u0ba4\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4 \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "26-3":{
-        "code": "26-3",
-        "id": 427,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Department of Land Settlement",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0db1\u0dd2\u0dbb\u0dc0\u0dd4\u0dbd\u0dca \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0bb2 \u0ba4\u0bc0\u0bb0\u0bcd\u0bb5\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "26-4":{
-        "code": "26-4",
-        "id": 428,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Department of Surveyor General",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd4\u0db8\u0dca\u0db4\u0dad\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bb0\u0bcd\u0bb5\u0bc7\u0baf\u0bb0\u0bcd \u0b9c\u0bc6\u0ba9\u0bb0\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "26-5":{
-        "code": "26-5",
-        "id": 429,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Institute of Surveying and Mapping",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd2\u0db1\u0dca\u0daf\u0ddd\u0dbb\u0dd4 \u0dc3\u0dc4 \u0dc3\u0dd2\u0dad\u0dd2\u0dba\u0db8\u0dca \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0ba9\u0bcd\u0bb8\u0bcd\u0b9f\u0bbf\u0b9f\u0bbf\u0baf\u0bc2\u0b9f\u0bcd \u0b86\u0baa\u0bcd \u0b9a\u0bb0\u0bcd\u0bb5\u0bc7\u0baf\u0bbf\u0b99\u0bcd \u0b85\u0ba3\u0bcd\u0b9f\u0bcd \u0bae\u0bc7\u0baa\u0bcd\u0baa\u0bbf\u0b99\u0bcd",
-        "status": "true"
-    },
-    "26-6":{
-        "code": "26-6",
-        "id": 430,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Land Survey Council",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0db8\u0dd0\u0db1\u0dd4\u0db8\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0bb2 \u0b85\u0bb3\u0bb5\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "26-7":{
-        "code": "26-7",
-        "id": 431,
-        "institute_type": "GOV",
-        "mother_org": 424,
-        "name": "Department of Land Use Policy Planning",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0db4\u0dbb\u0dd2\u0dc4\u0dbb\u0dab \u0db4\u0dca\u200d\u0dbb\u0dad\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd2 \u0dc3\u0dd0\u0dbd\u0dc3\u0dd4\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0bb2 \u0baa\u0baf\u0ba9\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b95\u0bca\u0bb3\u0bcd\u0b95\u0bc8 \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "27":{
-        "code": "27",
-        "id": 432,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Plantation Industries and Export Agriculture",
-        "sn_name": "\u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc3\u0dc4 \u0d85\u0db4\u0db1\u0dba\u0db1 \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0b95\u0bcd\u0b9f \u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8f\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0ba4\u0bbf \u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "27-1":{
-        "code": "27-1",
-        "id": 433,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "National Institute of Plantation Management",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0bae\u0bc1\u0b95\u0bbe\u0bae\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-2":{
-        "code": "27-2",
-        "id": 434,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Sri Lanka Tea Board",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dad\u0dda \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba4\u0bc7\u0baf\u0bbf\u0bb2\u0bc8\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "27-3":{
-        "code": "27-3",
-        "id": 435,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Tea Small Holdings Development Authority",
-        "sn_name": "\u0d9a\u0dd4\u0da9\u0dcf \u0dad\u0dda \u0dc0\u0dad\u0dd4 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bc1 \u0ba4\u0bc7\u0baf\u0bbf\u0bb2\u0bc8\u0ba4\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "27-4":{
-        "code": "27-4",
-        "id": 436,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Tea Shakthi Fund",
-        "sn_name": "\u0dad\u0dda \u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0ba4\u0bc7\u0baf\u0bbf\u0bb2\u0bc8 \u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-5":{
-        "code": "27-5",
-        "id": 437,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Tea Research Institute",
-        "sn_name": "\u0dad\u0dda \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0baf\u0bbf\u0bb2\u0bc8 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-6":{
-        "code": "27-6",
-        "id": 438,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Tea and Rubber Estates (Control and Fragmentation) Board",
-        "sn_name": "\u0dad\u0dda \u0dc4\u0dcf \u0dbb\u0db6\u0dbb\u0dca \u0dc0\u0dad\u0dd4 (\u0db4\u0dcf\u0dbd\u0db1\u0dba \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0dc4\u0dcf \u0d9a\u0dd0\u0db6\u0dbd\u0dd2 \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda) \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0baf\u0bbf\u0bb2\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb0\u0baa\u0bcd\u0baa\u0bb0\u0bcd \u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0b99\u0bcd\u0b95\u0bb3\u0bcd (\u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0baa\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bc1\u0ba3\u0bcd\u0b9f\u0bc1 \u0ba4\u0bc1\u0ba3\u0bcd\u0b9f\u0bbe\u0b95) \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-7":{
-        "code": "27-7",
-        "id": 439,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Kalubovitiyana Tea Factory Ltd",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d9a\u0dbd\u0dd4\u0db6\u0ddd\u0dc0\u0dd2\u0da7\u0dd2\u0dba\u0db1 \u0dad\u0dda \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc1\u0dcf\u0dbd\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bc1\u0baa\u0bcb\u0bb5\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf\u0bbe\u0ba9 \u0ba4\u0bc7\u0baf\u0bbf\u0bb2\u0bc8 \u0ba4\u0bca\u0bb4\u0bbf\u0bb1\u0bcd\u0b9a\u0bbe\u0bb2\u0bc8 \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd",
-        "status": "true"
-    },
-    "27-8":{
-        "code": "27-8",
-        "id": 440,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Janatha Estate Development Board",
-        "sn_name": "\u0da2\u0db1\u0dad\u0dcf \u0dc0\u0dad\u0dd4 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0bae\u0b95\u0bcd\u0b95\u0bb3\u0bcd \u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0b9a\u0bcd \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "27-9":{
-        "code": "27-9",
-        "id": 441,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Sri Lanka State Plantation Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b85\u0bb0\u0b9a \u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0b95\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bbe\u0baa\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-10":{
-        "code": "27-10",
-        "id": 442,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Elkaduwa Plantation Company Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d87\u0dbd\u0dca\u0d9a\u0da9\u0dd4\u0dc0 \u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b8e\u0bb2\u0bcd\u0b95\u0b9f\u0bc1\u0bb5 (\u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0b95\u0bcd) \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "27-11":{
-        "code": "27-11",
-        "id": 443,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Kurunegala Plantation Company Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d9a\u0dd4\u0dbb\u0dd4\u0dab\u0dd1\u0d9c\u0dbd \u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b95\u0bc1\u0bb0\u0bc1\u0ba8\u0bbe\u0b95\u0bb2\u0bcd \u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "27-12":{
-        "code": "27-12",
-        "id": 444,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Chilaw Plantation Company Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dc4\u0dbd\u0dcf\u0dc0\u0dad \u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0b9a\u0bbf\u0bb2\u0bbe\u0baa\u0bae\u0bcd \u0baa\u0bc6\u0bb0\u0bc1\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0b95\u0bcd \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "27-13":{
-        "code": "27-13",
-        "id": 445,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Galoya Plantation (Pvt.) Company",
-        "sn_name": "\u0d9c\u0dbd\u0dca\u0d94\u0dba \u0dc0\u0dd0\u0dc0\u0dd2\u0dbd\u0dd2 (\u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a) \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b95\u0bb2\u0bcb\u0baf\u0bbe \u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0bae\u0bcd (\u0baa\u0bbf\u0bb0\u0bc8\u0bb5\u0bc7\u0b9f\u0bcd) \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-14":{
-        "code": "27-14",
-        "id": 446,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Department of Rubber Development",
-        "sn_name": "\u0dbb\u0db6\u0dbb\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0bb0\u0baa\u0bcd\u0baa\u0bb0\u0bcd \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "27-15":{
-        "code": "27-15",
-        "id": 447,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Thurusaviya Fund",
-        "sn_name": "\u0dad\u0dd4\u0dbb\u0dd4\u0dc3\u0dc0\u0dd2\u0dba \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0ba4\u0bc1\u0bb0\u0bc1\u0b9a\u0bb5\u0bbf\u0baf \u0ba8\u0bbf\u0ba4\u0bbf\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-16":{
-        "code": "27-16",
-        "id": 448,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Rubber Research Institute",
-        "sn_name": "\u0dbb\u0db6\u0dbb\u0dca \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0bb0\u0baa\u0bcd\u0baa\u0bb0\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-17":{
-        "code": "27-17",
-        "id": 449,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Sri Lanka Rubber Manufacturing and Export Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dbb\u0db6\u0dbb\u0dca \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc3\u0dc4 \u0d85\u0db4\u0db1\u0dba\u0db1 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bb0\u0baa\u0bcd\u0baa\u0bb0\u0bcd \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8f\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0ba4\u0bbf \u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-18":{
-        "code": "27-18",
-        "id": 450,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Coconut Cultivation Board",
-        "sn_name": "\u0db4\u0ddc\u0dbd\u0dca \u0dc0\u0d9c\u0dcf \u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dda \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0ba4\u0bc6\u0b99\u0bcd\u0b95\u0bc1 \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "27-19":{
-        "code": "27-19",
-        "id": 451,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Coconut Development Authority",
-        "sn_name": "\u0db4\u0ddc\u0dbd\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc6\u0b99\u0bcd\u0b95\u0bc1 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-20":{
-        "code": "27-20",
-        "id": 452,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Coconut Research Institute",
-        "sn_name": "\u0db4\u0ddc\u0dbd\u0dca \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0ba4\u0bc7\u0b99\u0bcd\u0b95\u0bbe\u0baf\u0bcd \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-21":{
-        "code": "27-21",
-        "id": 453,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Kapruka Fund",
-        "sn_name": "\u0d9a\u0db4\u0dca\u0dbb\u0dd4\u0d9a \u0d85\u0dbb\u0db8\u0dd4\u0daf\u0dbd",
-        "tm_name": "\u0b95\u0baa\u0bcd\u0bb0\u0bc1\u0b95\u0bbe \u0ba8\u0bbf\u0ba4\u0bbf",
-        "status": "true"
-    },
-    "27-22":{
-        "code": "27-22",
-        "id": 454,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Sri Lanka Cashew Corporation",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0d9a\u0da2\u0dd4 \u0dc3\u0d82\u0dc3\u0dca\u0dae\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0bae\u0bc1\u0ba8\u0bcd\u0ba4\u0bbf\u0bb0\u0bbf \u0b95\u0bb4\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-23":{
-        "code": "27-23",
-        "id": 455,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Hingurana Sugar Industry Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dc4\u0dd2\u0d9f\u0dd4\u0dbb\u0dcf\u0db1 \u0dc3\u0dd3\u0db1\u0dd2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb9\u0bbf\u0b99\u0bcd\u0b95\u0bc1\u0bb0\u0bbe\u0ba9\u0bbe \u0b9a\u0bb0\u0bcd\u0b95\u0bcd\u0b95\u0bb0\u0bc8 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "27-24":{
-        "code": "27-24",
-        "id": 456,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Ceylon Sugar (Pvt.) Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0dd3\u0db1\u0dd2 (\u0db4\u0dd4\u0daf\u0dca\u0d9c\u0dbd\u0dd2\u0d9a) \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb2\u0b99\u0bcd\u0b95\u0bbe \u0b9a\u0bc0\u0ba9\u0bbf (\u0ba4\u0ba9\u0bbf\u0baf\u0bbe\u0bb0\u0bcd) \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf",
-        "status": "true"
-    },
-    "27-25":{
-        "code": "27-25",
-        "id": 457,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Kantale Sugar Company Ltd.",
-        "sn_name": "\u0d9a\u0db1\u0dca\u0dad\u0dbd\u0dda \u0dc3\u0dd3\u0db1\u0dd2 \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0b95\u0bbe\u0ba8\u0bcd\u0ba4\u0bb2\u0bc7 \u0b9a\u0bb0\u0bcd\u0b95\u0bcd\u0b95\u0bb0\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "27-26":{
-        "code": "27-26",
-        "id": 458,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Sugar Cane Research Institute",
-        "sn_name": "\u0d8b\u0d9a\u0dca \u0db4\u0dbb\u0dca\u0dba\u0dda\u0dc2\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b95\u0bb0\u0bc1\u0bae\u0bcd\u0baa\u0bc1 \u0b86\u0bb0\u0bbe\u0baf\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-27":{
-        "code": "27-27",
-        "id": 459,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Department of Export Agriculture",
-        "sn_name": "\u0d85\u0db4\u0db1\u0dba\u0db1 \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b8f\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0ba4\u0bbf \u0b95\u0bae\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "27-28":{
-        "code": "27-28",
-        "id": 460,
-        "institute_type": "GOV",
-        "mother_org": 432,
-        "name": "Spices and Allied Products Marketing Board.",
-        "sn_name": "\u0d9a\u0dd4\u0dc5\u0dd4\u0db6\u0da9\u0dd4 \u0dc4\u0dcf \u0d92 \u0d86\u0dc1\u0dca\u200d\u0dbb\u0dd3\u0dad \u0db1\u0dd2\u0dc1\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0d85\u0dbd\u0dd9\u0dc0\u0dd2 \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba",
-        "tm_name": "\u0bae\u0b9a\u0bbe\u0bb2\u0bbe \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bc1\u0b9f\u0ba9\u0bcd \u0ba4\u0bca\u0b9f\u0bb0\u0bcd\u0baa\u0bc1\u0b9f\u0bc8\u0baf \u0ba4\u0baf\u0bbe\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1\u0b95\u0bb3\u0bcd \u0b9a\u0ba8\u0bcd\u0ba4\u0bc8\u0baa\u0bcd\u0baa\u0b9f\u0bc1\u0ba4\u0bcd\u0ba4\u0bb2\u0bcd \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd.",
-        "status": "true"
-    },
-    "28":{
-        "code": "28",
-        "id": 461,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Ministry of Industrial Export and Investment Promotion",
-        "sn_name": "\u0d9a\u0dcf\u0dbb\u0dca\u0db8\u0dd2\u0d9a \u0d85\u0db4\u0db1\u0dba\u0db1 \u0dc3\u0dc4 \u0d86\u0dba\u0ddd\u0da2\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0b8f\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bae\u0bc1\u0ba4\u0bb2\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1 \u0b8a\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "29":{
-        "code": "29",
-        "id": 462,
-        "institute_type": "GOV",
-        "mother_org": 0,
-        "name": "Minister of Tourism and Civil Aviation",
-        "sn_name": "\u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0dc3\u0dc4 \u0d9c\u0dd4\u0dc0\u0db1\u0dca \u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbf\u0bae\u0bbe\u0ba9 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1",
-        "status": "true"
-    },
-    "29-1":{
-        "code": "29-1",
-        "id": 463,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Sri Lanka Tourism Promotion Bureau",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd;\u0b95\u0bc8\u0b9a\u0bcd \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0b8a\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bbf\u0baa\u0bcd\u0baa\u0bc1\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "29-2":{
-        "code": "29-2",
-        "id": 464,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Sri Lanka Tourism Development Authority",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0b85\u0baa\u0bbf\u0bb5\u0bbf\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "29-3":{
-        "code": "29-3",
-        "id": 465,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Sri Lanka Institute of Tourism and Hotel Management",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0dc4\u0dcf \u0dc4\u0ddd\u0da7\u0dbd\u0dca \u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0d86\u0dba\u0dad\u0db1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb9\u0bcb\u0b9f\u0bcd\u0b9f\u0bb2\u0bcd \u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd",
-        "status": "true"
-    },
-    "29-4":{
-        "code": "29-4",
-        "id": 466,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Sri Lanka Exhibition and Convention Bureau",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf \u0db4\u0dca\u200d\u0dbb\u0daf\u0dbb\u0dca\u0dc1\u0db1 \u0dc4\u0dcf \u0dc3\u0db8\u0dca\u0db8\u0dda\u0dbd\u0db1 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0b95\u0ba3\u0bcd\u0b95\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bae\u0bcd\u0bae\u0bc7\u0bb3\u0ba9\u0baa\u0bcd \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "29-5":{
-        "code": "29-5",
-        "id": 467,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Civil Aviation Authority",
-        "sn_name": "\u0dc3\u0dd2\u0dc0\u0dd2\u0dbd\u0dca \u0d9c\u0dd4\u0dc0\u0db1\u0dca\u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0b9a\u0bbf\u0bb5\u0bbf\u0bb2\u0bcd \u0bb5\u0bbf\u0bae\u0bbe\u0ba9 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "29-6":{
-        "code": "29-6",
-        "id": 468,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Airport and Aviation Services (Sri Lanka) Ltd.",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0d9c\u0dd4\u0dc0\u0db1\u0dca \u0dad\u0ddc\u0da7\u0dd4\u0db4\u0dc5 \u0dc4\u0dcf \u0d9c\u0dd4\u0dc0\u0db1\u0dca\u0dc3\u0dda\u0dc0\u0dcf (\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0dbd\u0d82\u0d9a\u0dcf) \u0dc3\u0db8\u0dcf\u0d9c\u0db8",
-        "tm_name": "\u0bb5\u0bbf\u0bae\u0bbe\u0ba9 \u0ba8\u0bbf\u0bb2\u0bc8\u0baf\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbf\u0bae\u0bbe\u0ba9 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd (\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8) \u0bb2\u0bbf\u0bae\u0bbf\u0b9f\u0bc6\u0b9f\u0bcd.",
-        "status": "true"
-    },
-    "29-7":{
-        "code": "29-7",
-        "id": 469,
-        "institute_type": "GOV",
-        "mother_org": 462,
-        "name": "Sri Lankan Air Line Limited and its subsidiaries",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf\u0dc3\u0dc4\u0dd2\u0dad \u0dc1\u0dca\u200d\u0dbb\u0dd3\u0dbd\u0db1\u0dca\u0d9a\u0db1\u0dca \u0d91\u0dba\u0dcf\u0dbb\u0dca \u0dbd\u0dba\u0dd2\u0db1\u0dca \u0dc3\u0dc4 \u0d91\u0dc4\u0dd2 \u0db4\u0dcf\u0dbd\u0dd2\u0dad \u0dc3\u0db8\u0dcf\u0d9c\u0db8\u0dca",
-        "tm_name": "\u0bb5\u0bb0\u0bc8\u0baf\u0bb1\u0bc1\u0b95\u0bcd\u0b95\u0baa\u0bcd\u0baa\u0b9f\u0bcd\u0b9f \u0bb8\u0bcd\u0bb0\u0bc0 \u0bb2\u0b99\u0bcd\u0b95\u0ba9\u0bcd \u0b8e\u0baf\u0bbe\u0bb0\u0bcd \u0bb2\u0bc8\u0ba9\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b85\u0ba4\u0ba9\u0bcb\u0b9f\u0bbf\u0ba3\u0bc8\u0ba8\u0bcd\u0ba4 \u0b95\u0bae\u0bcd\u0baa\u0ba9\u0bbf\u0b95\u0bb3\u0bc1\u0bae\u0bcd",
-        "status": "true"
-    },
-    "30":{
-        "code": "30",
-        "id": 470,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "Public Service Commission",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0b9a\u0bbe\u0b99\u0bcd\u0b95 \u0b9a\u0bc7\u0bb5\u0bc8 \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "31":{
-        "code": "31",
-        "id": 471,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "National Police Commission",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0ddc\u0dbd\u0dd2\u0dc3\u0dca \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0baa\u0bcb\u0bb2\u0bc0\u0bb8\u0bcd \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "32":{
-        "code": "32",
-        "id": 472,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "Human Rights Commission",
-        "sn_name": "\u0db8\u0dcf\u0db1\u0dc0 \u0dc4\u0dd2\u0db8\u0dd2\u0d9a\u0db8\u0dca \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba9\u0bbf\u0ba4 \u0b89\u0bb0\u0bbf\u0bae\u0bc8\u0b95\u0bb3\u0bcd \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "33":{
-        "code": "33",
-        "id": 473,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "The Commission to Investigate Allegations of Bribery or Corruption",
-        "sn_name": "\u0d85\u0dbd\u0dca\u0dbd\u0dc3\u0dca \u0dc4\u0ddd \u0daf\u0dd6\u0dc2\u0dab \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0db3 \u0dc0\u0dd2\u0db8\u0dbb\u0dca\u0dc1\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b9e\u0bcd\u0b9a\u0bae\u0bcd \u0b85\u0bb2\u0bcd\u0bb2\u0ba4\u0bc1 \u0b8a\u0bb4\u0bb2\u0bcd \u0baa\u0bb1\u0bcd\u0bb1\u0bbf\u0baf \u0b9a\u0bbe\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0bc1\u0ba4\u0bb2\u0bcd\u0b95\u0bb3\u0bc8\u0baa\u0bcd \u0baa\u0bc1\u0bb2\u0ba9\u0bbe\u0baf\u0bcd\u0bb5\u0bc1 \u0b9a\u0bc6\u0baf\u0bcd\u0bb5\u0ba4\u0bb1\u0bcd\u0b95\u0bbe\u0ba9 \u0b86\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bc1\u0bb4\u0bc1",
-        "status": "true"
-    },
-    "34":{
-        "code": "34",
-        "id": 474,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "Finance Commission",
-        "sn_name": "\u0db8\u0dd6\u0dbd\u0dca\u200d\u0dba \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0ba4\u0bbf \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "35":{
-        "code": "35",
-        "id": 475,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "Delimitation commission",
-        "sn_name": "\u0dc3\u0dd3\u0db8\u0dcf \u0db1\u0dd2\u0dbb\u0dca\u0dab\u0dba \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb0\u0bae\u0bcd\u0baa\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "36":{
-        "code": "36",
-        "id": 476,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "Audit Service Commission",
-        "sn_name": "\u0dc0\u0dd2\u0d9c\u0dab\u0db1 \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0ba3\u0bbf\u0b95\u0bcd\u0b95\u0bc8 \u0b9a\u0bc7\u0bb5\u0bc8 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "37":{
-        "code": "37",
-        "id": 477,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "National Procurement Commission",
-        "sn_name": "\u0da2\u0dcf\u0dad\u0dd2\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0d9a\u0ddc\u0db8\u0dd2\u0dc3\u0db8",
-        "tm_name": "\u0ba4\u0bc7\u0b9a\u0bbf\u0baf \u0b95\u0bca\u0bb3\u0bcd\u0bae\u0bc1\u0ba4\u0bb2\u0bcd \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "38":{
-        "code": "38",
-        "id": 478,
-        "institute_type": "COM",
-        "mother_org": 0,
-        "name": "Election Commission of Sri Lanka",
-        "sn_name": "\u0db8\u0dd0\u0dad\u0dd2\u0dc0\u0dbb\u0dab \u200c\u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb2\u0b99\u0bcd\u0b95\u0bc8 \u0ba4\u0bc7\u0bb0\u0bcd\u0ba4\u0bb2\u0bcd \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "39":{
-        "code": "39",
-        "id": 479,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Western Provincial Council",
-        "sn_name": "\u0db6\u0dc3\u0dca\u0db1\u0dcf\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "39-1":  {
-        "code": "39-1",
-        "id": 480,
-        "institute_type": "",
-        "mother_org": "null",
-        "name": "",
-        "sn_name": "\"\u0db6\u0dc3\u0dca\u0db1\u0dcf\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "",
-        "status": "true"
-    },
-    "39-2":  {
-        "code": "39-2",
-        "id": 481,
-        "institute_type": "",
-        "mother_org": "null",
-        "name": "",
-        "sn_name": "\"\u0db6\u0dc3\u0dca\u0db1\u0dcf\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0d86\u0dbb\u0dca\u0dae\u0dd2\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2 \u0db6\u0dbd \u0dc4\u0dcf \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0db4\u0dbb\u0dd2\u0dc3\u0dbb \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0da2\u0dbd \u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0da2\u0dbd\u0dcf\u0db4\u0dc0\u0dc4\u0db1 \u0dc3\u0dc4 \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba ",
-        "tm_name": "",
-        "status": "true"
-    },
-    "39-3":  {
-        "code": "39-3",
-        "id": 482,
-        "institute_type": "",
-        "mother_org": "null",
-        "name": "",
-        "sn_name": "\"\u0db6\u0dc3\u0dca\u0db1\u0dcf\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0dc4\u0dcf \u0d9a\u0dbd\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc4\u0dcf \u0dba\u0dde\u0dc0\u0db1 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0dc3\u0dc4 \u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab\u0dba \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba ",
-        "tm_name": "",
-        "status": "true"
-    },
-    "39-4":  {
-        "code": "39-4",
-        "id": 483,
-        "institute_type": "",
-        "mother_org": "null",
-        "name": "",
-        "sn_name": "\"\u0db6\u0dc3\u0dca\u0db1\u0dcf\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0d89\u0da9\u0db8\u0dca \u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0db0\u0dd3\u0dc0\u0dbb \u0dc3\u0dad\u0dca\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc1\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc4\u0dcf \u0d9c\u0ddc\u0dc0\u0dd2\u0da2\u0db1 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0daf \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba ",
-        "tm_name": "",
-        "status": "true"
-    },
-    "39-5":{
-        "code": "39-5",
-        "id": 484,
-        "institute_type": "",
-        "mother_org": 480,
-        "name": "Ministry of Health Indigenous Medicine Social Welfare Probation and Child Care Services Women's Affairs and Council Affairs- Western Province",
-        "sn_name": "\u0db6\u0dc3\u0dca\u0db1\u0dcf\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dd4\u0db7 \u0dc3\u0dcf\u0daf\u0db1 \u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf \u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0dcf\u0db1\u0dca\u0dad\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0dc3\u0dc4 \u0dc3\u0db7\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0bcd \u0b9a\u0bae\u0bc2\u0b95 \u0ba8\u0bb2\u0ba9\u0bcd \u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0baa\u0bc6\u0ba3\u0bcd\u0b95\u0bb3\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0baa\u0bc8 \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd - \u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40":{
-        "code": "40",
-        "id": 485,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Southern Provincial Council",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "40-1":{
-        "code": "40-1",
-        "id": 486,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Governor's Office - Southern Province",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40-2":{
-        "code": "40-2",
-        "id": 487,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Chief Minister of Southern Province Ministry of Law & Order Health & Indigenous Medicine Local Government Transport & Tourism",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba \u0db1\u0dd3\u0dad\u0dd2\u0dba \u0dc4\u0dcf \u0dc3\u0dcf\u0db8\u0dba \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc4\u0dcf \u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0dc3\u0dc4 \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bae\u0bc1\u0ba4\u0bb2\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bb0\u0bcd \u0b9a\u0b9f\u0bcd\u0b9f\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b92\u0bb4\u0bc1\u0b99\u0bcd\u0b95\u0bc1 \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0bcd \u0b89\u0bb3\u0bcd\u0bb3\u0bc2\u0bb0\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40-3":{
-        "code": "40-3",
-        "id": 488,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Department of Health Services Southern Province",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 \u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40-4":{
-        "code": "40-4",
-        "id": 489,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Department of Southern Province Ayurveda",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dba\u0dd4\u0dbb\u0dd4\u0dc0\u0dda\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd \u0b86\u0baf\u0bc1\u0bb0\u0bcd\u0bb5\u0bc7\u0ba4 \u0ba4\u0bbf\u0ba3\u0bc8\u0b95\u0bcd\u0b95\u0bb3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40-5":{
-        "code": "40-5",
-        "id": 490,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Department of Southern Local Government",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "40-6":{
-        "code": "40-6",
-        "id": 491,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Southern Provincial Department of Motor Traffic",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0ddc\u0da7\u0dbb\u0dca \u0dbb\u0dae \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bae\u0bcb\u0b9f\u0bcd\u0b9f\u0bbe\u0bb0\u0bcd \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "40-7":{
-        "code": "40-7",
-        "id": 492,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Southern Provincial Development Authority",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40-8":{
-        "code": "40-8",
-        "id": 493,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Southern Provincial Road Passenger Transport Authority",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0dcf\u0dbb\u0dca\u0d9c\u0dc3\u0dca\u0dae \u0db8\u0d9c\u0dd3 \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0bbe\u0bb2\u0bc8 \u0baa\u0baf\u0ba3\u0bbf\u0b95\u0bb3\u0bcd \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd",
-        "status": "true"
-    },
-    "40-9":{
-        "code": "40-9",
-        "id": 494,
-        "institute_type": "PRO",
-        "mother_org": 485,
-        "name": "Southern Province Ruhuna Tourist Bureau",
-        "sn_name": "\u0daf\u0d9a\u0dd4\u0dab\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dbb\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb0\u0bc1\u0bb9\u0bc1\u0ba9\u0bbe \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41":{
-        "code": "41",
-        "id": 495,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Central Provincial Council",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "41-1":{
-        "code": "41-1",
-        "id": 496,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Governor's office - Central Province",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-2":{
-        "code": "41-2",
-        "id": 497,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Ministry of Finance and Planning Local Government and Provincial Administration Manpower Education and Cultural Affairs Tourism Land Co-operative Development Trade and Commerce Food and Distribution a",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u200d\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba \u0dc3\u0dc4 \u0db8\u0dd4\u0daf\u0dbd\u0dca \u0dc4\u0dcf \u0d9a\u200d\u0dca\u200d\u0dbb\u0db8 \u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0db1\u0dd3\u0dad\u0dd2\u0dba \u0dc4\u0dcf \u0dc3\u0dcf\u0db8\u0dba \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0dc4\u0dcf \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dbb\u0dd2\u0db4\u0dcf\u0dbd\u0db1\u0dba \u0db8\u0dd2\u0db1\u0dd2\u0dc3\u0dca\u0db6\u0dbd \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc4\u0dcf \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0db4\u200d\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0d89\u0da9\u0db8\u0dca \u0dc3\u0db8\u0dd6\u0db4\u0dcf\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc0\u0dd9\u0dc5\u0db3 \u0dc4\u0dcf \u0dc0\u0dcf\u0dab\u0dd2\u0da2 \u0d86\u0dc4\u0dcf\u0dbb ",
-        "tm_name": "\u0ba8\u0bbf\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd \u0b89\u0bb3\u0bcd\u0bb3\u0bc2\u0bb0\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0ba8\u0bbf\u0bb0\u0bcd\u0bb5\u0bbe\u0b95\u0bae\u0bcd \u0bae\u0ba9\u0bbf\u0ba4\u0bb5\u0bb3\u0bae\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bb2\u0bbe\u0b9a\u0bcd\u0b9a\u0bbe\u0bb0 \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0ba8\u0bbf\u0bb2 \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95\u0bae\u0bcd \u0b89\u0ba3\u0bb5\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbf\u0ba8\u0bbf\u0baf\u0bcb\u0b95\u0bae\u0bcd \u0bae\u0bb1\u0bcd",
-        "status": "true"
-    },
-    "41-3":{
-        "code": "41-3",
-        "id": 498,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Ministry of Health Indigenous Medicine Social Welfare Probation and Child Care Services - Central Province",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dd4\u0db7 \u0dc3\u0dcf\u0db0\u0db1 \u0dc3\u0dc4 \u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0bcd \u0b9a\u0bae\u0bc2\u0b95 \u0ba8\u0bb2\u0ba9\u0bcd \u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-4":{
-        "code": "41-4",
-        "id": 499,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Ministry of Road Development Power & Energy Housing & Construction - Central Province",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0db6\u0dbd \u0dc4\u0dcf \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0d89\u0daf\u0dd2\u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dca \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bbf\u0ba9\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8e\u0bb0\u0bbf\u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0bb5\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0b9a\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0bae\u0bbe\u0ba9 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-5":{
-        "code": "41-5",
-        "id": 500,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Ministry of Industry Sports Women's Affairs Rural Development Estate Infrastructure Hindu Cultural Affairs Education (Tamil) and Youth Affairs - Central Province",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0d9a\u200d\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0d9a\u0dcf\u0db1\u0dca\u0dad\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d9c\u200d\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc0\u0dad\u0dd4 \u0dba\u0da7\u0dd2\u0dad\u0dbd \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dd2\u0db1\u0dca\u0daf\u0dd4 \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1(\u0daf\u0db8\u0dd2\u0dc5) \u0dc3\u0dc4 \u0dad\u0dbb\u0dd4\u0dab \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0b95\u0bc8\u0ba4\u0bcd\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0baa\u0bc6\u0ba3\u0bcd\u0b95\u0bb3\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b8a\u0bb0\u0b95 \u0bb5\u0bb3\u0bb0\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0b89\u0bb3\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0b87\u0ba8\u0bcd\u0ba4\u0bc1 \u0b95\u0bb2\u0bbe\u0b9a\u0bcd\u0b9a\u0bbe\u0bb0 \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf (\u0ba4\u0bae\u0bbf\u0bb4\u0bcd) \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b87\u0bb3\u0bc8\u0b9e\u0bb0\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-6":{
-        "code": "41-6",
-        "id": 501,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Central Provincial Ministry of Agriculture Irrigation Animal Production and Health Agrarian Development Fisheries and Environmental Affairs - Central Province",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0dc3\u0dd4\u0dc5\u0dd4 \u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0d9c\u0ddc\u0dc0\u0dd2\u0da2\u0db1 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db8\u0dd2\u0dbb\u0dd2\u0daf\u0dd2\u0dba \u0db0\u0dd3\u0dc0\u0dbb \u0dc4\u0dcf \u0db4\u0dbb\u0dd2\u0dc3\u0dbb \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0bae\u0bcd \u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0bb5\u0bbf\u0bb5\u0b9a\u0bbe\u0baf \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bc0\u0ba9\u0bcd\u0bb5\u0bb3 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0b9a\u0bcd\u0b9a\u0bc2\u0bb4\u0bb2\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-7":{
-        "code": "41-7",
-        "id": 502,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Local Government - Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-8":{
-        "code": "41-8",
-        "id": 503,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Education - Central Province",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-9":{
-        "code": "41-9",
-        "id": 504,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Land - Central Province",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bbf\u0bb2\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-10":{
-        "code": "41-10",
-        "id": 505,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Cultural Tourism and Trade and Commerce - Central Province",
-        "sn_name": "\u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0dc4\u0dcf \u0dc0\u0dd9\u0dc5\u0db3 \u0dc0\u0dcf\u0dab\u0dd2\u0da2 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bbe\u0b9a\u0bcd\u0b9a\u0bbe\u0bb0 \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bb0\u0bcd\u0ba4\u0bcd\u0ba4\u0b95 \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-11":{
-        "code": "41-11",
-        "id": 506,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Engineering Services Department - Central Province",
-        "sn_name": "\u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-12":{
-        "code": "41-12",
-        "id": 507,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Transport - Central Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-13":{
-        "code": "41-13",
-        "id": 508,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Co-operative Development - Central Province",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0dcf\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-14":{
-        "code": "41-14",
-        "id": 509,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Health Services - Central Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-15":{
-        "code": "41-15",
-        "id": 510,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Ayurveda - Central Province",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b86\u0baf\u0bc1\u0bb0\u0bcd\u0bb5\u0bc7\u0ba4\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-16":{
-        "code": "41-16",
-        "id": 511,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Social Welfare Probation and Child Care Service Affairs - Central Province",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dd4\u0db7 \u0dc3\u0dcf\u0db0\u0db1 \u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0db4\u0dd2\u0dc5\u0dd2\u0db6\u0db3 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0ba8\u0bb2\u0ba9\u0bcd \u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8 \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-17":{
-        "code": "41-17",
-        "id": 512,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Housing - Central Province",
-        "sn_name": "\u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0b9a\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-18":{
-        "code": "41-18",
-        "id": 513,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Textile Industry - Central Province",
-        "sn_name": "\u0db4\u0dda\u0dc2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9c\u0bb5\u0bc1\u0bb3\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-19":{
-        "code": "41-19",
-        "id": 514,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Industrial Development and Business Promotion",
-        "sn_name": "\u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0dc0\u0dca\u200d\u0dba\u0dcf\u0db4\u0dcf\u0dbb \u0db4\u200d\u0dca\u200d\u0dbb\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0ba3\u0bbf\u0b95 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8",
-        "status": "true"
-    },
-    "41-20":{
-        "code": "41-20",
-        "id": 515,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Sports - Central Province",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-21":{
-        "code": "41-21",
-        "id": 516,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Rural Development - Central Province",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb0\u0b95 \u0bb5\u0bb3\u0bb0\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-22":{
-        "code": "41-22",
-        "id": 517,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Agriculture - Central Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-23":{
-        "code": "41-23",
-        "id": 518,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Animal Production and Health - Central Province",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "41-24":{
-        "code": "41-24",
-        "id": 519,
-        "institute_type": "PRO",
-        "mother_org": 495,
-        "name": "Department of Irrigation - Central Province",
-        "sn_name": "\u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42":{
-        "code": "42",
-        "id": 520,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Sabaragamuwa Provincial Council",
-        "sn_name": "\u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "42-1":{
-        "code": "42-1",
-        "id": 521,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Governor's Office - Sabaragamuwa Province",
-        "sn_name": "\u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-2":{
-        "code": "42-2",
-        "id": 522,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Provincial Department of Health - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-3":{
-        "code": "42-3",
-        "id": 523,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Department of Local Government - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-4":{
-        "code": "42-4",
-        "id": 524,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Provincial Department of Ayurveda - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b86\u0baf\u0bc1\u0bb0\u0bcd\u0bb5\u0bc7\u0ba4 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-5":{
-        "code": "42-5",
-        "id": 525,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Department of Co-operative Development - Sabaragamuwa Province",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-6":{
-        "code": "42-6",
-        "id": 526,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Road Passenger Transport Authority - Sabaragamuwa Province",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c\u0dc3\u0dca\u0dae \u0db8\u0d9c\u0dd3 \u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0baa\u0baf\u0ba3\u0bbf\u0b95\u0bb3\u0bcd \u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-7":{
-        "code": "42-7",
-        "id": 527,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Co-operative Employees Commission - Sabaragamuwa Province",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0dda\u0dc0\u0d9a \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0b8a\u0bb4\u0bbf\u0baf\u0bb0\u0bcd \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-8":{
-        "code": "42-8",
-        "id": 528,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Construction Development and Machinery Authority - Sabaragamuwa Province",
-        "sn_name": "\u0d89\u0daf\u0dd2\u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0dba\u0db1\u0dca\u0dad\u0dca\u200d\u0dbb\u0ddd\u0db4\u0d9a\u0dbb\u0dab \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0bae\u0bbe\u0ba9 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b87\u0baf\u0ba8\u0bcd\u0ba4\u0bbf\u0bb0 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-9":{
-        "code": "42-9",
-        "id": 529,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Ministry of Education Cultural and Information Technology - Sabaragamuwa Province",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0dc4\u0dcf \u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b95\u0bb2\u0bbe\u0b9a\u0bcd\u0b9a\u0bbe\u0bb0 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-10":{
-        "code": "42-10",
-        "id": 530,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Provincial Education Department - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-11":{
-        "code": "42-11",
-        "id": 531,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Ministry of Land Provincial Irrigation Agriculture Animal Production Animal Health And Fisheries - Sabaragamuwa Province",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc3\u0dad\u0dca\u0dc0 \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc4\u0dcf \u0db0\u0dd3\u0dc0\u0dbb \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0d82\u0dc1\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bbf\u0bb2\u0bae\u0bcd \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0bae\u0bcd \u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bae\u0bc0\u0ba9\u0bcd\u0bb5\u0bb3\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-12":{
-        "code": "42-12",
-        "id": 532,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Department of Animal Production and Animal Health - Sabaragamuwa Province",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dad\u0dca\u0dc0 \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1\u0b95\u0bb3\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-13":{
-        "code": "42-13",
-        "id": 533,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Provincial Director of Agriculture - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0d85\u0db0\u0dca\u200d\u0dba\u0d9a\u0dca\u0dc2 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd \u0b87\u0baf\u0b95\u0bcd\u0b95\u0bc1\u0ba8\u0bb0\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-14":{
-        "code": "42-14",
-        "id": 534,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Provincial Land Commissioner's Department - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d89\u0da9\u0db8\u0dca \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0ba8\u0bbf\u0bb2 \u0b86\u0ba3\u0bc8\u0baf\u0bb0\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-15":{
-        "code": "42-15",
-        "id": 535,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Ministry of Provincial Road Development Rural Infrastructure Tourism Sports and Youth Affairs - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0dba\u0da7\u0dd2\u0dad\u0dbd \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca \u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0dc0\u0dca\u200d\u0dba\u0dcf\u0db4\u0dcf\u0dbb \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc4\u0dcf \u0dba\u0dde\u0dc0\u0db1 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0baa\u0bcd\u0baa\u0bc1\u0bb1 \u0b89\u0bb3\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b87\u0bb3\u0bc8\u0b9e\u0bb0\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-16":{
-        "code": "42-16",
-        "id": 536,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Department of Sports Development - Sabaragamuwa Province",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-17":{
-        "code": "42-17",
-        "id": 537,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Ministry of Social Welfare Probation and Child Care Rural Development and Rural Industries - Sabaragamuwa Province",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dd4\u0db7\u0dc3\u0dcf\u0db0\u0db1 \u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8 \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0ba8\u0bb2\u0ba9\u0bcd \u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b8a\u0bb0\u0b95 \u0bb5\u0bb3\u0bb0\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8a\u0bb0\u0b95 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-18":{
-        "code": "42-18",
-        "id": 538,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Department of Industrial Development - Sabaragamuwa Province",
-        "sn_name": "\u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "42-19":{
-        "code": "42-19",
-        "id": 539,
-        "institute_type": "PRO",
-        "mother_org": 520,
-        "name": "Department of Probation and Child Care - Sabaragamuwa Province",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc3\u0db6\u0dbb\u0d9c\u0db8\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b9a\u0baa\u0bb0\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43":{
-        "code": "43",
-        "id": 540,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Uva Provincial Council",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "43-1":{
-        "code": "43-1",
-        "id": 541,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Governor's office - Uva Province",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-2":{
-        "code": "43-2",
-        "id": 542,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Ministry of Finance Planning Law and Order Education Local Government Power & Energy Rural Infrastructure Development and Lands - Uva Province",
-        "sn_name": "\u0db8\u0dd4\u0daf\u0dbd\u0dca \u0dc4\u0dcf \u0d9a\u0dca\u200d\u0dbb\u0db8 \u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0db1\u0dd3\u0dad\u0dd2\u0dba \u0dc4\u0dcf \u0dc3\u0dcf\u0db8\u0dba \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0db6\u0dbd \u0dc4\u0dcf \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0d89\u0daf\u0dd2\u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dca \u200d\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0dba\u0da7\u0dd2\u0dad\u0dbd \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0d89\u0da9\u0db8\u0dca \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bbf\u0ba4\u0bbf \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0b9a\u0b9f\u0bcd\u0b9f\u0bae\u0bcd \u0b92\u0bb4\u0bc1\u0b99\u0bcd\u0b95\u0bc1 \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0bae\u0bbf\u0ba9\u0bcd\u0b9a\u0bbe\u0bb0\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8e\u0bb0\u0bbf\u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0b95\u0bbf\u0bb0\u0bbe\u0bae\u0bbf\u0baf \u0b89\u0bb3\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba8\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bb3\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-3":{
-        "code": "43-3",
-        "id": 543,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Ministry of Health Indigenous Medicine Probation and Child Care and Women's Affairs - Uva Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0dc3\u0dc4 \u0dc0\u0db1\u0dd2\u0dad\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0bcd \u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0bc6\u0ba3\u0bcd\u0b95\u0bb3\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-4":{
-        "code": "43-4",
-        "id": 544,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Ministry of Road Development Housing Water Supply Consumer Affairs & Cooperative and Food Supply and Distribution - Uva Province",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0da2\u0dbd\u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0db4\u0dcf\u0dbb\u0dd2\u0db7\u0ddd\u0d9c\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0dc4\u0dcf \u0dc3\u0db8\u0dd4\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0dc4 \u0d86\u0dc4\u0dcf\u0dbb \u0dc3\u0dd0\u0db4\u0dba\u0dd4\u0db8\u0dca \u0dc4\u0dcf \u0db6\u0dd9\u0daf\u0dcf \u0dc4\u0dd0\u0dbb\u0dd3\u0db8\u0dca \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bb5\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0b9a\u0ba4\u0bbf \u0ba8\u0bc0\u0bb0\u0bcd \u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0ba8\u0bc1\u0b95\u0bb0\u0bcd\u0bb5\u0bcb\u0bb0\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b89\u0ba3\u0bb5\u0bc1 \u0bb5\u0bb4\u0b99\u0bcd\u0b95\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbf\u0ba8\u0bbf\u0baf\u0bcb\u0b95 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-5":{
-        "code": "43-5",
-        "id": 545,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Ministry of Youth Affairs Sports Social Welfare Estate Infrastructure Development Power and Energy Textiles and Small Industries - Uva Province",
-        "sn_name": "\u0dba\u0dde\u0dc0\u0db1 \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dd4\u0db7 \u0dc3\u0dcf\u0db0\u0db1 \u0dc0\u0dad\u0dd4 \u0dba\u0da7\u0dd2\u0dad\u0dbd \u0db4\u0dc4\u0dc3\u0dd4\u0d9a\u0db8\u0dca \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0db6\u0dbd \u0dc4\u0dcf \u0db6\u0dbd\u0dc1\u0d9a\u0dca\u0dad\u0dd2 \u0dc3\u0dc4 \u0db4\u0dda\u0dc2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc4\u0dcf \u0d9a\u0dd4\u0da9\u0dcf \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b87\u0bb3\u0bc8\u0b9e\u0bb0\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b9a\u0bae\u0bc2\u0b95 \u0ba8\u0bb2\u0ba9\u0bcd \u0ba4\u0bcb\u0b9f\u0bcd\u0b9f \u0b89\u0bb3\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bae\u0bc8\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bbf\u0ba9\u0bcd\u0b9a\u0bbe\u0bb0\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8e\u0bb0\u0bbf\u0b9a\u0b95\u0bcd\u0ba4\u0bbf \u0b9c\u0bb5\u0bc1\u0bb3\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bbf\u0bb1\u0bc1 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0b95\u0bb3\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-6":{
-        "code": "43-6",
-        "id": 546,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Ministry of Agriculture Irrigation Animal Production and Inland Fisheries - Uva Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0db8\u0dd2\u0dbb\u0dd2\u0daf\u0dd2\u0dba \u0db0\u0dd3\u0dc0\u0dbb \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0bae\u0bcd \u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b89\u0bb3\u0bcd\u0ba8\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0bae\u0bc0\u0ba9\u0bcd\u0bb5\u0bb3\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-7":{
-        "code": "43-7",
-        "id": 547,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Uva Provincial Cooperative Commission - Uva Province",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-8":{
-        "code": "43-8",
-        "id": 548,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Agriculture - Uva Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-9":{
-        "code": "43-9",
-        "id": 549,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Animal Production - Uva Province",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-10":{
-        "code": "43-10",
-        "id": 550,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Co-operative Development Department of Education - Uva Province",
-        "sn_name": "\u0dc3\u0db8\u0dd4\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 \u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-11":{
-        "code": "43-11",
-        "id": 551,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Health Services - Uva Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-12":{
-        "code": "43-12",
-        "id": 552,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Ayurveda - Uva Province",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b86\u0baf\u0bc1\u0bb0\u0bcd\u0bb5\u0bc7\u0ba4\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-13":{
-        "code": "43-13",
-        "id": 553,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Industrial Development - Uva Province",
-        "sn_name": "\u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-14":{
-        "code": "43-14",
-        "id": 554,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Irrigation - Uva Province",
-        "sn_name": "\u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-15":{
-        "code": "43-15",
-        "id": 555,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Land Commissioner's Department - Uva Province",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bbf\u0bb2 \u0b86\u0ba3\u0bc8\u0baf\u0bb0\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-16":{
-        "code": "43-16",
-        "id": 556,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Local Government - Uva Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-17":{
-        "code": "43-17",
-        "id": 557,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Probation and Child Care Services - Uva Province",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-18":{
-        "code": "43-18",
-        "id": 558,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Provincial Revenue - Uva Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0daf\u0dcf\u0dba\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bb0\u0bc1\u0bb5\u0bbe\u0baf\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-19":{
-        "code": "43-19",
-        "id": 559,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Road Development - Uva Province",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-20":{
-        "code": "43-20",
-        "id": 560,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Rural Development and Construction - Uva Province",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc3\u0dc4 \u0d89\u0daf\u0dd2\u0d9a\u0dd2\u0dbb\u0dd3\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb0\u0b95 \u0bb5\u0bb3\u0bb0\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0bae\u0bbe\u0ba9\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-21":{
-        "code": "43-21",
-        "id": 561,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Department of Social Services - Uva Province",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-22":{
-        "code": "43-22",
-        "id": 562,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Uva Provincial Library Service Board - Uva Province",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dd4\u0dc3\u0dca\u0dad\u0d9a\u0dcf\u0dbd \u0dc3\u0dda\u0dc0\u0dcf \u0db8\u0dab\u0dca\u0da9\u0dbd\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0ba8\u0bc2\u0bb2\u0b95 \u0b9a\u0bc7\u0bb5\u0bc8 \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-23":{
-        "code": "43-23",
-        "id": 563,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Uva Community Radio - Uva Province",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0da2\u0dcf \u0d9c\u0dd4\u0dc0\u0db1\u0dca\u0dc0\u0dd2\u0daf\u0dd4\u0dbd\u0dd2\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb5\u0bbe \u0b9a\u0bae\u0bc2\u0b95 \u0bb5\u0bbe\u0ba9\u0bca\u0bb2\u0bbf - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-24":{
-        "code": "43-24",
-        "id": 564,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Provincial Director's (Mechanical) Office - Uva Province",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dba\u0dcf\u0db1\u0dca\u0dad\u0dca\u200d\u0dbb\u0dd2\u0d9a \u0d85\u0db0\u0dca\u200d\u0dba\u0d9a\u0dca\u0dc2 \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b87\u0baf\u0b95\u0bcd\u0b95\u0bc1\u0ba8\u0bb0\u0bcd (\u0bae\u0bc6\u0b95\u0bcd\u0b95\u0bbe\u0ba9\u0bbf\u0b95\u0bcd\u0b95\u0bb2\u0bcd) \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "43-25":{
-        "code": "43-25",
-        "id": 565,
-        "institute_type": "PRO",
-        "mother_org": 540,
-        "name": "Uva Provincial Press - Uva Province",
-        "sn_name": "\u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0dd4\u0daf\u0dca\u200d\u0dbb\u0dab\u0dcf\u0dbd\u0dba - \u0d8c\u0dc0 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0bb0\u0bbf\u0b95\u0bc8 - \u0b8a\u0bb5\u0bbe \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44":{
-        "code": "44",
-        "id": 566,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Eastern Provincial Council",
-        "sn_name": "\u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "44-1":{
-        "code": "44-1",
-        "id": 567,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Governor's Office - Eastern Province",
-        "sn_name": "\u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-2":{
-        "code": "44-2",
-        "id": 568,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Ministry of Agriculture - Eastern Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0d82\u0dc1\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb5\u0b9a\u0bbe\u0baf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-3":{
-        "code": "44-3",
-        "id": 569,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Ministry of Road Development - Eastern Province",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-4":{
-        "code": "44-4",
-        "id": 570,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Ministry of Education - Eastern Province",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-5":{
-        "code": "44-5",
-        "id": 571,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Ministry of Health - Eastern Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-6":{
-        "code": "44-6",
-        "id": 572,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Governor's Office - Eastern Province",
-        "sn_name": "\u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-7":{
-        "code": "44-7",
-        "id": 573,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Provincial Public Service Commission - Eastern Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0baa\u0bca\u0ba4\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-8":{
-        "code": "44-8",
-        "id": 574,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Chief Minister's Office - Eastern Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bc1\u0ba4\u0bb2\u0bcd\u0bb5\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-9":{
-        "code": "44-9",
-        "id": 575,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Local Government - Eastern Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-10":{
-        "code": "44-10",
-        "id": 576,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Rural Development - Eastern Province",
-        "sn_name": "\u0d9c\u0dca\u200d\u0dbb\u0dcf\u0db8\u0dd3\u0dba \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b8a\u0bb0\u0b95 \u0bb5\u0bb3\u0bb0\u0bcd\u0b9a\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-11":{
-        "code": "44-11",
-        "id": 577,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Transport Authority - Eastern Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0dc0\u0dcf\u0dc4\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0baa\u0bcb\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bb0\u0ba4\u0bcd\u0ba4\u0bc1 \u0b85\u0ba4\u0bbf\u0b95\u0bbe\u0bb0\u0b9a\u0baa\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-12":{
-        "code": "44-12",
-        "id": 578,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Buildings - Eastern Province",
-        "sn_name": "\u0d9c\u0ddc\u0da9\u0db1\u0dd0\u0d9c\u0dd2\u0dbd\u0dd2 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0b9f\u0bcd\u0b9f\u0bbf\u0b9f\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-13":{
-        "code": "44-13",
-        "id": 579,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Tourism Bureau - Eastern Province",
-        "sn_name": "\u0dc3\u0d82\u0da0\u0dcf\u0dbb\u0d9a \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0bb1\u0bcd\u0bb1\u0bc1\u0bb2\u0bbe \u0baa\u0ba3\u0bbf\u0baf\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-14":{
-        "code": "44-14",
-        "id": 580,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Housing Authority - Eastern Province",
-        "sn_name": "\u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0b9a\u0ba4\u0bbf \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-15":{
-        "code": "44-15",
-        "id": 581,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Council Secretariat - Eastern Province",
-        "sn_name": "\u0dc3\u0db7\u0dcf \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0baa\u0bc8 \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-16":{
-        "code": "44-16",
-        "id": 582,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Chief Secretary Office - Eastern Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bb2\u0bc8\u0bae\u0bc8 \u0b9a\u0bc6\u0baf\u0bb2\u0bbe\u0bb3\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-17":{
-        "code": "44-17",
-        "id": 583,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Provincial Treasury - Eastern Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db7\u0dcf\u0dab\u0dca\u0da9\u0dcf\u0d9c\u0dcf\u0dbb\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b95\u0bb0\u0bc1\u0bb5\u0bc2\u0bb2\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-18":{
-        "code": "44-18",
-        "id": 584,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Planning Secretariat - Eastern Province",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0db8\u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-19":{
-        "code": "44-19",
-        "id": 585,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Provincial Revenue - Eastern Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0daf\u0dcf\u0dba\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bb0\u0bc1\u0bb5\u0bbe\u0baf\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-20":{
-        "code": "44-20",
-        "id": 586,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Management Advancement Training - Eastern Province",
-        "sn_name": "\u0d9a\u0dc5\u0db8\u0dab\u0dcf\u0d9a\u0dbb\u0db1 \u0d85\u0db7\u0dd2\u0dc0\u0dd8\u0daf\u0dca\u0db0\u0dd2 \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bae\u0bc1\u0ba9\u0bcd\u0ba9\u0bc7\u0bb1\u0bcd\u0bb1 \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-21":{
-        "code": "44-21",
-        "id": 587,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Provincial Audit - Eastern Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc0\u0dd2\u0d9c\u0dab\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0ba4\u0ba3\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-22":{
-        "code": "44-22",
-        "id": 588,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Health Services - Eastern Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-23":{
-        "code": "44-23",
-        "id": 589,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Indigenous Medicine - Eastern Province",
-        "sn_name": "\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-24":{
-        "code": "44-24",
-        "id": 590,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Social Services - Eastern Province",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2\u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-25":{
-        "code": "44-25",
-        "id": 591,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Probation and Child Care Services - Eastern Province",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0dab \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-26":{
-        "code": "44-26",
-        "id": 592,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Education - Eastern Province",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-27":{
-        "code": "44-27",
-        "id": 593,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Cultural Affairs - Eastern Province",
-        "sn_name": "\u0dc3\u0d82\u0dc3\u0dca\u0d9a\u0dd8\u0dad\u0dd2\u0d9a \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bbe\u0b9a\u0bcd\u0b9a\u0bbe\u0bb0 \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0\u0b99\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-28":{
-        "code": "44-28",
-        "id": 594,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Sports - Eastern Province",
-        "sn_name": "\u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-29":{
-        "code": "44-29",
-        "id": 595,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Road Development - Eastern Province",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-30":{
-        "code": "44-30",
-        "id": 596,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Land Administration - Eastern Province",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0db4\u0dbb\u0dd2\u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bbf\u0bb2 \u0ba8\u0bbf\u0bb0\u0bcd\u0bb5\u0bbe\u0b95\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-31":{
-        "code": "44-31",
-        "id": 597,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Agriculture - Eastern Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-32":{
-        "code": "44-32",
-        "id": 598,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Animal Production - Eastern Province",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-33":{
-        "code": "44-33",
-        "id": 599,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Irrigation - Eastern Province",
-        "sn_name": "\u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-34":{
-        "code": "44-34",
-        "id": 600,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Department of Co-operative Development - Eastern Province",
-        "sn_name": "\u0dc3\u0db8\u0dd4\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "44-35":{
-        "code": "44-35",
-        "id": 601,
-        "institute_type": "PRO",
-        "mother_org": 566,
-        "name": "Cooperative Service Commission - Eastern Province",
-        "sn_name": "\u0dc3\u0db8\u0dd4\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 - \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45":{
-        "code": "45",
-        "id": 602,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "North Central Provincial Counci",
-        "sn_name": "\u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "45-1":{
-        "code": "45-1",
-        "id": 603,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Governor's office - North Central Province",
-        "sn_name": "\u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-2":{
-        "code": "45-2",
-        "id": 604,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Chief Ministry - North Central Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bb2\u0bc8\u0bae\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-3":{
-        "code": "45-3",
-        "id": 605,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Provincial Ministry of Agriculture - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-4":{
-        "code": "45-4",
-        "id": 606,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Ministry of Health - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-5":{
-        "code": "45-5",
-        "id": 607,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Ministry of Co-operative - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db8\u0dd4\u0db4\u0d9a\u0dcf\u0dbb \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-6":{
-        "code": "45-6",
-        "id": 608,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Ministry of Provincial Irrigation - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-7":{
-        "code": "45-7",
-        "id": 609,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Agriculture - North Central Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-8":{
-        "code": "45-8",
-        "id": 610,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Animal Production and Health - North Central Province",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-9":{
-        "code": "45-9",
-        "id": 611,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Co-operative Development - North Central Province",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-10":{
-        "code": "45-10",
-        "id": 612,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Education - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-11":{
-        "code": "45-11",
-        "id": 613,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Engineering Department - North Central Province",
-        "sn_name": "\u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-12":{
-        "code": "45-12",
-        "id": 614,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Health Services - North Central Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-13":{
-        "code": "45-13",
-        "id": 615,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Irrigation - North Central Province",
-        "sn_name": "\u0dc0\u0dcf\u0dbb\u0dd2\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0b9a\u0ba9\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-14":{
-        "code": "45-14",
-        "id": 616,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Local Government - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-15":{
-        "code": "45-15",
-        "id": 617,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Planning & Monitoring - North Central Province",
-        "sn_name": "\u0dc3\u0dd0\u0dbd\u0dc3\u0dd4\u0db8\u0dca \u0dc4\u0dcf \u0db8\u0dd9\u0dc4\u0dd9\u0dba\u0dd4\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0ba3\u0bcd\u0b95\u0bbe\u0ba3\u0bbf\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-16":{
-        "code": "45-16",
-        "id": 618,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Probation and Child Care Services - North Central Province",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-17":{
-        "code": "45-17",
-        "id": 619,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Provincial Revenue - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0daf\u0dcf\u0dba\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bb0\u0bc1\u0bb5\u0bbe\u0baf\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-18":{
-        "code": "45-18",
-        "id": 620,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Provincial Sports - North Central Province",
-        "sn_name": "\u0db4\u0dbd\u0dcf\u0dad\u0dca \u0d9a\u0dca\u200d\u0dbb\u0dd3\u0da9\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bbf\u0bb3\u0bc8\u0baf\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-19":{
-        "code": "45-19",
-        "id": 621,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Management Development and Training Unit - North Central Province",
-        "sn_name": "\u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d92\u0d9a\u0d9a\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0baa\u0bbf\u0bb0\u0bbf\u0bb5\u0bc1 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-20":{
-        "code": "45-20",
-        "id": 622,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Provincial Treasury - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db7\u0dcf\u0dab\u0dca\u0da9\u0dcf\u0d9c\u0dcf\u0dbb \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b95\u0bb0\u0bc1\u0bb5\u0bc2\u0bb2\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-21":{
-        "code": "45-21",
-        "id": 623,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Governor's Office - North Central Province",
-        "sn_name": "\u0d86\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-22":{
-        "code": "45-22",
-        "id": 624,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Provincial Secretariat - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0bc6\u0baf\u0bb2\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-23":{
-        "code": "45-23",
-        "id": 625,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Chief Secretary Office - North Central Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bb2\u0bc8\u0bae\u0bc8 \u0b9a\u0bc6\u0baf\u0bb2\u0bbe\u0bb3\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-24":{
-        "code": "45-24",
-        "id": 626,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Provincial Cooperative Employees Commission - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db8\u0dd4\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0dda\u0dc0\u0d9a \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0b8a\u0bb4\u0bbf\u0baf\u0bb0\u0bcd \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-25":{
-        "code": "45-25",
-        "id": 627,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Provincial Public Service Commission - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dbb\u0dcf\u0da2\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0d9a\u0ddc\u0db8\u0dd2\u0dc2\u0db1\u0dca \u0dc3\u0db7\u0dcf\u0dc0 - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0baa\u0bca\u0ba4\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-26":{
-        "code": "45-26",
-        "id": 628,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Management Development and Training Unit - North Central Province",
-        "sn_name": "\u0d9a\u0dc5\u0db8\u0db1\u0dcf\u0d9a\u0dbb\u0dab \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0dc4\u0dcf \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d92\u0d9a\u0d9a\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bc7\u0bb2\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0baa\u0bbf\u0bb0\u0bbf\u0bb5\u0bc1 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-27":{
-        "code": "45-27",
-        "id": 629,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Provincial Road Development Authority - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db0\u0dd2\u0d9a\u0dcf\u0dbb\u0dd2\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b86\u0ba3\u0bc8\u0baf\u0bae\u0bcd - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "45-28":{
-        "code": "45-28",
-        "id": 630,
-        "institute_type": "PRO",
-        "mother_org": 602,
-        "name": "Department of Internal Audit and Investigation - North Central Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d85\u0db7\u0dca\u200d\u0dba\u0db1\u0dca\u0dad\u0dbb \u0dc0\u0dd2\u0d9c\u0dab\u0db1 \u0dc4\u0dcf \u0dc0\u0dd2\u0db8\u0dbb\u0dca\u0dc1\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0- \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db8\u0dd0\u0daf \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd \u0ba4\u0ba3\u0bbf\u0b95\u0bcd\u0b95\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bb5\u0bbf\u0b9a\u0bbe\u0bb0\u0ba3\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46":{
-        "code": "46",
-        "id": 631,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "North Western Provincial Council",
-        "sn_name": "\u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "46-1":{
-        "code": "46-1",
-        "id": 632,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Governor's Office - North Western Province",
-        "sn_name": "\u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-2":{
-        "code": "46-2",
-        "id": 633,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Chief Ministry of North Western Province and Ministry of Education Local Government Finance & Planning",
-        "sn_name": "\u0dc0\u0dba\u0db9 \u0db4\u0dca\u200d\u0dbb\u0db0\u0dcf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba \u0dc3\u0dc4 \u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0db8\u0dd4\u0daf\u0dbd\u0dca \u0dc4\u0dcf \u0d9a\u0dca\u200d\u0dbb\u0db8\u0dc3\u0db8\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba",
-        "tm_name": "\u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0ba4\u0bcd\u0ba4\u0bbf\u0ba9\u0bcd \u0ba4\u0bb2\u0bc8\u0bae\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0bbf\u0b9f\u0bcd\u0b9f\u0bae\u0bbf\u0b9f\u0bb2\u0bcd \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-3":{
-        "code": "46-3",
-        "id": 634,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Ministry of Health Indigenous Medicine and Social Welfare - North Western Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc0\u0ddb\u0daf\u0dca\u200d\u0dba \u0dc4\u0dcf \u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dd4\u0db7\u0dc3\u0dcf\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0bae\u0bcd \u0b9a\u0bc1\u0ba4\u0bc7\u0b9a \u0bae\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bae\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bae\u0bc2\u0b95 \u0ba8\u0bb2 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-4":{
-        "code": "46-4",
-        "id": 635,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Ministry of Co-operatives and Information Technology - North Western Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dad\u0ddc\u0dbb\u0dad\u0dd4\u0dbb\u0dd4 \u0dad\u0dcf\u0d9a\u0dca\u0dc2\u0dab \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0ba4\u0b95\u0bb5\u0bb2\u0bcd \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0ba8\u0bc1\u0b9f\u0bcd\u0baa \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-5":{
-        "code": "46-5",
-        "id": 636,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Provincial Ministry of Agriculture and Fisheries - North Western Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0dc4\u0dcf \u0db0\u0dd3\u0dc0\u0dbb \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0bae\u0bc0\u0ba9\u0bcd\u0bb5\u0bb3\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-6":{
-        "code": "46-6",
-        "id": 637,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Ministry of Provincial Road Development - North Western Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-7":{
-        "code": "46-7",
-        "id": 638,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Agriculture - North Western Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc7\u0bb3\u0bbe\u0ba3\u0bcd\u0bae\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-8":{
-        "code": "46-8",
-        "id": 639,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Animal Production and Health - North Western Province",
-        "sn_name": "\u0dc3\u0dad\u0dca\u0dc0 \u0db1\u0dd2\u0dc2\u0dca\u0db4\u0dcf\u0daf\u0db1 \u0dc4\u0dcf \u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0b99\u0bcd\u0b95\u0bc1 \u0b89\u0bb1\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bbf \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-9":{
-        "code": "46-9",
-        "id": 640,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Ayurveda - North Western Province",
-        "sn_name": "\u0d86\u0dba\u0dd4\u0dbb\u0dca\u0dc0\u0dda\u0daf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b86\u0baf\u0bc1\u0bb0\u0bcd\u0bb5\u0bc7\u0ba4\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-10":{
-        "code": "46-10",
-        "id": 641,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Co-operative Development - North Western Province",
-        "sn_name": "\u0dc3\u0db8\u0dd6\u0db4\u0d9a\u0dcf\u0dbb \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bc2\u0b9f\u0bcd\u0b9f\u0bc1\u0bb1\u0bb5\u0bc1 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-11":{
-        "code": "46-11",
-        "id": 642,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Education - North Western Province",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-12":{
-        "code": "46-12",
-        "id": 643,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Engineering Department - North Western Province",
-        "sn_name": "\u0d89\u0d82\u0da2\u0dd2\u0db1\u0dda\u0dbb\u0dd4 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0baa\u0bca\u0bb1\u0bbf\u0baf\u0bbf\u0baf\u0bb2\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-13":{
-        "code": "46-13",
-        "id": 644,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Health Services - North Western Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-14":{
-        "code": "46-14",
-        "id": 645,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Internal Audit - North Western Province",
-        "sn_name": "\u0d85\u0db7\u0dca\u200d\u0dba\u0db1\u0dca\u0dad\u0dbb \u0dc0\u0dd2\u0d9c\u0dab\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd \u0ba4\u0ba3\u0bbf\u0b95\u0bcd\u0b95\u0bc8\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-15":{
-        "code": "46-15",
-        "id": 646,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Land Commissioner's Department - North Western Province",
-        "sn_name": "\u0d89\u0da9\u0db8\u0dca \u0d9a\u0ddc\u0db8\u0dc3\u0dcf\u0dbb\u0dd2\u0dc3\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0bbf\u0bb2 \u0b86\u0ba3\u0bc8\u0baf\u0bb0\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-16":{
-        "code": "46-16",
-        "id": 647,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Local Government - North Western Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-17":{
-        "code": "46-17",
-        "id": 648,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Probation and Child Care Services - North Western Province",
-        "sn_name": "\u0db4\u0dbb\u0dd2\u0dc0\u0dcf\u0dc3 \u0dc4\u0dcf \u0dc5\u0db8\u0dcf\u0dbb\u0d9a\u0dca\u0dc2\u0d9a \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba8\u0ba9\u0bcd\u0ba9\u0b9f\u0ba4\u0bcd\u0ba4\u0bc8 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0bc1\u0bb4\u0ba8\u0bcd\u0ba4\u0bc8 \u0baa\u0bb0\u0bbe\u0bae\u0bb0\u0bbf\u0baa\u0bcd\u0baa\u0bc1 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-18":{
-        "code": "46-18",
-        "id": 649,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Provincial Revenue - North Western Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0daf\u0dcf\u0dba\u0db8\u0dca \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0bb5\u0bb0\u0bc1\u0bb5\u0bbe\u0baf\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-19":{
-        "code": "46-19",
-        "id": 650,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Road Development - North Western Province",
-        "sn_name": "\u0db8\u0dcf\u0dbb\u0dca\u0d9c \u0dc3\u0d82\u0dc0\u0dbb\u0dca\u0db0\u0db1 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbe\u0bb2\u0bc8 \u0bae\u0bc7\u0bae\u0bcd\u0baa\u0bbe\u0b9f\u0bcd\u0b9f\u0bc1\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-20":{
-        "code": "46-20",
-        "id": 651,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Small Industries - North Western Province",
-        "sn_name": "\u0d9a\u0dd4\u0da9\u0dcf \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bbf\u0bb1\u0bc1 \u0ba4\u0bca\u0bb4\u0bbf\u0bb2\u0bcd\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-21":{
-        "code": "46-21",
-        "id": 652,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Social Services - North Western Province",
-        "sn_name": "\u0dc3\u0db8\u0dcf\u0da2 \u0dc3\u0dda\u0dc0\u0dcf \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bae\u0bc2\u0b95 \u0b9a\u0bc7\u0bb5\u0bc8\u0b95\u0bb3\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-22":{
-        "code": "46-22",
-        "id": 653,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Textile Industry - North Western Province",
-        "sn_name": "\u0db4\u0dda\u0dc2 \u0d9a\u0dbb\u0dca\u0db8\u0dcf\u0db1\u0dca\u0dad \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9c\u0bb5\u0bc1\u0bb3\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-23":{
-        "code": "46-23",
-        "id": 654,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Department of Housing - North Western Province",
-        "sn_name": "\u0db1\u0dd2\u0dc0\u0dcf\u0dc3 \u0daf\u0dd9\u0db4\u0dcf\u0dbb\u0dca\u0dad\u0db8\u0dda\u0db1\u0dca\u0dad\u0dd4\u0dc0 - \u0dc0\u0dba\u0db9 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bc0\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0b9a\u0ba4\u0bbf\u0ba4\u0bcd \u0ba4\u0bc1\u0bb1\u0bc8 - \u0bb5\u0b9f\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "46-24":{
-        "code": "46-24",
-        "id": 655,
-        "institute_type": "PRO",
-        "mother_org": 631,
-        "name": "Wayamba Training Institute - Wariyapola",
-        "sn_name": "\u0dc0\u0dba\u0d94 \u0db4\u0dd4\u0dc4\u0dd4\u0dab\u0dd4 \u0d86\u0dba\u0dad\u0db1\u0dba - \u0dc0\u0dcf\u0dbb\u0dd2\u0dba\u0db4\u0ddc\u0dbd",
-        "tm_name": "\u0bb5\u0baf\u0bae\u0bcd\u0baa\u0bbe \u0baa\u0baf\u0bbf\u0bb1\u0bcd\u0b9a\u0bbf \u0ba8\u0bbf\u0bb1\u0bc1\u0bb5\u0ba9\u0bae\u0bcd - \u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0baa\u0bcb\u0bb2\u0bbe",
-        "status": "true"
-    },
-    "47":{
-        "code": "47",
-        "id": 656,
-        "institute_type": "PRO",
-        "mother_org": 0,
-        "name": "Northern Provincial Council",
-        "sn_name": "\u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "47-1":{
-        "code": "47-1",
-        "id": 657,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Governor's Office",
-        "sn_name": "\u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad\u0dca \u0d86\u0dab\u0dca\u0da9\u0dd4\u0d9a\u0dcf\u0dbb\u0dc0\u0dbb \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba",
-        "tm_name": "\u0b86\u0bb3\u0bc1\u0ba8\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd",
-        "status": "true"
-    },
-    "47-2":{
-        "code": "47-2",
-        "id": 658,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Ministry of Local Government - Northern Province",
-        "sn_name": "\u0db4\u0dc5\u0dcf\u0dad\u0dca \u0db4\u0dcf\u0dbd\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b89\u0bb3\u0bcd\u0bb3\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1 - \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "47-3":{
-        "code": "47-3",
-        "id": 659,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Chief Secretary's Office - Northern Province",
-        "sn_name": "\u0db4\u0dca\u200d\u0dbb\u0db0\u0db1 \u0dbd\u0dda\u0d9a\u0db8\u0dca \u0d9a\u0dcf\u0dbb\u0dca\u0dba\u0dcf\u0dbd\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0ba4\u0bb2\u0bc8\u0bae\u0bc8 \u0b9a\u0bc6\u0baf\u0bb2\u0bbe\u0bb3\u0bb0\u0bcd \u0b85\u0bb2\u0bc1\u0bb5\u0bb2\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "47-4":{
-        "code": "47-4",
-        "id": 660,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Ministry of Women Affairs - Northern Province",
-        "sn_name": "\u0d9a\u0dcf\u0db1\u0dca\u0dad\u0dcf \u0d9a\u0da7\u0dba\u0dd4\u0dad\u0dd4 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0baa\u0bc6\u0ba3\u0bcd\u0b95\u0bb3\u0bcd \u0bb5\u0bbf\u0bb5\u0b95\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "47-5":{
-        "code": "47-5",
-        "id": 661,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Ministry of Education - Northern Province",
-        "sn_name": "\u0d85\u0db0\u0dca\u200d\u0dba\u0dcf\u0db4\u0db1 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bb5\u0bbf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0bc1 - \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "47-6":{
-        "code": "47-6",
-        "id": 662,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Ministry of Agriculture - Northern Province",
-        "sn_name": "\u0d9a\u0dd8\u0dc2\u0dd2\u0d9a\u0dbb\u0dca\u0db8 \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0bb5\u0bbf\u0bb5\u0b9a\u0bbe\u0baf \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "47-7":{
-        "code": "47-7",
-        "id": 663,
-        "institute_type": "PRO",
-        "mother_org": 656,
-        "name": "Ministry of Health - Northern Province",
-        "sn_name": "\u0dc3\u0dde\u0d9b\u0dca\u200d\u0dba \u0d85\u0db8\u0dcf\u0dad\u0dca\u200d\u0dba\u0dcf\u0d82\u0dc1\u0dba - \u0d8b\u0dad\u0dd4\u0dbb\u0dd4 \u0db4\u0dc5\u0dcf\u0dad",
-        "tm_name": "\u0b9a\u0bc1\u0b95\u0bbe\u0ba4\u0bbe\u0bb0 \u0b85\u0bae\u0bc8\u0b9a\u0bcd\u0b9a\u0b95\u0bae\u0bcd - \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bbe\u0b95\u0bbe\u0ba3\u0bae\u0bcd",
-        "status": "true"
-    },
-    "48-1":{
-        "code": "48-1",
-        "id": 664,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Colombo Municipal Council",
-        "sn_name": "\u0d9a\u0ddc\u0dc5\u0db9 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0bb4\u0bc1\u0bae\u0bcd\u0baa\u0bc1 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-2":{
-        "code": "48-2",
-        "id": 665,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dehiwala - Mount Lavinia Municipal Council",
-        "sn_name": "\u0daf\u0dd9\u0dc4\u0dd2\u0dc0\u0dbd - \u0d9c\u0dbd\u0dca\u0d9a\u0dd2\u0dc3\u0dca\u0dc3 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb9\u0bbf\u0bb5\u0bb3\u0bc8-\u0b95\u0bb2\u0bcd\u0b95\u0bbf\u0b9a\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-3":{
-        "code": "48-3",
-        "id": 666,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Sri Jayawardenepura Kotte Municipal Council",
-        "sn_name": "\u0dc1\u0dca\u200d\u0dbb\u0dd3 \u0da2\u0dba\u0dc0\u0dbb\u0dca\u0db0\u0db1\u0db4\u0dd4\u0dbb \u0d9a\u0ddd\u0da7\u0dca\u0da7\u0dda \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb8\u0bcd\u0bb0\u0bc0 \u0b9c\u0baf\u0bb5\u0bb0\u0bcd\u0ba4\u0ba9\u0baa\u0bc1\u0bb0 \u0b95\u0bcb\u0b9f\u0bcd\u0b9f\u0bc7 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-4":{
-        "code": "48-4",
-        "id": 667,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Moratuwa Municipal Council",
-        "sn_name": "\u0db8\u0ddc\u0dbb\u0da7\u0dd4\u0dc0 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bca\u0bb1\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-5":{
-        "code": "48-5",
-        "id": 668,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kaduwela Municipal Council",
-        "sn_name": "\u0d9a\u0da9\u0dd4\u0dc0\u0dd9\u0dbd \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bc1\u0bb5\u0bc6\u0bb2 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-6":{
-        "code": "48-6",
-        "id": 669,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kollonnawa Urban Council",
-        "sn_name": "\u0d9a\u0ddc\u0dc5\u0ddc\u0db1\u0dca\u0db1\u0dcf\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0bb2\u0bca\u0ba9\u0bcd\u0ba9\u0bbe\u0bb5\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-7":{
-        "code": "48-7",
-        "id": 670,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Seethawakapura Urban Council",
-        "sn_name": "\u0dc3\u0dd3\u0dad\u0dcf\u0dc0\u0d9a\u0db4\u0dd4\u0dbb \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bc0\u0ba4\u0bbe\u0bb5\u0b95\u0bcd\u0b95\u0baa\u0bc1\u0bb0 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-8":{
-        "code": "48-8",
-        "id": 671,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Maharagama Urban Council",
-        "sn_name": "\u0db8\u0dc4\u0dbb\u0d9c\u0db8 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bb9\u0bb0\u0b95\u0bae \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-9":{
-        "code": "48-9",
-        "id": 672,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kesbewa Urban Council",
-        "sn_name": "\u0d9a\u0dd0\u0dc3\u0dca\u0db6\u0dd1\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc6\u0bb8\u0bcd\u0baa\u0bc7\u0bb5 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-10":{
-        "code": "48-10",
-        "id": 673,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Boralesgamuwa Urban Council",
-        "sn_name": "\u0db6\u0ddc\u0dbb\u0dbd\u0dd0\u0dc3\u0dca\u0d9c\u0db8\u0dd4\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0bb0\u0bb2\u0bc6\u0bb8\u0bcd\u0b95\u0bae\u0bc1\u0bb5 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-11":{
-        "code": "48-11",
-        "id": 674,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kotikawatta Mulleriyawa Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddc\u0da7\u0dd2\u0d9a\u0dcf\u0dc0\u0dad\u0dca\u0dad-\u0db8\u0dd4\u0dbd\u0dca\u0dbd\u0dda\u0dbb\u0dd2\u0dba\u0dcf\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0b9f\u0bcd\u0b9f\u0bbf\u0b95\u0bbe\u0bb5\u0ba4\u0bcd\u0ba4-\u0bae\u0bc1\u0bb2\u0bcd\u0bb2\u0bc7\u0bb0\u0bbf\u0baf\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-12":{
-        "code": "48-12",
-        "id": 675,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Seethawaka Pradeshiya Sabha",
-        "sn_name": "\u0dc3\u0dd3\u0dad\u0dcf\u0dc0\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bc0\u0ba4\u0bbe\u0bb5\u0b95\u0bcd\u0b95 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "48-13":{
-        "code": "48-13",
-        "id": 676,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Homagama Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0ddd\u0db8\u0dcf\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bcb\u0bae\u0bbe\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-1":{
-        "code": "49-1",
-        "id": 677,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Negombo Municipal Council",
-        "sn_name": "\u0db8\u0dd3\u0d9c\u0db8\u0dd4\u0dc0 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc0\u0bb0\u0bcd\u0b95\u0bca\u0bb4\u0bc1\u0bae\u0bcd\u0baa\u0bc1 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-2":{
-        "code": "49-2",
-        "id": 678,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Gampaha Municipal Council",
-        "sn_name": "\u0d9c\u0db8\u0dca\u0db4\u0dc4 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bae\u0bcd\u0baa\u0bb9\u0bbe \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-3":{
-        "code": "49-3",
-        "id": 679,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wattala - Mabola Urban Council",
-        "sn_name": "\u0dc0\u0dad\u0dca\u0dad\u0dbd- \u0db8\u0dcf\u0db6\u0ddd\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0ba4\u0bcd\u0ba4\u0bb3\u0bc8- \u0bae\u0bbe\u0baa\u0bcb\u0bb2 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-4":{
-        "code": "49-4",
-        "id": 680,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Katunayaka - Seeduwa Urban Council",
-        "sn_name": "\u0d9a\u0da7\u0dd4\u0db1\u0dcf\u0dba\u0d9a-\u0dc3\u0dd3\u0daf\u0dd6\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0ba8\u0bbe\u0baf\u0b95\u0bcd\u0b95- \u0b9a\u0bc0\u0ba4\u0bc1\u0bb5 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-5":{
-        "code": "49-5",
-        "id": 681,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Minuwangoda Urban Council",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd4\u0dc0\u0db1\u0dca\u0d9c\u0ddc\u0da9 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbf\u0ba9\u0bc1\u0bb5\u0ba9\u0bcd\u0b95\u0bca\u0b9f \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-6":{
-        "code": "49-6",
-        "id": 682,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ja-Ela Urban Council",
-        "sn_name": "\u0da2\u0dcf-\u0d87\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9c\u0bbe- \u0b8e\u0bb2 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-7":{
-        "code": "49-7",
-        "id": 683,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Peliyagoda Urban Council",
-        "sn_name": "\u0db4\u0dd1\u0dbd\u0dd2\u0dba\u0d9c\u0ddc\u0da9 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbe\u0bb2\u0bbf\u0baf\u0b95\u0bca\u0b9f\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-8":{
-        "code": "49-8",
-        "id": 684,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wattala Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dad\u0dca\u0dad\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0ba4\u0bcd\u0ba4\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-9":{
-        "code": "49-9",
-        "id": 685,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Katana Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0da7\u0dcf\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bcd\u0b9f\u0bbe\u0ba9\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-10":{
-        "code": "49-10",
-        "id": 686,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Divulapitiya Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd2\u0dc0\u0dd4\u0dbd\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb5\u0bc2\u0bb2\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-11":{
-        "code": "49-11",
-        "id": 687,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mirigama Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd3\u0dbb\u0dd2\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc0\u0bb0\u0bbf\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-12":{
-        "code": "49-12",
-        "id": 688,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Minuwangoda Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd4\u0dc0\u0db1\u0dca\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbf\u0ba9\u0bc1\u0bb5\u0ba9\u0bcd\u0b95\u0bca\u0b9f\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-13":{
-        "code": "49-13",
-        "id": 689,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Attanagalla Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0dad\u0dca\u0dad\u0db1\u0d9c\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0ba4\u0bcd\u0ba4\u0ba9\u0b95\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-14":{
-        "code": "49-14",
-        "id": 690,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Gampaha Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0db8\u0dca\u0db4\u0dc4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bae\u0bcd\u0baa\u0bb9\u0bbe \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-15":{
-        "code": "49-15",
-        "id": 691,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ja-Ela Pradeshiya Sabha",
-        "sn_name": "\u0da2\u0dcf-\u0d87\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9c\u0bbe- \u0b8e\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-16":{
-        "code": "49-16",
-        "id": 692,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mahara Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dc4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bb9\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-17":{
-        "code": "49-17",
-        "id": 693,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dompe Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0ddc\u0db8\u0dca\u0db4\u0dd9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0bae\u0bcd\u0baa\u0bc7 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-18":{
-        "code": "49-18",
-        "id": 694,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Biyagama Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd2\u0dba\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbf\u0baf\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "49-19":{
-        "code": "49-19",
-        "id": 695,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kelaniya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd0\u0dc5\u0dab\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb3\u0ba9\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-1":{
-        "code": "50-1",
-        "id": 696,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Panadura Urban Council",
-        "sn_name": "\u0db4\u0dcf\u0db1\u0daf\u0dd4\u0dbb \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbe\u0ba3\u0ba8\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-2":{
-        "code": "50-2",
-        "id": 697,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Horana Urban Council",
-        "sn_name": "\u0dc4\u0ddc\u0dbb\u0dab \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bca\u0bb0\u0ba3 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-3":{
-        "code": "50-3",
-        "id": 698,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kalutara Urban Council",
-        "sn_name": "\u0d9a\u0dc5\u0dd4\u0dad\u0dbb \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb3\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-4":{
-        "code": "50-4",
-        "id": 699,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Beruwala Urban Council",
-        "sn_name": "\u0db6\u0dda\u0dbb\u0dd4\u0dc0\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc7\u0bb0\u0bc1\u0bb5\u0bb3\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-5":{
-        "code": "50-5",
-        "id": 700,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Panadura Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dcf\u0db1\u0daf\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbe\u0ba3\u0ba8\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-6":{
-        "code": "50-6",
-        "id": 701,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bandaragama Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dab\u0dca\u0da9\u0dcf\u0dbb\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba3\u0bcd\u0b9f\u0bbe\u0bb0\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-7":{
-        "code": "50-7",
-        "id": 702,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Horana Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0ddc\u0dbb\u0dab \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bca\u0bb0\u0ba3 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-8":{
-        "code": "50-8",
-        "id": 703,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Madurawala Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0daf\u0dd4\u0dbb\u0dcf\u0dc0\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba4\u0bc1\u0bb0\u0bbe\u0bb5\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-9":{
-        "code": "50-9",
-        "id": 704,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bulathsinhala Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd4\u0dbd\u0dad\u0dca\u0dc3\u0dd2\u0d82\u0dc4\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc1\u0bb3\u0ba4\u0bcd\u0b9a\u0bbf\u0b99\u0bcd\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-10":{
-        "code": "50-10",
-        "id": 705,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mathugama Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dad\u0dd4\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba4\u0bcd\u0ba4\u0bc1\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-11":{
-        "code": "50-11",
-        "id": 706,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dodangoda Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0ddc\u0da9\u0db1\u0dca\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bca\u0b9f\u0b99\u0bcd\u0b95\u0bca\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-12":{
-        "code": "50-12",
-        "id": 707,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kalutara Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dc5\u0dd4\u0dad\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb3\u0bc1\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-13":{
-        "code": "50-13",
-        "id": 708,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Beruwala Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dda\u0dbb\u0dd4\u0dc0\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc7\u0bb0\u0bc1\u0bb5\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-14":{
-        "code": "50-14",
-        "id": 709,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Palindanuwara Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dcf\u0dbd\u0dd2\u0db1\u0dca\u0daf\u0db1\u0dd4\u0dc0\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbe\u0bb2\u0bbf\u0ba8\u0bcd\u0ba4\u0ba8\u0bc1\u0bb5\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-15":{
-        "code": "50-15",
-        "id": 710,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Agalawaththa Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0d9c\u0dbd\u0dc0\u0dad\u0dca\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bb2\u0bb5\u0ba4\u0bcd\u0ba4\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-16":{
-        "code": "50-16",
-        "id": 711,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Millaniya Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd2\u0dbd\u0dca\u0dbd\u0db1\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbf\u0bb2\u0bcd\u0bb2\u0ba9\u0bbf\u0baf\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "50-17":{
-        "code": "50-17",
-        "id": 712,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Walallawita Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0dbd\u0dca\u0dbd\u0dcf\u0dc0\u0dd2\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bb2\u0bcd\u0bb2\u0bbe\u0bb5\u0bbf\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-1":{
-        "code": "51-1",
-        "id": 713,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kandy Municipal Council",
-        "sn_name": "\u0db8\u0dc4\u0db1\u0dd4\u0dc0\u0dbb \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0ba3\u0bcd\u0b9f\u0bbf \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-2":{
-        "code": "51-2",
-        "id": 714,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wattegama Urban Council",
-        "sn_name": "\u0dc0\u0dad\u0dca\u0dad\u0dda\u0d9c\u0db8 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0ba4\u0bcd\u0ba4\u0bc7\u0b95\u0bae \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-3":{
-        "code": "51-3",
-        "id": 715,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kadugannawa Urban Council",
-        "sn_name": "\u0d9a\u0da9\u0dd4\u0d9c\u0db1\u0dca\u0db1\u0dcf\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bc1\u0b95\u0ba9\u0bcd\u0ba9\u0bbe\u0bb5\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-4":{
-        "code": "51-4",
-        "id": 716,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Gampola Urban Council",
-        "sn_name": "\u0d9c\u0db8\u0dca\u0db4\u0ddc\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bae\u0bcd\u0baa\u0bb3\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-5":{
-        "code": "51-5",
-        "id": 717,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nawalapitiya Urban Council",
-        "sn_name": "\u0db1\u0dcf\u0dc0\u0dbd\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0bb5\u0bb2\u0baa\u0bcd\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-6":{
-        "code": "51-6",
-        "id": 718,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thumpane Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dd4\u0db8\u0dca\u0db4\u0db1\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc1\u0bae\u0bcd\u0baa\u0ba9\u0bc7 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-7":{
-        "code": "51-7",
-        "id": 719,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Harispattuwa Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0dcf\u0dbb\u0dd2\u0dc3\u0dca\u0db4\u0dad\u0dca\u0dad\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bbehp\u0bb8\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-8":{
-        "code": "51-8",
-        "id": 720,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Akurana Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0d9a\u0dd4\u0dbb\u0dab \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bcd\u0b95\u0bc1\u0bb0\u0ba3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-9":{
-        "code": "51-9",
-        "id": 721,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Poojapitiya Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dd6\u0da2\u0dcf\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc2\u0b9c\u0bbe\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-10":{
-        "code": "51-10",
-        "id": 722,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pathadumbara Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dcf\u0dad\u0daf\u0dd4\u0db8\u0dca\u0db6\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0ba4\u0bc1\u0bae\u0bcd\u0baa\u0bc1\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-11":{
-        "code": "51-11",
-        "id": 723,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Panwila Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0db1\u0dca\u0dc0\u0dd2\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba9\u0bcd\u0bb5\u0bbf\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-12":{
-        "code": "51-12",
-        "id": 724,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Udadumbara Pradeshiya Sabha",
-        "sn_name": "\u0d8b\u0da9\u0daf\u0dd4\u0db8\u0dca\u0db6\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b89\u0b9f\u0ba4\u0bc1\u0bae\u0bcd\u0baa\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-13":{
-        "code": "51-13",
-        "id": 725,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Minipe Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd2\u0db1\u0dd2\u0db4\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbf\u0ba9\u0bbf\u0baa\u0bcd\u0baa\u0bc7 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-14":{
-        "code": "51-14",
-        "id": 726,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Medadumbara Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd0\u0daf\u0daf\u0dd4\u0db8\u0dca\u0db6\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc6\u0ba4\u0ba4\u0bc1\u0bae\u0bcd\u0baa\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-15":{
-        "code": "51-15",
-        "id": 727,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kundasale Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd4\u0dab\u0dca\u0da9\u0dc3\u0dcf\u0dbd\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0ba3\u0bcd\u0b9f\u0b9a\u0bbe\u0bb2\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-16":{
-        "code": "51-16",
-        "id": 728,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pathahewaheta Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dcf\u0dad\u0dc4\u0dda\u0dc0\u0dcf\u0dc4\u0dd0\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbe\u0ba4\u0bb9\u0bc7\u0bb5\u0bbe\u0bb9\u0bc6\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-17":{
-        "code": "51-17",
-        "id": 729,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kandy Four Gravets and Gangawata Korale Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dc4\u0db1\u0dd4\u0dc0\u0dbb \u0d9a\u0da9\u0dc0\u0dad\u0dca\u0dc3\u0dad\u0dbb \u0dc3\u0dc4 \u0d9c\u0d9f\u0dc0\u0da7 \u0d9a\u0ddd\u0dbb\u0dc5\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3.",
-        "tm_name": "\u0b95\u0ba3\u0bcd\u0b9f\u0bbf \u0ba8\u0bbe\u0ba9\u0bcd\u0b95\u0bc1 \u0b8e\u0bb2\u0bcd\u0bb2\u0bc8\u0b95\u0bb3\u0bcd \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b95\u0b99\u0bcd\u0b95\u0bb5\u0b9f\u0bcd\u0b9f \u0b95\u0bcb\u0bb1\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-18":{
-        "code": "51-18",
-        "id": 730,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Yatinuwara Pradeshiya Sabha",
-        "sn_name": "\u0dba\u0da7\u0dd2\u0db1\u0dd4\u0dc0\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baf\u0b9f\u0bcd\u0b9f\u0bbf\u0ba8\u0bc1\u0bb5\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-19":{
-        "code": "51-19",
-        "id": 731,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Udunuwara Pradeshiya Sabha",
-        "sn_name": "\u0d8b\u0da9\u0dd4\u0db1\u0dd4\u0dc0\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b89\u0b9f\u0bc1\u0ba8\u0bc1\u0bb5\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-20":{
-        "code": "51-20",
-        "id": 732,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Udapalatha Pradeshiya Sabha",
-        "sn_name": "\u0d8b\u0da9\u0db4\u0dc5\u0dcf\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b89\u0b9f\u0baa\u0bb2\u0bbe\u0ba4 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-21":{
-        "code": "51-21",
-        "id": 733,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ganga Ihala Korale Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0d9f \u0d89\u0dc4\u0dc5 \u0d9a\u0ddd\u0dbb\u0dc5\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0b99\u0bcd\u0b95 \u0b87\u0bb9\u0bb2\u0b95\u0bcb\u0bb0\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "51-22":{
-        "code": "51-22",
-        "id": 734,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pasbage Korale Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dc3\u0dca\u0db6\u0dcf\u0d9c\u0dda \u0d9a\u0ddd\u0dbb\u0dc5\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb8\u0bcd\u0baa\u0bbe\u0b95\u0bc7 \u0b95\u0bcbh\u0bb0\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-1":{
-        "code": "52-1",
-        "id": 735,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dambulla Municipal Council",
-        "sn_name": "\u0daf\u0db9\u0dd4\u0dbd\u0dca\u0dbd \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bae\u0bcd\u0baa\u0bc1\u0bb3\u0bcd\u0bb3\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-2":{
-        "code": "52-2",
-        "id": 736,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Matale Municipal Council",
-        "sn_name": "\u0db8\u0dcf\u0dad\u0dbd\u0dda \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba4\u0bcd\u0ba4\u0bb3\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-3":{
-        "code": "52-3",
-        "id": 737,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pallepola Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dbd\u0dca\u0dbd\u0dda\u0db4\u0ddc\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb2\u0bcd\u0bb2\u0bc7\u0baa\u0bca\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-4":{
-        "code": "52-4",
-        "id": 738,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Galewela Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0dbd\u0dda\u0dc0\u0dd9\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bc7\u0bb5\u0bc6\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-5":{
-        "code": "52-5",
-        "id": 739,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dambulla Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0db9\u0dd4\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bae\u0bcd\u0baa\u0bc1\u0bb3\u0bcd\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-6":{
-        "code": "52-6",
-        "id": 740,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ambanganga Korale Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0db9\u0db1\u0dca\u0d9c\u0d9f \u0d9a\u0ddd\u0dbb\u0dc5\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0ba9\u0bcd\u0b95\u0b99\u0bcd\u0b95 \u0b95\u0bcb\u0bb0\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-7":{
-        "code": "52-7",
-        "id": 741,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Naula Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dcf\u0d8b\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0bb5\u0bc2\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-8":{
-        "code": "52-8",
-        "id": 742,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Laggala Pallegama Pradeshiya Sabha",
-        "sn_name": "\u0dbd\u0d9c\u0dca\u0d9c\u0dbd-\u0db4\u0dbd\u0dca\u0dbd\u0dda\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb2\u0b95\u0bcd\u0b95\u0bb2- \u0baa\u0bb2\u0bcd\u0bb2\u0bc7\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-9":{
-        "code": "52-9",
-        "id": 743,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wilgamuwa Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd2\u0dbd\u0dca\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bbf\u0bb2\u0bcd\u0b95\u0bae\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-10":{
-        "code": "52-10",
-        "id": 744,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Matale Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0dad\u0dbd\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba4\u0bcd\u0ba4\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-11":{
-        "code": "52-11",
-        "id": 745,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Yatawatta Pradeshiya Sabha",
-        "sn_name": "\u0dba\u0da7\u0dc0\u0dad\u0dca\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baf\u0b9f\u0bcd\u0b9f\u0bb5\u0ba4\u0bcd\u0ba4\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-12":{
-        "code": "52-12",
-        "id": 746,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ukuwela Pradeshiya Sabha",
-        "sn_name": "\u0d8b\u0d9a\u0dd4\u0dc0\u0dd9\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b89\u0b95\u0bcd\u0b95\u0bc1\u0bb5\u0bc6\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "52-13":{
-        "code": "52-13",
-        "id": 747,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rattota Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0dad\u0dca\u0dad\u0ddc\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb0\u0ba4\u0bcd\u0ba4\u0bca\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-1":{
-        "code": "53-1",
-        "id": 748,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nuwara Eliya Municipal Council",
-        "sn_name": "\u0db1\u0dd4\u0dc0\u0dbb\u0d91\u0dc5\u0dd2\u0dba \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc1\u0bb5\u0bb0\u0bc6\u0bb2\u0bbf\u0baf\u0bbe \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-2":{
-        "code": "53-2",
-        "id": 749,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hatton - Dickoya Urban Council",
-        "sn_name": "\u0dc4\u0dd0\u0da7\u0db1\u0dca-\u0daf\u0dd2\u0d9a\u0dca\u0d94\u0dba \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0b9f\u0bcd\u0b9f\u0ba9\u0bcd - \u0b9f\u0bbf\u0b95\u0bcd\u0b95\u0bcb\u0baf\u0bbe \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-3":{
-        "code": "53-3",
-        "id": 750,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thalawakele Lindula Urban Council",
-        "sn_name": "\u0dad\u0dbd\u0dc0\u0d9a\u0dd0\u0dbd\u0dda-\u0dbd\u0dd2\u0db3\u0dd4\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bb2\u0bb5\u0bbe\u0b95\u0bcd\u0b95\u0bb2\u0bc8-\u0bb2\u0bbf\u0ba8\u0bcd\u0ba4\u0bc1\u0bb2\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-4":{
-        "code": "53-4",
-        "id": 751,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Maskeliya Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dc3\u0dca\u0d9a\u0dd9\u0dc5\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bb8\u0bcd\u0b95\u0bc6\u0bb2\u0bbf\u0baf\u0bbe\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-5":{
-        "code": "53-5",
-        "id": 752,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Norwood Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0ddd\u0dbb\u0dca\u0dc0\u0dd4\u0da9\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bcb\u0bb0\u0bcd\u0bb5\u0bc2+\u0b9f\u0bcd\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-6":{
-        "code": "53-6",
-        "id": 753,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ambagamuwa Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0db9\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0b95\u0bae\u0bc1\u0bb5\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-7":{
-        "code": "53-7",
-        "id": 754,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Agarapathana Pradeshiya Sabha",
-        "sn_name": "\u0d86\u0d9c\u0dbb\u0db4\u0dad\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bcd\u0b95\u0bb0\u0baa\u0bcd\u0baa\u0ba4\u0bcd\u0ba4\u0ba9\u0bc8\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-8":{
-        "code": "53-8",
-        "id": 755,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kotagala Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddc\u0da7\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0b9f\u0bcd\u0b9f\u0b95\u0bcd\u0b95\u0bb2\u0bc8\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-9":{
-        "code": "53-9",
-        "id": 756,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nuwaraeliya Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd4\u0dc0\u0dbb\u0d91\u0dc5\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc1\u0bb5\u0bb0\u0bc6\u0bb2\u0bbf\u0baf\u0bbe \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-10":{
-        "code": "53-10",
-        "id": 757,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kothmale Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddc\u0dad\u0dca\u0db8\u0dbd\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0ba4\u0bcd\u0bae\u0bb2\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-11":{
-        "code": "53-11",
-        "id": 758,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hanguranketha Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0d9f\u0dd4\u0dbb\u0db1\u0dca\u0d9a\u0dd9\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0b99\u0bcd\u0b95\u0bc1\u0bb0\u0ba9\u0bcd\u0b95\u0bc6\u0ba4\u0bcd\u0ba4 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "53-12":{
-        "code": "53-12",
-        "id": 759,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Walapane Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0db4\u0db1\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0baa\u0bcd\u0baa\u0ba9\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-1":{
-        "code": "54-1",
-        "id": 760,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Galle Municipal Council",
-        "sn_name": "\u0d9c\u0dcf\u0dbd\u0dca\u0dbd \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0bb2\u0bbf \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-2":{
-        "code": "54-2",
-        "id": 761,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ambalangoda Urban Council",
-        "sn_name": "\u0d85\u0db8\u0dca\u0db6\u0dbd\u0db1\u0dca\u0d9c\u0ddc\u0da9 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0bb2\u0bbe\u0b99\u0bcd\u0b95\u0bca\u0b9f\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-3":{
-        "code": "54-3",
-        "id": 762,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hikkaduwa Urban Council",
-        "sn_name": "\u0dc4\u0dd2\u0d9a\u0dca\u0d9a\u0da9\u0dd4\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bbf\u0b95\u0bcd\u0b95\u0b9f\u0bc1\u0bb5\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-4":{
-        "code": "54-4",
-        "id": 763,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Balapitiya Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dbd\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb2\u0baa\u0bcd\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-5":{
-        "code": "54-5",
-        "id": 764,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ambalangoda Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0db8\u0dca\u0db6\u0dbd\u0db1\u0dca\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0bb2\u0bbe\u0b99\u0bcd\u0b95\u0bca\u0b9f\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-6":{
-        "code": "54-6",
-        "id": 765,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Valivita Diwitura Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0dc0\u0dd2\u0da7\u0dd2\u0dba-\u0daf\u0dd2\u0dc0\u0dd2\u0dad\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb2\u0bbf\u0bb5\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0ba4\u0bbf\u0bb5\u0bbf\u0ba4\u0bc1\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-7":{
-        "code": "54-7",
-        "id": 766,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Karandeniya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dbb\u0db1\u0dca\u0daf\u0dd9\u0dab\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb0\u0ba9\u0bcd\u0ba4\u0bc6\u0ba9\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-8":{
-        "code": "54-8",
-        "id": 767,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bentota Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd9\u0db1\u0dca\u0dad\u0ddc\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc6\u0ba9\u0bcd\u0ba4\u0bca\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-9":{
-        "code": "54-9",
-        "id": 768,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Elpitiya Pradeshiya Sabha",
-        "sn_name": "\u0d87\u0dbd\u0dca\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8e\u0bb2\u0bcd\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-10":{
-        "code": "54-10",
-        "id": 769,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Neluwa Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd9\u0dc5\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc6\u0bb2\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-11":{
-        "code": "54-11",
-        "id": 770,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thawalama Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dc0\u0dbd\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bb5\u0bb2\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-12":{
-        "code": "54-12",
-        "id": 771,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nagoda Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dcf\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0b95\u0bca\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-13":{
-        "code": "54-13",
-        "id": 772,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Niyagama Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd2\u0dba\u0dcf\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0baf\u0bbe\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-14":{
-        "code": "54-14",
-        "id": 773,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Baddegama Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0daf\u0dca\u0daf\u0dda\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bcd\u0ba4\u0bc7\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-15":{
-        "code": "54-15",
-        "id": 774,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Yakkalamulla Pradeshiya Sabha",
-        "sn_name": "\u0dba\u0d9a\u0dca\u0d9a\u0dbd\u0db8\u0dd4\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baf\u0b95\u0bcd\u0b95\u0bb2\u0bae\u0bc1\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-16":{
-        "code": "54-16",
-        "id": 775,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rajgama Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0da2\u0dca\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb1\u0b9c\u0bcd\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-17":{
-        "code": "54-17",
-        "id": 776,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Akmeemana Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0d9a\u0dca\u0db8\u0dd3\u0db8\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bcd\u0bae\u0bc0\u0bae\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-18":{
-        "code": "54-18",
-        "id": 777,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bope Poddala Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0ddd\u0db4\u0dda-\u0db4\u0ddd\u0daf\u0dca\u0daf\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bcb\u0baa\u0bc7- \u0baa\u0bcb\u0ba4\u0bcd\u0ba4\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-19":{
-        "code": "54-19",
-        "id": 778,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Imaduwa Pradeshiya Sabha",
-        "sn_name": "\u0d89\u0db8\u0daf\u0dd6\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bae\u0ba4\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "54-20":{
-        "code": "54-20",
-        "id": 779,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Habaraduwa Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0db6\u0dbb\u0dcf\u0daf\u0dd6\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0baa\u0bb0\u0bbe\u0ba4\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-1":{
-        "code": "55-1",
-        "id": 780,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Matara Municipal Council",
-        "sn_name": "\u0db8\u0dcf\u0dad\u0dbb \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba4\u0bcd\u0ba4\u0bb1\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-2":{
-        "code": "55-2",
-        "id": 781,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Weligama Urban Council",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0d9c\u0db8 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb2\u0bbf\u0b95\u0bae \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-3":{
-        "code": "55-3",
-        "id": 782,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pitabaddara Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dd2\u0da7\u0db6\u0dd0\u0daf\u0dca\u0daf\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0baa\u0bc6\u0ba4\u0bcd\u0ba4\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-4":{
-        "code": "55-4",
-        "id": 783,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kotapola Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddc\u0da7\u0db4\u0ddc\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0b9f\u0bcd\u0b9f\u0baa\u0bca\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-5":{
-        "code": "55-5",
-        "id": 784,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kirinda Puhulwella Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd2\u0dbb\u0dd2\u0db1\u0dca\u0daf- \u0db4\u0dd4\u0dc4\u0dd4\u0dbd\u0dca\u0dc0\u0dd0\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbf\u0ba8\u0bcd\u0ba4- \u0baa\u0bc1\u0bb9\u0bc1\u0bb2\u0bcd;\u0bb5\u0bc6\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-6":{
-        "code": "55-6",
-        "id": 785,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mulatiyana Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd4\u0dbd\u0da7\u0dd2\u0dba\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc1\u0bb2\u0b9f\u0bcd\u0b9f\u0bbf\u0baf\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-7":{
-        "code": "55-7",
-        "id": 786,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pasgoda Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dc3\u0dca\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb8\u0bcd\u0b95\u0bca\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-8":{
-        "code": "55-8",
-        "id": 787,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Athuraliya Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0dad\u0dd4\u0dbb\u0dbd\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0ba4\u0bcd\u0ba4\u0bc1\u0bb0\u0bb2\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-9":{
-        "code": "55-9",
-        "id": 788,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Akuressa Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0d9a\u0dd4\u0dbb\u0dd0\u0dc3\u0dca\u0dc3 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bcd\u0b95\u0bc1\u0bb0\u0bb8\u0bcd\u0bb8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-10":{
-        "code": "55-10",
-        "id": 789,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Malimbada Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0dbd\u0dd2\u0db8\u0dca\u0db6\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0bb2\u0bbf\u0bae\u0bcd\u0baa\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-11":{
-        "code": "55-11",
-        "id": 790,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hakmana Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0d9a\u0dca\u0db8\u0dab \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0b95\u0bcd\u0bae\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-12":{
-        "code": "55-12",
-        "id": 791,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kamburupitiya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0db9\u0dd4\u0dbb\u0dd4\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bae\u0bcd\u0baa\u0bc1\u0bb1\u0bc1\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-13":{
-        "code": "55-13",
-        "id": 792,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thihagoda Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dd2\u0dc4\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb9\u0b95\u0bca\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-14":{
-        "code": "55-14",
-        "id": 793,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dewinuwara Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd9\u0dc0\u0dd2\u0db1\u0dd4\u0dc0\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb5\u0bbf\u0ba8\u0bc1\u0bb5\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-15":{
-        "code": "55-15",
-        "id": 794,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dickwella Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd2\u0d9a\u0dca\u0dc0\u0dd0\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0b95\u0bcd\u0bb5\u0bc6\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-16":{
-        "code": "55-16",
-        "id": 795,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Matara Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0dad\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba4\u0bcd\u0ba4\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "55-17":{
-        "code": "55-17",
-        "id": 796,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Weligama Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb2\u0bbf\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-1":{
-        "code": "56-1",
-        "id": 797,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hambantota Municipal Council",
-        "sn_name": "\u0dc4\u0db8\u0dca\u0db6\u0db1\u0dca\u0dad\u0ddc\u0da7 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0bbe\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-2":{
-        "code": "56-2",
-        "id": 798,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Tangalle Urban Council",
-        "sn_name": "\u0dad\u0d82\u0d9c\u0dbd\u0dca\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0b99\u0bcd\u0b95\u0bb2\u0bcd\u0bb2 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-3":{
-        "code": "56-3",
-        "id": 799,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Weeraketiya Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd3\u0dbb\u0d9a\u0dd0\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc0\u0bb0\u0b95\u0bc6\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-4":{
-        "code": "56-4",
-        "id": 800,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Katuwana Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0da7\u0dd4\u0dc0\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-5":{
-        "code": "56-5",
-        "id": 801,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Beliatta Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd9\u0dbd\u0dd2\u0d85\u0dad\u0dca\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc6\u0bb2\u0bbf\u0baf\u0ba4\u0bcd\u0ba4 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-6":{
-        "code": "56-6",
-        "id": 802,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Tangalle Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0d82\u0d9c\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0b99\u0bcd\u0b95\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-7":{
-        "code": "56-7",
-        "id": 803,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Angunakolapelessa Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0d9f\u0dd4\u0dab\u0d9a\u0ddc\u0dbd\u0db4\u0dd0\u0dbd\u0dd0\u0dc3\u0dca\u0dc3 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b99\u0bcd\u0b95\u0bc1\u0ba3\u0b95\u0bca\u0bb2\u0baa\u0bc6\u0bb2\u0bc6\u0bb8\u0bcd;\u0bb8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-8":{
-        "code": "56-8",
-        "id": 804,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ambalantota Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0db8\u0dca\u0db6\u0dbd\u0db1\u0dca\u0dad\u0ddc\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0bb2\u0bbe\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-9":{
-        "code": "56-9",
-        "id": 805,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thissamaharama Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dd2\u0dc3\u0dca\u0dc3\u0db8\u0dc4\u0dcf\u0dbb\u0dcf\u0db8\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb8\u0bcd\u0bb8\u0bae\u0bb9\u0bbe\u0bb0\u0bbe\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-10":{
-        "code": "56-10",
-        "id": 806,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Sooriyawewa Pradeshiya Sabha",
-        "sn_name": "\u0dc3\u0dd6\u0dbb\u0dd2\u0dba\u0dc0\u0dd0\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bc2\u0bb0\u0bbf\u0baf\u0bb5\u0bc6\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-11":{
-        "code": "56-11",
-        "id": 807,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hambantota Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0db8\u0dca\u0db6\u0db1\u0dca\u0dad\u0ddc\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0bbe\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "56-12":{
-        "code": "56-12",
-        "id": 808,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Lunugamwehera Pradeshiya Sabha",
-        "sn_name": "\u0dbd\u0dd4\u0dab\u0dd4\u0d9c\u0db8\u0dca\u0dc0\u0dd9\u0dc4\u0dd9\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb2\u0bc1\u0ba3\u0b95\u0bae\u0bcd\u0bb5\u0bc6\u0bb9\u0bc6\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-1":{
-        "code": "57-1",
-        "id": 809,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Jaffna Municipal Council",
-        "sn_name": "\u0dba\u0dcf\u0db4\u0db1\u0dba \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baf\u0bbe\u0bb4\u0bcd\u0baa\u0bcd\u0baa\u0bbe\u0ba3\u0bae\u0bcd \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-2":{
-        "code": "57-2",
-        "id": 810,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Valvettithurai Urban Council",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0dc0\u0dd0\u0da7\u0dd2\u0dad\u0dd4\u0dbb\u0dd9\u0dba\u0dd2 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bcd\u0bb5\u0bc6\u0b9f\u0bcd\u0b9f\u0bbf\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-3":{
-        "code": "57-3",
-        "id": 811,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Point Pedro Urban Council",
-        "sn_name": "\u0db4\u0dda\u0daf\u0dd4\u0dbb\u0dd4\u0dad\u0dd4\u0da9\u0dd4\u0dc0 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-4":{
-        "code": "57-4",
-        "id": 812,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Chavakachcheri Urban Council",
-        "sn_name": "\u0da0\u0dcf\u0dc0\u0d9a\u0da0\u0dca\u0da0\u0dda\u0dbb\u0dd2\u0dba \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bbe\u0bb5\u0b95\u0b9a\u0bcd\u0b9a\u0bc7\u0bb0\u0bbf \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-5":{
-        "code": "57-5",
-        "id": 813,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Karainagar Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dbb\u0dd9\u0dba\u0dd2\u0db1\u0d9c\u0dbb\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0bb0\u0bc8\u0ba8\u0b95\u0bb0\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-6":{
-        "code": "57-6",
-        "id": 814,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kayts Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dba\u0dd2\u0da7\u0dca\u0dc3\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8a\u0bb0\u0bcd\u0b95\u0bbe\u0bb5\u0bb1\u0bcd\u0bb1\u0bc1\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-7":{
-        "code": "57-7",
-        "id": 815,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Delft Pradeshiya Sabha",
-        "sn_name": "\u0da9\u0dd9\u0dbd\u0dca\u0dc6\u0dca\u0da7\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc6\u0b9f\u0bc1\u0ba8\u0bcd\u0ba4\u0bc0\u0bb5\u0bc2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-8":{
-        "code": "57-8",
-        "id": 816,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Velanai Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dda\u0dbd\u0db1\u0dd9\u0dba\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc7\u0bb2\u0ba3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-9":{
-        "code": "57-9",
-        "id": 817,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Valikamam West Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0dd2\u0d9a\u0dcf\u0db8\u0db8\u0dca \u0db6\u0da7\u0dc4\u0dd2\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bbf\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-10":{
-        "code": "57-10",
-        "id": 818,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Walikamam North Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0dd2\u0d9a\u0dcf\u0db8\u0db8\u0dca \u0d8b\u0dad\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bbf\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-11":{
-        "code": "57-11",
-        "id": 819,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Valikamam South West Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0dd2\u0d9a\u0dcf\u0db8\u0db8\u0dca \u0db1\u0dd2\u0dbb\u0dd2\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bbf\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0ba4\u0bc6\u0ba9\u0bcd\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-12":{
-        "code": "57-12",
-        "id": 820,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Walikamam South Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0dd2\u0d9a\u0dcf\u0db8\u0db8\u0dca \u0daf\u0d9a\u0dd4\u0dab \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bbf\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-13":{
-        "code": "57-13",
-        "id": 821,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Walikamam East Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbd\u0dd2\u0d9a\u0dcf\u0db8\u0db8\u0dca \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb2\u0bbf\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-14":{
-        "code": "57-14",
-        "id": 822,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wadamarachchi South West Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0da9\u0db8\u0dcf\u0dbb\u0da0\u0dca\u0da0\u0dd2 \u0db1\u0dd2\u0dbb\u0dd2\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0b9f\u0bae\u0bb0\u0bbe\u0b9f\u0bcd\u0b9a\u0bbf \u0ba4\u0bc6\u0ba9\u0bcd\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-15":{
-        "code": "57-15",
-        "id": 823,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Point Pedro Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dda\u0daf\u0dd4\u0dbb\u0dd4\u0dad\u0dd4\u0da9\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb0\u0bc1\u0ba4\u0bcd\u0ba4\u0bbf\u0ba4\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-16":{
-        "code": "57-16",
-        "id": 824,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Chawakachcheri Pradeshiya Sabha",
-        "sn_name": "\u0da0\u0dcf\u0dc0\u0d9a\u0da0\u0dca\u0da0\u0dda\u0dbb\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bbe\u0bb5\u0b95\u0b9a\u0bcd\u0b9a\u0bc7\u0bb0\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "57-17":{
-        "code": "57-17",
-        "id": 825,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nallur Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dbd\u0dca\u0dbd\u0dd6\u0dbb\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bb2\u0bcd\u0bb2\u0bc2\u0bb0\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "58-1":{
-        "code": "58-1",
-        "id": 826,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pachchilaippalli Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0da0\u0dca\u0da0\u0dd2\u0dbd\u0dba\u0dd2\u0db4\u0dbd\u0dca\u0dbd\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0b9a\u0bcd\u0b9a\u0bbf\u0bb2\u0bc8\u0baa\u0bcd\u0baa\u0bb3\u0bcd\u0bb3\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "58-2":{
-        "code": "58-2",
-        "id": 827,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Karachchi Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dbb\u0da0\u0dca\u0da0\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb0\u0bc8\u0b9a\u0bcd\u0b9a\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "58-3":{
-        "code": "58-3",
-        "id": 828,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Poonakary Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dd6\u0db1\u0dcf\u0d9a\u0dbb\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc2\u0ba8\u0b95\u0bb0\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "59-1":{
-        "code": "59-1",
-        "id": 829,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mannar Urban Council",
-        "sn_name": "\u0db8\u0db1\u0dca\u0db1\u0dcf\u0dbb\u0db8 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba9\u0bcd\u0ba9\u0bbe\u0bb0\u0bcd \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "59-2":{
-        "code": "59-2",
-        "id": 830,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mannar Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0db1\u0dca\u0db1\u0dcf\u0dbb\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba9\u0bcd\u0ba9\u0bbe\u0bb0\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "59-3":{
-        "code": "59-3",
-        "id": 831,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nanattan Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dcf\u0db1\u0dcf\u0da7\u0dca\u0da7\u0dcf\u0db1\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0ba9\u0bbe\u0b9f\u0bcd\u0b9f\u0bbe\u0ba9\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "59-4":{
-        "code": "59-4",
-        "id": 832,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Musali Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd4\u0dc3\u0dbd\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc1\u0b9a\u0bb2\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "59-5":{
-        "code": "59-5",
-        "id": 833,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Manthai West Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0db1\u0dca\u0dad\u0dd9\u0dba\u0dd2 \u0db6\u0da7\u0dc4\u0dd2\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba8\u0bcd\u0ba4\u0bc8 \u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "60-1":{
-        "code": "60-1",
-        "id": 834,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Vavuniya Urban Council",
-        "sn_name": "\u0dc0\u0dc0\u0dd4\u0db1\u0dd2\u0dba\u0dcf \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb5\u0bc2\u0ba9\u0bbf\u0baf\u0bbe \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "60-2":{
-        "code": "60-2",
-        "id": 835,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Vavuniya North Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dc0\u0dd4\u0db1\u0dd2\u0dba\u0dcf \u0d8b\u0dad\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb5\u0bc2\u0ba9\u0bbf\u0baf\u0bbe \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "60-3":{
-        "code": "60-3",
-        "id": 836,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Vengalasettikulam Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dda\u0db1\u0dca\u0d9a\u0dbd\u0da0\u0dd9\u0da7\u0dca\u0da7\u0dd2\u0d9a\u0dd4\u0dbd\u0db8\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0b99\u0bcd\u0b95\u0bb2\u0b9a\u0bcd \u0b9a\u0bc6\u0b9f\u0bcd\u0b9f\u0bbf\u0b95\u0bc1\u0bb3\u0bae\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "60-4":{
-        "code": "60-4",
-        "id": 837,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Vavuniya South (Tamil) Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dc0\u0dd4\u0db1\u0dd2\u0dba\u0dcf \u0daf\u0d9a\u0dd4\u0dab ( \u0daf\u0dd9\u0db8\u0dc5 ) \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb5\u0bc2\u0ba9\u0bbf\u0baf\u0bbe \u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 (\u0ba4\u0bae\u0bbf\u0bb4\u0bcd) \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "60-5":{
-        "code": "60-5",
-        "id": 838,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Vavuniya South (Sinhala) Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dc0\u0dd4\u0db1\u0dd2\u0dba\u0dcf \u0daf\u0d9a\u0dd4\u0dab ( \u0dc3\u0dd2\u0d82\u0dc4\u0dbd ) \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb5\u0bc2\u0ba9\u0bbf\u0baf\u0bbe \u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 (\u0b9a\u0bbf\u0b99\u0bcd\u0b95\u0bb3) \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "61-1":{
-        "code": "61-1",
-        "id": 839,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Manthai East Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0db1\u0dca\u0dad\u0dd9\u0dba\u0dd2 \u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0ba8\u0bcd\u0ba4\u0bc8 \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "61-2":{
-        "code": "61-2",
-        "id": 840,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thunukkai Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dd4\u0db1\u0dd4\u0d9a\u0dca\u0d9a\u0dcf\u0dba\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc1\u0ba3\u0bc1\u0b95\u0bcd\u0b95\u0bbe\u0baf\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "61-3":{
-        "code": "61-3",
-        "id": 841,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Puthukudiyiruppu Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dd4\u0dad\u0dd4\u0d9a\u0dd4\u0da9\u0dd2\u0d89\u0dbb\u0dd4\u0db4\u0dca\u0db4\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bc1\u0b95\u0bcd\u0b95\u0bc1\u0b9f\u0bbf\u0baf\u0bbf\u0bb0\u0bc1\u0baa\u0bcd\u0baa\u0bc1\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "61-4":{
-        "code": "61-4",
-        "id": 842,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Maritimepattu Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd4\u0dc4\u0dd4\u0daf\u0dd4\u0db6\u0da9\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb0\u0bc8\u0ba4\u0bcd\u0ba4\u0bc1\u0bb0\u0bc8\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-1":{
-        "code": "62-1",
-        "id": 843,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Batticaloa Municipal Council",
-        "sn_name": "\u0db8\u0da9\u0d9a\u0dbd\u0db4\u0dd4\u0dc0 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0b9f\u0bcd\u0b9f\u0b95\u0bcd\u0b95\u0bb3\u0baa\u0bcd\u0baa\u0bc1 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-2":{
-        "code": "62-2",
-        "id": 844,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Eravur Urban Council",
-        "sn_name": "\u0d91\u0dbb\u0dcf\u0dc0\u0dd6\u0dbb\u0dca \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8f\u0bb1\u0bbe\u0bb5\u0bc2+\u0bb0\u0bcd \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-3":{
-        "code": "62-3",
-        "id": 845,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kattankudy Division Urban Council",
-        "sn_name": "\u0d9a\u0dcf\u0dad\u0dca\u0dad\u0db1\u0dca\u0d9a\u0dd4\u0da9\u0dd2 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0ba4\u0bcd\u0ba4\u0bbe\u0ba9\u0bcd\u0b95\u0bc1\u0b9f\u0bbf \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-4":{
-        "code": "62-4",
-        "id": 846,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Eravur Pattu Pradeshiya Sabha",
-        "sn_name": "\u0d91\u0dbb\u0dcf\u0dc0\u0dd4\u0dbb\u0dca\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8f\u0bb1\u0bbe\u0bb5\u0bc2+\u0bb0\u0bcd\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-5":{
-        "code": "62-5",
-        "id": 847,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Koralaipattu Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddd\u0dbb\u0dc5\u0dda\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bcb\u0bb0\u0bb3\u0bc8\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-6":{
-        "code": "62-6",
-        "id": 848,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Koralai Pattu West Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddd\u0dbb\u0dc5\u0dda\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db6\u0da7\u0dc4\u0dd2\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bcb\u0bb0\u0bb3\u0bc8\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-7":{
-        "code": "62-7",
-        "id": 849,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Koralaipattu North Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddd\u0dbb\u0dc5\u0dda\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0d8b\u0dad\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bcb\u0bb0\u0bb3\u0bc8\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0bb5\u0b9f\u0b95\u0bcd\u0b95\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-8":{
-        "code": "62-8",
-        "id": 850,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Manmunai South and Eruvil Pattu Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0db1\u0dca\u0db8\u0dd4\u0db1\u0dda \u0daf\u0d9a\u0dd4\u0dab \u0dc3\u0dc4 \u0d91\u0dbb\u0dd4\u0dc0\u0dd2\u0dbd\u0dca\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba3\u0bcd\u0bae\u0bc1\u0ba3\u0bc8 \u0ba4\u0bc6\u0bb1\u0bcd\u0b95\u0bc1 \u0bae\u0bb1\u0bcd\u0bb1\u0bc1\u0bae\u0bcd \u0b8e\u0bb0\u0bc1\u0bb5\u0bbf\u0bb2\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-9":{
-        "code": "62-9",
-        "id": 851,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Manmunai Pattu Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0db1\u0dca\u0db8\u0dd4\u0db1\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba3\u0bcd\u0bae\u0bc1\u0ba3\u0bc8\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-10":{
-        "code": "62-10",
-        "id": 852,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Manmunai West (Vavunatheev) Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0db1\u0dca\u0db8\u0dd4\u0db1\u0dda \u0db6\u0da7\u0dc4\u0dd2\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba3\u0bcd\u0bae\u0bc1\u0ba3\u0bc8\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-11":{
-        "code": "62-11",
-        "id": 853,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Manmunai South West Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0db1\u0dca\u0db8\u0dd4\u0db1\u0dda \u0db1\u0dd2\u0dbb\u0dd2\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba3\u0bcd\u0bae\u0bc1\u0ba3\u0bc8\u0ba4\u0bc6\u0ba9\u0bcd\u0bae\u0bc7\u0bb1\u0bcd\u0b95\u0bc1\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "62-12":{
-        "code": "62-12",
-        "id": 854,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Porativpattu Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0ddd\u0dbb\u0dad\u0dd2\u0dc0\u0dd4\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bcb\u0bb0\u0ba4\u0bc0\u0bb5\u0bc2\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1\u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-1":{
-        "code": "63-1",
-        "id": 855,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kalmunai Municipal Council",
-        "sn_name": "\u0d9a\u0dbd\u0dca\u0db8\u0dd4\u0dab\u0dda \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0bae\u0bc1\u0ba9\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-2":{
-        "code": "63-2",
-        "id": 856,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Akkaripattu Municipal Council",
-        "sn_name": "\u0d85\u0d9a\u0dca\u0d9a\u0dbb\u0dd9\u0dba\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db8. \u0db1. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bcd\u0b95\u0bb0\u0bc8\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-3":{
-        "code": "63-3",
-        "id": 857,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ampara Urban Council",
-        "sn_name": "\u0d85\u0db8\u0dca\u0db4\u0dcf\u0dbb \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bae\u0bcd\u0baa\u0bbe\u0bb1\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-4":{
-        "code": "63-4",
-        "id": 858,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dehiaththakandiya Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd9\u0dc4\u0dd2\u0d85\u0dad\u0dca\u0dad\u0d9a\u0dab\u0dca\u0da9\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb9\u0bbf\u0baf\u0ba4\u0bcd\u0ba4\u0b95\u0ba3\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-5":{
-        "code": "63-5",
-        "id": 859,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Damana Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0db8\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bae\u0ba3 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-6":{
-        "code": "63-6",
-        "id": 860,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Uhana Pradeshiya Sabha",
-        "sn_name": "\u0d8b\u0dc4\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b89\u0bb9\u0ba3 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-7":{
-        "code": "63-7",
-        "id": 861,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mahaoya Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dc4\u0d94\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bb9\u0bbe- \u0b93\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-8":{
-        "code": "63-8",
-        "id": 862,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Namaloya Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dcf\u0db8\u0dbd\u0dca \u0d94\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0bae\u0bb2\u0bcd- \u0b93\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-9":{
-        "code": "63-9",
-        "id": 863,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Padiyathalawa Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0daf\u0dd2\u0dba\u0dad\u0dbd\u0dcf\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bbf\u0baf\u0ba4\u0bcd\u0ba4\u0bb2\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-10":{
-        "code": "63-10",
-        "id": 864,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Navithanveli Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dc0\u0dd2\u0dad\u0dcf\u0db1\u0dca\u0dc0\u0dda\u0dbd\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0bb5\u0bbf\u0ba4\u0ba9\u0bcd\u0bb5\u0bc6\u0bb3\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-11":{
-        "code": "63-11",
-        "id": 865,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Sammanthurai Pradeshiya Sabha",
-        "sn_name": "\u0dc3\u0db8\u0dca\u0db8\u0db1\u0dca\u0dad\u0dd4\u0dbb\u0dd9\u0dba\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bae\u0bcd\u0bae\u0bbe\u0ba8\u0bcd\u0ba4\u0bc1\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-12":{
-        "code": "63-12",
-        "id": 866,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Irakkamam Pradeshiya Sabha",
-        "sn_name": "\u0d89\u0dbb\u0d9a\u0dca\u0d9a\u0dcf\u0db8\u0db8\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb1\u0b95\u0bcd\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-13":{
-        "code": "63-13",
-        "id": 867,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Akkaraipattu Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0d9a\u0dca\u0d9a\u0dbb\u0dd9\u0dba\u0dd2\u0db4\u0dad\u0dca\u0dad\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b95\u0bcd\u0b95\u0bb0\u0bc8\u0baa\u0bcd\u0baa\u0bb1\u0bcd\u0bb1\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-14":{
-        "code": "63-14",
-        "id": 868,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Potuvil Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0ddc\u0dad\u0dd4\u0dc0\u0dd2\u0dbd\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0ba4\u0bcd\u0ba4\u0bc1\u0bb5\u0bbf\u0bb2\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-15":{
-        "code": "63-15",
-        "id": 869,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Addalachchenai Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0da9\u0dca\u0da9\u0dcf\u0dbd\u0da0\u0dca\u0da0\u0dda\u0db1\u0dd9\u0dba\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0b9f\u0bcd\u0b9f\u0bbe\u0bb3\u0bc8\u0b9a\u0bcd\u0b9a\u0bc7\u0ba9\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-16":{
-        "code": "63-16",
-        "id": 870,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Alayadiwembu Pradeshiya Sabha",
-        "sn_name": "\u0d86\u0dbd\u0dba\u0da9\u0dd2\u0dc0\u0dda\u0db8\u0dca\u0db6\u0dd4 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b86\u0bb2\u0bc8\u0baf\u0b9f\u0bbf\u0bb5\u0bc7\u0bae\u0bcd\u0baa\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-17":{
-        "code": "63-17",
-        "id": 871,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Lahugala Pradeshiya Sabha",
-        "sn_name": "\u0dbd\u0dcf\u0dc4\u0dd4\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb2\u0bbe\u0bb9\u0bc1\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-18":{
-        "code": "63-18",
-        "id": 872,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Karaitheevu Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dcf\u0dbb\u0dd9\u0dba\u0dd2\u0dad\u0dd2\u0dc0\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbe\u0bb0\u0bc8\u0ba4\u0bc0\u0bb5\u0bc2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-19":{
-        "code": "63-19",
-        "id": 873,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ninthavur Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd2\u0db1\u0dca\u0daf\u0dc0\u0dd4\u0dbb\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0ba8\u0bcd\u0ba4\u0bb5\u0bc2+\u0bb0\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "63-20":{
-        "code": "63-20",
-        "id": 874,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thirukkovil Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dd2\u0dbb\u0dd4\u0d9a\u0dca\u0d9a\u0ddd\u0dc0\u0dd2\u0dbd\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb0\u0bc1\u0b95\u0bcd\u0b95\u0bcb\u0bb5\u0bbf\u0bb2\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-1":{
-        "code": "64-1",
-        "id": 875,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Trincomalee Urban Council",
-        "sn_name": "\u0dad\u0dca\u200d\u0dbb\u0dd2\u0d9a\u0dd4\u0dab\u0dcf\u0db8\u0dbd\u0dba \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb0\u0bc1\u0b95\u0bcb\u0ba3\u0bae\u0bb2\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-2":{
-        "code": "64-2",
-        "id": 876,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kinniya Urban Council",
-        "sn_name": "\u0d9a\u0dd2\u0db1\u0dca\u0db1\u0dd2\u0dba\u0dcf \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbf\u0ba3\u0bcd\u0ba3\u0bbf\u0baf\u0bbe \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-3":{
-        "code": "64-3",
-        "id": 877,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Verugal Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd9\u0dbb\u0dd4\u0d9c\u0dbd\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb0\u0bc1\u0b95\u0bb2\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-4":{
-        "code": "64-4",
-        "id": 878,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Seruwila Pradeshiya Sabha",
-        "sn_name": "\u0dc3\u0dda\u0dbb\u0dd4\u0dc0\u0dd2\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bc7\u0bb0\u0bc1\u0bb5\u0bbf\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-5":{
-        "code": "64-5",
-        "id": 879,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kanthale Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0db1\u0dca\u0dad\u0dbd\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0ba8\u0bcd\u0ba4\u0bb3\u0bbe\u0baf\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-6":{
-        "code": "64-6",
-        "id": 880,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Morawewa Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0ddc\u0dbb\u0dc0\u0dd0\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bca\u0bb0\u0bb5\u0bc6\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-7":{
-        "code": "64-7",
-        "id": 881,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Gomarankadawala Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0ddd\u0db8\u0dbb\u0db1\u0dca\u0d9a\u0da9\u0dc0\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bcb\u0bae\u0bb0\u0b99\u0bcd\u0b95\u0b9f\u0bb5\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-8":{
-        "code": "64-8",
-        "id": 882,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Padavi Sri Pura Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0daf\u0dc0\u0dd2-\u0dc3\u0dd2\u0dbb\u0dd2\u0db4\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bb5\u0bbf\u0b9a\u0bbf\u0bb1\u0bbf\u0baa\u0bc1\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-9":{
-        "code": "64-9",
-        "id": 883,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Trincomalee Town and Gravets Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dca\u200d\u0dbb\u0dd2\u0d9a\u0dd4\u0dab\u0dcf\u0db8\u0dbd \u0db1\u0d9c\u0dbb\u0dba \u0dc3\u0dc4 \u0d9a\u0da9\u0dc0\u0dad\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb0\u0bc1\u0b95\u0bcb\u0ba3\u0bae\u0bb2\u0bc8\u0b87 \u0ba8\u0b95\u0bb0 \u0b8e\u0bb2\u0bcd\u0bb2\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-10":{
-        "code": "64-10",
-        "id": 884,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kuchchaveli Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd4\u0da0\u0dca\u0da0\u0dc0\u0dda\u0dbd\u0dd2 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0b9a\u0bcd\u0b9a\u0bb5\u0bc6\u0bb3\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-11":{
-        "code": "64-11",
-        "id": 885,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thambalagamuwa Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0db9\u0dbd\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bae\u0bcd\u0baa\u0bb2\u0b95\u0bae\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-12":{
-        "code": "64-12",
-        "id": 886,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Muttur Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd4\u0dad\u0dca\u0dad\u0dd6\u0dbb\u0dca \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc2\u0ba4\u0bc2h; \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "64-13":{
-        "code": "64-13",
-        "id": 887,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kinniya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd2\u0db1\u0dca\u0db1\u0dd2\u0dba\u0dcf \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbf\u0ba3\u0bcd\u0ba3\u0bbf\u0baf\u0bbe \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-1":{
-        "code": "65-1",
-        "id": 888,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kurunegala Municipal Council",
-        "sn_name": "\u0d9a\u0dd4\u0dbb\u0dd4\u0dab\u0dd1\u0d9c\u0dbd \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0bb0\u0bc1\u0ba8\u0bbe\u0b95\u0bb2\u0bcd \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-2":{
-        "code": "65-2",
-        "id": 889,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kuliyapitiya Urban Council",
-        "sn_name": "\u0d9a\u0dd4\u0dbd\u0dd2\u0dba\u0dcf\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0bb3\u0bbf\u0baf\u0bbe\u0baa\u0bcd\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-3":{
-        "code": "65-3",
-        "id": 890,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Giribawa Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0dd2\u0dbb\u0dd2\u0db6\u0dcf\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bbf\u0bb0\u0bbf\u0baa\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-4":{
-        "code": "65-4",
-        "id": 891,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Galgamuwa Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0dbd\u0dca\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0b95\u0bae\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-5":{
-        "code": "65-5",
-        "id": 892,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Polpithigama Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0ddc\u0dbd\u0dca\u0db4\u0dd2\u0dad\u0dd2\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0bb2\u0bcd\u0baa\u0bbf\u0ba4\u0bcd\u0ba4\u0bbf\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-6":{
-        "code": "65-6",
-        "id": 893,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nikaweratiya Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd2\u0d9a\u0dc0\u0dd0\u0dbb\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0b95\u0bcd\u0b95\u0bb5\u0bc6\u0bb0\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-7":{
-        "code": "65-7",
-        "id": 894,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kobeigane Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddc\u0db6\u0dd9\u0dba\u0dd2\u0d9c\u0db1\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0baa\u0bcd\u0baa\u0bc7\u0b95\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-8":{
-        "code": "65-8",
-        "id": 895,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mahawa Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dc4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bb9\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-9":{
-        "code": "65-9",
-        "id": 896,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ibbagamuwa Pradeshiya Sabha",
-        "sn_name": "\u0d89\u0db6\u0dca\u0db6\u0dcf\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0baa\u0bcd\u0baa\u0bbe\u0b95\u0bae\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-10":{
-        "code": "65-10",
-        "id": 897,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wariyapola Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dcf\u0dbb\u0dd2\u0dba\u0db4\u0ddc\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bbe\u0bb0\u0bbf\u0baf\u0baa\u0bca\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-11":{
-        "code": "65-11",
-        "id": 898,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Panduwasnuwara Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dac\u0dd4\u0dc0\u0dc3\u0dca\u0db1\u0dd4\u0dc0\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba3\u0bcd\u0b9f\u0bc1\u0bb5\u0bb8\u0bcd\u0ba8\u0bc1\u0bb5\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-12":{
-        "code": "65-12",
-        "id": 899,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bingiriya Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd2\u0d82\u0d9c\u0dd2\u0dbb\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbf\u0b99\u0bcd\u0b95\u0bbf\u0bb0\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-13":{
-        "code": "65-13",
-        "id": 900,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Udubaddawa Pradeshiya Sabha",
-        "sn_name": "\u0d8b\u0da9\u0dd4\u0db6\u0daf\u0dca\u0daf\u0dcf\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b89\u0b9f\u0bc1\u0baa\u0ba4\u0bcd\u0ba4\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-14":{
-        "code": "65-14",
-        "id": 901,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pannala Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0db1\u0dca\u0db1\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba9\u0bcd\u0ba9\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-15":{
-        "code": "65-15",
-        "id": 902,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kuliyapitiya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd4\u0dbd\u0dd2\u0dba\u0dcf\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0bb3\u0bbf\u0baf\u0bbe\u0baa\u0bcd\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-16":{
-        "code": "65-16",
-        "id": 903,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Alawwa Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0dbd\u0dc0\u0dca\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb3\u0bb5\u0bcd\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-17":{
-        "code": "65-17",
-        "id": 904,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Narammala Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dcf\u0dbb\u0db8\u0dca\u0db8\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0bb0\u0bae\u0bcd\u0bae\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-18":{
-        "code": "65-18",
-        "id": 905,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Polgahawela Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0ddc\u0dbd\u0dca\u0d9c\u0dc4\u0dc0\u0dd9\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0bb2\u0bcd\u0b95\u0bb9\u0bb5\u0bc6\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-19":{
-        "code": "65-19",
-        "id": 906,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kurunegala Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd4\u0dbb\u0dd4\u0dab\u0dd1\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0bb0\u0bc1\u0ba8\u0bbe\u0b95\u0bb2\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-20":{
-        "code": "65-20",
-        "id": 907,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mawathagama Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0dc0\u0dad\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0bb5\u0ba4\u0bcd\u0ba4\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "65-21":{
-        "code": "65-21",
-        "id": 908,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rideegama Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0dd2\u0daf\u0dd3\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb0\u0bbf\u0ba4\u0bc0\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-1":{
-        "code": "66-1",
-        "id": 909,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Puttalam Urban Council",
-        "sn_name": "\u0db4\u0dd4\u0dad\u0dca\u0dad\u0dbd\u0db8 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bb3\u0bae\u0bcd \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-2":{
-        "code": "66-2",
-        "id": 910,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Chilaw Urban Council",
-        "sn_name": "\u0dc4\u0dbd\u0dcf\u0dc0\u0dad \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bbf\u0bb2\u0bbe\u0baa\u0bae\u0bcd \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-3":{
-        "code": "66-3",
-        "id": 911,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kalpitiya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dbd\u0dca\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-4":{
-        "code": "66-4",
-        "id": 912,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Puttalam Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dd4\u0dad\u0dca\u0dad\u0dbd\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bb3\u0bae\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-5":{
-        "code": "66-5",
-        "id": 913,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wanathawilluwa Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0db1\u0dcf\u0dad\u0dc0\u0dd2\u0dbd\u0dca\u0dbd\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0ba9\u0bbe\u0ba4\u0bcd\u0ba4\u0bb5\u0bbf\u0bb2\u0bcd\u0bb2\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-6":{
-        "code": "66-6",
-        "id": 914,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Karuwalagaswewa Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dbb\u0dd4\u0dc0\u0dbd\u0d9c\u0dc3\u0dca\u0dc0\u0dd0\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb0\u0bc1\u0bb5\u0bc6\u0bb2\u0b95\u0bb8\u0bcd\u0bb5\u0bc6\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-7":{
-        "code": "66-7",
-        "id": 915,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nawagattegama Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dc0\u0d9c\u0dad\u0dca\u0dad\u0dda\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bb5\u0b95\u0ba4\u0bcd\u0ba4\u0bc7\u0b95\u0bae\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-8":{
-        "code": "66-8",
-        "id": 916,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Anamaduwa Pradeshiya Sabha",
-        "sn_name": "\u0d86\u0dab\u0db8\u0da9\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b86\u0ba9\u0bae\u0b9f\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-9":{
-        "code": "66-9",
-        "id": 917,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Arachchikattuwa Pradeshiya Sabha",
-        "sn_name": "\u0d86\u0dbb\u0da0\u0dca\u0da0\u0dd2\u0d9a\u0da7\u0dca\u0da7\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b86\u0bb0\u0b9a\u0bcd\u0b9a\u0bbf\u0b95\u0bcd\u0b95\u0b9f\u0bcd\u0b9f\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-10":{
-        "code": "66-10",
-        "id": 918,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Chilaw Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0dbd\u0dcf\u0dc0\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bbf\u0bb2\u0bbe\u0baa\u0bae\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-11":{
-        "code": "66-11",
-        "id": 919,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nattandiya Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dcf\u0dad\u0dca\u0dad\u0dab\u0dca\u0da9\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbe\u0ba4\u0bcd\u0ba4\u0bbe\u0ba3\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "66-12":{
-        "code": "66-12",
-        "id": 920,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wennappuwa Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd9\u0db1\u0dca\u0db1\u0db4\u0dca\u0db4\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0ba9\u0bcd\u0ba9\u0baa\u0bcd\u0baa\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-1":{
-        "code": "67-1",
-        "id": 921,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Anuradhapura Municipal Council",
-        "sn_name": "\u0d85\u0db1\u0dd4\u0dbb\u0dcf\u0db0\u0db4\u0dd4\u0dbb \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0ba8\u0bc1\u0bb0\u0bbe\u0ba4\u0baa\u0bc1\u0bb0\u0bae\u0bcd \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-2":{
-        "code": "67-2",
-        "id": 922,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Medawachchiya Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd0\u0daf\u0dc0\u0da0\u0dca\u0da0\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0ba4\u0bb5\u0bbe\u0b9a\u0bcd\u0b9a\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-3":{
-        "code": "67-3",
-        "id": 923,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rambewa Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0db9\u0dd1\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb0\u0bae\u0bcd\u0baa\u0bbe\u0bb5\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-4":{
-        "code": "67-4",
-        "id": 924,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kebithigollewa Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd0\u0db6\u0dd2\u0dad\u0dd2\u0d9c\u0ddc\u0dbd\u0dca\u0dbd\u0dd1\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc6\u0baa\u0bcd\u0baa\u0bc6\u0b9f\u0bcd\u0b9f\u0bbf\u0b95\u0bca\u0bb2\u0bcd\u0bb2\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-5":{
-        "code": "67-5",
-        "id": 925,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Padaviya Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0daf\u0dc0\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bb5\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-6":{
-        "code": "67-6",
-        "id": 926,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kahatagasdigiliya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dc4\u0da7\u0d9c\u0dc3\u0dca\u0daf\u0dd2\u0d9c\u0dd2\u0dbd\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb9\u0b9f\u0bcd\u0b9f\u0b95\u0bb8\u0bcd\u0ba4\u0bbf\u0b95\u0bbf\u0bb2\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-7":{
-        "code": "67-7",
-        "id": 927,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Horowpothana Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0ddc\u0dbb\u0ddc\u0dc0\u0dca\u0db4\u0ddc\u0dad\u0dcf\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bca\u0bb0\u0bb5\u0baa\u0bca\u0ba4\u0bcd\u0ba4\u0bbe\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-8":{
-        "code": "67-8",
-        "id": 928,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Galenbindunuweva Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0dbd\u0dd9\u0db1\u0dca\u0db6\u0dd2\u0db3\u0dd4\u0db1\u0dd4\u0dc0\u0dd0\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf. \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bc6\u0ba9\u0bcd\u0baa\u0bbf\u0ba8\u0bcd\u0ba4\u0bc1\u0ba9\u0bc1\u0bb5\u0bc6\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-9":{
-        "code": "67-9",
-        "id": 929,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thalawa Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dbd\u0dcf\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bb2\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-10":{
-        "code": "67-10",
-        "id": 930,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nuwaragampalatha East Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd0\u0d9c\u0dd9\u0db1\u0dc4\u0dd2\u0dbb \u0db1\u0dd4\u0dc0\u0dbb\u0d9c\u0db8\u0dca \u0db4\u0dc5\u0dcf\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc1\u0bb5\u0bb0\u0b95\u0bae\u0bcd\u0baa\u0bb2\u0bbe\u0ba4\u0bcd\u0ba4 \u0b95\u0bbf\u0bb4\u0b95\u0bcd\u0b95\u0bc1 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-11":{
-        "code": "67-11",
-        "id": 931,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nuwaragampalatha Central Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0db0\u0dca\u200d\u0dba\u0db8 \u0db1\u0dd4\u0dc0\u0dbb\u0d9c\u0db8\u0dca \u0db4\u0dc5\u0dcf\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bc1\u0bb5\u0bb0\u0b95\u0bae\u0bcd\u0baa\u0bb2\u0bbe\u0ba4\u0bcd\u0ba4 \u0bae\u0ba4\u0bcd\u0ba4\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-12":{
-        "code": "67-12",
-        "id": 932,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Nochchiyagama Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0ddc\u0da0\u0dca\u0da0\u0dd2\u0dba\u0dcf\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bca\u0b9a\u0bcd\u0b9a\u0bbf\u0baf\u0bbe\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-13":{
-        "code": "67-13",
-        "id": 933,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rajanganaya Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0dcf\u0da2\u0dcf\u0d82\u0d9c\u0db1\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb0\u0bbe\u0b9c\u0bbe\u0b99\u0bcd\u0b95\u0ba9\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-14":{
-        "code": "67-14",
-        "id": 934,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Galnewa Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0dbd\u0dca\u0db1\u0dd1\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0ba9\u0bc7\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-15":{
-        "code": "67-15",
-        "id": 935,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ipalogama Pradeshiya Sabha",
-        "sn_name": "\u0d89\u0db4\u0dbd\u0ddd\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0baa\u0bb2\u0bcb\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-16":{
-        "code": "67-16",
-        "id": 936,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mihintale Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd2\u0dc4\u0dd2\u0db1\u0dca\u0dad\u0dbd\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbf\u0bb9\u0bbf\u0ba8\u0bcd\u0ba4\u0bb2\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-17":{
-        "code": "67-17",
-        "id": 937,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thirappane Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dd2\u0dbb\u0db4\u0dca\u0db4\u0db1\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bb0\u0baa\u0bcd\u0baa\u0ba9\u0bc7 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-18":{
-        "code": "67-18",
-        "id": 938,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kekirawa Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd0\u0d9a\u0dd2\u0dbb\u0dcf\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc6\u0b95\u0bcd\u0b95\u0bbf\u0bb0\u0bbe\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "67-19":{
-        "code": "67-19",
-        "id": 939,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Palagala Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dbd\u0dcf\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb2\u0bbe\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-1":{
-        "code": "68-1",
-        "id": 940,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Polonnaruwa Municipal Council",
-        "sn_name": "\u0db4\u0ddc\u0dc5\u0ddc\u0db1\u0dca\u0db1\u0dbb\u0dd4\u0dc0 \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bca\u0bb2\u0ba9\u0bcd\u0ba9\u0bb1\u0bc1\u0bb5\u0bc8\u0bae\u0bbe \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-2":{
-        "code": "68-2",
-        "id": 941,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Elahera Pradeshiya Sabha",
-        "sn_name": "\u0d87\u0dbd\u0dc4\u0dd0\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8e\u0bb2\u0bb9\u0bc6\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-3":{
-        "code": "68-3",
-        "id": 942,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hingurakgoda Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0dd2\u0d9f\u0dd4\u0dbb\u0d9a\u0dca\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bbf\u0b99\u0bcd\u0b95\u0bc1\u0bb0\u0b95\u0bcd\u0b95\u0bca\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-4":{
-        "code": "68-4",
-        "id": 943,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Medirigiriya Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd0\u0daf\u0dd2\u0dbb\u0dd2\u0d9c\u0dd2\u0dbb\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc6\u0ba4\u0bbf\u0bb0\u0bbf\u0b95\u0bbf\u0bb0\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-5":{
-        "code": "68-5",
-        "id": 944,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Lankapura Pradeshiya Sabha",
-        "sn_name": "\u0dbd\u0d82\u0d9a\u0dcf\u0db4\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb2\u0b99\u0bcd\u0b95\u0bbe\u0baa\u0bc1\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-6":{
-        "code": "68-6",
-        "id": 945,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Welikanda Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0d9a\u0db1\u0dca\u0daf \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb2\u0bbf\u0b95\u0ba8\u0bcd\u0ba4 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-7":{
-        "code": "68-7",
-        "id": 946,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dimbulagala Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd2\u0db9\u0dd4\u0dbd\u0dcf\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bbf\u0bae\u0bcd\u0baa\u0bc1\u0bb2\u0bbe\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "68-8":{
-        "code": "68-8",
-        "id": 947,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Polonnaruwa Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0ddc\u0dc5\u0ddc\u0db1\u0dca\u0db1\u0dbb\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bae\u0ba9\u0bcd\u0b95\u0b9f\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-1":{
-        "code": "69-1",
-        "id": 948,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Badulla Municipal Council",
-        "sn_name": "\u0db6\u0daf\u0dd4\u0dbd\u0dca\u0dbd \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bc1\u0bb3\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-2":{
-        "code": "69-2",
-        "id": 949,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bandarawela Municipal Council",
-        "sn_name": "\u0db6\u0dab\u0dca\u0da9\u0dcf\u0dbb\u0dc0\u0dd9\u0dbd \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba3\u0bcd\u0b9f\u0bbe\u0bb0\u0bb5\u0bb3\u0bc8 \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-3":{
-        "code": "69-3",
-        "id": 950,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Haputhale Urban Council",
-        "sn_name": "\u0dc4\u0db4\u0dd4\u0dad\u0dbd\u0dda \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bb3\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-4":{
-        "code": "69-4",
-        "id": 951,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mahiyangana Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dc4\u0dd2\u0dba\u0d82\u0d9c\u0db1\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bb9\u0bbf\u0baf\u0b99\u0bcd\u0b95\u0ba9\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-5":{
-        "code": "69-5",
-        "id": 952,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rideemaliyadda Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0dd2\u0daf\u0dd3\u0db8\u0dcf\u0dbd\u0dd2\u0dba\u0daf\u0dca\u0daf \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb0\u0bbf\u0ba4\u0bc0\u0bae\u0bbe\u0bb2\u0bbf\u0baf\u0ba4\u0bcd\u0ba4\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-6":{
-        "code": "69-6",
-        "id": 953,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Soranathota Pradeshiya Sabha",
-        "sn_name": "\u0dc3\u0ddc\u0dbb\u0dab\u0dcf\u0dad\u0ddc\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bca\u0bb0\u0ba3\u0bbe\u0ba4\u0bca\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-7":{
-        "code": "69-7",
-        "id": 954,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Meegahakivula Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd3\u0d9c\u0dc4\u0d9a\u0dd2\u0dc0\u0dd4\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc0\u0b95\u0bb9\u0b95\u0bbf\u0bb5\u0bc2\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-8":{
-        "code": "69-8",
-        "id": 955,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kandaketiya Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0db1\u0dca\u0daf\u0dd9\u0d9a\u0dd0\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0ba8\u0bcd\u0ba4\u0b95\u0bc6\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-9":{
-        "code": "69-9",
-        "id": 956,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Passara Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dc3\u0dca\u0dc3\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0b9a\u0bb1\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-10":{
-        "code": "69-10",
-        "id": 957,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Lunugala Pradeshiya Sabha",
-        "sn_name": "\u0dbd\u0dd4\u0dab\u0dd4\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb2\u0bc1\u0ba3\u0bc1\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-11":{
-        "code": "69-11",
-        "id": 958,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Badulla Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0daf\u0dd4\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba4\u0bc1\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-12":{
-        "code": "69-12",
-        "id": 959,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Hali Ela Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0dcf\u0dbd\u0dd2 -\u0d87\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0bbe\u0bb2\u0bbf- \u0b8e\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-13":{
-        "code": "69-13",
-        "id": 960,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Uva Paranagama Pradeshiya Sabha",
-        "sn_name": "\u0d8c\u0dc0-\u0db4\u0dbb\u0dab\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8a\u0bb5\u0bbe- \u0baa\u0bb0\u0ba3\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-14":{
-        "code": "69-14",
-        "id": 961,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Welimada Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0db8\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb2\u0bbf\u0bae\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-15":{
-        "code": "69-15",
-        "id": 962,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bandarawela Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dab\u0dca\u0da9\u0dcf\u0dbb\u0dc0\u0dd9\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0ba3\u0bcd\u0b9f\u0bbe\u0bb0\u0bb5\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-16":{
-        "code": "69-16",
-        "id": 963,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ella Pradeshiya Sabha",
-        "sn_name": "\u0d87\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8e\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-17":{
-        "code": "69-17",
-        "id": 964,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Haputale Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0db4\u0dd4\u0dad\u0dbd\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb9\u0baa\u0bcd\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bb3\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "69-18":{
-        "code": "69-18",
-        "id": 965,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Haldummulla Pradeshiya Sabha",
-        "sn_name": "\u0dc4\u0dbd\u0dca\u0daf\u0dd4\u0db8\u0dca\u0db8\u0dd4\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bcd\u0ba4\u0bc1\u0bae\u0bcd\u0bae\u0bc1\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-1":{
-        "code": "70-1",
-        "id": 966,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bibila Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd2\u0db6\u0dd2\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bbf\u0baa\u0bbf\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-2":{
-        "code": "70-2",
-        "id": 967,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Medagama Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dd0\u0daf\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bc6\u0ba4\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-3":{
-        "code": "70-3",
-        "id": 968,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Madulla Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0da9\u0dd4\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0b9f\u0bc1\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-4":{
-        "code": "70-4",
-        "id": 969,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Siyambalanduwa Pradeshiya Sabha",
-        "sn_name": "\u0dc3\u0dd2\u0dba\u0db9\u0dbd\u0dcf\u0dab\u0dca\u0da9\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b9a\u0bbf\u0baf\u0bae\u0bcd\u0baa\u0bb2\u0bbe\u0ba3\u0bcd\u0b9f\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-5":{
-        "code": "70-5",
-        "id": 970,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Moneragala Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0ddc\u0dab\u0dbb\u0dcf\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bca\u0ba9\u0bb0\u0bbe\u0b95\u0bb2\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-6":{
-        "code": "70-6",
-        "id": 971,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Badalkumbura Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0da9\u0dbd\u0dca\u0d9a\u0dd4\u0db9\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0b9f\u0bb2\u0bcd\u0b95\u0bc1\u0bae\u0bcd\u0baa\u0bc1\u0bb0 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-7":{
-        "code": "70-7",
-        "id": 972,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Buttala Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd4\u0dad\u0dca\u0dad\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc1\u0ba4\u0bcd\u0ba4\u0bb3 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-8":{
-        "code": "70-8",
-        "id": 973,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Katharagama Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dad\u0dbb\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0ba4\u0bbf\u0bb0\u0bcd\u0b95\u0bbe\u0bae\u0bae\u0bcd \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-9":{
-        "code": "70-9",
-        "id": 974,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Wellawaya Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dca\u0dbd\u0dc0\u0dcf\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb3\u0bcd\u0bb3\u0bb5\u0bbe\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "70-10":{
-        "code": "70-10",
-        "id": 975,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Thanamalwila Pradeshiya Sabha",
-        "sn_name": "\u0dad\u0dab\u0db8\u0dbd\u0dca\u0dc0\u0dd2\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0ba9\u0bae\u0bb2\u0bcd\u0bb5\u0bbf\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-1":{
-        "code": "71-1",
-        "id": 976,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ratnapura Municipal Council",
-        "sn_name": "\u0dbb\u0dad\u0dca\u0db1\u0db4\u0dd4\u0dbb \u0db8\u0dc4 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb0\u0ba4\u0bcd\u0ba4\u0bbf\u0ba9\u0baa\u0bc1\u0bb0\u0bbf \u0bae\u0bbe\u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-2":{
-        "code": "71-2",
-        "id": 977,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Balangoda Urban Council",
-        "sn_name": "\u0db6\u0dbd\u0d82\u0d9c\u0ddc\u0da9 \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb2\u0bbe\u0b99\u0bcd\u0b95\u0bca\u0b9f\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-3":{
-        "code": "71-3",
-        "id": 978,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Embilipitiya Urban Council",
-        "sn_name": "\u0d87\u0db9\u0dd2\u0dbd\u0dd2\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8e\u0bae\u0bcd\u0baa\u0bbf\u0bb2\u0bbf\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-4":{
-        "code": "71-4",
-        "id": 979,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Eheliyagoda Pradeshiya Sabha",
-        "sn_name": "\u0d87\u0dc4\u0dd0\u0dbd\u0dd2\u0dba\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8e\u0bb9\u0bb2\u0bbf\u0baf\u0b95\u0bca\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-5":{
-        "code": "71-5",
-        "id": 980,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ratnapura Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0dad\u0dca\u0db1\u0db4\u0dd4\u0dbb \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bb0\u0ba4\u0bcd\u0ba4\u0bbf\u0ba9\u0baa\u0bc1\u0bb0\u0bbf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-6":{
-        "code": "71-6",
-        "id": 981,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kuruwita Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd4\u0dbb\u0dd4\u0dc0\u0dd2\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc1\u0bb0\u0bc1\u0bb5\u0bbf\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-7":{
-        "code": "71-7",
-        "id": 982,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Pelmadulla Pradeshiya Sabha",
-        "sn_name": "\u0db4\u0dd0\u0dbd\u0dca\u0db8\u0da9\u0dd4\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc6\u0bb2\u0bcd\u0bae\u0b9f\u0bc1\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-8":{
-        "code": "71-8",
-        "id": 983,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Balangoda Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dbd\u0d82\u0d9c\u0ddc\u0da9 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bb2\u0bbe\u0b99\u0bcd\u0b95\u0bca\u0b9f\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-9":{
-        "code": "71-9",
-        "id": 984,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Imbulpe Pradeshiya Sabha",
-        "sn_name": "\u0d89\u0db9\u0dd4\u0dbd\u0dca\u0db4\u0dda \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b87\u0bae\u0bcd\u0baa\u0bc1\u0bb2\u0bcd\u0baa\u0bc7 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-10":{
-        "code": "71-10",
-        "id": 985,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Godakawela Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0ddc\u0da9\u0d9a\u0dc0\u0dd9\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0b9f\u0b95\u0bcd\u0b95\u0bb5\u0bc6\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-11":{
-        "code": "71-11",
-        "id": 986,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kahawatta Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dc4\u0dc0\u0dad\u0dca\u0dad \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb9\u0bb5\u0ba4\u0bcd\u0ba4 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-12":{
-        "code": "71-12",
-        "id": 987,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Weligepola Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dd0\u0dbd\u0dd2\u0d9c\u0dd9\u0db4\u0ddc\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bc6\u0bb2\u0bbf\u0b95\u0bc7\u0baa\u0bca\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-13":{
-        "code": "71-13",
-        "id": 988,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Niwitigala Pradeshiya Sabha",
-        "sn_name": "\u0db1\u0dd2\u0dc0\u0dd2\u0dad\u0dd2\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba8\u0bbf\u0bb5\u0bbf\u0ba4\u0bbf\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-14":{
-        "code": "71-14",
-        "id": 989,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ayagama Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0dba\u0d9c\u0db8 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0baf\u0b95\u0bae \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-15":{
-        "code": "71-15",
-        "id": 990,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kalawana Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dbd\u0dc0\u0dcf\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bb5\u0bbe\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-16":{
-        "code": "71-16",
-        "id": 991,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Embilipitiya Pradeshiya Sabha",
-        "sn_name": "\u0d87\u0db9\u0dd2\u0dbd\u0dd2\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b8e\u0bae\u0bcd\u0baa\u0bbf\u0bb2\u0bbf\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "71-17":{
-        "code": "71-17",
-        "id": 992,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kolonna Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0ddc\u0dbd\u0ddc\u0db1\u0dca\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bca\u0bb2\u0bca\u0ba9\u0bcd\u0ba9 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-1":{
-        "code": "72-1",
-        "id": 993,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kegalle Urban Council",
-        "sn_name": "\u0d9a\u0dd1\u0d9c\u0dbd\u0dca\u0dbd \u0db1\u0d9c\u0dbb \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc7\u0b95\u0bbe\u0bb2\u0bc8 \u0ba8\u0b95\u0bb0 \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-2":{
-        "code": "72-2",
-        "id": 994,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Warakapola Pradeshiya Sabha",
-        "sn_name": "\u0dc0\u0dbb\u0d9a\u0dcf\u0db4\u0ddc\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb5\u0bb1\u0b95\u0bcd\u0b95\u0bbe\u0baa\u0bca\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-3":{
-        "code": "72-3",
-        "id": 995,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Galigamuwa Pradeshiya Sabha",
-        "sn_name": "\u0d9c\u0dbd\u0dd2\u0d9c\u0db8\u0dd4\u0dc0 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bb2\u0bbf\u0b95\u0bae\u0bc1\u0bb5 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-4":{
-        "code": "72-4",
-        "id": 996,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Kegalle Pradeshiya Sabha",
-        "sn_name": "\u0d9a\u0dd1\u0d9c\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b95\u0bc7\u0b95\u0bbe\u0bb2\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-5":{
-        "code": "72-5",
-        "id": 997,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Rambukkana Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0db9\u0dd4\u0d9a\u0dca\u0d9a\u0db1 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb1\u0bae\u0bcd\u0baa\u0bc1\u0b95\u0bcd\u0b95\u0ba9\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-6":{
-        "code": "72-6",
-        "id": 998,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Mawanella Pradeshiya Sabha",
-        "sn_name": "\u0db8\u0dcf\u0dc0\u0db1\u0dd0\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bae\u0bbe\u0bb5\u0ba9\u0bc6\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-7":{
-        "code": "72-7",
-        "id": 999,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Aranayaka Pradeshiya Sabha",
-        "sn_name": "\u0d85\u0dbb\u0dab\u0dcf\u0dba\u0d9a \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0b85\u0bb0\u0ba9\u0bbe\u0baf\u0b95\u0bcd\u0b95 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-8":{
-        "code": "72-8",
-        "id": 1000,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Yatiyantotoa Pradeshiya Sabha",
-        "sn_name": "\u0dba\u0da7\u0dd2\u0dba\u0db1\u0dca\u0dad\u0ddc\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf\u0bbe\u0ba8\u0bcd\u0ba4\u0bcb\u0b9f\u0bcd\u0b9f\u0bc8 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-9":{
-        "code": "72-9",
-        "id": 1001,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Bulatkohupitiya Pradeshiya Sabha",
-        "sn_name": "\u0db6\u0dd4\u0dbd\u0dad\u0dca\u0d9a\u0ddc\u0dc4\u0dd4\u0db4\u0dd2\u0da7\u0dd2\u0dba \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0baa\u0bc1\u0bb3\u0ba4\u0bcd\u0b95\u0bca\u0bb9\u0bc2\u0baa\u0bbf\u0b9f\u0bcd\u0b9f\u0bbf\u0baf \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-10":{
-        "code": "72-10",
-        "id": 1002,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Ruwanwella Pradeshiya Sabha",
-        "sn_name": "\u0dbb\u0dd4\u0dc0\u0db1\u0dca\u0dc0\u0dd0\u0dbd\u0dca\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0bb0\u0bc1\u0bb5\u0ba9\u0bcd\u0bb5\u0bc6\u0bb2\u0bcd\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-11":{
-        "code": "72-11",
-        "id": 1003,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Deraniyagala Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd0\u0dbb\u0dab\u0dd2\u0dba\u0d9c\u0dbd \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb0\u0ba3\u0bbf\u0baf\u0b95\u0bb2 \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "72-12":{
-        "code": "72-12",
-        "id": 1004,
-        "institute_type": "LOC",
-        "mother_org": 0,
-        "name": "Dehiowita Pradeshiya Sabha",
-        "sn_name": "\u0daf\u0dd9\u0dc4\u0dd2\u0d95\u0dc0\u0dd2\u0da7 \u0db4\u0dca\u200d\u0dbb\u0dcf\u0daf\u0dda\u0dc1\u0dd3\u0dba \u0dc3\u0db7\u0dcf\u0dc0",
-        "tm_name": "\u0ba4\u0bc6\u0bb9\u0bbf\u0baf\u0bcb\u0bb5\u0bbf\u0b9f\u0bcd\u0b9f \u0baa\u0bbf\u0bb0\u0ba4\u0bc7\u0b9a \u0b9a\u0baa\u0bc8",
-        "status": "true"
-    },
-    "OTHER":{
-        "code": "OTHER",
-        "id": 1005,
-        "institute_type": "OTHER",
-        "mother_org": 0,
-        "name": "OTHER",
-        "sn_name": "වෙනත්",
-        "tm_name": "மற்றவை",
-        "status": "true"
-    }
-}
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Institutions incidents are referred to (ministries, departments, local
+authorities...), read from data/institutions.json on first use and kept
+for the life of the process. The data only changes with a deploy.
+
+Institutions are looked up by code, along the `mother_org` tree (it holds
+the id of the parent, 0 for the top level) and by name prefix in english,
+sinhala and tamil.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import threading
+from collections import namedtuple, defaultdict
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "institutions.json")
+
+LANGUAGE_FIELDS = {
+    "english": "name",
+    "sinhala": "sn_name",
+    "tamil": "tm_name",
+}
+
+Institution = namedtuple("Institution", "id code institute_type mother_org name sn_name tm_name status")
+
+_lock = threading.Lock()
+_index = None
+
+
+def normalize_name(name: str) -> str:
+    # zero width joiners are part of the sinhala spelling, but not always typed
+    return " ".join(name.replace("\u200d", "").casefold().split())
+
+
+class InstitutionIndex:
+
+    def __init__(self, rows, version):
+        self.version = version
+        self.institutions = tuple(sorted((Institution(*row) for row in rows), key=lambda institution: institution.id))
+        self.by_code = {institution.code: institution for institution in self.institutions}
+        self.by_id = {institution.id: institution for institution in self.institutions}
+
+        children = defaultdict(list)
+        for institution in self.institutions:
+            children[institution.mother_org].append(institution)
+        self.children = {parent: tuple(items) for parent, items in children.items()}
+
+        # language -> sorted (normalized name, id), searched by bisection
+        self.names = {
+            language: sorted((normalize_name(getattr(institution, field) or ""), institution.id)
+                             for institution in self.institutions)
+            for language, field in LANGUAGE_FIELDS.items()
+        }
+
+    def find(self, prefix: str, language="english", limit=None) -> list:
+        names = self.names[language]
+        prefix = normalize_name(prefix)
+        found = []
+        for name, institution_id in names[bisect.bisect_left(names, (prefix,)):]:
+            if not name.startswith(prefix) or (limit is not None and len(found) >= limit):
+                break
+            found.append(self.by_id[institution_id])
+        return found
+
+
+def get_institution_index() -> InstitutionIndex:
+    global _index
+
+    if _index is None:
+        with _lock:
+            if _index is None:
+                with open(DATA_FILE, "rb") as fp:
+                    content = fp.read()
+                data = json.loads(content.decode("utf-8"))
+                fields = data["fields"]
+                rows = ([row[fields.index(field)] for field in Institution._fields] for row in data["rows"])
+                _index = InstitutionIndex(rows, hashlib.sha256(content).hexdigest()[:16])
+    return _index
+
+
+def get_institutions() -> tuple:
+    """ all institutions in id order """
+    return get_institution_index().institutions
+
+def get_institution(code: str):
+    """ the institution of the code, None if there's none """
+    return get_institution_index().by_code.get(code)
+
+def get_parent_institution(institution: Institution):
+    return get_institution_index().by_id.get(institution.mother_org)
+
+def get_child_institutions(institution: Institution = None, recursive=False) -> list:
+    """ the institutions under the given one (the top level ones without),
+        with `recursive` all of its descendants in depth first order
+    """
+    index = get_institution_index()
+    children = list(index.children.get(institution.id if institution is not None else 0, ()))
+    if not recursive:
+        return children
+
+    descendants = []
+    seen = {institution.id} if institution is not None else set()
+    stack = children[::-1]
+    while stack:
+        child = stack.pop()
+        if child.id in seen:
+            continue
+        seen.add(child.id)
+        descendants.append(child)
+        stack.extend(index.children.get(child.id, ())[::-1])
+    return descendants
+
+def find_institutions(prefix: str, language="english", limit=None) -> list:
+    """ institutions whose name in the language starts with the prefix,
+        ignoring case and spacing, in name order
+    """
+    if language not in LANGUAGE_FIELDS:
+        raise ValueError("Unknown language %s" % language)
+    return get_institution_index().find(prefix, language, limit)
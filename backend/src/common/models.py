@@ -1,6 +1,10 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 import enum
 
+from . import caches
+
 class PartyType(enum.Enum):
     REGISTERED_PARTY = "Registered Party"
     NON_REGISTERED_PARTY = "Non Registered Party"
@@ -165,4 +169,22 @@ class PoliticalParty(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ('id',)
\ No newline at end of file
+        ordering = ('id',)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    caches.invalidate_categories()
+
+
+# served from the reference data cache, see caches.py
+REFERENCE_MODELS = (Category, Channel, Province, District, PollingDivision, PollingStation, DSDivision, GNDivision,
+                    Ward, PoliceDivision, PoliceStation, PoliticalParty)
+
+def invalidate_reference_cache(sender, **kwargs):
+    caches.invalidate_reference_data(sender)
+
+for reference_model in REFERENCE_MODELS:
+    post_save.connect(invalidate_reference_cache, sender=reference_model)
+    post_delete.connect(invalidate_reference_cache, sender=reference_model)
@@ -1,3 +1,91 @@
+import gzip
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Category, Province
+from .institutions import get_institution, get_parent_institution, get_child_institutions, find_institutions
+
+
+class InstitutionTest(TestCase):
+
+    def test_lookups(self):
+        army = get_institution("1-2")
+        self.assertEqual(army.name, "Sri Lanka Army")
+        self.assertIsNone(get_institution("unknown"))
+
+        defence = get_parent_institution(army)
+        self.assertEqual(defence.code, "1")
+        self.assertIn(army, get_child_institutions(defence))
+        self.assertIn(defence, get_child_institutions())
+        descendants = get_child_institutions(defence, recursive=True)
+        self.assertTrue(set(get_child_institutions(defence)) <= set(descendants))
+
+    def test_name_prefix_in_every_language(self):
+        army = get_institution("1-2")
+        self.assertIn(army, find_institutions("sri lanka  ar"))
+        self.assertIn(army, find_institutions(army.tm_name[:6], "tamil"))
+        # typed without the zero width joiner
+        self.assertIn(army, find_institutions(army.sn_name.replace("\u200d", "")[:8], "sinhala"))
+        self.assertEqual(find_institutions("sri lanka", limit=2), find_institutions("sri lanka")[:2])
+
+    def test_endpoint_is_cacheable(self):
+        response = self.client.get("/institutions/", {"parent": "1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Sri Lanka Army", [institution["name"] for institution in response.json()["data"]])
+        self.assertIn("max-age", response["Cache-Control"])
+
+        response = self.client.get("/institutions/", {"parent": "1"}, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.client.get("/institutions/", {"parent": "unknown"}).status_code, 404)
+
+
+class ReferenceDataTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        Category.objects.create(code="1", top_category="Violence", sub_category="Assault",
+                                sn_top_category="", sn_sub_category="", tm_top_category="", tm_sub_category="")
+
+    def test_list_is_cached_until_the_table_changes(self):
+        response = self.client.get("/categories/", HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.content))["data"][0]["sub_category"], "Assault")
+        self.assertIn("public", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/categories/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        etag = response["ETag"]
+
+        # TestCase never commits, run the callbacks right away
+        with mock.patch("src.common.caches.transaction.on_commit", side_effect=lambda callback: callback()):
+            response = self.client.post("/categories/", {
+                "code": "2", "top_category": "Violence", "sub_category": "Threat", "sn_top_category": "-",
+                "sn_sub_category": "-", "tm_top_category": "-", "tm_sub_category": "-"})
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get("/categories/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]), 2)
+
+    def test_bootstrap_returns_the_lists_the_user_may_see(self):
+        Province.objects.create(code="WP", name="Western", sn_name="", tm_name="")
+
+        response = self.client.get("/reference-data/")
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("Authorization", response["Vary"])
+        data = response.json()["data"]
+        self.assertEqual(data["categories"][0]["code"], "1")
+        self.assertNotIn("provinces", data)
+        self.assertIn("institutions", data)
 
-# Create your tests here.
+        client = APIClient()
+        client.force_authenticate(user=get_user_model().objects.create(username="user"))
+        response = client.get("/reference-data/")
+        self.assertEqual(response.json()["data"]["provinces"][0]["code"], "WP")
+        self.assertIn("private", response["Cache-Control"])
@@ -1,11 +1,35 @@
 from rest_framework import mixins
 from rest_framework import generics
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from django.db.models import F
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 
 from .models import Category, Channel, Province, District, PoliceStation, PollingStation, DSDivision, GNDivision, Ward, PoliceDivision, PollingDivision, PoliticalParty
+from . import caches
+from .institutions import get_institution_index, get_institution, get_child_institutions, find_institutions, \
+    LANGUAGE_FIELDS
 from .serializers import CategorySerializer, ChannelSerializer, ProvinceSerializer, DistrictSerializer, PoliceStationSerializer, PollingStationSerializer, DSDivisionSerializer, GNDivisionSerializer, WardSerializer, PoliceDivisionSerializer, PollingDivisionSerializer, PoliticalPartySerializer
 
-class CategoryList(generics.ListCreateAPIView):
+def get_reference_list_data(view_class):
+    return view_class.serializer_class(view_class.queryset.all(), many=True).data
+
+
+class CachedReferenceListMixin:
+    """ lists from the reference data cache (see caches.py), writes are
+        handled by the generic view and bump the version of the table
+    """
+
+    def list(self, request, *args, **kwargs):
+        view_class = type(self)
+        model = view_class.queryset.model
+        payload = caches.get_reference_payload(view_class.__name__, caches.get_reference_version(model),
+                                               lambda: get_reference_list_data(view_class))
+        return caches.get_reference_response(request, payload, public=not self.permission_classes)
+
+
+class CategoryList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = []
@@ -15,48 +39,142 @@ class CategoryDetail(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = CategorySerializer
     permission_classes = []
 
-class ChannelList(generics.ListCreateAPIView):
+class ChannelList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = Channel.objects.all().order_by(F('order').asc(nulls_last=True))
     serializer_class = ChannelSerializer
     permission_classes = []
 
-class ProvinceList(generics.ListCreateAPIView):
+class ProvinceList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = Province.objects.all().order_by('name')
     serializer_class = ProvinceSerializer
 
-class DistrictList(generics.ListCreateAPIView):
+class DistrictList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = District.objects.all().order_by('name')
     serializer_class = DistrictSerializer
     permission_classes = []
 
-class PoliceStationList(generics.ListCreateAPIView):
+class PoliceStationList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = PoliceStation.objects.all().order_by('name')
     serializer_class = PoliceStationSerializer
 
-class PollingStationList(generics.ListCreateAPIView):
+class PollingStationList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = PollingStation.objects.all().order_by('name')
     serializer_class = PollingStationSerializer
 
-class DSDivisionList(generics.ListCreateAPIView):
+class DSDivisionList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = DSDivision.objects.all().order_by('name')
     serializer_class = DSDivisionSerializer
 
-class GNDivisionList(generics.ListCreateAPIView):
+class GNDivisionList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = GNDivision.objects.all().order_by('name')
     serializer_class = GNDivisionSerializer
 
-class WardList(generics.ListCreateAPIView):
+class WardList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = Ward.objects.all().order_by('name')
     serializer_class = WardSerializer
 
-class PoliceDivisionList(generics.ListCreateAPIView):
+class PoliceDivisionList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = PoliceDivision.objects.all().order_by('name')
     serializer_class = PoliceDivisionSerializer
 
-class PollingDivisionList(generics.ListCreateAPIView):
+class PollingDivisionList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = PollingDivision.objects.all().order_by('name')
     serializer_class = PollingDivisionSerializer
 
-class PoliticalPartyList(generics.ListCreateAPIView):
+class PoliticalPartyList(CachedReferenceListMixin, generics.ListCreateAPIView):
     queryset = PoliticalParty.objects.all().order_by('name')
-    serializer_class = PoliticalPartySerializer
\ No newline at end of file
+    serializer_class = PoliticalPartySerializer
+
+def get_institution_data():
+    return [institution._asdict() for institution in get_institution_index().institutions]
+
+
+class InstitutionList(APIView):
+    permission_classes = []
+
+    # seconds clients may use search results and subtrees without revalidating them
+    MAX_AGE = 3600
+
+    def get(self, request, format=None):
+        """
+            Institutions in id order, served from the reference data cache. `q` filters by name prefix in `language`
+            (english, sinhala or tamil) and returns them in name order, `parent`
+            (a code) lists the institutions under it, all of its descendants
+            with `recursive=true`
+        """
+        prefix = request.query_params.get("q")
+        parent_code = request.query_params.get("parent")
+        if not prefix and parent_code is None:
+            index = get_institution_index()
+            payload = caches.get_reference_payload("institutions", index.version, get_institution_data)
+            return caches.get_reference_response(request, payload)
+
+        # the results only change with the data file
+        etag = '"institutions-%s"' % get_institution_index().version
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return self.set_validators(not_modified, etag)
+
+        language = request.query_params.get("language", "english")
+        if language not in LANGUAGE_FIELDS:
+            return Response("Invalid language", status=status.HTTP_400_BAD_REQUEST)
+
+        if prefix:
+            institutions = find_institutions(prefix, language)
+        else:
+            parent = get_institution(parent_code)
+            if parent is None:
+                return Response("Institution not found", status=status.HTTP_404_NOT_FOUND)
+            institutions = get_child_institutions(parent, request.query_params.get("recursive") == "true")
+
+        return self.set_validators(Response([institution._asdict() for institution in institutions]), etag)
+
+    def set_validators(self, response, etag):
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=self.MAX_AGE)
+        return response
+
+
+# the reference lists by the name the bootstrap endpoint returns them under
+REFERENCE_LISTS = {
+    "categories": CategoryList,
+    "channels": ChannelList,
+    "provinces": ProvinceList,
+    "districts": DistrictList,
+    "policestations": PoliceStationList,
+    "pollingstations": PollingStationList,
+    "dsdivisions": DSDivisionList,
+    "gndivisions": GNDivisionList,
+    "wards": WardList,
+    "policedivisions": PoliceDivisionList,
+    "pollingdivisions": PollingDivisionList,
+    "politicalparties": PoliticalPartyList,
+}
+
+class ReferenceDataBootstrap(APIView):
+    permission_classes = []
+
+    def get(self, request, format=None):
+        """
+            Every reference list and the institutions in one response, keyed
+            by the name of their endpoint. Anonymous users get the public
+            lists only
+        """
+        authenticated = request.user.is_authenticated
+        lists = {name: view_class for name, view_class in REFERENCE_LISTS.items()
+                 if authenticated or not view_class.permission_classes}
+        index = get_institution_index()
+
+        def get_data():
+            data = {name: get_reference_list_data(view_class) for name, view_class in lists.items()}
+            data["institutions"] = get_institution_data()
+            return data
+
+        version = (index.version,) + tuple(caches.get_reference_version(view_class.queryset.model)
+                                           for view_class in lists.values())
+        payload = caches.get_reference_payload("bootstrap:%s" % ("all" if authenticated else "public"),
+                                               version, get_data)
+        # the body depends on the user, shared caches mustn't hand one to another
+        response = caches.get_reference_response(request, payload, public=False)
+        patch_vary_headers(response, ("Authorization", "Cookie"))
+        return response
@@ -0,0 +1,156 @@
+"""Process local caches for organization / permission data
+
+These tables are tiny and change rarely, yet they are consulted on every
+request. Each process keeps its own copy and rebuilds it when the version
+token kept in the django cache changes. A change made by one worker is only
+picked up by the others when that cache is shared by all of them (redis,
+CACHE_REDIS_URL in settings.py); the default local memory cache is per
+process and only suits a single worker.
+"""
+
+import uuid
+import threading
+
+from django.db import transaction
+from django.core.cache import cache
+from django.contrib.auth.models import Permission
+
+PERMISSIONS_VERSION_KEY = "custom_auth:permissions:version"
+
+_lock = threading.Lock()
+_role_permissions = {}
+_role_permissions_version = None
+
+
+def get_cache_version(key):
+    version = cache.get(key)
+    if version is None:
+        # lost or never set, start a new version so every process rebuilds
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key):
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+def get_role_permissions(role_id) -> frozenset:
+    """ returns the set of permission codenames granted to the given role (group) """
+    global _role_permissions, _role_permissions_version
+
+    version = get_cache_version(PERMISSIONS_VERSION_KEY)
+    if version != _role_permissions_version:
+        with _lock:
+            if version != _role_permissions_version:
+                role_permissions = {}
+                grants = Permission.objects.filter(group__isnull=False).values_list("group__id", "codename")
+                for group_id, codename in grants:
+                    role_permissions.setdefault(group_id, set()).add(codename)
+
+                _role_permissions = {
+                    group_id: frozenset(codenames) for group_id, codenames in role_permissions.items()
+                }
+                _role_permissions_version = version
+
+    return _role_permissions.get(role_id, frozenset())
+
+
+def get_level_permissions(user_level) -> frozenset:
+    """ returns the set of permission codenames of the role of a user level """
+    if user_level is None or user_level.role_id is None:
+        return frozenset()
+
+    return get_role_permissions(user_level.role_id)
+
+
+def invalidate_permissions():
+    global _role_permissions_version
+
+    _role_permissions_version = None
+    # other processes must not rebuild before the change is visible to them
+    transaction.on_commit(lambda: bump_cache_version(PERMISSIONS_VERSION_KEY))
+
+
+HIERARCHY_VERSION_KEY = "custom_auth:hierarchy:version"
+
+_hierarchy = None
+_hierarchy_version = None
+
+
+class OrganizationHierarchy:
+    """ Snapshot of organizations, divisions and user levels with the
+        parent chain of every level resolved. Instances handed out are shared,
+        treat them as read only.
+    """
+
+    def __init__(self, organizations, divisions, levels):
+        self.organizations = { organization.id: organization for organization in organizations }
+        self.divisions = { division.id: division for division in divisions }
+        self.levels = { level.id: level for level in levels }
+
+        self.default_division = None
+        self.hq_divisions = {}
+        for division in self.divisions.values():
+            if division.organization_id in self.organizations:
+                division.organization = self.organizations[division.organization_id]
+            if division.is_default_division:
+                self.default_division = division
+            if division.is_hq:
+                self.hq_divisions.setdefault(division.organization_id, division)
+
+        self.parent_chains = {}
+        for level in self.levels.values():
+            if level.organization_id in self.organizations:
+                level.organization = self.organizations[level.organization_id]
+            self.parent_chains[level.id] = self._resolve_parents(level)
+
+    def _resolve_parents(self, level):
+        parents = []
+        parent = self.levels.get(level.parent_id)
+        while parent is not None and parent not in parents:
+            parents.append(parent)
+            parent = self.levels.get(parent.parent_id)
+        return tuple(parents)
+
+    def get_division(self, division_id):
+        return self.divisions.get(division_id)
+
+    def get_level(self, level_id):
+        return self.levels.get(level_id)
+
+    def get_hq_division(self, organization_id):
+        return self.hq_divisions.get(organization_id)
+
+    def get_parent_levels(self, level):
+        """ parent, grand parent, ... of the given level, nearest first """
+        return self.parent_chains.get(level.id, ())
+
+    def level_has_permission(self, level, codename):
+        return codename in get_level_permissions(level)
+
+
+def get_hierarchy() -> OrganizationHierarchy:
+    global _hierarchy, _hierarchy_version
+
+    version = get_cache_version(HIERARCHY_VERSION_KEY)
+    if version != _hierarchy_version:
+        with _lock:
+            if version != _hierarchy_version:
+                from .models import Organization, Division, UserLevel
+
+                _hierarchy = OrganizationHierarchy(
+                    Organization.objects.all(),
+                    Division.objects.all(),
+                    UserLevel.objects.all()
+                )
+                _hierarchy_version = version
+
+    return _hierarchy
+
+
+def invalidate_hierarchy():
+    global _hierarchy_version
+
+    _hierarchy_version = None
+    transaction.on_commit(lambda: bump_cache_version(HIERARCHY_VERSION_KEY))
@@ -1,9 +1,10 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser, Group
+from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
+from . import caches
 
 class Organization(models.Model):
     code = models.CharField(max_length=10, unique=True)
@@ -65,4 +66,23 @@ def create_user_profile(sender, **kwargs):
 
     profile = Profile()
     profile.user = user
-    profile.save()
\ No newline at end of file
+    profile.save()
+
+# role permission sets are cached per process, see caches.py
+@receiver(m2m_changed, sender=Group.permissions.through)
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+def invalidate_role_permissions(sender, **kwargs):
+    caches.invalidate_permissions()
+
+# organizations, divisions and levels are cached per process, see caches.py
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=Division)
+@receiver(post_delete, sender=Division)
+@receiver(post_save, sender=UserLevel)
+@receiver(post_delete, sender=UserLevel)
+def invalidate_organization_hierarchy(sender, **kwargs):
+    caches.invalidate_hierarchy()
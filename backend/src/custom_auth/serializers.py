@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth.models import Permission, Group
 from django.contrib.auth import get_user_model
 from .models import Organization
+from .caches import get_level_permissions, get_role_permissions
 
 User = get_user_model()
 
@@ -71,16 +72,13 @@ class UserSerializer(serializers.ModelSerializer):
 
     def get_permissions(self, obj):
         if hasattr(obj, "profile"):
-            if obj.profile.level is not None:
-                permissions = Permission.objects.filter(group=obj.profile.level.role)
-                permission_data = map(lambda p: p.codename, permissions)
-                return permission_data
-
-        if obj.groups.count() > 0:
-            group = obj.groups.all()[0]
-            permissions = Permission.objects.filter(group=group)
-            permission_data = map(lambda p: p.codename, permissions)
-            return permission_data
+            if obj.profile.level is not None and obj.profile.level.role_id is not None:
+                return sorted(get_level_permissions(obj.profile.level))
+
+        # same as groups.first(), but served from prefetched groups if present
+        group = min(obj.groups.all(), key=lambda group: group.id, default=None)
+        if group is not None:
+            return sorted(get_role_permissions(group.id))
 
         return []
         # return obj.get_group_permissions()
@@ -1,5 +1,5 @@
 from .exceptions import IdentityException
-from django.contrib.auth.models import Permission
+from .caches import get_level_permissions
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -9,10 +9,7 @@ def user_can(user: User, permission: str):
         if user.username == "admin":
             return True
 
-        permission = Permission.objects.get(codename=permission)
-        user_level = user.profile.level
-        user_permissions = permissions = Permission.objects.filter(group=user_level.role)
-        return permission in user_permissions
+        return permission in get_level_permissions(user.profile.level)
     except:
         raise IdentityException("Unkown permission error")
 
@@ -1,3 +1,34 @@
 from django.test import TestCase
+from django.contrib.auth.models import Group, Permission
 
-# Create your tests here.
+from .models import Organization, UserLevel
+from .caches import get_level_permissions
+from ..incidents.permissions import CAN_CLOSE_INCIDENT, CAN_VERIFY_INCIDENT
+
+
+class LevelPermissionCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        cls.role = Group.objects.create(name="ec-coordinator")
+        cls.role.permissions.add(Permission.objects.get(codename=CAN_VERIFY_INCIDENT))
+        cls.level = UserLevel.objects.create(code="coordinator", displayName="Coordinator",
+                                             organization=organization, role=cls.role)
+
+    def test_cached_lookup_costs_no_queries(self):
+        get_level_permissions(self.level)
+
+        with self.assertNumQueries(0):
+            permissions = get_level_permissions(self.level)
+
+        self.assertEqual(permissions, frozenset([CAN_VERIFY_INCIDENT]))
+
+    def test_role_permission_change_invalidates_cache(self):
+        get_level_permissions(self.level)
+
+        self.role.permissions.add(Permission.objects.get(codename=CAN_CLOSE_INCIDENT))
+        self.assertIn(CAN_CLOSE_INCIDENT, get_level_permissions(self.level))
+
+        self.role.permissions.clear()
+        self.assertEqual(get_level_permissions(self.level), frozenset())
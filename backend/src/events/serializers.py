@@ -179,7 +179,7 @@ class GenericDataRelatedField(serializers.RelatedField):
                 "workflow": {
                     "type":"Send Canned Response",
                     "data": {
-                        "responseId":value.canned_response.id
+                        "responseId":value.canned_response_id
                     }
                 }
             }
@@ -191,9 +191,17 @@ class EventSerializer(serializers.ModelSerializer):
     affectedAttribute = serializers.CharField(source="affected_attribute")
     createdDate = serializers.DateTimeField(source="created_date")
     data = GenericDataRelatedField(source="refered_model", read_only=True)
-    incident = IncidentSerializer()
+    incident = serializers.SerializerMethodField()
     initiator = UserSerializer()
 
+    def get_incident(self, obj):
+        # events of a trail share the incident, pass it serialized once
+        # as context["incident"] instead of serializing it per event
+        if "incident" in self.context:
+            return self.context["incident"]
+
+        return IncidentSerializer(obj.incident).data
+
     class Meta:
         model = Event
         fields = (
@@ -208,3 +216,19 @@ class EventSerializer(serializers.ModelSerializer):
             "data"
         )
 
+
+class EventTrailSerializer(EventSerializer):
+    """ event without the incident, see the event trail endpoint """
+
+    class Meta:
+        model = Event
+        fields = (
+            "id",
+            "action",
+            "linked_event",
+            "description",
+            "initiator",
+            "affectedAttribute",
+            "createdDate",
+            "data"
+        )
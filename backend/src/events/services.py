@@ -1,15 +1,93 @@
 """Contains the domain model / business logic for events"""
 
+from django.db.models import Q
+from django.core.exceptions import ValidationError
+from django.contrib.contenttypes.models import ContentType
+from rest_framework.exceptions import ParseError
+
 from .models import Event, EventAction, AffectedAttribute
-from ..incidents.models import IncidentStatus
+from ..incidents.models import IncidentStatus, EscalateExternalWorkflow, AssignUserWorkflow, EscalateWorkflow
 from ..file_upload.models import File
 from .exceptions import EventException
 
+EVENT_INITIATOR_RELATED = (
+    "initiator__profile__organization",
+    "initiator__profile__division",
+    "initiator__profile__level",
+)
+
+# related objects used when describing each kind of refered model
+REFERED_MODEL_RELATED = {
+    EscalateExternalWorkflow: ("escalated_user__profile__organization",),
+    AssignUserWorkflow: ("assignee",),
+    EscalateWorkflow: ("assignee",),
+}
+
+TRAIL_PAGE_SIZE = 50
+MAX_TRAIL_PAGE_SIZE = 200
+
 def get_events_by_incident_id(incident_id: str):
-    events = Event.objects.filter(incident_id=incident_id)
+    events = Event.objects.filter(incident_id=incident_id).select_related(*EVENT_INITIATOR_RELATED) \
+                .prefetch_related("initiator__groups")
+
+    return prefetch_event_references(events)
+
+def prefetch_event_references(events) -> list:
+    """ Loads the refered models of the given events with one query per
+        content type, instead of one query per event.
+    """
+    events = list(events)
+
+    ids_by_type = {}
+    for event in events:
+        if event.refered_model_type_id is not None and event.reference_id is not None:
+            ids_by_type.setdefault(event.refered_model_type_id, set()).add(event.reference_id)
+
+    refered_models = {}
+    for content_type_id, ids in ids_by_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+
+        queryset = model._base_manager.filter(pk__in=ids)
+        if model in REFERED_MODEL_RELATED:
+            queryset = queryset.select_related(*REFERED_MODEL_RELATED[model])
+
+        for refered_model in queryset:
+            refered_models[(content_type_id, refered_model.pk)] = refered_model
+
+    field = Event._meta.get_field("refered_model")
+    for event in events:
+        refered_model = refered_models.get((event.refered_model_type_id, event.reference_id))
+        if refered_model is not None:
+            field.set_cached_value(event, refered_model)
 
     return events
 
+def get_event_trail_page(incident_id: str, after_event_id=None, page_size=TRAIL_PAGE_SIZE):
+    """ A page of the events of an incident in the order they happened,
+        starting after the given event. Returns (events, has more events)
+    """
+    events = Event.objects.filter(incident_id=incident_id).order_by("created_date", "id")
+
+    if after_event_id is not None:
+        try:
+            after = Event.objects.filter(incident_id=incident_id, id=after_event_id) \
+                        .values_list("created_date", "id").first()
+        except ValidationError:
+            after = None
+
+        if after is None:
+            # client input, a 400
+            raise ParseError("Invalid event id")
+
+        events = events.filter(Q(created_date__gt=after[0]) | Q(created_date=after[0], id__gt=after[1]))
+
+    events = list(events.select_related(*EVENT_INITIATOR_RELATED).prefetch_related("initiator__groups")[:page_size + 1])
+    has_more = len(events) > page_size
+
+    return prefetch_event_references(events[:page_size]), has_more
+
 def get_event_by_id(event_id: str):
     try:
         event = Event.objects.get(id=event_id)
@@ -1,3 +1,97 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from . import services as event_services
+from ..custom_auth.models import Organization
+from ..incidents.models import Incident, IncidentComment, AssignUserWorkflow, EscalateExternalWorkflow
+
+User = get_user_model()
+
+
+class EventTrailTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        cls.user = User.objects.create(username="coordinator", first_name="co", last_name="ordinator")
+        cls.user.profile.organization = organization
+        cls.user.profile.save()
+
+        cls.incident = Incident.objects.create(title="incident", description="description", assignee=cls.user)
+        cls.add_events(cls.incident, 10)
+
+    @classmethod
+    def add_events(cls, incident, count):
+        for i in range(count):
+            comment = IncidentComment.objects.create(body="comment %d" % i, incident=incident, user=cls.user)
+            event_services.create_comment_event(cls.user, incident, comment)
+
+            workflow = AssignUserWorkflow.objects.create(incident=incident, actioned_user=cls.user,
+                                                         assignee=cls.user)
+            event_services.update_workflow_event(cls.user, incident, workflow)
+
+            workflow = EscalateExternalWorkflow.objects.create(incident=incident, actioned_user=cls.user,
+                                                               escalated_user=cls.user, is_internal_user=True,
+                                                               comment="refer")
+            event_services.update_workflow_event(cls.user, incident, workflow)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get_trail(self, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/incidents/%s/events/trail" % self.incident.id, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["data"], len(context.captured_queries)
+
+    def test_pages_follow_the_cursor(self):
+        first, _ = self.get_trail(pageSize=20)
+        self.assertEqual(first["incident"]["id"], str(self.incident.id))
+        self.assertEqual(len(first["events"]), 20)
+        self.assertEqual(first["events"][0]["data"], {"comment": {"body": "comment 0", "isOutcome": False}})
+
+        second, _ = self.get_trail(pageSize=20, cursor=first["nextCursor"])
+        self.assertNotIn("incident", second)
+        self.assertEqual(len(second["events"]), 10)
+        self.assertIsNone(second["nextCursor"])
+
+        entity = second["events"][-1]["data"]["workflow"]["data"]["entity"]
+        self.assertEqual(entity, {"name": "co ordinator", "type": "Election Commission"})
+
+    def test_since_returns_only_new_events(self):
+        first, _ = self.get_trail(pageSize=100)
+        polled, _ = self.get_trail(since=first["lastEventId"])
+        self.assertEqual(polled["events"], [])
+        self.assertEqual(polled["lastEventId"], first["lastEventId"])
+
+        self.add_events(self.incident, 1)
+        polled, _ = self.get_trail(since=first["lastEventId"])
+        self.assertEqual([event["action"] for event in polled["events"]],
+                         ["COMMENTED", "WORKFLOW_ACTIONED", "WORKFLOW_ACTIONED"])
+
+    def test_query_count_is_independent_of_event_count(self):
+        # warm up process level caches
+        self.get_trail(pageSize=3)
+
+        _, small_page_queries = self.get_trail(pageSize=3)
+        _, large_page_queries = self.get_trail(pageSize=30)
+        self.assertEqual(small_page_queries, large_page_queries)
+
+    def test_cursor_of_another_incident_is_rejected(self):
+        other = Incident.objects.create(title="other", description="description")
+        first, _ = self.get_trail(pageSize=1)
+
+        response = self.client.get("/incidents/%s/events/trail" % other.id, {"cursor": first["nextCursor"]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["data"]["message"], "Invalid event id")
+
+    def test_old_trail_embeds_the_incident(self):
+        response = self.client.get("/incidents/%s/events" % self.incident.id)
+        events = response.json()["data"]
+
+        self.assertEqual(len(events), 30)
+        self.assertEqual(events[0]["incident"]["id"], str(self.incident.id))
@@ -2,17 +2,27 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 
-from .services import get_events_by_incident_id
-from .serializers import EventSerializer
+from .services import get_events_by_incident_id, get_event_trail_page, TRAIL_PAGE_SIZE, MAX_TRAIL_PAGE_SIZE
+from .serializers import EventSerializer, EventTrailSerializer
+from .exceptions import EventException
 
-from ..incidents.services import is_valid_incident
+from ..incidents.models import Incident
+from ..incidents.services import prefetch_incident_list
+from ..incidents.serializers import IncidentSerializer
+
+def get_trail_incident(incident_id):
+    """ the incident with everything IncidentSerializer needs, None if not found """
+    return prefetch_incident_list(Incident.objects.filter(id=incident_id)).first()
 
 @api_view(['GET'])
 def get_event_trail(request, incident_id):
     if request.method == "GET":
-        if is_valid_incident(incident_id):
+        incident = get_trail_incident(incident_id)
+        if incident is not None:
             events = get_events_by_incident_id(incident_id)
-            serializer = EventSerializer(events, many=True)
+            serializer = EventSerializer(events, many=True, context={
+                "incident": IncidentSerializer(incident).data
+            })
 
             return Response(serializer.data)
         
@@ -20,3 +30,40 @@ def get_event_trail(request, incident_id):
     
     return Response(status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
+@api_view(['GET'])
+def get_event_trail_pages(request, incident_id):
+    """ Events of an incident, a page at a time.
+
+        The incident is sent once, with the first page. Pass the
+        `nextCursor` of a page as `cursor` to get the next page, or the
+        `lastEventId` as `since` to poll for events that happened after it.
+    """
+    cursor = request.query_params.get("cursor", None)
+    since = request.query_params.get("since", None)
+    after_event_id = cursor or since
+
+    # later pages and polls don't need the incident, an event of another
+    # incident is rejected when looking up the cursor
+    incident = None
+    if after_event_id is None:
+        incident = get_trail_incident(incident_id)
+        if incident is None:
+            return Response("Invalid incident id", status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        page_size = min(int(request.query_params.get("pageSize", TRAIL_PAGE_SIZE)), MAX_TRAIL_PAGE_SIZE)
+    except ValueError:
+        raise EventException("Invalid page size")
+
+    events, has_more = get_event_trail_page(incident_id, after_event_id, max(page_size, 1))
+    last_event_id = events[-1].id if events else after_event_id
+
+    data = {
+        "events": EventTrailSerializer(events, many=True).data,
+        "nextCursor": last_event_id if has_more else None,
+        "lastEventId": last_event_id,
+    }
+    if incident is not None:
+        data["incident"] = IncidentSerializer(incident).data
+
+    return Response(data)
@@ -1,5 +1,7 @@
 from django.contrib import admin
 
-from .models import File
+from .models import File, FileBlob, UploadSession
 
-admin.site.register(File)
\ No newline at end of file
+admin.site.register(File)
+admin.site.register(FileBlob)
+admin.site.register(UploadSession)
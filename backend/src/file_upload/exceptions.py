@@ -5,3 +5,10 @@ class BaseException(APIException):
 
 class FileException(BaseException):
     pass
+
+class RangeNotSatisfiableException(FileException):
+    status_code = 416
+    default_detail = "Requested range not satisfiable"
+
+class UploadOffsetException(FileException):
+    status_code = 409
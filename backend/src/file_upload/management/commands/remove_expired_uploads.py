@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...services import remove_expired_uploads
+
+
+class Command(BaseCommand):
+    help = "Remove resumable uploads that were not finished within FILE_UPLOAD_SESSION_EXPIRY hours"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=int, default=None)
+
+    def handle(self, *args, **options):
+        removed = remove_expired_uploads(options["hours"])
+        self.stdout.write(self.style.SUCCESS("Removed %d expired upload(s)" % removed))
@@ -1,4 +1,7 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from functools import partial
 import uuid
 import os
@@ -13,14 +16,60 @@ def _update_filename(instance, filename, path):
 def upload_to(path):
     return partial(_update_filename, path=path)
 
+class FileBlob(models.Model):
+    """ Stored content of an upload, shared by every File with the same
+        content. ref_count is the number of File rows pointing at it.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(max_length=200)
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_date = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
+
+class UploadSession(models.Model):
+    """ A resumable upload. Chunks are appended to a part file until all
+        `size` bytes are received and the upload is finalized into a File.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    incident = models.ForeignKey("incidents.Incident", on_delete=models.CASCADE)
+    original_name = models.TextField(blank=False, null=False)
+    size = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64, null=True, blank=True)
+    received = models.BigIntegerField(default=0)
+    created_date = models.DateTimeField(auto_now_add=True)
+    updated_date = models.DateTimeField(auto_now=True)
+
 class File(models.Model):
     # id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     file = models.FileField(upload_to=upload_to(''), blank=False, null=False)
     original_name = models.TextField(blank=False, null=False)
     extension = models.CharField(max_length=20, default="no_ext", blank=False, null=False)
     incident = models.ForeignKey("incidents.Incident", on_delete=models.DO_NOTHING)
+    blob = models.ForeignKey(FileBlob, on_delete=models.PROTECT, null=True, blank=True, related_name="files")
     remark = models.CharField(max_length=200, null=True)
     created_date = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ('created_date',)
+
+
+@receiver(post_save, sender=File)
+def reference_file_blob(sender, instance, created, **kwargs):
+    if created and instance.blob_id is not None:
+        FileBlob.objects.filter(id=instance.blob_id).update(ref_count=F("ref_count") + 1)
+
+@receiver(post_delete, sender=File)
+def release_file_blob(sender, instance, **kwargs):
+    """ the blob goes with its last file """
+    if instance.blob_id is None:
+        return
+
+    FileBlob.objects.filter(id=instance.blob_id).update(ref_count=F("ref_count") - 1)
+    blob = FileBlob.objects.select_for_update().filter(id=instance.blob_id, ref_count__lte=0).first()
+    if blob is not None:
+        name = blob.file.name
+        blob.delete()
+        transaction.on_commit(lambda: blob.file.storage.delete(name))
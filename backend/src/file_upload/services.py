@@ -1,6 +1,23 @@
-from .models import File
+import os
+import re
+import hashlib
+from datetime import timedelta
+
+from .models import File, FileBlob, UploadSession
+from django.conf import settings
 from django.core import serializers
-from .exceptions import FileException
+from django.core.files.storage import default_storage
+from django.db import transaction, IntegrityError
+from django.utils import timezone
+from .exceptions import FileException, RangeNotSatisfiableException, UploadOffsetException
+from ..incidents.models import Incident
+
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+UPLOAD_DIRECTORY = "uploads"
+BLOB_DIRECTORY = "blobs"
+COPY_CHUNK_SIZE = 1024 * 1024
 
 def get_file_by_id(file_id: str) -> File:
     try:
@@ -21,3 +38,250 @@ def get_incident_file_ids(incident_id: str):
         return files
     except:
         raise FileException("Couldn't find files for the incident")
+
+def get_file_etag(uploaded_file: File, stat: os.stat_result) -> str:
+    """ strong validator of the stored file, uploads are never modified in
+        place so the id, size and modification time identify the content
+    """
+    version = "%s:%s:%s" % (uploaded_file.id, stat.st_size, stat.st_mtime_ns)
+    return '"%s"' % hashlib.sha1(version.encode()).hexdigest()
+
+def parse_range(range_header: str, size: int):
+    """ (start, end) inclusive byte positions of a single range request.
+        Returns None when the header should be ignored (absent, malformed or
+        several ranges), the whole file is sent then.
+    """
+    if not range_header:
+        return None
+
+    match = RANGE_HEADER.match(range_header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if first == "" and last == "":
+        return None
+
+    if first == "":
+        # suffix range, the last n bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiableException()
+        return (max(size - length, 0), size - 1)
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if start >= size or start > end:
+        raise RangeNotSatisfiableException()
+
+    return (start, end)
+
+def iter_file_range(path: str, start: int, length: int, chunk_size: int):
+    """ reads `length` bytes from `start` a chunk at a time """
+    with open(path, "rb") as fp:
+        fp.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = fp.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def get_extension(file_name: str) -> str:
+    return file_name.split('.')[-1][:20]
+
+def get_blob_name(sha256: str) -> str:
+    return os.path.join(BLOB_DIRECTORY, sha256[:2], sha256)
+
+def get_part_path(session: UploadSession) -> str:
+    return os.path.join(settings.MEDIA_ROOT, UPLOAD_DIRECTORY, "%s.part" % session.id)
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def acquire_blob(sha256: str, size: int, store) -> FileBlob:
+    """ the locked blob for the given content. `store(name)` is only called
+        when the content isn't stored yet and has to write it to the storage.
+        Must run in a transaction, the reference is taken by the File saved
+        with the blob.
+    """
+    blob = FileBlob.objects.select_for_update().filter(sha256=sha256).first()
+    if blob is not None:
+        return blob
+
+    name = get_blob_name(sha256)
+    store(name)
+    try:
+        with transaction.atomic():
+            return FileBlob.objects.create(sha256=sha256, file=name, size=size)
+    except IntegrityError:
+        # stored concurrently, the content (and so the file) is the same
+        return FileBlob.objects.select_for_update().get(sha256=sha256)
+
+def create_blob_file(incident_id, original_name: str, blob: FileBlob) -> File:
+    return File.objects.create(
+        file=blob.file.name,
+        original_name=original_name,
+        extension=get_extension(original_name),
+        incident_id=incident_id,
+        blob=blob
+    )
+
+def save_incident_file(incident_id: str, uploaded_file) -> File:
+    """ stores a file uploaded in a single request, sharing the blob of
+        identical content uploaded earlier
+    """
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    sha256 = digest.hexdigest()
+
+    def store(name):
+        if not default_storage.exists(name):
+            uploaded_file.seek(0)
+            default_storage.save(name, uploaded_file)
+
+    with transaction.atomic():
+        blob = acquire_blob(sha256, uploaded_file.size, store)
+        return create_blob_file(incident_id, uploaded_file.name, blob)
+
+
+def start_upload(incident_id: str, original_name: str, size, sha256: str = None) -> UploadSession:
+    if not original_name:
+        raise FileException("File name is required")
+
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise FileException("Invalid file size")
+    if size < 0 or size > settings.FILE_UPLOAD_MAX_SIZE:
+        raise FileException("Invalid file size")
+
+    if sha256:
+        sha256 = sha256.lower()
+        if SHA256_HEX.match(sha256) is None:
+            raise FileException("Invalid sha256 checksum")
+
+    if not Incident.objects.filter(id=incident_id).exists():
+        raise FileException("Invalid incident id")
+
+    return UploadSession.objects.create(
+        incident_id=incident_id,
+        original_name=original_name,
+        size=size,
+        sha256=sha256 or None
+    )
+
+def get_upload_session(upload_id: str) -> UploadSession:
+    try:
+        return UploadSession.objects.get(id=upload_id)
+    except UploadSession.DoesNotExist:
+        raise FileException("Invalid upload id")
+
+def append_upload_chunk(upload_id: str, offset, stream, length: int) -> UploadSession:
+    """ writes `length` bytes read from `stream` at `offset` of the upload.
+        The offset must be the number of bytes received so far, a retried
+        chunk after a dropped connection resumes from there.
+    """
+    try:
+        offset = int(offset)
+    except (TypeError, ValueError):
+        raise FileException("Invalid upload offset")
+
+    if length <= 0 or length > settings.FILE_UPLOAD_MAX_CHUNK_SIZE:
+        raise FileException("Invalid chunk size")
+
+    with transaction.atomic():
+        try:
+            session = UploadSession.objects.select_for_update().get(id=upload_id)
+        except UploadSession.DoesNotExist:
+            raise FileException("Invalid upload id")
+
+        if offset != session.received:
+            raise UploadOffsetException("Expected offset %d" % session.received)
+        if session.received + length > session.size:
+            raise FileException("Chunk exceeds the declared file size")
+
+        path = get_part_path(session)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        written = 0
+        with open(path, "r+b" if os.path.exists(path) else "wb") as fp:
+            # anything after the received offset is left over from a failed chunk
+            fp.seek(session.received)
+            fp.truncate()
+            while written < length:
+                chunk = stream.read(min(COPY_CHUNK_SIZE, length - written))
+                if not chunk:
+                    break
+                fp.write(chunk)
+                written += len(chunk)
+
+        session.received += written
+        session.save(update_fields=["received", "updated_date"])
+
+    if written < length:
+        raise FileException("Incomplete chunk, %d of %d bytes received" % (written, length))
+
+    return session
+
+def finalize_upload(upload_id: str) -> File:
+    """ turns a complete upload into an incident File, the content is stored
+        once no matter how many times it is uploaded. The whole content has to
+        be received: the uploads are anonymous, a declared checksum alone
+        mustn't give access to a file stored for another incident.
+    """
+    session = get_upload_session(upload_id)
+    path = get_part_path(session)
+
+    if session.received != session.size:
+        raise FileException("Upload incomplete, %d of %d bytes received" % (session.received, session.size))
+
+    if session.size == 0:
+        open(path, "wb").close()
+    sha256 = hash_file(path)
+    if session.sha256 and session.sha256 != sha256:
+        # start over, the received data isn't the declared file
+        UploadSession.objects.filter(id=session.id).update(received=0)
+        os.remove(path)
+        raise FileException("Checksum mismatch")
+
+    def store(name):
+        target = default_storage.path(name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+
+    with transaction.atomic():
+        if not UploadSession.objects.select_for_update().filter(id=session.id).exists():
+            raise FileException("Invalid upload id")
+
+        blob = acquire_blob(sha256, session.size, store)
+        uploaded_file = create_blob_file(session.incident_id, session.original_name, blob)
+        session.delete()
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    return uploaded_file
+
+def remove_expired_uploads(expiry_hours: int = None) -> int:
+    """ drops uploads not touched within the expiry, returns how many """
+    if expiry_hours is None:
+        expiry_hours = settings.FILE_UPLOAD_SESSION_EXPIRY
+    expired = UploadSession.objects.filter(
+        updated_date__lt=timezone.now() - timedelta(hours=expiry_hours))
+
+    removed = 0
+    for session in expired:
+        path = get_part_path(session)
+        session.delete()
+        if os.path.exists(path):
+            os.remove(path)
+        removed += 1
+
+    return removed
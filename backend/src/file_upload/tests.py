@@ -1,3 +1,173 @@
-from django.test import TestCase
+import shutil
+import hashlib
+import tempfile
+import uuid
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from .models import File, FileBlob, UploadSession
+from ..incidents.models import Incident
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, FILE_DOWNLOAD_CHUNK_SIZE=4, FILE_DOWNLOAD_OFFLOAD=None)
+class FileDownloadTest(TestCase):
+    content = b"0123456789abcdefghij"
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        incident = Incident.objects.create(title="incident", description="description")
+        self.uploaded_file = File(original_name="notes.txt", extension="txt", incident=incident)
+        self.uploaded_file.file.save("notes.txt", ContentFile(self.content))
+        self.url = "/incidents/files/download/%s" % self.uploaded_file.id
+
+    def test_streams_whole_file(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response["Content-Length"], str(len(self.content)))
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+
+    def test_range_request(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=5-9")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"56789")
+        self.assertEqual(response["Content-Range"], "bytes 5-9/20")
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=-3")
+        self.assertEqual(b"".join(response.streaming_content), b"hij")
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=30-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */20")
+
+    def test_conditional_requests(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # a stale If-Range gets the whole file instead of the range
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(FILE_DOWNLOAD_OFFLOAD="x-accel-redirect", FILE_DOWNLOAD_ACCEL_PREFIX="/protected/")
+    def test_accel_redirect(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected/" + self.uploaded_file.file.name)
+        self.assertEqual(response.content, b"")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class FileUploadTest(TestCase):
+    def setUp(self):
+        self.incident = Incident.objects.create(title="incident", description="description")
+        self.url = "/incidents/%s/files" % self.incident.id
+
+    def test_upload_is_stored(self):
+        upload = SimpleUploadedFile("notes.txt", b"evidence")
+        response = self.client.post(self.url, {"files[]": [upload]})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(File.objects.get().original_name, "notes.txt")
+
+    def test_invalid_upload_is_refused(self):
+        response = self.client.post(self.url, {"files[]": [SimpleUploadedFile("empty.txt", b"")]})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(self.url, {"files[]": ["not a file"]})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post("/incidents/%s/files" % uuid.uuid4(),
+                                    {"files[]": [SimpleUploadedFile("notes.txt", b"evidence")]})
+        self.assertEqual(response.status_code, 400)
+
+        self.assertFalse(File.objects.exists())
+        self.assertFalse(FileBlob.objects.exists())
+
+
+class ResumableUploadTest(TestCase):
+    content = b"evidence " * 100
+
+    def setUp(self):
+        self.incident = Incident.objects.create(title="incident", description="description")
+
+    def start(self, **data):
+        data.setdefault("fileName", "photo.jpg")
+        data.setdefault("size", len(self.content))
+        response = self.client.post("/incidents/%s/uploads" % self.incident.id, data,
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        return response.json()["data"]
+
+    def put_chunk(self, upload_id, offset, chunk):
+        return self.client.put("/uploads/%s" % upload_id, chunk,
+                               content_type="application/octet-stream", HTTP_UPLOAD_OFFSET=str(offset))
+
+    def finalize(self, upload_id):
+        return self.client.post("/uploads/%s/finalize" % upload_id)
+
+    def test_upload_resumes_and_dedupes(self):
+        upload = self.start()
+
+        self.assertEqual(self.put_chunk(upload["uploadId"], 0, self.content[:300]).status_code, 200)
+        # a retried chunk with a stale offset is refused, the client asks where to resume
+        self.assertEqual(self.put_chunk(upload["uploadId"], 0, self.content[:300]).status_code, 409)
+        offset = self.client.get("/uploads/%s" % upload["uploadId"]).json()["data"]["offset"]
+        self.assertEqual(offset, 300)
+        self.put_chunk(upload["uploadId"], offset, self.content[offset:])
+
+        response = self.finalize(upload["uploadId"])
+        self.assertEqual(response.status_code, 201)
+        first = File.objects.get(id=response.json()["data"]["id"])
+        with first.file.open("rb") as fp:
+            self.assertEqual(fp.read(), self.content)
+        self.assertFalse(UploadSession.objects.exists())
+
+        # the same content uploaded again shares the stored blob
+        upload = self.start(fileName="copy.jpg", sha256=hashlib.sha256(self.content).hexdigest())
+        self.put_chunk(upload["uploadId"], 0, self.content)
+        second = File.objects.get(id=self.finalize(upload["uploadId"]).json()["data"]["id"])
+
+        self.assertEqual(second.blob_id, first.blob_id)
+        self.assertEqual(second.file.name, first.file.name)
+        self.assertEqual(FileBlob.objects.get().ref_count, 2)
+
+        second.delete()
+        self.assertEqual(FileBlob.objects.get().ref_count, 1)
+        first.delete()
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_finalize_checks_content(self):
+        upload = self.start(sha256="0" * 64)
+        self.assertEqual(self.finalize(upload["uploadId"]).status_code, 500)
+
+        self.put_chunk(upload["uploadId"], 0, self.content)
+        response = self.finalize(upload["uploadId"])
+        self.assertEqual(response.json()["data"]["message"], "Checksum mismatch")
+        self.assertEqual(UploadSession.objects.get().received, 0)
+
+    def test_finalize_requires_content(self):
+        upload = self.start()
+        self.put_chunk(upload["uploadId"], 0, self.content)
+        self.assertEqual(self.finalize(upload["uploadId"]).status_code, 201)
+
+        # knowing the checksum of a stored file doesn't give access to it
+        upload = self.start(sha256=hashlib.sha256(self.content).hexdigest())
+        self.assertNotIn("contentKnown", upload)
+        response = self.finalize(upload["uploadId"])
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()["data"]["message"],
+                         "Upload incomplete, 0 of %d bytes received" % len(self.content))
+        self.assertEqual(File.objects.count(), 1)
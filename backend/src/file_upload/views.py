@@ -2,18 +2,28 @@ from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework import status
-from django.utils.encoding import smart_str
-from django.http import HttpResponse
-from wsgiref.util import FileWrapper
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 import mimetypes
 import os
-import urllib
+import urllib.parse
 
 from .serializers import FileSerializer
 from .services import ( 
     get_incident_file_ids,
-    get_file_by_id
+    get_file_by_id,
+    get_file_etag,
+    parse_range,
+    iter_file_range,
+    save_incident_file,
+    start_upload,
+    get_upload_session,
+    append_upload_chunk,
+    finalize_upload
 )
+from .exceptions import FileException, RangeNotSatisfiableException
 from ..events import services as event_service
 from ..incidents import services as incident_service
 
@@ -30,50 +40,131 @@ class FileView(APIView):
       
   def post(self, request, incident_id):
     files = request.data.getlist("files[]")
-    file_data = []
+    if not files:
+      return Response({"files[]": ["No files were submitted."]}, status=status.HTTP_400_BAD_REQUEST)
+
+    # every upload is checked before anything reaches the storage
     for _file in files:
       file_dict = dict()
       file_dict["file"] = _file
       file_dict["incident"] = incident_id
-      file_dict["extension"] = _file.name.split('.')[-1]
-      file_dict["original_name"] = _file.name
+      file_dict["original_name"] = getattr(_file, "name", "")
+      file_dict["extension"] = file_dict["original_name"].split('.')[-1]
 
-      file_data.append(file_dict)
+      FileSerializer(data=file_dict).is_valid(raise_exception=True)
 
-    file_serializer = FileSerializer(data=file_data, many=True)
-    if file_serializer.is_valid():
-      file_serializer.save()
-      return Response(file_serializer.data, status=status.HTTP_201_CREATED)
-    else:
-      return Response(file_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    saved_files = [save_incident_file(incident_id, _file) for _file in files]
+    file_serializer = FileSerializer(saved_files, many=True)
+    return Response(file_serializer.data, status=status.HTTP_201_CREATED)
+
+class UploadSessionView(APIView):
+  """ Starts a resumable upload, chunks are then PUT to uploads/<id> """
+  permission_classes = []
+
+  def post(self, request, incident_id):
+    session = start_upload(
+      incident_id,
+      request.data.get("fileName"),
+      request.data.get("size"),
+      request.data.get("sha256")
+    )
+    return Response(get_upload_state(session), status=status.HTTP_201_CREATED)
+
+class UploadChunkView(APIView):
+  permission_classes = []
+
+  def get(self, request, upload_id):
+    """ where to resume an interrupted upload """
+    session = get_upload_session(upload_id)
+    return Response(get_upload_state(session), status=status.HTTP_200_OK)
+
+  def put(self, request, upload_id):
+    offset = request.META.get("HTTP_UPLOAD_OFFSET", request.query_params.get("offset"))
+    try:
+      length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+      length = 0
+
+    session = append_upload_chunk(upload_id, offset, request.stream, length)
+    return Response(get_upload_state(session), status=status.HTTP_200_OK)
+
+class UploadFinalizeView(APIView):
+  permission_classes = []
+
+  def post(self, request, upload_id):
+    uploaded_file = finalize_upload(upload_id)
+    return Response(FileSerializer(uploaded_file).data, status=status.HTTP_201_CREATED)
+
+def get_upload_state(session):
+  return {
+    "uploadId": session.id,
+    "offset": session.received,
+    "size": session.size
+  }
 
 class FileDownload(APIView):
   permission_classes = []
 
   def get(self, request, file_id):
     uploaded_file = get_file_by_id(file_id)
-    file_path = uploaded_file.file.url
+    file_path = uploaded_file.file.path
     file_full_name = uploaded_file.original_name
 
-    fp = open(file_path, 'rb')
-    response = HttpResponse(fp.read())
-    fp.close()
+    try:
+      stat = os.stat(file_path)
+    except FileNotFoundError:
+      raise FileException("File not found")
+
+    etag = get_file_etag(uploaded_file, stat)
+    last_modified = int(stat.st_mtime)
+
+    # If-None-Match / If-Modified-Since, browsers re-opening a file get a 304
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+      return self.set_validators(not_modified, etag, last_modified)
+
+    byte_range = None
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range is None or if_range in (etag, http_date(last_modified)):
+      try:
+        byte_range = parse_range(request.META.get("HTTP_RANGE"), stat.st_size)
+      except RangeNotSatisfiableException:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = "bytes */%d" % stat.st_size
+        return self.set_validators(response, etag, last_modified)
+
+    offload = (settings.FILE_DOWNLOAD_OFFLOAD or "").lower()
+    if offload == "x-sendfile":
+      # the front server reads the file and handles the range itself
+      response = HttpResponse()
+      response["X-Sendfile"] = file_path
+    elif offload == "x-accel-redirect":
+      response = HttpResponse()
+      response["X-Accel-Redirect"] = settings.FILE_DOWNLOAD_ACCEL_PREFIX + urllib.parse.quote(uploaded_file.file.name)
+    elif byte_range is None:
+      response = StreamingHttpResponse(
+        iter_file_range(file_path, 0, stat.st_size, settings.FILE_DOWNLOAD_CHUNK_SIZE))
+      response["Content-Length"] = str(stat.st_size)
+    else:
+      start, end = byte_range
+      response = StreamingHttpResponse(
+        iter_file_range(file_path, start, end - start + 1, settings.FILE_DOWNLOAD_CHUNK_SIZE),
+        status=206)
+      response["Content-Length"] = str(end - start + 1)
+      response["Content-Range"] = "bytes %d-%d/%d" % (start, end, stat.st_size)
+
     type, encoding = mimetypes.guess_type(file_full_name)
     if type is None:
         type = 'application/octet-stream'
     response['Content-Type'] = type
-    response['Content-Length'] = str(os.stat(file_path).st_size)
     if encoding is not None:
         response['Content-Encoding'] = encoding
+    response["Accept-Ranges"] = "bytes"
 
-    if u'WebKit' in request.META['HTTP_USER_AGENT']:
-        # Safari 3.0 and Chrome 2.0 
-        filename_header = 'filename=%s' % file_full_name
-    elif u'MSIE' in request.META['HTTP_USER_AGENT']:
-        # IE does not support internationalized filename at all
-        filename_header = ''
-    else:
-        # For others like Firefox
-        filename_header = 'filename*=UTF-8\'\'%s' % file_full_name
-    # response['Content-Disposition'] = 'attachment; ' + filename_header
+    return self.set_validators(response, etag, last_modified)
+
+  def set_validators(self, response, etag, last_modified):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = "private, max-age=0, must-revalidate"
     return response
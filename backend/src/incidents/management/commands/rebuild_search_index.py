@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...search import rebuild_search_index, REBUILD_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "Reindex every incident for the incident list search"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=REBUILD_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index(options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS("Indexed %d incident(s)" % indexed))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...services import rebuild_user_workloads
+
+
+class Command(BaseCommand):
+    help = "Recount open incidents per assignee and repair the user workload counters"
+
+    def handle(self, *args, **options):
+        repaired = rebuild_user_workloads()
+        self.stdout.write(self.style.SUCCESS("Repaired %d user workload(s)" % repaired))
@@ -0,0 +1,25 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0002_incident_due_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RefIdSequence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('organization_code', models.CharField(max_length=10)),
+                ('year', models.IntegerField()),
+                ('last_value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('organization_code', 'year')},
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:15
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_user_workloads(apps, schema_editor):
+    """ initial open incident counts, later kept up to date by signals """
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Incident = apps.get_model("incidents", "Incident")
+    UserWorkload = apps.get_model("incidents", "UserWorkload")
+
+    open_counts = dict(
+        Incident.objects.filter(assignee__isnull=False)
+            .exclude(current_status__in=["CLOSED", "INVALIDATED"])
+            .values_list("assignee_id")
+            .annotate(models.Count("id"))
+            .order_by()
+    )
+
+    workloads = [
+        UserWorkload(
+            user_id=user_id,
+            division_id=division_id,
+            level_id=level_id,
+            is_active=is_active,
+            open_incidents=open_counts.get(user_id, 0)
+        )
+        for user_id, is_active, division_id, level_id in User.objects.values_list(
+            "id", "is_active", "profile__division", "profile__level")
+    ]
+    UserWorkload.objects.bulk_create(workloads, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_auth', '0003_auto_20200529_2253'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('incidents', '0003_refidsequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserWorkload',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(default=True)),
+                ('open_incidents', models.IntegerField(default=0)),
+                ('division', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='custom_auth.Division')),
+                ('level', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='custom_auth.UserLevel')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='workload', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='userworkload',
+            index=models.Index(fields=['division', 'level', 'is_active', 'open_incidents'], name='incidents_u_divisio_e7a28f_idx'),
+        ),
+        migrations.RunPython(populate_user_workloads, migrations.RunPython.noop),
+    ]
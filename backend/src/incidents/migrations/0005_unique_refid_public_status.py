@@ -0,0 +1,106 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:34
+
+import json
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count
+
+
+RENAMED_COMMENT = "Reference number changed from %s to %s, an earlier incident has the same number. " \
+                  "Citizens may still quote the old one."
+
+
+def dedupe_refIds(apps, schema_editor):
+    """ blank refIds become null. The earliest incident of a duplicated refId
+        keeps it, the later ones get a -2, -3 .. suffix and a comment with
+        the old and new number, as the old one was already sent to citizens
+    """
+    Incident = apps.get_model("incidents", "Incident")
+    IncidentComment = apps.get_model("incidents", "IncidentComment")
+
+    Incident.objects.filter(refId="").update(refId=None)
+
+    # without the default ordering, which would be grouped by too
+    duplicates = Incident.objects.exclude(refId=None).order_by().values("refId").annotate(
+        count=Count("id")).filter(count__gt=1).values_list("refId", flat=True)
+    for refId in list(duplicates):
+        incident_ids = Incident.objects.filter(refId=refId).order_by("created_date", "id").values_list("id", flat=True)
+        suffix = 2
+        for incident_id in list(incident_ids)[1:]:
+            while Incident.objects.filter(refId="%s-%d" % (refId, suffix)).exists():
+                suffix += 1
+            new_refId = "%s-%d" % (refId, suffix)
+            Incident.objects.filter(id=incident_id).update(refId=new_refId)
+            IncidentComment.objects.create(
+                incident_id=incident_id, body=(RENAMED_COMMENT % (refId, new_refId))[:200])
+            suffix += 1
+
+
+def get_public_status_reply(current_status, has_pending_information_request, close_comment=None):
+    """ frozen copy of models.get_public_status_reply """
+    if current_status == "NEW":
+        return ("Your request has been received. Please check again later for status updates.", [])
+    elif current_status == "VERIFIED":
+        return ("Your request has been acknowledged.", [])
+    elif current_status == "INFORMATION_REQUESTED" or has_pending_information_request:
+        return ("Your request requires further information to proceed. Reach us ealiest or we will contact \
+            you soon, for more information", [])
+    elif current_status in ("ACTION_PENDING", "ACTION_TAKEN", "INFORMATION_PROVIDED"):
+        return ("Your request is currently being attended to.", [])
+    elif current_status == "CLOSED":
+        return ("Your request has been resolved and closed.", [{"header": "Resolution", "content": close_comment}])
+    elif current_status == "INVALIDATED":
+        return ("We regret, we will not be able to proceed with your request at this time. \
+            Please feel free to access this system for future needs or requests. We look forward to serving you.", [])
+
+    return ("", [])
+
+
+def populate_public_status(apps, schema_editor):
+    """ initial projection, later kept up to date by signals """
+    Incident = apps.get_model("incidents", "Incident")
+    RequestInformationWorkflow = apps.get_model("incidents", "RequestInformationWorkflow")
+    CloseWorkflow = apps.get_model("incidents", "CloseWorkflow")
+    PublicIncidentStatus = apps.get_model("incidents", "PublicIncidentStatus")
+
+    pending_requests = set(RequestInformationWorkflow.objects.filter(
+        is_information_provided=False).values_list("incident_id", flat=True))
+    close_comments = dict(CloseWorkflow.objects.order_by("created_date").values_list("incident_id", "comment"))
+
+    statuses = []
+    for incident_id, refId, current_status in Incident.objects.values_list(
+            "id", "refId", "current_status").iterator(chunk_size=5000):
+        reply, messages = get_public_status_reply(
+            current_status, incident_id in pending_requests, close_comments.get(incident_id))
+        statuses.append(PublicIncidentStatus(
+            incident_id=incident_id, refId=refId, reply=reply, messages=json.dumps(messages)))
+
+    PublicIncidentStatus.objects.bulk_create(statuses, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0004_userworkload'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_refIds, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='incident',
+            name='refId',
+            field=models.CharField(blank=True, max_length=200, null=True, unique=True),
+        ),
+        migrations.CreateModel(
+            name='PublicIncidentStatus',
+            fields=[
+                ('incident', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='public_status', serialize=False, to='incidents.Incident')),
+                ('refId', models.CharField(blank=True, max_length=200, null=True, unique=True)),
+                ('reply', models.TextField(blank=True, default='')),
+                ('messages', models.TextField(blank=True, default='[]')),
+                ('updated_date', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_public_status, migrations.RunPython.noop),
+    ]
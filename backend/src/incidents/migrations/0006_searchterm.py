@@ -0,0 +1,27 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0005_unique_refid_public_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('incident', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='incidents.Incident')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='searchterm',
+            index=models.Index(fields=['term', 'incident'], name='incidents_s_term_3c06ef_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0006_searchterm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['due_date', 'id'], name='incidents_i_due_dat_071483_idx'),
+        ),
+    ]
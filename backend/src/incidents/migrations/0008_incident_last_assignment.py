@@ -0,0 +1,53 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:39
+
+from django.db import migrations, models
+
+
+def get_division_name(user):
+    """ Division.__str__, historical models don't have it """
+    division = user.profile.division
+    if division is None:
+        return str(None)
+    return '%s - %s: %s' % (division.organization.displayName, division.division_type, division.name)
+
+
+def populate_last_assignment(apps, schema_editor):
+    """ latest open internal referral of every incident, later kept by the workflow services """
+    Incident = apps.get_model("incidents", "Incident")
+    EscalateExternalWorkflow = apps.get_model("incidents", "EscalateExternalWorkflow")
+
+    last_assignments = {}
+    for workflow in EscalateExternalWorkflow.objects.filter(
+            is_action_completed=False, is_internal_user=True
+        ).select_related(
+            "actioned_user__profile__division__organization",
+            "escalated_user__profile__division__organization",
+        ).order_by("id").iterator(chunk_size=2000):
+        last_assignments[workflow.incident_id] = workflow
+
+    for incident_id, workflow in last_assignments.items():
+        Incident.objects.filter(id=incident_id).update(
+            last_assigned_from=get_division_name(workflow.actioned_user),
+            last_assigned_to=get_division_name(workflow.escalated_user)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0007_incident_due_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='last_assigned_from',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='incident',
+            name='last_assigned_to',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+        migrations.RunPython(populate_last_assignment, migrations.RunPython.noop),
+    ]
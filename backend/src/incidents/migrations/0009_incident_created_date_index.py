@@ -0,0 +1,17 @@
+# Generated by Django 2.2.12 on 2026-10-18 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0008_incident_last_assignment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['created_date', 'id'], name='incidents_i_created_8f3b13_idx'),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 2.2.12 on 2026-10-18 07:40
+
+import re
+import unicodedata
+
+from django.db import migrations
+
+# frozen copy of the indexing of search.py
+WORD = re.compile(r"[\w\u0300-\u036f\u0b80-\u0bff\u0d80-\u0dff]+")
+JOINERS = dict.fromkeys(map(ord, "\u200c\u200d"))
+
+MAX_TERM_LENGTH = 64
+MIN_TERM_LENGTH = 2
+CHUNK_SIZE = 500
+
+REFID_WEIGHT = 8
+TITLE_WEIGHT = 5
+REPORTER_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+COMMENT_WEIGHT = 1
+
+
+def tokenize(text):
+    if not text:
+        return []
+
+    text = unicodedata.normalize("NFKC", text).translate(JOINERS).casefold()
+    terms = []
+    for word in WORD.findall(text):
+        word = word.strip("_")[:MAX_TERM_LENGTH]
+        if len(word) >= MIN_TERM_LENGTH or word.isdigit():
+            terms.append(word)
+
+    return list(dict.fromkeys(terms))
+
+
+def add_terms(weights, text, weight):
+    for term in tokenize(text):
+        weights[term] = weights.get(term, 0) + weight
+
+
+def get_incident_terms(incident, reporter, comments):
+    weights = {}
+    add_terms(weights, incident.refId, REFID_WEIGHT)
+    if incident.refId:
+        refId = incident.refId.strip().casefold()[:MAX_TERM_LENGTH]
+        weights[refId] = weights.get(refId, 0) + REFID_WEIGHT
+    add_terms(weights, incident.title, TITLE_WEIGHT)
+    add_terms(weights, incident.description, DESCRIPTION_WEIGHT)
+    if reporter is not None:
+        for name in (reporter.name, reporter.sn_name, reporter.tm_name):
+            add_terms(weights, name, REPORTER_WEIGHT)
+    for comment in comments:
+        for body in (comment.body, comment.sn_body, comment.tm_body):
+            add_terms(weights, body, COMMENT_WEIGHT)
+    return weights
+
+
+def backfill_search_index(apps, schema_editor):
+    """ indexes the incidents created before the index, in chunks """
+    Incident = apps.get_model("incidents", "Incident")
+    IncidentComment = apps.get_model("incidents", "IncidentComment")
+    SearchTerm = apps.get_model("incidents", "SearchTerm")
+
+    last_id = None
+    while True:
+        incidents = Incident.objects.select_related("reporter").only(
+            "refId", "title", "description", "reporter__name", "reporter__sn_name", "reporter__tm_name"
+        ).order_by("id")
+        if last_id is not None:
+            incidents = incidents.filter(id__gt=last_id)
+        incidents = list(incidents[:CHUNK_SIZE])
+        if not incidents:
+            break
+
+        comments = {}
+        for comment in IncidentComment.objects.filter(incident__in=incidents, is_active=True).only(
+                "incident_id", "body", "sn_body", "tm_body"):
+            comments.setdefault(comment.incident_id, []).append(comment)
+
+        SearchTerm.objects.filter(incident__in=incidents).delete()
+        SearchTerm.objects.bulk_create([
+            SearchTerm(term=term, incident_id=incident.id, weight=weight)
+            for incident in incidents
+            for term, weight in get_incident_terms(
+                incident, incident.reporter, comments.get(incident.id, [])).items()
+        ], batch_size=500)
+
+        last_id = incidents[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0009_incident_created_date_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
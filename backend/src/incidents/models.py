@@ -1,13 +1,18 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django_filters import rest_framework as filters
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_init, pre_save
+from django.core.cache import cache
 from django.dispatch import receiver
 import uuid
 import enum
+import hashlib
+import json
 from datetime import datetime, timedelta
 from .permissions import *
 from ..common.models import Category
+from ..custom_auth.models import Profile, Division, UserLevel
 from django.conf import settings
 
 User = settings.AUTH_USER_MODEL
@@ -177,7 +182,7 @@ class IncidentComment(models.Model):
 class Incident(models.Model):
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    refId = models.CharField(max_length=200, blank=True, null=True)
+    refId = models.CharField(max_length=200, blank=True, null=True, unique=True)
     title = models.CharField(max_length=200)
     description = models.TextField()
     category = models.CharField(max_length=200, blank=True, null=True)
@@ -246,6 +251,11 @@ class Incident(models.Model):
     institution = models.CharField(max_length=200, blank=True, null=True) # this will save `code` of institute pulled from location-service API endpoint
 
     current_decision = models.CharField(max_length=50, default=None, null=True, blank=True)
+
+    # divisions of the latest open internal referral, kept by
+    # services.update_last_assignment so listing incidents needs no lookups
+    last_assigned_from = models.CharField(max_length=500, null=True, blank=True)
+    last_assigned_to = models.CharField(max_length=500, null=True, blank=True)
     occured_date = models.DateTimeField(null=True, blank=True)
     due_date = models.DateTimeField(null=True, blank=True)
     response_time = models.IntegerField(default=12)
@@ -255,6 +265,12 @@ class Incident(models.Model):
 
     class Meta:
         ordering = ("created_date",)
+        indexes = [
+            # keyset pagination of the incident list
+            models.Index(fields=["due_date", "id"]),
+            # keyset chunks of the export
+            models.Index(fields=["created_date", "id"]),
+        ]
 
         permissions = (
             (CAN_REVIEW_INCIDENTS, "Can review created incidents"),
@@ -277,6 +293,15 @@ class Incident(models.Model):
             (CAN_VIEW_REPORTS, "Can view inciddent reports"),
         )
 
+class RefIdSequence(models.Model):
+    """ last issued refId number per organization and year """
+    organization_code = models.CharField(max_length=10)
+    year = models.IntegerField()
+    last_value = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = (("organization_code", "year"),)
+
 # the following signals will update the current status and severity fields
 @receiver(post_save, sender=IncidentStatus)
 def update_incident_current_status(sender, **kwargs):
@@ -285,6 +310,99 @@ def update_incident_current_status(sender, **kwargs):
     incident.current_status = incident_status.current_status.name
     incident.save()
 
+class UserWorkload(models.Model):
+    """ Number of open incidents assigned to each user.
+        Kept up to date by the incident signals below, so that picking the
+        least loaded assignee doesn't need to count the incident table.
+        division, level and is_active are copied from the user profile for
+        the same reason.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="workload")
+    division = models.ForeignKey(Division, on_delete=models.DO_NOTHING, null=True, blank=True)
+    level = models.ForeignKey(UserLevel, on_delete=models.DO_NOTHING, null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+    open_incidents = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["division", "level", "is_active", "open_incidents"]),
+        ]
+
+# incidents in these statuses don't count towards the workload of the assignee
+CLOSED_STATUSES = (StatusType.CLOSED.name, StatusType.INVALIDATED.name)
+
+def get_workload_state(incident):
+    """ (assignee, is open) as last loaded or saved, None if those fields were deferred """
+    if "assignee_id" not in incident.__dict__ or "current_status" not in incident.__dict__:
+        return None
+
+    is_open = incident.current_status not in CLOSED_STATUSES
+    return (incident.assignee_id, is_open)
+
+def add_user_workload(user_id, count):
+    updated = UserWorkload.objects.filter(user_id=user_id).update(open_incidents=F("open_incidents") + count)
+    if updated == 0:
+        UserWorkload.objects.get_or_create(user_id=user_id)
+        UserWorkload.objects.filter(user_id=user_id).update(open_incidents=F("open_incidents") + count)
+
+@receiver(post_init, sender=Incident)
+def remember_incident_workload_state(sender, instance, **kwargs):
+    instance._workload_state = get_workload_state(instance)
+
+@receiver(pre_save, sender=Incident)
+def load_incident_workload_state(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding or instance._workload_state is not None:
+        return
+
+    # loaded with deferred fields, check what is in the database
+    previous = Incident.objects.filter(pk=instance.pk).values_list("assignee_id", "current_status").first()
+    if previous is not None:
+        instance._workload_state = (previous[0], previous[1] not in CLOSED_STATUSES)
+
+@receiver(post_save, sender=Incident)
+def update_user_workload(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous_state = None if created else instance._workload_state
+    previous_assignee_id, was_open = previous_state or (None, False)
+    # deferred fields are not written by save, so those are unchanged
+    assignee_id, is_open = get_workload_state(instance) or previous_state or (None, False)
+
+    if (previous_assignee_id, was_open) != (assignee_id, is_open):
+        with transaction.atomic():
+            if previous_assignee_id is not None and was_open:
+                add_user_workload(previous_assignee_id, -1)
+            if assignee_id is not None and is_open:
+                add_user_workload(assignee_id, 1)
+
+    instance._workload_state = (assignee_id, is_open)
+
+@receiver(post_save, sender=Profile)
+def sync_user_workload_profile(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    UserWorkload.objects.update_or_create(
+        user_id=instance.user_id,
+        defaults={
+            "division_id": instance.division_id,
+            "level_id": instance.level_id,
+            "is_active": instance.user.is_active
+        }
+    )
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_user_workload_active(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+
+    if update_fields is not None and "is_active" not in update_fields:
+        # ex: last_login updates
+        return
+
+    UserWorkload.objects.filter(user_id=instance.id).update(is_active=instance.is_active)
+
 class IncidentPerson(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200, null=True, blank=True)
@@ -422,3 +540,169 @@ class SendCannedResponseWorkflow(IncidentWorkflow):
 
 
 
+
+
+class PublicIncidentStatus(models.Model):
+    """ What the public status page shows for an incident, kept up to date
+        by the signals below so that looking up a refId doesn't touch the
+        workflow tables.
+    """
+    incident = models.OneToOneField(Incident, on_delete=models.CASCADE, primary_key=True,
+                    related_name="public_status")
+    refId = models.CharField(max_length=200, null=True, blank=True, unique=True)
+    reply = models.TextField(blank=True, default="")
+    # json list of {"header", "content"} shown below the reply
+    messages = models.TextField(blank=True, default="[]")
+    updated_date = models.DateTimeField(auto_now=True)
+
+    def as_status(self) -> dict:
+        status = {}
+        if self.reply:
+            status["reply"] = self.reply
+        messages = json.loads(self.messages)
+        if messages:
+            status["messages"] = messages
+        return status
+
+PUBLIC_STATUS_CACHE_KEY = "incidents:public_status:%s"
+
+def get_public_status_cache_key(refId):
+    # refIds come from the public, hashed to keep the key valid for any cache backend
+    return PUBLIC_STATUS_CACHE_KEY % hashlib.sha256(str(refId).encode()).hexdigest()
+
+def get_public_status_reply(current_status, has_pending_information_request, close_comment=None):
+    """ (reply, messages) shown to the public for an incident in the given state """
+    if current_status == StatusType.NEW.name:
+        return ("Your request has been received. Please check again later for status updates.", [])
+    elif current_status == StatusType.VERIFIED.name:
+        return ("Your request has been acknowledged.", [])
+    elif current_status == StatusType.INFORMATION_REQUESTED.name or has_pending_information_request:
+        # not setting the user to input requested information
+        return ("Your request requires further information to proceed. Reach us ealiest or we will contact \
+            you soon, for more information", [])
+    elif current_status in (StatusType.ACTION_PENDING.name, StatusType.ACTION_TAKEN.name,
+                            StatusType.INFORMATION_PROVIDED.name):
+        return ("Your request is currently being attended to.", [])
+    elif current_status == StatusType.CLOSED.name:
+        return ("Your request has been resolved and closed.", [{"header": "Resolution", "content": close_comment}])
+    elif current_status == StatusType.INVALIDATED.name:
+        return ("We regret, we will not be able to proceed with your request at this time. \
+            Please feel free to access this system for future needs or requests. We look forward to serving you.", [])
+
+    return ("", [])
+
+def refresh_public_status(incident_id):
+    """ recomputes the public status projection of the incident """
+    incident = Incident.objects.filter(id=incident_id).values("refId", "current_status").first()
+    if incident is None:
+        return
+
+    current_status = incident["current_status"]
+    has_pending_request = current_status not in (StatusType.NEW.name, StatusType.VERIFIED.name,
+                                                 StatusType.INFORMATION_REQUESTED.name) and \
+        RequestInformationWorkflow.objects.filter(incident_id=incident_id, is_information_provided=False).exists()
+    close_comment = None
+    if current_status == StatusType.CLOSED.name:
+        close_comment = CloseWorkflow.objects.filter(incident_id=incident_id).order_by(
+            "-created_date").values_list("comment", flat=True).first()
+
+    reply, messages = get_public_status_reply(current_status, has_pending_request, close_comment)
+    previous_refId = PublicIncidentStatus.objects.filter(incident_id=incident_id).values_list(
+        "refId", flat=True).first()
+    PublicIncidentStatus.objects.update_or_create(
+        incident_id=incident_id,
+        defaults={"refId": incident["refId"], "reply": reply, "messages": json.dumps(messages)}
+    )
+
+    refIds = { refId for refId in (previous_refId, incident["refId"]) if refId }
+    transaction.on_commit(lambda: cache.delete_many([get_public_status_cache_key(refId) for refId in refIds]))
+
+def get_public_status_state(incident):
+    if "refId" not in incident.__dict__ or "current_status" not in incident.__dict__:
+        return None
+    return (incident.refId, incident.current_status)
+
+@receiver(post_init, sender=Incident)
+def remember_public_status_state(sender, instance, **kwargs):
+    instance._public_status_state = get_public_status_state(instance)
+
+@receiver(post_save, sender=Incident)
+def update_incident_public_status(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    state = get_public_status_state(instance)
+    if created or state is None or state != instance._public_status_state:
+        refresh_public_status(instance.id)
+    instance._public_status_state = state
+
+@receiver(post_save, sender=RequestInformationWorkflow)
+@receiver(post_save, sender=CloseWorkflow)
+def update_workflow_public_status(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_public_status(instance.incident_id)
+
+
+class SearchTerm(models.Model):
+    """ A word of an incident, see search.py """
+    term = models.CharField(max_length=64)
+    incident = models.ForeignKey(Incident, on_delete=models.CASCADE, related_name="search_terms")
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["term", "incident"]),
+        ]
+
+def get_search_state(incident):
+    fields = ("refId", "title", "description", "reporter_id")
+    if any(field not in incident.__dict__ for field in fields):
+        return None
+    return tuple(incident.__dict__[field] for field in fields)
+
+@receiver(post_init, sender=Incident)
+def remember_search_state(sender, instance, **kwargs):
+    instance._search_state = get_search_state(instance)
+
+@receiver(post_save, sender=Incident)
+def update_incident_search_index(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    state = get_search_state(instance)
+    if created or state is None or state != instance._search_state:
+        from .search import index_incident
+        index_incident(instance.id)
+    instance._search_state = state
+
+@receiver(post_save, sender=IncidentComment)
+def update_comment_search_index(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    from .search import index_incident
+    index_incident(instance.incident_id)
+
+def get_reporter_search_state(reporter):
+    fields = ("name", "sn_name", "tm_name")
+    if any(field not in reporter.__dict__ for field in fields):
+        return None
+    return tuple(reporter.__dict__[field] for field in fields)
+
+@receiver(post_init, sender=Reporter)
+def remember_reporter_search_state(sender, instance, **kwargs):
+    instance._search_state = get_reporter_search_state(instance)
+
+@receiver(post_save, sender=Reporter)
+def update_reporter_search_index(sender, instance, created, raw=False, **kwargs):
+    if raw or created:
+        return
+
+    # the names of the reporter are indexed with each of the reporter's incidents
+    state = get_reporter_search_state(instance)
+    if state is None or state != instance._search_state:
+        from .search import index_incident
+        for incident_id in Incident.objects.filter(reporter_id=instance.id).values_list("id", flat=True):
+            index_incident(incident_id)
+    instance._search_state = state
@@ -0,0 +1,184 @@
+"""Incident search index
+
+An inverted index of the words in an incident's refId, title, description,
+reporter name (english, sinhala and tamil) and comments. SearchTerm holds
+one row per (word, incident) with a weight telling where the word was found,
+so a query is a few index range scans instead of LIKE '%..%' over the
+description column.
+
+The index is updated by the signals in models.py as incidents, reporters and
+comments are saved, was filled for the existing incidents by migration 0010
+and can be rebuilt with `rebuild_search_index`.
+"""
+
+import re
+import unicodedata
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Q, Max, Sum, Case, When, Value, IntegerField, OuterRef, Subquery
+
+from .models import Incident, IncidentComment, SearchTerm
+
+# \w misses the vowel signs (combining marks) of sinhala and tamil words
+WORD = re.compile(r"[\w\u0300-\u036f\u0b80-\u0bff\u0d80-\u0dff]+")
+# queries like GMS/EC/2020/41 look up the refId as a whole
+REFID = re.compile(r"^\S+/\S+$")
+# joiners change how sinhala conjuncts are drawn, not the word
+JOINERS = dict.fromkeys(map(ord, "\u200c\u200d"))
+
+MAX_TERM_LENGTH = 64
+MIN_TERM_LENGTH = 2
+# shorter query words (and numbers) match whole indexed words only, a one or
+# two letter prefix would match a large part of the index
+MIN_PREFIX_LENGTH = 3
+MAX_QUERY_TERMS = 8
+REBUILD_CHUNK_SIZE = 500
+
+REFID_WEIGHT = 8
+TITLE_WEIGHT = 5
+REPORTER_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+COMMENT_WEIGHT = 1
+
+
+def tokenize(text, min_length=MIN_TERM_LENGTH) -> list:
+    """ normalized words of the text in order, without duplicates """
+    if not text:
+        return []
+
+    text = unicodedata.normalize("NFKC", text).translate(JOINERS).casefold()
+    terms = []
+    for word in WORD.findall(text):
+        word = word.strip("_")[:MAX_TERM_LENGTH]
+        if len(word) >= min_length or word.isdigit():
+            terms.append(word)
+
+    return list(dict.fromkeys(terms))
+
+
+def add_terms(weights, text, weight):
+    for term in tokenize(text):
+        weights[term] = weights.get(term, 0) + weight
+
+
+def get_incident_terms(incident, reporter, comments) -> dict:
+    """ weight of every term of the incident, higher for words found in more
+        prominent fields
+    """
+    weights = {}
+    add_terms(weights, incident.refId, REFID_WEIGHT)
+    if incident.refId:
+        refId = incident.refId.strip().casefold()[:MAX_TERM_LENGTH]
+        weights[refId] = weights.get(refId, 0) + REFID_WEIGHT
+    add_terms(weights, incident.title, TITLE_WEIGHT)
+    add_terms(weights, incident.description, DESCRIPTION_WEIGHT)
+    if reporter is not None:
+        for name in (reporter.name, reporter.sn_name, reporter.tm_name):
+            add_terms(weights, name, REPORTER_WEIGHT)
+    for comment in comments:
+        for body in (comment.body, comment.sn_body, comment.tm_body):
+            add_terms(weights, body, COMMENT_WEIGHT)
+    return weights
+
+
+def index_incident(incident_id):
+    """ brings the index of one incident up to date, only changed terms are written """
+    incident = Incident.objects.select_related("reporter").filter(id=incident_id).only(
+        "refId", "title", "description", "reporter__name", "reporter__sn_name", "reporter__tm_name").first()
+    if incident is None:
+        return
+
+    comments = IncidentComment.objects.filter(incident_id=incident_id, is_active=True).only(
+        "body", "sn_body", "tm_body")
+    weights = get_incident_terms(incident, incident.reporter, comments)
+
+    with transaction.atomic():
+        indexed = dict(SearchTerm.objects.filter(incident_id=incident_id).values_list("term", "weight"))
+
+        removed = [term for term in indexed if term not in weights]
+        if removed:
+            SearchTerm.objects.filter(incident_id=incident_id, term__in=removed).delete()
+
+        for term, weight in weights.items():
+            if term in indexed and indexed[term] != weight:
+                SearchTerm.objects.filter(incident_id=incident_id, term=term).update(weight=weight)
+
+        SearchTerm.objects.bulk_create([
+            SearchTerm(term=term, incident_id=incident_id, weight=weight)
+            for term, weight in weights.items() if term not in indexed
+        ])
+
+
+def rebuild_search_index(chunk_size=REBUILD_CHUNK_SIZE) -> int:
+    """ reindexes every incident, a chunk per transaction so that searches
+        keep working while it runs. Returns the number of incidents indexed.
+    """
+    indexed = 0
+    last_id = None
+    while True:
+        incidents = Incident.objects.select_related("reporter").only(
+            "refId", "title", "description", "reporter__name", "reporter__sn_name", "reporter__tm_name"
+        ).order_by("id")
+        if last_id is not None:
+            incidents = incidents.filter(id__gt=last_id)
+        incidents = list(incidents[:chunk_size])
+        if not incidents:
+            break
+
+        comments = {}
+        for comment in IncidentComment.objects.filter(incident__in=incidents, is_active=True).only(
+                "incident_id", "body", "sn_body", "tm_body"):
+            comments.setdefault(comment.incident_id, []).append(comment)
+
+        with transaction.atomic():
+            SearchTerm.objects.filter(incident__in=incidents).delete()
+            SearchTerm.objects.bulk_create([
+                SearchTerm(term=term, incident_id=incident.id, weight=weight)
+                for incident in incidents
+                for term, weight in get_incident_terms(
+                    incident, incident.reporter, comments.get(incident.id, [])).items()
+            ], batch_size=500)
+
+        indexed += len(incidents)
+        last_id = incidents[-1].id
+
+    return indexed
+
+
+def get_term_lookup(term) -> Q:
+    if len(term) < MIN_PREFIX_LENGTH:
+        return Q(term=term)
+    return Q(term__startswith=term)
+
+
+def search_incidents(incidents, query):
+    """ incidents having every word of the query (as a prefix of an indexed
+        word, or the word itself when shorter than MIN_PREFIX_LENGTH),
+        annotated with `search_rank`. Single letters are ignored, a query of
+        single letters returns every incident with a rank of 0.
+    """
+    query = query.strip()
+    if REFID.match(query):
+        terms = [query.casefold()[:MAX_TERM_LENGTH]]
+    else:
+        terms = tokenize(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        return incidents.annotate(search_rank=Value(0, output_field=IntegerField()))
+
+    lookups = [get_term_lookup(term) for term in terms]
+    matches = SearchTerm.objects.filter(reduce(or_, lookups)).order_by()
+
+    matched_terms = {
+        "matched_%d" % i: Max(Case(When(lookup, then=Value(1)), default=Value(0), output_field=IntegerField()))
+        for i, lookup in enumerate(lookups)
+    }
+    matched_incidents = matches.values("incident_id").annotate(**matched_terms).filter(
+        **{ name: 1 for name in matched_terms }).values("incident_id")
+
+    rank = matches.filter(incident_id=OuterRef("pk")).values("incident_id").annotate(
+        rank=Sum("weight")).values("rank")
+
+    return incidents.filter(id__in=matched_incidents).annotate(
+        search_rank=Subquery(rank, output_field=IntegerField()))
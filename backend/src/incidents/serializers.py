@@ -18,13 +18,11 @@ from .models import (
     IncidentPoliceReport,
     IncidentPerson,
     IncidentVehicle,
-    EscalateExternalWorkflow,
     CannedResponse,
     SendCannedResponseWorkflow)
 from ..common.serializers import DistrictSerializer, PoliceStationSerializer
 from ..common.models import PoliceStation
 from ..custom_auth.serializers import UserSerializer
-from django.db.models import Q
 
 class IncidentStatusSerializer(serializers.ModelSerializer):
     class Meta:
@@ -81,7 +79,8 @@ class IncidentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Incident
         exclude = ["created_date", "updated_date", "ds_division", "grama_niladhari",
-                   "current_severity", "complainer_consent", "due_date"]
+                   "current_severity", "complainer_consent", "due_date",
+                   "last_assigned_from", "last_assigned_to"]
         read_only_fields = ['recaptcha']
 
     def get_extra_kwargs(self):
@@ -97,16 +96,11 @@ class IncidentSerializer(serializers.ModelSerializer):
         return extra_kwargs
 
     def get_last_assignment(self, obj):
-        if obj.linked_individuals.count() > 0:
-            last_assignment = EscalateExternalWorkflow.objects.filter(
-                Q(incident=obj) & Q(is_action_completed=False) & Q(is_internal_user=True)
-            ).order_by('-id').first()
-
-            if last_assignment is not None:
-                return {
-                    "assigned_from": last_assignment.actioned_user.profile.division.__str__(),
-                    "assigned_to": last_assignment.escalated_user.profile.division.__str__()
-                }
+        if obj.last_assigned_to is not None:
+            return {
+                "assigned_from": obj.last_assigned_from,
+                "assigned_to": obj.last_assigned_to
+            }
 
 class IncidentPersonSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(required=False, write_only=False)
@@ -1,6 +1,9 @@
 import os
+import uuid
+import base64
+import hashlib
+import logging
 import requests
-import _thread
 
 from .models import (
     Incident,
@@ -23,32 +26,42 @@ from .models import (
     ReopenWorkflow,
     CannedResponse,
     SendCannedResponseWorkflow,
-    Category
+    RefIdSequence,
+    UserWorkload,
+    CLOSED_STATUSES,
+    Category,
+    PublicIncidentStatus,
+    get_public_status_cache_key
 )
 from ..common.models import (Channel)
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.utils.dateparse import parse_datetime
 
 from ..events import services as event_services
 from ..events.models import Event
 from ..file_upload.models import File
 from ..custom_auth.models import Division, UserLevel, Profile, Organization
-from django.db import connection
+from ..custom_auth.caches import get_level_permissions, get_hierarchy
+from django.db import connection, transaction, IntegrityError
 
 from datetime import datetime
 from .exceptions import WorkflowException, IncidentException
 import pandas as pd
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from xhtml2pdf import pisa
+import csv
 import json
 from rest_framework.renderers import StaticHTMLRenderer
-from django.db.models import Q
+from rest_framework.exceptions import ParseError
+from django.db.models import Q, F, Count, QuerySet, prefetch_related_objects
 from .permissions import *
 
 from ..notifications.services import add_notification
 from ..notifications.models import NotificationType
+from ..notifications import outbox
+from ..instrumentation import external_call
 
-from django.core.mail import send_mail
 
 from .serializers import IncidentCommentSerializer
 
@@ -56,62 +69,112 @@ from zeep import Client
 from zeep.wsse.username import UsernameToken
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
-def generate_refId(user):
-    """ Function to generate refId for requests on creation """
+logger = logging.getLogger(__name__)
+
+REFID_FORMAT = "GMS/%s/%s/%d"
+
+def get_last_issued_refId_number(organization_code: str, year: int) -> int:
+    """ highest number issued for the organization and year before
+        refId sequences existed
+    """
+    prefix = "GMS/%s/%s/" % (organization_code, year)
+
+    last_number = 0
+    for refId in Incident.objects.filter(refId__startswith=prefix).values_list("refId", flat=True):
+        number = refId[len(prefix):]
+        if number.isdigit():
+            last_number = max(last_number, int(number))
+
+    return last_number
+
+def get_refId_sequence(organization_code: str, year: int) -> RefIdSequence:
+    """ returns the sequence row for the organization and year locked for
+        update, must be called within a transaction
+    """
+    try:
+        return RefIdSequence.objects.select_for_update().get(organization_code=organization_code, year=year)
+    except RefIdSequence.DoesNotExist:
+        pass
+
+    try:
+        with transaction.atomic():
+            # first refId of the year for the organization, continue from
+            # whatever was issued before the sequence existed
+            return RefIdSequence.objects.create(
+                organization_code=organization_code,
+                year=year,
+                last_value=get_last_issued_refId_number(organization_code, year)
+            )
+    except IntegrityError:
+        # created by a parallel request
+        return RefIdSequence.objects.select_for_update().get(organization_code=organization_code, year=year)
+
+def reserve_refId_numbers(organization_code: str, count: int = 1, year: int = None) -> range:
+    """ Reserves a block of consecutive refId numbers for the organization
+        and returns them. Numbers are never handed out twice, even for
+        parallel requests.
+    """
+    if count < 1:
+        raise IncidentException("Invalid refId block size")
 
-    today = datetime.now().replace(month=1, day=1, hour=0, minute=0, second=0)
-    current_count = Incident.objects.filter(created_date__gte=today).count()
+    if year is None:
+        year = datetime.now().year
 
+    with transaction.atomic():
+        sequence = get_refId_sequence(organization_code, year)
+        first_number = sequence.last_value + 1
+        RefIdSequence.objects.filter(id=sequence.id).update(last_value=F("last_value") + count)
+
+    return range(first_number, first_number + count)
+
+def get_refId_organization_code(user) -> str:
     if user == "GUEST" :
-        default_division = Division.objects.get(is_default_division=True)
-        refId = "GMS/%s/%s/%d" % (default_division.organization.code.upper(), str(today.year), current_count + 1)
-    else:
-        profile = Profile.objects.get(user=user)
-        refId = "GMS/%s/%s/%d" % (profile.organization.code.upper(), str(today.year), current_count + 1)
+        default_division = Division.objects.select_related("organization").get(is_default_division=True)
+        return default_division.organization.code.upper()
+
+    profile = Profile.objects.select_related("organization").get(user=user)
+    return profile.organization.code.upper()
 
-    return refId
+def generate_refIds(user, count: int) -> list:
+    """ Function to generate a block of refIds, ex: for bulk or SMS intake """
+
+    organization_code = get_refId_organization_code(user)
+    year = datetime.now().year
+    numbers = reserve_refId_numbers(organization_code, count, year)
+
+    return [REFID_FORMAT % (organization_code, str(year), number) for number in numbers]
+
+def generate_refId(user):
+    """ Function to generate refId for requests on creation """
+
+    return generate_refIds(user, 1)[0]
 
 def get_incident_status_guest(refId):
     """This function is to annouce public on a incident status"""
-    status = {}
-    try:
-        incident = Incident.objects.get(refId=refId)
-    except Incident.DoesNotExist:
-        status["reply"] = "No records for the given reference number. Please check and submit."
+    cache_key = get_public_status_cache_key(refId)
+    status = cache.get(cache_key)
+    if status is not None:
         return status
 
-    if incident.current_status == StatusType.NEW.name:
-        status["reply"] = "Your request has been received. Please check again later for status updates."
-    elif incident.current_status == StatusType.VERIFIED.name:
-        status["reply"] = "Your request has been acknowledged."
-    elif incident.current_status == StatusType.INFORMATION_REQUESTED.name or has_pending_information_request(incident):
-        # not setting the user to input requested information
-        # status = get_public_status_on_information_request(incident)
-        status["reply"] = "Your request requires further information to proceed. Reach us ealiest or we will contact \
-            you soon, for more information"
-    elif incident.current_status == StatusType.ACTION_PENDING.name or incident.current_status == StatusType.ACTION_TAKEN.name \
-        or incident.current_status == StatusType.INFORMATION_PROVIDED.name:
-        status["reply"] = "Your request is currently being attended to."
-    elif incident.current_status == StatusType.CLOSED.name:
-        status = get_public_status_on_close(incident)
-    elif incident.current_status == StatusType.INVALIDATED.name:
-        status["reply"] = "We regret, we will not be able to proceed with your request at this time. \
-            Please feel free to access this system for future needs or requests. We look forward to serving you."
+    public_status = PublicIncidentStatus.objects.filter(refId=refId).first()
+    if public_status is None:
+        status = { "reply": "No records for the given reference number. Please check and submit." }
+    else:
+        status = public_status.as_status()
 
+    # the projection's signals clear this key, the timeout only bounds staleness
+    cache.set(cache_key, status, settings.PUBLIC_STATUS_CACHE_TIMEOUT)
     return status
 
 def has_pending_information_request(incident):
     """ function that returns boolean, on pending information requests """
 
-    requests = RequestInformationWorkflow.objects.filter(incident=incident, is_information_provided=False)
-    if len(requests) > 0 :
-        return True
-    else:
-        return False
+    return RequestInformationWorkflow.objects.filter(incident=incident, is_information_provided=False).exists()
 
 
 def get_public_status_on_information_request(incident):
@@ -143,76 +206,16 @@ def get_public_status_on_information_request(incident):
 
     return status
 
-def get_public_status_on_close(incident):
-    status = {}
-    messages = []
-
-    # FIXME: check for status type on StatusType.CLOSED.name
-    # prepare resolution messages
-    close = CloseWorkflow.objects.filter(incident=incident).order_by('-created_date')
-    output = {}
-    output["header"] = "Resolution"
-    # get the last close comment
-    output["content"] = close[0].comment
-    messages.append(output)
-
-    status["reply"] = "Your request has been resolved and closed."
-    status["messages"] = messages
-
-    return status
-
 def send_email(subject, message, receivers):
-    try :
-        send_mail(
-            subject,
-            message,
-            settings.EMAIL_FROM_ADDRESS,
-            receivers,
-            fail_silently=False,
-        )
-        print("email sent to:")
-        print(*receivers)
-
-    except Exception as e:
-        print("email sending failed to :")
-        print(*receivers)
-        print(e)
+    """ queues the email in the outbox, sent after the current transaction commits """
+    outbox.queue_email(subject, message, receivers)
 
 
 def send_sms(number, message):
-    number = "94" + number[-9:]
-    headers = {'content-type': 'text/xml'}
-
-    body = """<?xml version='1.0' encoding='utf-8'?>
-<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:v1="http://schemas.icta.lk/xsd/kannel/handler/v1/" soapenv:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
-<soapenv:Header>
-<govsms:authData xmlns:govsms="http://govsms.icta.lk/">
-<govsms:user>{2}</govsms:user>
-<govsms:key>{3}</govsms:key>
-</govsms:authData>
-</soapenv:Header>
-<soapenv:Body>
-<v1:SMSRequest>
-<v1:requestData>
-<v1:outSms>{1}</v1:outSms>
-<v1:recepient>{0}</v1:recepient>
-<v1:depCode>IctaTest</v1:depCode>
-<v1:smscId/>
-<v1:billable/>
-</v1:requestData>
-</v1:SMSRequest>
-</soapenv:Body>
-</soapenv:Envelope>
-""".format(number, message, settings.SMS_GATEWAY_USER, settings.SMS_GATEWAY_PASSWORD)
-
-    response = requests.post(settings.SMS_GATEWAY_BASE_URL+"/services/GovSMSMTHandlerProxy?wsdl",data=body,headers=headers)
-    print("response")
-    print(response.status_code)
-    print(response.reason)
+    outbox.queue_sms([number], message)
 
 def send_sms_to_list(recievers, message):
-    for reciever in recievers:
-        send_sms(reciever, message)
+    outbox.queue_sms(recievers, message)
 
 def send_incident_changed_email_sms(incident, subject, message):
     """ function to send email and sms to reporters and recipient to the given incident. """
@@ -232,26 +235,17 @@ def send_incident_changed_email_sms(incident, subject, message):
             sms_recievers.append(incident.recipient.mobile)
 
     if email_recievers :
-        print("sending email")
-        try:
-            _thread.start_new_thread( send_email, ( subject, message, email_recievers) )
-        except:
-            print ("Error: unable to start information requested email sending thread")
+        send_email(subject, message, email_recievers)
 
     if sms_recievers :
-        print("sending sms")
-        try:
-            _thread.start_new_thread( send_sms_to_list, (sms_recievers, message))
-        except Exception as e:
-            print("information requested sms sending failed with exception: ")
-            print(e)
+        send_sms_to_list(sms_recievers, message)
 
 def send_incident_created_mail_sms(reporter_id):
     """ request created content for correspondance """
 
     # reporter = get_reporter_by_id(reporter_id)
     incident = Incident.objects.get(reporter=reporter_id)
-    print("sending incident created email and sms")
+    logger.info("sending incident created email and sms for %s", incident.refId)
     subject = 'Your Request Recieved'
     message = """Your request has been received and is being attended to.
 Ref ID: {0}
@@ -272,10 +266,11 @@ def validateRecaptcha(response: str) -> bool:
         'secret': os.environ.get('RECAPTCHA_SECRET_KEY'),
         'response': response
     }
-    validationResponse = requests.post(
-        'https://www.google.com/recaptcha/api/siteverify',
-        params
-    )
+    with external_call("recaptcha"):
+        validationResponse = requests.post(
+            'https://www.google.com/recaptcha/api/siteverify',
+            params
+        )
     return validationResponse.json()['success']
 
 
@@ -346,124 +341,165 @@ def get_guest_user():
     except:
         raise IncidentException("No guest user available")
 
-def user_level_has_permission(user_level: UserLevel, permission: Permission):
-    permissions = Permission.objects.filter(group=user_level.role)
-    return permission in permissions
+def user_level_has_permission(user_level: UserLevel, permission):
+    """ permission can be given as a codename or a Permission object """
+    codename = permission.codename if isinstance(permission, Permission) else permission
+    return codename in get_level_permissions(user_level)
+
+def find_least_loaded_user(candidates) -> User:
+    """ candidates is a list of (division, user level) pairs in order of
+        preference. Returns the least loaded active user of the first pair
+        that has one, using a single query over the UserWorkload counters.
+    """
+    candidates = [(division.id, level.id) for division, level in candidates if level.role_id is not None]
+    if len(candidates) == 0:
+        return None
+
+    workloads = UserWorkload.objects.filter(
+        division_id__in=set(division_id for division_id, _ in candidates),
+        level_id__in=set(level_id for _, level_id in candidates),
+        is_active=True
+    ).select_related("user").order_by("open_incidents", "user_id")
+
+    least_loaded = {}
+    for workload in workloads:
+        least_loaded.setdefault((workload.division_id, workload.level_id), workload)
+
+    for candidate in candidates:
+        if candidate in least_loaded:
+            return least_loaded[candidate].user
+
+    return None
 
 def get_user_from_level(user_level: UserLevel, division: Division) -> User:
 
     """ This function would take in a user level and find the user
         within the level that has the least workload
-        It will query the assignee counts for each user and get the
-        one with lowest assignments
+        It reads the maintained open incident counts of the users in the
+        level, see UserWorkload
     """
 
-    sql = """
-            SELECT usr.id, COUNT(incident.id) as incident_count FROM `custom_auth_user` as usr
-            LEFT JOIN incidents_incident as incident on incident.assignee_id = usr.id
-            INNER JOIN custom_auth_profile as prf on prf.user_id = usr.id
-            INNER JOIN custom_auth_userlevel as ulvl on prf.level_id = ulvl.id
-            INNER JOIN auth_group as grp on ulvl.role_id = grp.id
-            INNER JOIN custom_auth_division as udiv on prf.division_id = udiv.id
-            WHERE ulvl.code = "%s" AND udiv.code = "%s" AND usr.is_active = true
-            GROUP BY usr.id
-            ORDER BY incident_count ASC
-          """ % (user_level.code, division.code)
+    return find_least_loaded_user([(division, user_level)])
 
-    with connection.cursor() as cursor:
-        cursor.execute(sql)
-        row = cursor.fetchone()
-
-        if row is None:
-            return None
+def rebuild_user_workloads() -> int:
+    """ Recounts the open incidents of every user and repairs the
+        UserWorkload rows that drifted. Returns the number of rows fixed.
+    """
+    open_counts = dict(
+        Incident.objects.filter(assignee__isnull=False)
+            .exclude(current_status__in=CLOSED_STATUSES)
+            .values_list("assignee_id")
+            .annotate(Count("id"))
+            .order_by()
+    )
+    workloads = { workload.user_id: workload for workload in UserWorkload.objects.all() }
+
+    new_workloads = []
+    changed_workloads = []
+    for user_id, is_active, division_id, level_id in User.objects.values_list(
+            "id", "is_active", "profile__division", "profile__level"):
+        expected = {
+            "division_id": division_id,
+            "level_id": level_id,
+            "is_active": is_active,
+            "open_incidents": open_counts.get(user_id, 0)
+        }
+        workload = workloads.get(user_id)
 
-        try:
-            assignee = User.objects.get(id=row[0])
-            return assignee
-        except:
-            return None
+        if workload is None:
+            new_workloads.append(UserWorkload(user_id=user_id, **expected))
+        elif any(getattr(workload, field) != value for field, value in expected.items()):
+            for field, value in expected.items():
+                setattr(workload, field, value)
+            changed_workloads.append(workload)
 
-def find_candidate_from_division(current_division: Division, current_level: UserLevel, required_permission: Permission=None):
-    parent_level = current_level.parent
+    with transaction.atomic():
+        UserWorkload.objects.bulk_create(new_workloads, batch_size=500)
+        UserWorkload.objects.bulk_update(changed_workloads,
+            ["division_id", "level_id", "is_active", "open_incidents"], batch_size=500)
 
-    new_assignee = None
+    return len(new_workloads) + len(changed_workloads)
 
-    while new_assignee is None:
-        if parent_level is None:
-            # reached the top most position of current division
-            break
+def get_candidate_levels(current_level: UserLevel, required_permission=None):
+    """ parent levels of the given level, nearest first, that may take
+        over an incident. Resolved from the cached hierarchy, no queries.
+    """
+    hierarchy = get_hierarchy()
+    candidate_levels = []
 
-        if required_permission is None or (
-            required_permission is not None and user_level_has_permission(parent_level, required_permission)
-        ):
-            assignee = get_user_from_level(parent_level, current_division)
+    # traversing upwards the user hierarchy
+    for parent_level in hierarchy.get_parent_levels(current_level):
+        if required_permission is None or hierarchy.level_has_permission(parent_level, required_permission):
+            candidate_levels.append(parent_level)
 
-            if assignee is not None:
-                new_assignee = assignee
-                break
+    return candidate_levels
 
-        # if the current user level doesn't have the permission or no assignees from
-        # current level
-        # check the parent user level of the current parent
-        # ie: traversing upwards the user hierarchy
-        parent_level = parent_level.parent
+def find_candidate_from_division(current_division: Division, current_level: UserLevel, required_permission=None):
+    candidate_levels = get_candidate_levels(current_level, required_permission)
 
-    return new_assignee
+    return find_least_loaded_user([(current_division, level) for level in candidate_levels])
 
 
 def find_escalation_candidate(current_user: User) -> User:
     """ This function finds an esclation candidate within the
         <b>same organization</b>
     """
-    current_division = current_user.profile.division
-    current_level = current_user.profile.level
+    hierarchy = get_hierarchy()
+    profile = current_user.profile
+    current_division = hierarchy.get_division(profile.division_id)
+    current_level = hierarchy.get_level(profile.level_id)
+
+    if current_division is None or current_level is None:
+        raise WorkflowException("Can't find escalation candidate for current user")
+
+    candidate_levels = get_candidate_levels(current_level)
 
     # first check if we can find a candidate from the same division
     # ex: EC Gampaha Cordinator -> EC Gampaha Manager
-    new_assignee = find_candidate_from_division(current_division, current_level)
-
-    # either found an assignee or exhausted the current division
-    if new_assignee is not None:
-        return new_assignee
+    candidates = [(current_division, level) for level in candidate_levels]
 
-    # this part means we have to search in the HQ of the organization
-    # for an assignee
-    hq_division = Division.objects.get(Q(is_hq=True) &
-                                        Q(organization=current_user.profile.organization))
-    if hq_division is None:
-        raise WorkflowException("Organization Hierarchy Configure Error - No HQ defined")
+    # once the current division is exhausted, we have to search in the HQ
+    # of the organization, starting from the same level as the current
+    # user's parent. if current user is Cordinator, we start with Managers
+    # in HQ. both divisions are read in the same query
+    hq_division = hierarchy.get_hq_division(profile.organization_id)
+    if hq_division is not None:
+        candidates += [(hq_division, level) for level in candidate_levels]
 
-    # in the new divsion, we start the search from the
-    # same level as the current user's parent
-    # if current user is Cordinator, we start with Managers in HQ
-    new_assignee = find_candidate_from_division(hq_division, current_level)
+    new_assignee = find_least_loaded_user(candidates)
 
     if new_assignee is None:
+        if hq_division is None:
+            raise WorkflowException("Organization Hierarchy Configure Error - No HQ defined")
         raise WorkflowException("Can't find escalation candidate for current user")
 
     return new_assignee
 
 def find_incident_assignee(current_user: User):
     assignee = None
-    required_permission = Permission.objects.get(codename=CAN_MANAGE_INCIDENT)
-    default_division = Division.objects.get(is_default_division=True)
+    required_permission = CAN_MANAGE_INCIDENT
+    hierarchy = get_hierarchy()
+    default_division = hierarchy.default_division
+    if default_division is None:
+        raise WorkflowException("Organization Hierarchy Configure Error - No default division defined")
+    current_level = hierarchy.get_level(current_user.profile.level_id)
 
     # first if a public user case
     if current_user.username == "guest":
         # guest is a user level under EC organization
         # ideally we can check if the parent of the current user has
         # permissions
-        assignee = find_candidate_from_division(default_division, current_user.profile.level)
+        assignee = find_candidate_from_division(default_division, current_level)
 
     else:
         # this is a logged in user
         # first check if the current user has the permission to manage an incident
-        if user_level_has_permission(current_user.profile.level, required_permission):
+        if user_level_has_permission(current_level, required_permission):
             # if so assign it to self
             return current_user
         else:
             # if not, first check if the current user is from EC -> or default org
-            if current_user.profile.organization == default_division.organization:
+            if current_user.profile.organization_id == default_division.organization_id:
                 # then we can do a escalation on the assignment
                 assignee = find_escalation_candidate(current_user)
             else:
@@ -471,7 +507,8 @@ def find_incident_assignee(current_user: User):
                 # then we ONLY try to assign this to someone at the EC HQ
                 # ie: default division HQ
                 guest_user = get_guest_user()
-                assignee = find_candidate_from_division(default_division, guest_user.profile.level)
+                guest_level = hierarchy.get_level(guest_user.profile.level_id)
+                assignee = find_candidate_from_division(default_division, guest_level)
 
     if assignee is None:
         raise WorkflowException("Error in finding assignee")
@@ -589,23 +626,105 @@ def get_incidents_before_date(date: str) -> Incident:
     except Exception as e:
         return None
 
-def get_incident_list_by_organization_code(org_code):
-    """ get all incident assigned or linked to given orgnization """
-    # get orgnization id
-    org = Organization.objects.get(code=org_code)
+def filter_incidents_by_organization(incidents, org_code):
+    """ incidents linked to any user of the given organization, external
+        organizations are always listed on linked individuals
+    """
+    linked = Incident.linked_individuals.through.objects.filter(
+        user__profile__organization__code=org_code).values("incident_id")
+    return incidents.filter(id__in=linked)
+
+# relations IncidentSerializer walks for every row of a list page
+INCIDENT_LIST_RELATED = (
+    "reporter",
+    "assignee__profile__organization",
+    "assignee__profile__division",
+    "assignee__profile__level",
+)
+
+def prefetch_incident_list(incidents):
+    """ Loads everything IncidentSerializer needs for a page of incidents
+        up front, so serializing a page costs a fixed number of queries
+        regardless of the page size.
+        Accepts either a queryset (before pagination) or a list of incidents.
+    """
+    lookups = (
+        "linked_individuals",
+    )
+
+    if isinstance(incidents, QuerySet):
+        return incidents.select_related(*INCIDENT_LIST_RELATED).prefetch_related(*lookups)
+
+    prefetch_related_objects(incidents, *INCIDENT_LIST_RELATED, *lookups)
+    return incidents
+
 
-    # get user list of the organization
-    profiles = Profile.objects.filter(organization=org)
+INCIDENT_COUNT_CACHE_KEY = "incidents:list_count:%s"
 
-    all_incidents = []
-    # all external organizations will all ways be listed on linked-individuals
-    for profile in profiles:
-        incidents = Incident.objects.filter(linked_individuals__id=profile.user_id)
-        for incident in incidents:
-            if incident not in all_incidents:
-                all_incidents.append(incident)
+def encode_incident_cursor(incident, ranked=False) -> str:
+    """ opaque cursor of the position after the incident: its due date and
+        id, and its search rank for a search
+    """
+    values = [incident.due_date.isoformat() if incident.due_date else None, str(incident.id)]
+    if ranked:
+        values.insert(0, incident.search_rank)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
 
-    return all_incidents
+def decode_incident_cursor(cursor: str, ranked=False):
+    """ (search rank, due date, id) of a cursor, the rank is None unless ranked """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        rank = int(values.pop(0)) if ranked else None
+        due_date, incident_id = values
+        if due_date is not None:
+            due_date = parse_datetime(due_date)
+            if due_date is None:
+                raise ValueError(due_date)
+        return rank, due_date, uuid.UUID(incident_id)
+    except (ValueError, TypeError, AttributeError, IndexError):
+        # client input, a 400
+        raise ParseError("Invalid cursor")
+
+def get_incident_page_after(incidents, cursor=None, page_size=15, ranked=False):
+    """ A page of the incident list in due date order (search rank first
+        when ranked), starting after the position of the cursor. Costs the
+        same on any page as it seeks on the (due_date, id) index instead of
+        skipping rows, and holds while the incidents of earlier pages change.
+        Returns (incidents, cursor of the next page or None)
+    """
+    ordering = ("due_date", "id")
+    if ranked:
+        ordering = ("-search_rank",) + ordering
+    incidents = incidents.order_by(*ordering)
+
+    if cursor is not None:
+        rank, due_date, incident_id = decode_incident_cursor(cursor, ranked)
+        if due_date is None:
+            # incidents without a due date come first (mysql orders nulls first)
+            after = Q(due_date__isnull=True, id__gt=incident_id) | Q(due_date__isnull=False)
+        else:
+            after = Q(due_date__gt=due_date) | Q(due_date=due_date, id__gt=incident_id)
+        if ranked:
+            after = Q(search_rank__lt=rank) | (Q(search_rank=rank) & after)
+        incidents = incidents.filter(after)
+
+    incidents = list(incidents[:page_size + 1])
+    next_cursor = encode_incident_cursor(incidents[page_size - 1], ranked) if len(incidents) > page_size else None
+    return incidents[:page_size], next_cursor
+
+def get_cached_incident_count(incidents) -> int:
+    """ size of a filtered incident list, cached per filter (the query) for
+        INCIDENT_LIST_COUNT_CACHE_TIMEOUT seconds, so it can lag a little
+    """
+    incidents = incidents.order_by()
+    sql, params = incidents.query.sql_with_params()
+    cache_key = INCIDENT_COUNT_CACHE_KEY % hashlib.sha1(("%s %r" % (sql, params)).encode()).hexdigest()
+
+    count = cache.get(cache_key)
+    if count is None:
+        count = incidents.count()
+        cache.set(cache_key, count, settings.INCIDENT_LIST_COUNT_CACHE_TIMEOUT)
+    return count
 
 
 def incident_escalate(user: User, incident: Incident, escalate_dir: str = "UP", comment=None, response_time=None):
@@ -671,16 +790,12 @@ def incident_change_assignee(user: User, incident: Incident, assignee: User):
     incident.save()
 
     # request assigned email
-    print("sending request assigned email")
+    logger.info("sending request assigned email for %s", incident.refId)
     if assignee.email:
         subject = 'Request Assigned'
         message = 'You have been assigned to a request. Reference ID' + incident.refId
         recievers = [assignee.email]
-        try:
-            _thread.start_new_thread( send_email, ( subject, message, recievers) )
-        except:
-            print ("Error: unable to start thread")
-        print("request assigned email sent")
+        send_email(subject, message, recievers)
 
     event_services.update_workflow_event(user, incident, workflow)
 
@@ -736,7 +851,7 @@ def incident_close(user: User, incident: Incident, details: str):
     workflow.save()
 
     # request closed email and sms
-    print("sending request closed email and sms")
+    logger.info("sending request closed email and sms for %s", incident.refId)
     subject = "Your Request Closed"
     message = """Your request has been resolved.
 Ref ID: {0}
@@ -791,6 +906,9 @@ def incident_escalate_external_action(user: User, incident: Incident, entity: ob
 
     workflow.save()
 
+    if is_internal_user:
+        update_last_assignment(incident)
+
     status = IncidentStatus(
         current_status=StatusType.ACTION_PENDING,
         previous_status=incident.current_status,
@@ -804,6 +922,29 @@ def incident_escalate_external_action(user: User, incident: Incident, entity: ob
 
 
 
+def update_last_assignment(incident: Incident):
+    """ stores the divisions of the latest open internal referral on the
+        incident, shown as the last assignment with every incident
+    """
+    last_assignment = EscalateExternalWorkflow.objects.filter(
+        incident=incident, is_action_completed=False, is_internal_user=True
+    ).select_related(
+        "actioned_user__profile__division__organization",
+        "escalated_user__profile__division__organization",
+    ).order_by("-id").first()
+
+    if last_assignment is None:
+        incident.last_assigned_from = None
+        incident.last_assigned_to = None
+    else:
+        incident.last_assigned_from = str(last_assignment.actioned_user.profile.division)
+        incident.last_assigned_to = str(last_assignment.escalated_user.profile.division)
+
+    Incident.objects.filter(id=incident.id).update(
+        last_assigned_from=incident.last_assigned_from,
+        last_assigned_to=incident.last_assigned_to
+    )
+
 def incident_complete_external_action(user: User, incident: Incident, comment: str, start_event: Event):
     initiated_workflow = start_event.refered_model
 
@@ -825,6 +966,9 @@ def incident_complete_external_action(user: User, incident: Incident, comment: s
 
     initiated_workflow.save()
 
+    if initiated_workflow.is_internal_user:
+        update_last_assignment(incident)
+
     # check if there are any more pending actions
     pending_actions = EscalateExternalWorkflow.objects.filter(Q(incident=incident) & Q(is_action_completed=False))
     if pending_actions.count() == 0:
@@ -865,7 +1009,7 @@ def incident_request_information(user: User, incident: Incident, comment: str):
     incident.save()
 
     # information requested email and sms
-    print("sending information requested email and sms")
+    logger.info("sending information requested email and sms for %s", incident.refId)
     subject = "Your Request Need Information"
     message = """Your request requires further information to proceed.
 Ref ID: {0}
@@ -921,7 +1065,7 @@ def incident_verify(user: User, incident: Incident, comment: str, proof: bool):
     if incident.assignee != user:
         # need to check if the user got permission: 'CAN_ACTION_OVER_CURRENT_ASSIGNEE'
         profile = Profile.objects.get(user_id=user.id)
-        required_permission = Permission.objects.get(codename=CAN_ACTION_OVER_CURRENT_ASSIGNEE)
+        required_permission = CAN_ACTION_OVER_CURRENT_ASSIGNEE
 
         if not user_level_has_permission(profile.level, required_permission):
             raise WorkflowException("Only assignee can verify the incident")
@@ -1043,40 +1187,80 @@ def attach_media(user:User, incident:Incident, uploaded_file:File):
     """ Method to indicate media attachment """
     event_services.media_attached_event(user, incident, uploaded_file)
 
-def get_fitlered_incidents_report(incidents: Incident, output_format: str):
+EXPORT_COLUMNS = ["Ref ID", "Reporter Name", "City", "Submitted Date", "Mode of receipt", "Status", "Priority", "Response Time", "Category"]
 
-    sql = """
-            SELECT i.refId,g.name,i.city,DATE_FORMAT(i.created_date,'%Y-%m-%d') as submitted_date, f.name as channel, i.current_status, i.current_severity, i.response_time, d.sub_category as category
-                FROM incidents_incident i
-                LEFT JOIN (
-                  SELECT c.id, c.sub_category
-                  FROM common_category c
-                ) d
-                ON d.id = i.category
-                LEFT JOIN (
-                    SELECT e.id, e.name FROM common_channel e
-                ) f
-                ON f.id = i.infoChannel
-                LEFT JOIN (
-                    SELECT r.id, r.name FROM incidents_reporter r
-                ) g
-                ON g.id = i.reporter_id
-        """
-    incidentList=[]
-    for incident in incidents:
-        mode_of_receipt=Channel.objects.get(pk=incident.infoChannel)
-        category=Category.objects.get(pk=incident.category)
-        incidentList.append([incident.refId,incident.reporter.name, incident.city, incident.created_date.strftime('%Y-%m-%d'), mode_of_receipt.name,incident.current_status, incident.current_severity,incident.response_time,category.sub_category])
-    dataframe = pd.DataFrame(incidentList)
-    dataframe.columns = ["Ref ID", "Reporter Name", "City", "Submitted Date", "Mode of receipt", "Status", "Priority", "Response Time", "Category"]
+# rows fetched per query while exporting
+EXPORT_CHUNK_SIZE = 2000
+
+class CSVStreamBuffer:
+    """ file like object for csv.writer that hands the written row back
+        instead of storing it
+    """
+    def write(self, value):
+        return value
+
+def iter_incident_export_rows(incidents, chunk_size=EXPORT_CHUNK_SIZE):
+    """ yields export rows of the given incidents in submission order.
+        Incidents are read in keyset chunks of (created_date, id), seeking on
+        its index, with the reporter joined in, so memory use does not depend
+        on the export size. The former pandas export formatted floats as %.2f
+        with a decimal comma: no column is a float (response_time is an
+        integer), the rows are written as they were.
+    """
+    channels = { str(channel_id): name for channel_id, name in Channel.objects.values_list("id", "name") }
+    categories = {
+        str(category_id): sub_category
+        for category_id, sub_category in Category.objects.values_list("id", "sub_category")
+    }
+
+    rows = incidents.order_by("created_date", "id").values_list(
+        "id", "created_date", "refId", "reporter__name", "city", "infoChannel",
+        "current_status", "current_severity", "response_time", "category"
+    ).distinct()
+
+    last_row = None
+    while True:
+        chunk = rows
+        if last_row is not None:
+            chunk = chunk.filter(
+                Q(created_date__gt=last_row[1]) | Q(created_date=last_row[1], id__gt=last_row[0])
+            )
+        chunk = list(chunk[:chunk_size])
+
+        for (_, created_date, refId, reporter_name, city, channel, status,
+                severity, response_time, category) in chunk:
+            yield [
+                refId,
+                reporter_name,
+                city,
+                created_date.strftime('%Y-%m-%d'),
+                channels.get(channel),
+                status,
+                severity,
+                response_time,
+                categories.get(category)
+            ]
+
+        if len(chunk) < chunk_size:
+            break
+        last_row = chunk[-1]
 
+def stream_incidents_csv(incidents, chunk_size=EXPORT_CHUNK_SIZE):
+    writer = csv.writer(CSVStreamBuffer(), delimiter=';')
+    # header goes out before the first query
+    yield writer.writerow(EXPORT_COLUMNS)
+
+    for row in iter_incident_export_rows(incidents, chunk_size):
+        yield writer.writerow(row)
+
+def get_fitlered_incidents_report(incidents: Incident, output_format: str):
     if output_format == "csv":
-        response = HttpResponse(content_type='text/csv')
+        response = StreamingHttpResponse(stream_incidents_csv(incidents), content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename=incidents.csv'
-        dataframe.to_csv(path_or_buf=response,sep=';',float_format='%.2f',index=False,decimal=",")
         return response
 
     if output_format == "html":
+        dataframe = pd.DataFrame(list(iter_incident_export_rows(incidents)), columns=EXPORT_COLUMNS)
         # output = dataframe.to_html(float_format='%.2f',index=False)
         output = write_to_html_file(dataframe, "Incidents")
         output = output.encode('utf-8')
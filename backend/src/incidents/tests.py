@@ -1,3 +1,496 @@
-from django.test import TestCase
+import uuid
+from importlib import import_module
+from datetime import datetime, timezone
 
-# Create your tests here.
+from django.apps import apps
+from django.test import TestCase, TransactionTestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import Group, Permission
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from .models import Incident, IncidentStatus, Reporter, EscalateExternalWorkflow, StatusType, UserWorkload, \
+    CloseWorkflow, RequestInformationWorkflow, IncidentComment, SearchTerm, get_public_status_cache_key
+from .permissions import *
+from .serializers import IncidentSerializer
+from .search import search_incidents, rebuild_search_index, tokenize
+from .services import generate_refId, generate_refIds, reserve_refId_numbers, \
+    get_user_from_level, rebuild_user_workloads, update_last_assignment, incident_escalate_external_action, \
+    incident_complete_external_action, find_escalation_candidate, find_incident_assignee, stream_incidents_csv
+from .exceptions import WorkflowException
+from ..custom_auth.models import Organization, Division, UserLevel
+from ..common.models import Category, Channel
+from ..events.models import Event
+
+User = get_user_model()
+
+
+def create_user(username, organization, division, level):
+    user = User.objects.create(username=username, first_name=username, last_name="user")
+    user.profile.organization = organization
+    user.profile.division = division
+    user.profile.level = level
+    user.profile.save()
+    return user
+
+
+class IncidentListQueryCountTest(TestCase):
+    """ the incident list must not issue queries per listed incident """
+
+    # upper bound for a full list request, including auth and pagination
+    MAX_QUERIES = 8
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        division = Division.objects.create(code="ec-hq", organization=organization,
+                                           division_type="HQ", name="Head Office",
+                                           is_default_division=True, is_hq=True)
+        role = Group.objects.create(name="ec-manager")
+        role.permissions.set(Permission.objects.filter(
+            codename__in=[CAN_REVIEW_ALL_INCIDENTS, CAN_MANAGE_INCIDENT]))
+        level = UserLevel.objects.create(code="manager", displayName="Manager",
+                                         organization=organization, role=role)
+
+        cls.user = create_user("manager1", organization, division, level)
+        assignees = [create_user("manager%d" % i, organization, division, level) for i in range(2, 6)]
+
+        for i in range(30):
+            assignee = assignees[i % len(assignees)]
+            reporter = Reporter.objects.create(title="Mr", name="reporter %d" % i)
+            incident = Incident.objects.create(
+                refId="GMS/EC/2020/%d" % i,
+                title="incident %d" % i,
+                description="description",
+                reporter=reporter,
+                assignee=assignee,
+                current_status=StatusType.NEW.name
+            )
+            incident.linked_individuals.add(cls.user, assignee)
+            EscalateExternalWorkflow.objects.create(
+                incident=incident,
+                actioned_user=cls.user,
+                escalated_user=assignee,
+                is_internal_user=True,
+                comment="refer"
+            )
+            update_last_assignment(incident)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def list_incidents(self, page_size):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/incidents/", {"pageSize": page_size})
+        self.assertEqual(response.status_code, 200)
+        return response, len(context.captured_queries)
+
+    def test_query_count_is_independent_of_page_size(self):
+        # warm up process level caches (permissions etc.)
+        self.list_incidents(5)
+
+        _, small_page_queries = self.list_incidents(5)
+        _, large_page_queries = self.list_incidents(30)
+
+        self.assertEqual(small_page_queries, large_page_queries)
+        self.assertLessEqual(large_page_queries, self.MAX_QUERIES)
+
+    def test_reporter_and_assignment_details_are_listed(self):
+        response, _ = self.list_incidents(30)
+        incidents = response.json()["data"]["incidents"]
+
+        self.assertEqual(len(incidents), 30)
+        for incident in incidents:
+            self.assertEqual(incident["reporterTitle"], "Mr")
+            self.assertTrue(incident["reporterName"].startswith("reporter"))
+            self.assertIn(CAN_REVIEW_ALL_INCIDENTS, incident["assignee"]["userPermissions"])
+            self.assertEqual(incident["lastAssignment"]["assigned_to"],
+                             "Election Commission - HQ: Head Office")
+
+    def test_cursor_pages_cover_the_list_once(self):
+        # half without a due date, the rest sharing a few due dates
+        for i, incident in enumerate(Incident.objects.order_by("refId")[:15]):
+            Incident.objects.filter(id=incident.id).update(due_date=datetime(2020, 5, 1 + i % 3, tzinfo=timezone.utc))
+
+        seen = []
+        query_counts = []
+        cursor = ""
+        while cursor is not None:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get("/incidents/", {"pageSize": 7, "cursor": cursor})
+            query_counts.append(len(context.captured_queries))
+            data = response.json()["data"]
+            seen.extend(incident["id"] for incident in data["incidents"])
+            cursor = data["nextCursor"]
+
+        self.assertEqual(len(seen), 30)
+        self.assertEqual(len(set(seen)), 30)
+        # later pages cost what the second page costs (the first warms up caches)
+        self.assertEqual(len(set(query_counts[1:-1])), 1)
+
+        response = self.client.get("/incidents/", {"cursor": "", "count": "true"})
+        self.assertEqual(response.json()["data"]["count"], 30)
+
+    def get_cursor_pages(self, cursor="", **params):
+        ids = []
+        while cursor is not None:
+            data = self.client.get("/incidents/", dict(params, cursor=cursor)).json()["data"]
+            ids.extend(incident["id"] for incident in data["incidents"])
+            cursor = data["nextCursor"]
+        return ids
+
+    def test_cursor_holds_when_the_last_incident_changes(self):
+        ids = self.get_cursor_pages(pageSize=30)
+        data = self.client.get("/incidents/", {"pageSize": 7, "cursor": ""}).json()["data"]
+        self.assertEqual([incident["id"] for incident in data["incidents"]], ids[:7])
+
+        # the last incident of the page moves to the end of the list, then goes
+        Incident.objects.filter(id=ids[6]).update(due_date=datetime(2030, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(self.get_cursor_pages(data["nextCursor"], pageSize=7), ids[7:] + [ids[6]])
+        EscalateExternalWorkflow.objects.filter(incident_id=ids[6]).delete()
+        Incident.objects.filter(id=ids[6]).delete()
+        self.assertEqual(self.get_cursor_pages(data["nextCursor"], pageSize=7), ids[7:])
+
+    def test_search_cursor_keeps_the_rank(self):
+        commented = list(Incident.objects.order_by("-refId")[:3])
+        for incident in commented:
+            IncidentComment.objects.create(incident=incident, body="incident")
+
+        ids = self.get_cursor_pages(pageSize=4, q="incident")
+        self.assertEqual(len(ids), 30)
+        self.assertEqual(len(set(ids)), 30)
+        self.assertEqual(set(ids[:3]), {str(incident.id) for incident in commented})
+
+    def test_bad_cursor_is_a_client_error(self):
+        for cursor in ("not-an-id", str(uuid.uuid4()), "WyJub3QtYS1kYXRlIl0=", "WzEsIDJd"):
+            response = self.client.get("/incidents/", {"cursor": cursor})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()["data"]["message"], "Invalid cursor")
+
+    def test_organization_filter_composes_with_other_filters(self):
+        police = Organization.objects.create(code="police", displayName="Police")
+        officer = User.objects.create(username="officer")
+        officer.profile.organization = police
+        officer.profile.save()
+        for incident in Incident.objects.filter(refId__in=["GMS/EC/2020/1", "GMS/EC/2020/2"]):
+            incident.linked_individuals.add(officer)
+
+        response = self.client.get("/incidents/", {"organization": "police"})
+        self.assertEqual(response.json()["data"]["count"], 2)
+
+        response = self.client.get("/incidents/", {"organization": "police", "q": "GMS/EC/2020/2"})
+        self.assertEqual([incident["refId"] for incident in response.json()["data"]["incidents"]],
+                         ["GMS/EC/2020/2"])
+
+        # every user of the organization is linked, an incident is still listed once
+        response = self.client.get("/incidents/", {"organization": "ec", "cursor": "", "count": "true"})
+        self.assertEqual(response.json()["data"]["count"], 30)
+
+
+class RefIdSequenceTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        division = Division.objects.create(code="ec-hq", organization=cls.organization,
+                                           division_type="HQ", name="Head Office",
+                                           is_default_division=True, is_hq=True)
+        level = UserLevel.objects.create(code="coordinator", displayName="Coordinator",
+                                         organization=cls.organization)
+        cls.user = create_user("coordinator1", cls.organization, division, level)
+
+    def test_refIds_are_consecutive(self):
+        first = generate_refId(self.user)
+        second = generate_refId("GUEST")
+
+        year = datetime.now().year
+        self.assertEqual(first, "GMS/EC/%d/1" % year)
+        self.assertEqual(second, "GMS/EC/%d/2" % year)
+
+    def test_reserved_blocks_do_not_overlap(self):
+        block = reserve_refId_numbers("EC", 100)
+        refIds = generate_refIds(self.user, 3)
+
+        self.assertEqual(list(block), list(range(1, 101)))
+        self.assertEqual([refId.split("/")[-1] for refId in refIds], ["101", "102", "103"])
+
+    def test_sequence_continues_after_existing_refIds(self):
+        year = datetime.now().year
+        Incident.objects.create(refId="GMS/EC/%d/41" % year, title="old", description="old")
+        Incident.objects.create(refId="GMS/EC/%d/7" % year, title="old", description="old")
+
+        self.assertEqual(generate_refId(self.user), "GMS/EC/%d/42" % year)
+
+
+class UserWorkloadTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        cls.division = Division.objects.create(code="ec-hq", organization=organization,
+                                               division_type="HQ", name="Head Office",
+                                               is_default_division=True, is_hq=True)
+        role = Group.objects.create(name="ec-manager")
+        cls.level = UserLevel.objects.create(code="manager", displayName="Manager",
+                                             organization=organization, role=role)
+        cls.first = create_user("manager1", organization, cls.division, cls.level)
+        cls.second = create_user("manager2", organization, cls.division, cls.level)
+
+    def create_incident(self, assignee):
+        return Incident.objects.create(title="incident", description="description", assignee=assignee)
+
+    def open_incidents(self, user):
+        return UserWorkload.objects.get(user=user).open_incidents
+
+    def test_counters_follow_assignee_and_status(self):
+        incident = self.create_incident(self.first)
+        self.create_incident(self.first)
+        self.assertEqual(self.open_incidents(self.first), 2)
+
+        incident = Incident.objects.get(id=incident.id)
+        incident.assignee = self.second
+        incident.save()
+        self.assertEqual(self.open_incidents(self.first), 1)
+        self.assertEqual(self.open_incidents(self.second), 1)
+
+        IncidentStatus(current_status=StatusType.CLOSED, incident=incident, approved=True).save()
+        self.assertEqual(self.open_incidents(self.second), 0)
+
+    def test_least_loaded_user_is_picked(self):
+        self.create_incident(self.first)
+        self.assertEqual(get_user_from_level(self.level, self.division), self.second)
+
+        self.create_incident(self.second)
+        self.create_incident(self.second)
+        self.assertEqual(get_user_from_level(self.level, self.division), self.first)
+
+    def test_last_assignment_follows_referrals(self):
+        incident = self.create_incident(self.first)
+        incident_escalate_external_action(self.first, incident, {"isInternalUser": True, "name": self.second.id},
+                                          "refer")
+
+        incident = Incident.objects.get(id=incident.id)
+        self.assertEqual(incident.last_assigned_to, "Election Commission - HQ: Head Office")
+        with self.assertNumQueries(0):
+            self.assertEqual(IncidentSerializer().get_last_assignment(incident)["assigned_from"],
+                             "Election Commission - HQ: Head Office")
+
+        start_event = Event.objects.filter(incident=incident).order_by("created_date").last()
+        incident_complete_external_action(self.second, incident, "done", start_event)
+        self.assertIsNone(IncidentSerializer(Incident.objects.get(id=incident.id)).data["lastAssignment"])
+
+    def test_rebuild_repairs_drifted_counters(self):
+        self.create_incident(self.first)
+        UserWorkload.objects.filter(user=self.first).update(open_incidents=10)
+        UserWorkload.objects.filter(user=self.second).delete()
+
+        self.assertEqual(rebuild_user_workloads(), 2)
+        self.assertEqual(self.open_incidents(self.first), 1)
+        self.assertEqual(self.open_incidents(self.second), 0)
+        self.assertEqual(rebuild_user_workloads(), 0)
+
+
+class EscalationCandidateTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        cls.hq = Division.objects.create(code="ec-hq", organization=organization,
+                                         division_type="HQ", name="Head Office",
+                                         is_default_division=True, is_hq=True)
+        cls.district = Division.objects.create(code="ec-gampaha", organization=organization,
+                                               division_type="DISTRICT", name="Gampaha")
+        role = Group.objects.create(name="ec-staff")
+        cls.manager = UserLevel.objects.create(code="manager", displayName="Manager",
+                                               organization=organization, role=role)
+        cls.coordinator = UserLevel.objects.create(code="coordinator", displayName="Coordinator",
+                                                   organization=organization, role=role,
+                                                   parent=cls.manager)
+
+        cls.coordinator_user = create_user("coordinator1", organization, cls.district, cls.coordinator)
+        cls.hq_manager = create_user("manager1", organization, cls.hq, cls.manager)
+
+    def test_falls_back_to_hq_of_organization(self):
+        self.assertEqual(find_escalation_candidate(self.coordinator_user), self.hq_manager)
+
+    def test_prefers_same_division(self):
+        district_manager = create_user("manager2", self.hq.organization, self.district, self.manager)
+        self.assertEqual(find_escalation_candidate(self.coordinator_user), district_manager)
+
+    def test_hq_is_only_needed_after_the_division(self):
+        self.hq.is_hq = False
+        self.hq.save()
+        with self.assertRaisesMessage(WorkflowException, "No HQ defined"):
+            find_escalation_candidate(self.coordinator_user)
+
+        district_manager = create_user("manager2", self.hq.organization, self.district, self.manager)
+        self.assertEqual(find_escalation_candidate(self.coordinator_user), district_manager)
+
+    def test_assignee_needs_a_default_division(self):
+        self.hq.is_default_division = False
+        self.hq.save()
+        with self.assertRaisesMessage(WorkflowException, "No default division defined"):
+            find_incident_assignee(self.coordinator_user)
+
+    def test_hierarchy_walk_costs_a_single_query(self):
+        coordinator_user = User.objects.select_related("profile").get(id=self.coordinator_user.id)
+        find_escalation_candidate(coordinator_user)
+
+        with self.assertNumQueries(1):
+            find_escalation_candidate(coordinator_user)
+
+
+class IncidentExportTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        channel = Channel.objects.create(name="Telephone")
+        category = Category.objects.create(code="1", top_category="Violence", sub_category="Assault",
+                                           sn_top_category="-", sn_sub_category="-",
+                                           tm_top_category="-", tm_sub_category="-")
+        for i in range(25):
+            Incident.objects.create(
+                refId="GMS/EC/2020/%d" % i,
+                title="incident %d" % i,
+                description="description",
+                city="Colombo",
+                reporter=Reporter.objects.create(name="reporter %d" % i),
+                infoChannel=str(channel.id),
+                category=str(category.id),
+            )
+
+    def test_rows_are_streamed_in_chunks(self):
+        stream = stream_incidents_csv(Incident.objects.all(), chunk_size=10)
+
+        with self.assertNumQueries(0):
+            header = next(stream)
+        self.assertEqual(header.split(";")[0], "Ref ID")
+
+        # channel and category lookups, then three chunks
+        with self.assertNumQueries(5):
+            rows = list(stream)
+
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(len(set(rows)), 25)
+        self.assertTrue(rows[0].startswith("GMS/EC/2020/0;reporter 0;Colombo;"))
+        self.assertIn(";Telephone;", rows[0])
+        self.assertTrue(rows[0].strip().endswith(";Assault"))
+
+
+class PublicStatusTest(TransactionTestCase):
+    """ commits, the cache is cleared once a change is committed """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username="officer")
+        self.incident = Incident.objects.create(refId="GMS/EC/2020/1", title="incident",
+                                                description="description", current_status=StatusType.NEW.name)
+
+    def get_status(self, refId="GMS/EC/2020/1"):
+        response = APIClient().get("/public/incidents/", {"refId": refId})
+        return response.json()["data"]
+
+    def test_status_follows_workflow(self):
+        self.assertEqual(self.get_status()["reply"],
+                         "Your request has been received. Please check again later for status updates.")
+        self.assertIn("No records", self.get_status("GMS/EC/2020/2")["reply"])
+        # any refId is a valid cache key
+        self.assertIn("No records", self.get_status("GMS EC\t2020 \u0dc1")["reply"])
+        self.assertRegex(get_public_status_cache_key("GMS EC\t2020"), r"^incidents:public_status:[0-9a-f]{64}$")
+
+        # polling is answered from the cache
+        with CaptureQueriesContext(connection) as queries:
+            self.get_status()
+        self.assertEqual(len(queries), 0)
+
+        self.incident.current_status = StatusType.ACTION_PENDING.name
+        self.incident.save()
+        request = RequestInformationWorkflow.objects.create(incident=self.incident, actioned_user=self.user,
+                                                            comment="which polling station?")
+        self.assertIn("further information", self.get_status()["reply"])
+
+        request.is_information_provided = True
+        request.save()
+        self.assertEqual(self.get_status()["reply"], "Your request is currently being attended to.")
+
+        CloseWorkflow.objects.create(incident=self.incident, actioned_user=self.user, comment="resolved",
+                                     assignees="", entities="", departments="", individuals="")
+        self.incident.current_status = StatusType.CLOSED.name
+        self.incident.save()
+        status = self.get_status()
+        self.assertEqual(status["reply"], "Your request has been resolved and closed.")
+        self.assertEqual(status["messages"], [{"header": "Resolution", "content": "resolved"}])
+
+
+class IncidentSearchTest(TestCase):
+
+    def setUp(self):
+        self.reporter = Reporter.objects.create(name="Kamal Perera", sn_name="කමල් පෙරේරා")
+        self.flood = Incident.objects.create(refId="GMS/EC/2020/1", title="Flood relief not received",
+                                             description="families in the village are waiting",
+                                             reporter=self.reporter)
+        self.road = Incident.objects.create(refId="GMS/EC/2020/2", title="Damaged road",
+                                            description="the road to the flood shelter is closed")
+
+    def search(self, query):
+        return list(search_incidents(Incident.objects.all(), query).order_by("-search_rank", "due_date"))
+
+    def test_tokenize_keeps_sinhala_and_tamil_words(self):
+        self.assertEqual(tokenize("කමල් පෙරේරා"), ["කමල්", "පෙරේරා"])
+        self.assertEqual(tokenize("வெள்ள நிவாரணம்"), ["வெள்ள", "நிவாரணம்"])
+
+    def test_ranked_prefix_search(self):
+        # a title match ranks above a description match
+        self.assertEqual(self.search("flood"), [self.flood, self.road])
+        self.assertEqual(self.search("floo relie"), [self.flood])
+        self.assertEqual(self.search("කමල්"), [self.flood])
+        self.assertEqual(self.search("GMS/EC/2020/2"), [self.road])
+        self.assertEqual(self.search("tsunami"), [])
+
+    def test_short_words_match_whole_words(self):
+        # single letters are ignored, two letters and numbers aren't prefixes
+        self.assertCountEqual(self.search("f"), [self.flood, self.road])
+        self.assertEqual(self.search("to"), [self.road])
+        self.assertEqual(self.search("fl"), [])
+        self.assertEqual(self.search("2"), [self.road])
+        self.assertCountEqual(self.search("202"), [self.flood, self.road])
+
+    def test_index_follows_changes(self):
+        self.road.title = "Landslide"
+        self.road.save()
+        IncidentComment.objects.create(incident=self.flood, body="police informed")
+        self.reporter.name = "Nimal Silva"
+        self.reporter.save()
+
+        self.assertEqual(self.search("landslide"), [self.road])
+        self.assertEqual(self.search("police"), [self.flood])
+        self.assertEqual(self.search("nimal"), [self.flood])
+        self.assertEqual(self.search("kamal"), [])
+
+        indexed = set(SearchTerm.objects.values_list("term", "incident_id", "weight"))
+        SearchTerm.objects.all().delete()
+        self.assertEqual(rebuild_search_index(chunk_size=1), 2)
+        self.assertEqual(set(SearchTerm.objects.values_list("term", "incident_id", "weight")), indexed)
+
+        SearchTerm.objects.all().delete()
+        backfill = import_module("src.incidents.migrations.0010_backfill_search_index")
+        backfill.backfill_search_index(apps, None)
+        self.assertEqual(set(SearchTerm.objects.values_list("term", "incident_id", "weight")), indexed)
+
+    def test_index_follows_reporter_renames(self):
+        reporter = Reporter.objects.get(id=self.reporter.id)
+        reporter.sn_name = "නිමල් සිල්වා"
+        reporter.tm_name = "நிமல் சில்வா"
+        reporter.save()
+
+        self.assertEqual(self.search("නිමල්"), [self.flood])
+        self.assertEqual(self.search("நிமல்"), [self.flood])
+        self.assertEqual(self.search("කමල්"), [])
+
+        # the index is left alone when no name changes
+        reporter.email = "nimal@example.com"
+        with self.assertNumQueries(1):
+            reporter.save()
@@ -60,13 +60,18 @@ from .services import (
     get_incident_status_guest,
     send_canned_response,
     get_incident_status_guest,
-    get_incident_list_by_organization_code
+    filter_incidents_by_organization,
+    prefetch_incident_list,
+    get_incident_page_after,
+    get_cached_incident_count
 )
 
 from ..events import services as event_service
 from ..file_upload import services as file_services
 from .exceptions import IncidentException
+from .search import search_incidents
 from ..renderer import CustomJSONRenderer
+from ..instrumentation import timed
 from rest_framework.renderers import JSONRenderer
 
 import json
@@ -124,9 +129,7 @@ class IncidentList(APIView, IncidentResultsSetPagination):
         # filtering
         param_query = self.request.query_params.get('q', None)
         if param_query is not None and param_query != "":
-            incidents = incidents.filter(
-                Q(refId__icontains=param_query) | Q(title__icontains=param_query) |
-                Q(description__icontains=param_query))
+            incidents = search_incidents(incidents, param_query).order_by("-search_rank", "due_date")
 
         # filter by title
         param_title = self.request.query_params.get('title', None)
@@ -209,27 +212,51 @@ class IncidentList(APIView, IncidentResultsSetPagination):
         if param_district is not None:
             incidents = incidents.filter(district=param_district)
 
+        # filter by organization
+        param_organization = self.request.query_params.get('organization', None)
+        if param_organization is not None:
+            incidents = filter_incidents_by_organization(incidents, param_organization)
+
         param_export = self.request.query_params.get('export', None)
         if param_export is not None:
             # export path will send a different response
             return get_fitlered_incidents_report(incidents, param_export)
 
-        # organization filter shoulb de the last filter as it only returns generic list.
-        # not a Incident object list.
+        if "cursor" in self.request.query_params:
+            return self.get_cursor_page(request, incidents)
 
-        # filter by organization
-        param_organization = self.request.query_params.get('organization', None)
-        if param_organization is not None:
-            incidents = get_incident_list_by_organization_code(param_organization)
+        results = self.paginate_queryset(prefetch_incident_list(incidents), request, view=self)
+        return self.get_paginated_response(self.serialize_incidents(results))
+
+    def get_cursor_page(self, request, incidents):
+        """ Cursor mode, pass the `nextCursor` of a page as `cursor` for the
+            next one (an empty cursor for the first). Ordered by due date,
+            by search rank first with `q`. The count is only sent with
+            count=true and may lag a little.
+        """
+        cursor = request.query_params.get("cursor") or None
+        ranked = bool(request.query_params.get("q"))
+        results, next_cursor = get_incident_page_after(
+            prefetch_incident_list(incidents), cursor, self.get_page_size(request), ranked)
+
+        data = {
+            "incidents": self.serialize_incidents(results),
+            "nextCursor": next_cursor,
+        }
+        if request.query_params.get("count") == "true":
+            data["count"] = get_cached_incident_count(incidents)
+
+        return Response(data)
 
-        results = self.paginate_queryset(incidents, request, view=self)
-        serializer = IncidentSerializer(results, many=True)
-        all_results = list(serializer.data)
-        for result in all_results:
-            reporter = Reporter.objects.get(id=result["reporter"])
-            result["reporterTitle"] = reporter.title
-            result["reporterName"] = reporter.name
-        return self.get_paginated_response(serializer.data)
+    def serialize_incidents(self, incidents):
+        serializer = IncidentSerializer(incidents, many=True)
+        with timed("serializer"):
+            for incident, result in zip(incidents, serializer.data):
+                # reporter is already loaded with the page
+                reporter = incident.reporter
+                result["reporterTitle"] = reporter.title if reporter else None
+                result["reporterName"] = reporter.name if reporter else None
+        return serializer.data
 
     def post(self, request, format=None):
         incident_data = request.data
@@ -326,7 +353,8 @@ class IncidentDetail(APIView):
             return Response("Invalid incident id", status=status.HTTP_404_NOT_FOUND)
 
         serializer = IncidentSerializer(incident)
-        incident_data = serializer.data
+        with timed("serializer"):
+            incident_data = serializer.data
 
         # get the reopen count of the incident
         reopened_incidents = Reopened.objects.filter(incident_id=incident_id)
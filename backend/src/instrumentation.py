@@ -0,0 +1,367 @@
+"""Request instrumentation
+
+Opt-in (INSTRUMENTATION_ENABLED) accounting of where requests spend their
+time: the view (url route), database queries and their time, the sections
+timed with `timed` (serializers, rendering), calls to external services
+timed with `external_call` (sms gateway, email, recaptcha, pdf service) and
+the response size. Every request is logged as one json line on the
+`src.instrumentation` logger and aggregated into the counters and
+histograms `metrics_view` serves in the prometheus text format. They are
+kept per process: under several gunicorn workers each scrape reaches one of
+them, so every series carries a `worker` label (host:pid) and dashboards sum
+over it.
+
+With INSTRUMENTATION_PROFILE_SLOWEST set, a sample of the requests
+(INSTRUMENTATION_PROFILE_RATE) runs under a profiler and the traces of the
+slowest of them are kept in INSTRUMENTATION_PROFILE_DIR.
+"""
+
+import cProfile
+import heapq
+import hmac
+import json
+import logging
+import os
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager, ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, ImproperlyConfigured
+from django.db import connections
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 10 * 1024 ** 2)
+
+# label of requests that didn't match a url
+UNMATCHED_VIEW = "unmatched"
+
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def format_labels(names, values) -> str:
+    if not names:
+        return ""
+    return "{%s}" % ",".join('%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+                             for name, value in zip(names, values))
+
+
+class Counter:
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.values = defaultdict(float)
+
+    def inc(self, label_values=(), amount=1):
+        with _lock:
+            self.values[tuple(label_values)] += amount
+
+    def render(self, worker) -> list:
+        lines = ["# HELP %s %s" % (self.name, self.description), "# TYPE %s counter" % self.name]
+        labels = ("worker",) + self.labels
+        with _lock:
+            for label_values, value in sorted(self.values.items()):
+                lines.append("%s%s %s" % (self.name, format_labels(labels, (worker,) + label_values), value))
+        return lines
+
+
+class Histogram:
+    """ cumulative buckets per label values, like a prometheus histogram """
+
+    def __init__(self, name, description, labels=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = buckets
+        # label values -> (bucket counts, sum, count)
+        self.values = {}
+
+    def observe(self, label_values, value):
+        label_values = tuple(label_values)
+        with _lock:
+            counts, total, count = self.values.get(label_values) or ([0] * len(self.buckets), 0, 0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self.values[label_values] = (counts, total + value, count + 1)
+
+    def render(self, worker) -> list:
+        lines = ["# HELP %s %s" % (self.name, self.description), "# TYPE %s histogram" % self.name]
+        labels = ("worker",) + self.labels
+        bucket_labels = labels + ("le",)
+        with _lock:
+            for label_values, (counts, total, count) in sorted(self.values.items()):
+                label_values = (worker,) + label_values
+                for bound, bucket_count in zip(self.buckets, counts):
+                    lines.append("%s_bucket%s %d" % (self.name, format_labels(bucket_labels, label_values + (bound,)),
+                                                     bucket_count))
+                lines.append("%s_bucket%s %d" % (self.name, format_labels(bucket_labels, label_values + ("+Inf",)),
+                                                 count))
+                lines.append("%s_sum%s %s" % (self.name, format_labels(labels, label_values), total))
+                lines.append("%s_count%s %d" % (self.name, format_labels(labels, label_values), count))
+        return lines
+
+
+REQUESTS = Counter("http_requests_total", "Requests by view, method and status", ("view", "method", "status"))
+REQUEST_DURATION = Histogram("http_request_duration_seconds", "Request duration", ("view",))
+REQUEST_QUERIES = Histogram("http_request_db_queries", "Database queries per request", ("view",), QUERY_BUCKETS)
+REQUEST_DB_DURATION = Histogram("http_request_db_duration_seconds", "Time in database queries per request",
+                                ("view",))
+SECTION_DURATION = Histogram("http_request_section_duration_seconds",
+                             "Time in timed sections (serializers, rendering) per request", ("view", "section"))
+RESPONSE_SIZE = Histogram("http_response_size_bytes", "Response size", ("view",), SIZE_BUCKETS)
+EXTERNAL_CALL_DURATION = Histogram("external_call_duration_seconds", "Calls to external services",
+                                   ("service", "outcome"))
+
+METRICS = (REQUESTS, REQUEST_DURATION, REQUEST_QUERIES, REQUEST_DB_DURATION, SECTION_DURATION, RESPONSE_SIZE,
+           EXTERNAL_CALL_DURATION)
+
+
+def get_worker_label() -> str:
+    # the pid at render time, gunicorn forks the workers after the import
+    return "%s:%d" % (socket.gethostname(), os.getpid())
+
+
+def render_metrics() -> str:
+    worker = get_worker_label()
+    return "\n".join(line for metric in METRICS for line in metric.render(worker)) + "\n"
+
+
+class RequestRecord:
+    """ what the current request spent its time on """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0
+        self.sections = defaultdict(float)
+        # service -> [calls, seconds]
+        self.external = defaultdict(lambda: [0, 0])
+
+    def time_query(self, execute, sql, params, many, context):
+        """ database execute wrapper """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += time.perf_counter() - start
+
+
+def get_current_record():
+    return getattr(_local, "record", None)
+
+
+@contextmanager
+def timed(section):
+    """ adds the time spent in the block to `section` of the current request """
+    record = get_current_record()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if record is not None:
+            record.sections[section] += time.perf_counter() - start
+
+
+@contextmanager
+def external_call(service):
+    """ times a call to an external service. Calls made outside of requests
+        (ex: by the outbox workers) are only counted in the metrics.
+    """
+    record = get_current_record()
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        duration = time.perf_counter() - start
+        if settings.INSTRUMENTATION_ENABLED:
+            EXTERNAL_CALL_DURATION.observe((service, outcome), duration)
+        if record is not None:
+            record.external[service][0] += 1
+            record.external[service][1] += duration
+
+
+def get_view_label(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None or match.route is None:
+        return UNMATCHED_VIEW
+    return "/" + match.route
+
+
+def get_response_size(response) -> int:
+    if response.streaming:
+        return int(response.get("Content-Length") or 0)
+    return len(response.content)
+
+
+class SlowestProfiles:
+    """ profiles requests and keeps the traces of the `count` slowest """
+
+    def __init__(self, directory, count, profiler="cprofile"):
+        if profiler not in ("cprofile", "pyinstrument"):
+            raise ImproperlyConfigured("INSTRUMENTATION_PROFILER must be cprofile or pyinstrument")
+        if profiler == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                raise ImproperlyConfigured("INSTRUMENTATION_PROFILER is pyinstrument, but it isn't installed")
+
+        self.directory = directory
+        self.count = count
+        self.profiler = profiler
+        # (duration, path) of the kept traces, the fastest first
+        self.kept = []
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self):
+        """ a running profiler, None when the thread is being profiled already """
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return None
+        return profiler
+
+    def stop(self, profiler, duration, view):
+        """ stops the profiler and writes its trace if the request is among the slowest """
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+        else:
+            profiler.disable()
+
+        with _lock:
+            if len(self.kept) >= self.count and duration <= self.kept[0][0]:
+                return
+            name = "%08dms%s-%s" % (duration * 1000, re.sub(r"[^\w.-]+", "_", view), uuid.uuid4().hex[:8])
+            path = os.path.join(self.directory, name + (".html" if self.profiler == "pyinstrument" else ".prof"))
+            heapq.heappush(self.kept, (duration, path))
+            dropped = heapq.heappop(self.kept)[1] if len(self.kept) > self.count else None
+
+        if self.profiler == "pyinstrument":
+            with open(path, "w") as fp:
+                fp.write(profiler.output_html())
+        else:
+            profiler.dump_stats(path)
+        if dropped is not None and os.path.exists(dropped):
+            os.remove(dropped)
+
+
+class InstrumentationMiddleware:
+    """ records every request for the metrics and the request log, should
+        be the first middleware to include the time spent in the others
+    """
+
+    def __init__(self, get_response):
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.profiles = None
+        if settings.INSTRUMENTATION_PROFILE_SLOWEST:
+            self.profiles = SlowestProfiles(settings.INSTRUMENTATION_PROFILE_DIR,
+                                            settings.INSTRUMENTATION_PROFILE_SLOWEST,
+                                            settings.INSTRUMENTATION_PROFILER)
+
+    def __call__(self, request):
+        record = RequestRecord()
+        profiler = None
+        if self.profiles is not None and random.random() < settings.INSTRUMENTATION_PROFILE_RATE:
+            profiler = self.profiles.start()
+
+        _local.record = record
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(record.time_query))
+                response = self.get_response(request)
+        finally:
+            _local.record = None
+        duration = time.perf_counter() - start
+
+        view = get_view_label(request)
+        if profiler is not None:
+            self.profiles.stop(profiler, duration, view)
+        self.record_request(request, response, record, view, duration)
+        return response
+
+    def record_request(self, request, response, record, view, duration):
+        size = get_response_size(response)
+
+        REQUESTS.inc((view, request.method, response.status_code))
+        REQUEST_DURATION.observe((view,), duration)
+        REQUEST_QUERIES.observe((view,), record.queries)
+        REQUEST_DB_DURATION.observe((view,), record.db_seconds)
+        RESPONSE_SIZE.observe((view,), size)
+        for section, seconds in record.sections.items():
+            SECTION_DURATION.observe((view, section), seconds)
+
+        user = getattr(request, "user", None)
+        logger.info(json.dumps({
+            "event": "request",
+            "view": view,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "user": user.id if user is not None and user.is_authenticated else None,
+            "duration_ms": round(duration * 1000, 1),
+            "db_queries": record.queries,
+            "db_ms": round(record.db_seconds * 1000, 1),
+            "sections_ms": {section: round(seconds * 1000, 1) for section, seconds in record.sections.items()},
+            "external": {service: {"calls": calls, "ms": round(seconds * 1000, 1)}
+                         for service, (calls, seconds) in record.external.items()},
+            "response_bytes": size,
+        }, sort_keys=True))
+
+
+def is_staff_request(request) -> bool:
+    """ whether the request is made by a staff user, authenticated like the
+        api (JWT, session or basic)
+    """
+    # imported here, the rest framework settings import the renderer which imports this module
+    from rest_framework.exceptions import APIException
+    from rest_framework.request import Request
+    from rest_framework.settings import api_settings
+
+    authenticators = [authentication() for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    try:
+        return Request(request, authenticators=authenticators).user.is_staff
+    except APIException:
+        return False
+
+
+def metrics_view(request):
+    """ the metrics of this worker in the prometheus text format. With
+        INSTRUMENTATION_METRICS_TOKEN set the scraper has to send it as
+        `Authorization: Bearer <token>`, without it only staff users may
+        read them
+    """
+    token = settings.INSTRUMENTATION_METRICS_TOKEN
+    if token:
+        if not hmac.compare_digest(request.META.get("HTTP_AUTHORIZATION", "").encode(),
+                                   ("Bearer " + token).encode()):
+            return HttpResponse("Invalid metrics token", status=403, content_type="text/plain")
+    elif not is_staff_request(request):
+        return HttpResponse("Metrics require INSTRUMENTATION_METRICS_TOKEN or a staff user", status=403,
+                            content_type="text/plain")
+
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,33 +1,78 @@
 import json
+import logging
+
 from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.db import database_sync_to_async
+
+USER_GROUP_NAME = "notifications-user-%s"
+ORGANIZATION_GROUP_NAME = "notifications-organization-%s"
+DIVISION_GROUP_NAME = "notifications-division-%s"
+
+logger = logging.getLogger(__name__)
+
+
+def get_user_group_name(user_id):
+    return USER_GROUP_NAME % user_id
+
+def get_organization_group_name(organization_id):
+    return ORGANIZATION_GROUP_NAME % organization_id
+
+def get_division_group_name(division_id):
+    return DIVISION_GROUP_NAME % division_id
+
+def get_user_group_names(user):
+    """ groups a connection of the given user joins: the user's own group
+        and the groups of the user's organization and division
+    """
+    group_names = [get_user_group_name(user.id)]
+
+    profile = getattr(user, "profile", None)
+    if profile is not None:
+        if profile.organization_id is not None:
+            group_names.append(get_organization_group_name(profile.organization_id))
+        if profile.division_id is not None:
+            group_names.append(get_division_group_name(profile.division_id))
+
+    return group_names
 
-NOTIFICATION_GROUP_NAME = "notification-group"
 
 class NotificationConsumer(AsyncWebsocketConsumer):
+    group_names = []
+    user_group = None
+
     async def connect(self):
-        await self.channel_layer.group_add(
-            NOTIFICATION_GROUP_NAME,
-            self.channel_name
-        )
+        user = self.scope.get('user')
+        if user is None or not user.is_authenticated:
+            await self.close()
+            return
+
+        self.user_group = get_user_group_name(user.id)
+        self.group_names = await database_sync_to_async(get_user_group_names)(user)
+        for group_name in self.group_names:
+            await self.channel_layer.group_add(
+                group_name,
+                self.channel_name
+            )
 
         await self.accept()
 
     async def disconnect(self, close_code):
-        await self.channel_layer.group_discard(
-            NOTIFICATION_GROUP_NAME,
-            self.channel_name
-        )
+        for group_name in self.group_names:
+            await self.channel_layer.group_discard(
+                group_name,
+                self.channel_name
+            )
 
     async def receive(self, text_data):
         text_data_json = json.loads(text_data)
         payload = text_data_json['payload']
 
+        # echoed to the sockets of the connected user only
         await self.channel_layer.group_send(
-            NOTIFICATION_GROUP_NAME,
+            self.user_group,
             {
                 'type': 'notify',
-                'payload': payload,
-                'send_to': 1
+                'payload': payload
             }
         )
 
@@ -35,15 +80,11 @@ class NotificationConsumer(AsyncWebsocketConsumer):
     async def notify(self, event):
         try:
             payload = event['payload']
-            send_to = event['send_to']
-
-            if self.scope['user'].id == send_to:
-                # Send message to WebSocket
-                await self.send(text_data=json.dumps({
-                    'type': 'notification',
-                    'payload': payload
-                }))
-        except Exception as e:
-            print("error", e)
-            pass
-        
\ No newline at end of file
+
+            # Send message to WebSocket
+            await self.send(text_data=json.dumps({
+                'type': 'notification',
+                'payload': payload
+            }))
+        except Exception:
+            logger.exception("notification could not be sent to the socket")
@@ -0,0 +1,76 @@
+import time
+import random
+import asyncio
+import statistics
+
+from django.core.management.base import BaseCommand
+from channels.layers import get_channel_layer
+
+from ...consumers import get_user_group_name, get_organization_group_name
+
+BROADCAST_GROUP_NAME = "notifications-benchmark-broadcast"
+
+
+class Command(BaseCommand):
+    help = "Measure notification delivery latency through the channel layer with many connected sockets"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sockets", type=int, default=5000)
+        parser.add_argument("--notifications", type=int, default=200)
+        parser.add_argument("--organizations", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        asyncio.get_event_loop().run_until_complete(self.benchmark(
+            options["sockets"], options["notifications"], options["organizations"]))
+
+    async def benchmark(self, socket_count, notification_count, organization_count):
+        channel_layer = get_channel_layer()
+        self.stdout.write("Channel layer: %s" % type(channel_layer).__name__)
+
+        # one socket per user, joined to the same groups a consumer joins
+        channels = []
+        for user_id in range(1, socket_count + 1):
+            channel_name = await channel_layer.new_channel()
+            await channel_layer.group_add(get_user_group_name(user_id), channel_name)
+            await channel_layer.group_add(
+                get_organization_group_name(user_id % organization_count), channel_name)
+            await channel_layer.group_add(BROADCAST_GROUP_NAME, channel_name)
+            channels.append(channel_name)
+
+        try:
+            latencies = []
+            for _ in range(notification_count):
+                user_id = random.randint(1, socket_count)
+                started = time.perf_counter()
+                await channel_layer.group_send(get_user_group_name(user_id), {"type": "notify", "payload": {}})
+                await channel_layer.receive(channels[user_id - 1])
+                latencies.append(time.perf_counter() - started)
+            self.report("Per user group", latencies)
+
+            # the previous behaviour, every socket gets every notification.
+            # only the fan out is timed, the sockets are not drained
+            latencies = []
+            for _ in range(max(1, notification_count // 20)):
+                started = time.perf_counter()
+                await channel_layer.group_send(BROADCAST_GROUP_NAME, {"type": "notify", "payload": {}})
+                latencies.append(time.perf_counter() - started)
+            self.report("Broadcast to every socket (send only)", latencies)
+        finally:
+            for user_id, channel_name in enumerate(channels, start=1):
+                await channel_layer.group_discard(get_user_group_name(user_id), channel_name)
+                await channel_layer.group_discard(
+                    get_organization_group_name(user_id % organization_count), channel_name)
+                await channel_layer.group_discard(BROADCAST_GROUP_NAME, channel_name)
+
+    def report(self, label, latencies):
+        latencies = sorted(latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        self.stdout.write("%s: %d sends, median %.3f ms, p95 %.3f ms, max %.3f ms" % (
+            label,
+            len(latencies),
+            statistics.median(latencies) * 1000,
+            p95 * 1000,
+            latencies[-1] * 1000
+        ))
@@ -0,0 +1,51 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.core.management.base import BaseCommand
+
+from ...outbox import drain_outbox, get_outbox_metrics
+
+
+def drain_in_worker(limit):
+    try:
+        return drain_outbox(limit)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = "Deliver due email / sms from the outbox and report queue depth and delivery latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=settings.OUTBOX_WORKERS)
+        parser.add_argument("--limit", type=int, default=None,
+                            help="maximum number of delivery attempts per worker")
+        parser.add_argument("--forever", action="store_true",
+                            help="keep polling the outbox instead of exiting once it is empty")
+        parser.add_argument("--interval", type=int, default=10,
+                            help="seconds between polls with --forever")
+        parser.add_argument("--metrics", action="store_true",
+                            help="only print the outbox metrics")
+
+    def handle(self, *args, **options):
+        if options["metrics"]:
+            self.print_metrics()
+            return
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            while True:
+                futures = [executor.submit(drain_in_worker, options["limit"]) for _ in range(options["workers"])]
+                attempted = sum(future.result() for future in futures)
+                self.stdout.write("Attempted %d message(s)" % attempted)
+
+                if not options["forever"]:
+                    break
+                time.sleep(options["interval"])
+
+        self.print_metrics()
+
+    def print_metrics(self):
+        for key, value in get_outbox_metrics().items():
+            self.stdout.write("%s: %s" % (key, value))
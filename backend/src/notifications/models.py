@@ -2,6 +2,7 @@ from django.db import models
 import enum
 import uuid
 from django.conf import settings
+from django.utils import timezone
 
 User = settings.AUTH_USER_MODEL
 
@@ -28,4 +29,44 @@ class Notification(models.Model):
 
     created_date = models.DateTimeField(auto_now_add=True)
 
-    
\ No newline at end of file
+
+class OutboxChannel(enum.Enum):
+    EMAIL = "Email"
+    SMS = "SMS"
+
+class OutboxStatus(enum.Enum):
+    PENDING = "Pending"
+    SENDING = "Sending"
+    SENT = "Sent"
+    FAILED = "Failed"
+
+class OutboxMessage(models.Model):
+    """ an email or sms waiting to be delivered, see outbox.py """
+
+    channel = models.CharField(max_length=10, choices=[(tag.name, tag.value) for tag in OutboxChannel])
+
+    recipient = models.CharField(max_length=255)
+
+    subject = models.CharField(max_length=255, null=True, blank=True)
+
+    message = models.TextField()
+
+    status = models.CharField(max_length=10, choices=[(tag.name, tag.value) for tag in OutboxStatus],
+                                default=OutboxStatus.PENDING.name)
+
+    attempts = models.IntegerField(default=0)
+
+    # when pending, earliest time of the next attempt
+    # when sending, the time the claim of the worker expires
+    next_attempt_date = models.DateTimeField(default=timezone.now)
+
+    last_error = models.TextField(null=True, blank=True)
+
+    created_date = models.DateTimeField(auto_now_add=True)
+
+    sent_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_date"]),
+        ]
@@ -0,0 +1,284 @@
+"""Durable email / sms delivery
+
+Messages are written to the OutboxMessage table in the caller's transaction
+and delivered after commit by a small, bounded pool of worker threads. A
+message that fails is retried with exponential backoff, and anything left
+over after a restart is picked up by the next dispatch or by the
+`drain_outbox` management command.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+from xml.sax.saxutils import escape
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.db import transaction, close_old_connections
+from django.db.models import Min, Count
+from django.utils import timezone
+from django.core.mail import EmailMessage, get_connection
+
+from .models import OutboxMessage, OutboxChannel, OutboxStatus
+from ..instrumentation import external_call
+
+logger = logging.getLogger(__name__)
+
+SMS_GATEWAY_PATH = "/services/GovSMSMTHandlerProxy?wsdl"
+
+SMS_BODY = """<?xml version='1.0' encoding='utf-8'?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:v1="http://schemas.icta.lk/xsd/kannel/handler/v1/" soapenv:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
+<soapenv:Header>
+<govsms:authData xmlns:govsms="http://govsms.icta.lk/">
+<govsms:user>{2}</govsms:user>
+<govsms:key>{3}</govsms:key>
+</govsms:authData>
+</soapenv:Header>
+<soapenv:Body>
+<v1:SMSRequest>
+<v1:requestData>
+<v1:outSms>{1}</v1:outSms>
+<v1:recepient>{0}</v1:recepient>
+<v1:depCode>IctaTest</v1:depCode>
+<v1:smscId/>
+<v1:billable/>
+</v1:requestData>
+</v1:SMSRequest>
+</soapenv:Body>
+</soapenv:Envelope>
+"""
+
+_lock = threading.Lock()
+_executor = None
+_scheduled_drains = 0
+_sms_session = None
+_local = threading.local()
+
+
+def queue_email(subject, message, receivers):
+    """ queues one email per receiver, delivered once the current transaction commits """
+    return _queue(OutboxChannel.EMAIL, receivers, message, subject)
+
+def queue_sms(numbers, message):
+    """ queues one sms per number, delivered once the current transaction commits """
+    return _queue(OutboxChannel.SMS, numbers, message)
+
+def _queue(channel: OutboxChannel, recipients, message, subject=None):
+    messages = OutboxMessage.objects.bulk_create([
+        OutboxMessage(channel=channel.name, recipient=recipient, subject=subject, message=message)
+        for recipient in recipients if recipient
+    ])
+
+    if messages:
+        transaction.on_commit(dispatch)
+
+    return messages
+
+
+def _get_executor():
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.OUTBOX_WORKERS,
+                                           thread_name_prefix="outbox")
+        return _executor
+
+def dispatch():
+    """ wakes up a worker of the pool. At most one drain per worker is
+        scheduled, the rest stays in the table for the running drains.
+    """
+    global _scheduled_drains
+
+    with _lock:
+        if _scheduled_drains >= settings.OUTBOX_WORKERS:
+            return
+        _scheduled_drains += 1
+
+    try:
+        _get_executor().submit(_background_drain)
+    except RuntimeError:
+        # interpreter shutting down, the drain command picks these up later
+        with _lock:
+            _scheduled_drains -= 1
+
+def _background_drain():
+    global _scheduled_drains
+
+    try:
+        drain_outbox()
+    except Exception:
+        logger.exception("outbox drain failed")
+    finally:
+        with _lock:
+            _scheduled_drains -= 1
+        close_old_connections()
+
+
+def claim_messages(limit: int) -> list:
+    """ marks up to `limit` due messages as being sent by this worker.
+        A claim is a conditional update, so concurrent workers (threads or
+        processes) never deliver the same message twice.
+    """
+    now = timezone.now()
+    candidates = OutboxMessage.objects.filter(
+        status__in=[OutboxStatus.PENDING.name, OutboxStatus.SENDING.name],
+        next_attempt_date__lte=now
+    ).order_by("next_attempt_date")[:limit]
+
+    claimed = []
+    claim_expiry = now + timedelta(seconds=settings.OUTBOX_CLAIM_TIMEOUT)
+    for message in candidates:
+        updated = OutboxMessage.objects.filter(
+            id=message.id,
+            status=message.status,
+            attempts=message.attempts,
+            next_attempt_date=message.next_attempt_date
+        ).update(
+            status=OutboxStatus.SENDING.name,
+            attempts=message.attempts + 1,
+            next_attempt_date=claim_expiry
+        )
+        if updated:
+            message.status = OutboxStatus.SENDING.name
+            message.attempts += 1
+            message.next_attempt_date = claim_expiry
+            claimed.append(message)
+
+    return claimed
+
+def drain_outbox(limit: int = None) -> int:
+    """ delivers due messages in the calling thread until none are left
+        (or `limit` were attempted). Returns the number of attempts made.
+    """
+    attempted = 0
+    while limit is None or attempted < limit:
+        batch_size = settings.OUTBOX_BATCH_SIZE
+        if limit is not None:
+            batch_size = min(batch_size, limit - attempted)
+
+        messages = claim_messages(batch_size)
+        if not messages:
+            break
+
+        for message in messages:
+            deliver_message(message)
+        attempted += len(messages)
+
+    return attempted
+
+def get_retry_delay(attempts: int) -> timedelta:
+    delay = settings.OUTBOX_RETRY_DELAY * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(delay, settings.OUTBOX_MAX_RETRY_DELAY))
+
+def deliver_message(message: OutboxMessage) -> bool:
+    try:
+        if message.channel == OutboxChannel.EMAIL.name:
+            send_email(message.subject, message.message, message.recipient)
+        else:
+            send_sms(message.recipient, message.message)
+    except Exception as e:
+        message.last_error = str(e)
+        if message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            message.status = OutboxStatus.FAILED.name
+            logger.error("giving up on %s to %s after %d attempts: %s",
+                         message.channel, message.recipient, message.attempts, e)
+        else:
+            message.status = OutboxStatus.PENDING.name
+            message.next_attempt_date = timezone.now() + get_retry_delay(message.attempts)
+            logger.warning("%s to %s failed, attempt %d: %s",
+                           message.channel, message.recipient, message.attempts, e)
+        message.save(update_fields=["status", "next_attempt_date", "last_error"])
+        return False
+
+    message.status = OutboxStatus.SENT.name
+    message.sent_date = timezone.now()
+    message.save(update_fields=["status", "sent_date"])
+    return True
+
+
+def _get_smtp_connection():
+    """ one open SMTP connection per worker thread, reused across messages """
+    connection = getattr(_local, "smtp_connection", None)
+    if connection is None:
+        connection = get_connection(fail_silently=False)
+        connection.open()
+        _local.smtp_connection = connection
+    return connection
+
+def _reset_smtp_connection():
+    connection = getattr(_local, "smtp_connection", None)
+    _local.smtp_connection = None
+    if connection is not None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+def send_email(subject, message, receiver):
+    try:
+        with external_call("email"):
+            EmailMessage(
+                subject,
+                message,
+                settings.EMAIL_FROM_ADDRESS,
+                [receiver],
+                connection=_get_smtp_connection()
+            ).send()
+    except Exception:
+        # the server may have dropped the connection, start over next time
+        _reset_smtp_connection()
+        raise
+
+
+def _get_sms_session():
+    global _sms_session
+
+    with _lock:
+        if _sms_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.OUTBOX_WORKERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({'content-type': 'text/xml'})
+            _sms_session = session
+        return _sms_session
+
+def send_sms(number, message):
+    number = "94" + number[-9:]
+    body = SMS_BODY.format(number, escape(message), settings.SMS_GATEWAY_USER, settings.SMS_GATEWAY_PASSWORD)
+
+    with external_call("sms_gateway"):
+        response = _get_sms_session().post(settings.SMS_GATEWAY_BASE_URL + SMS_GATEWAY_PATH,
+                                           data=body.encode("utf-8"), timeout=settings.SMS_GATEWAY_TIMEOUT)
+        response.raise_for_status()
+
+
+def get_outbox_metrics() -> dict:
+    """ queue depth and delivery latency (created -> sent) over the last hour """
+    now = timezone.now()
+    depth = {status.name.lower(): 0 for status in OutboxStatus if status != OutboxStatus.SENT}
+    counts = OutboxMessage.objects.exclude(status=OutboxStatus.SENT.name).values_list("status").annotate(
+        count=Count("id"))
+    for status, count in counts:
+        depth[status.lower()] = count
+
+    oldest = OutboxMessage.objects.filter(status=OutboxStatus.PENDING.name).aggregate(
+        oldest=Min("created_date"))["oldest"]
+
+    latencies = sorted(
+        (sent_date - created_date).total_seconds()
+        for created_date, sent_date in OutboxMessage.objects.filter(
+            status=OutboxStatus.SENT.name,
+            sent_date__gte=now - timedelta(hours=1)
+        ).values_list("created_date", "sent_date")
+    )
+
+    metrics = dict(depth)
+    metrics["oldest_pending_seconds"] = (now - oldest).total_seconds() if oldest else 0
+    metrics["sent_last_hour"] = len(latencies)
+    metrics["latency_avg_seconds"] = sum(latencies) / len(latencies) if latencies else 0
+    metrics["latency_p95_seconds"] = latencies[int(len(latencies) * 0.95)] if latencies else 0
+    return metrics
@@ -1,7 +1,7 @@
 from .models import Notification, NotificationType
 from .exceptions import NotificationException
 from channels.layers import get_channel_layer
-from .consumers import NOTIFICATION_GROUP_NAME
+from .consumers import get_user_group_name, get_organization_group_name, get_division_group_name
 from asgiref.sync import async_to_sync
 from .serializers import NotificationSerializer
 from rest_framework.renderers import JSONRenderer
@@ -31,12 +31,26 @@ def add_notification(notification_type: NotificationType, actioned_by, send_to,
 
     serializer = NotificationSerializer(notification)
 
+    send_to_user(send_to, serializer.data)
+
+    return notification
+
+def send_to_group(group_name: str, payload):
     channel_layer = get_channel_layer()
     async_to_sync(channel_layer.group_send)(
-        NOTIFICATION_GROUP_NAME,
+        group_name,
         {
             'type': 'notify',
-            'payload': serializer.data,
-            'send_to': send_to.id
+            'payload': payload
         }
     )
+
+def send_to_user(user, payload):
+    """ delivers the payload only to the open connections of the given user """
+    send_to_group(get_user_group_name(user.id), payload)
+
+def send_to_organization(organization, payload):
+    send_to_group(get_organization_group_name(organization.id), payload)
+
+def send_to_division(division, payload):
+    send_to_group(get_division_group_name(division.id), payload)
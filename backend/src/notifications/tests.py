@@ -0,0 +1,136 @@
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.utils import timezone
+
+from . import outbox
+from .models import NotificationType, OutboxMessage, OutboxStatus
+from .services import add_notification
+from .consumers import NotificationConsumer, get_user_group_name, get_user_group_names
+from ..custom_auth.models import Organization, Division
+
+User = get_user_model()
+
+# stand in for the redis layer used in production
+IN_MEMORY_CHANNEL_LAYERS = {
+    "default": {
+        "BACKEND": "channels.layers.InMemoryChannelLayer"
+    }
+}
+
+
+@override_settings(CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS)
+class TargetedNotificationTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(code="ec", displayName="Election Commission")
+        cls.division = Division.objects.create(code="ec-hq", organization=cls.organization,
+                                               division_type="HQ", name="Head Office")
+        cls.recipient = User.objects.create(username="recipient")
+        cls.other = User.objects.create(username="other")
+
+    def connect(self, user):
+        channel_layer = get_channel_layer()
+        channel_name = async_to_sync(channel_layer.new_channel)()
+        async_to_sync(channel_layer.group_add)(get_user_group_name(user.id), channel_name)
+        return channel_name
+
+    def pending_messages(self, channel_name):
+        return len(get_channel_layer().channels.get(channel_name, []))
+
+    def test_notification_reaches_only_recipient(self):
+        recipient_channel = self.connect(self.recipient)
+        other_channel = self.connect(self.other)
+
+        add_notification(NotificationType.INCIDENT_ASSIGNED, self.other, self.recipient)
+
+        message = async_to_sync(get_channel_layer().receive)(recipient_channel)
+        self.assertEqual(message["type"], "notify")
+        self.assertEqual(message["payload"]["notification_type"], NotificationType.INCIDENT_ASSIGNED.name)
+        self.assertEqual(self.pending_messages(other_channel), 0)
+
+    def test_received_message_is_echoed_to_the_sender_only(self):
+        recipient_channel = self.connect(self.recipient)
+        other_channel = self.connect(self.other)
+
+        consumer = NotificationConsumer({"type": "websocket"})
+        consumer.channel_layer = get_channel_layer()
+        consumer.user_group = get_user_group_name(self.recipient.id)
+        async_to_sync(consumer.receive)('{"payload": "ping"}')
+
+        message = async_to_sync(get_channel_layer().receive)(recipient_channel)
+        self.assertEqual(message, {"type": "notify", "payload": "ping"})
+        self.assertEqual(self.pending_messages(other_channel), 0)
+
+    def test_connection_joins_organization_and_division_groups(self):
+        self.recipient.profile.organization = self.organization
+        self.recipient.profile.division = self.division
+        self.recipient.profile.save()
+
+        self.assertEqual(get_user_group_names(self.recipient), [
+            "notifications-user-%s" % self.recipient.id,
+            "notifications-organization-%s" % self.organization.id,
+            "notifications-division-%s" % self.division.id,
+        ])
+
+
+@override_settings(OUTBOX_MAX_ATTEMPTS=2, OUTBOX_RETRY_DELAY=30, SMS_GATEWAY_BASE_URL="http://sms.example")
+class OutboxTest(TestCase):
+
+    def test_queued_email_is_delivered_once(self):
+        outbox.queue_email("Request Closed", "resolved", ["a@example.com", "b@example.com", None])
+
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+        self.assertEqual(outbox.drain_outbox(), 2)
+        self.assertEqual(outbox.drain_outbox(), 0)
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ["a@example.com", "b@example.com"])
+        self.assertEqual(OutboxMessage.objects.filter(status=OutboxStatus.SENT.name).count(), 2)
+
+    def test_failed_sms_is_retried_with_backoff_then_given_up(self):
+        outbox.queue_sms(["0771234567"], "resolved")
+
+        with mock.patch.object(outbox._get_sms_session(), "post", side_effect=IOError("gateway down")) as post:
+            outbox.drain_outbox()
+
+            message = OutboxMessage.objects.get()
+            self.assertEqual(message.status, OutboxStatus.PENDING.name)
+            self.assertEqual(message.attempts, 1)
+            self.assertGreater(message.next_attempt_date, timezone.now() + timedelta(seconds=20))
+
+            # not due yet
+            self.assertEqual(outbox.drain_outbox(), 0)
+
+            OutboxMessage.objects.update(next_attempt_date=timezone.now())
+            outbox.drain_outbox()
+
+        self.assertEqual(post.call_count, 2)
+        self.assertIn("94771234567", post.call_args[1]["data"].decode())
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.status, OutboxStatus.FAILED.name)
+        self.assertEqual(message.last_error, "gateway down")
+
+    def test_expired_claim_is_picked_up_again(self):
+        outbox.queue_email("subject", "message", ["a@example.com"])
+        self.assertEqual(len(outbox.claim_messages(10)), 1)
+        self.assertEqual(len(outbox.claim_messages(10)), 0)
+
+        # the worker holding the claim died
+        OutboxMessage.objects.update(next_attempt_date=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(outbox.drain_outbox(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_metrics_report_depth_and_latency(self):
+        outbox.queue_email("subject", "message", ["a@example.com", "b@example.com"])
+        outbox.drain_outbox(limit=1)
+
+        metrics = outbox.get_outbox_metrics()
+        self.assertEqual(metrics["pending"], 1)
+        self.assertEqual(metrics["sent_last_hour"], 1)
+        self.assertGreaterEqual(metrics["latency_avg_seconds"], 0)
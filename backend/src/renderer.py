@@ -1,5 +1,7 @@
 from rest_framework.renderers import JSONRenderer
 
+from .instrumentation import timed
+
 class CustomJSONRenderer(JSONRenderer):
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
@@ -9,6 +11,7 @@ class CustomJSONRenderer(JSONRenderer):
         # getattr(renderer_context.get('view').get_serializer().Meta,'resource_name', 'objects')
 
         # call super to render the response
-        response = super(CustomJSONRenderer, self).render(response_data, accepted_media_type, renderer_context)
+        with timed("render"):
+            response = super(CustomJSONRenderer, self).render(response_data, accepted_media_type, renderer_context)
 
         return response
\ No newline at end of file
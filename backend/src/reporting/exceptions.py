@@ -0,0 +1,27 @@
+from rest_framework.exceptions import APIException
+
+class BaseException(APIException):
+    pass
+
+class ReportException(BaseException):
+    pass
+
+class ReportJobNotFoundException(ReportException):
+    status_code = 404
+    default_detail = "Invalid report job id"
+
+class PdfServiceException(ReportException):
+    status_code = 502
+    default_detail = "PDF service failed"
+
+class PdfServiceUnavailableException(PdfServiceException):
+    status_code = 503
+    default_detail = "PDF service unavailable"
+
+class PdfServiceResponseException(PdfServiceException):
+    """ the pdf service answered with an error, passed on to the client """
+
+    def __init__(self, status_code, content=b""):
+        super().__init__("PDF service returned %d" % status_code)
+        self.service_status_code = status_code
+        self.content = content
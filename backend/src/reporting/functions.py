@@ -24,6 +24,15 @@ def incident_type_query(complain, inquiry):
     return "(incidents_incident.incidentType LIKE 'COMPLAINT' OR incidents_incident.incidentType LIKE 'INQUIRY')"
 
 
+def incident_type_names(complain, inquiry):
+    """ incident types of the report, same selection as incident_type_query """
+    if complain and not inquiry:
+        return ["COMPLAINT"]
+    if inquiry and not complain:
+        return ["INQUIRY"]
+    return ["COMPLAINT", "INQUIRY"]
+
+
 def incident_list_query(start_date, end_date, incident_type):
     return """WHERE  incidents_incident.created_date BETWEEN CONVERT_TZ('%s','+05:30','+00:00') AND
                                                                    CONVERT_TZ('%s','+05:30','+00:00') AND %s""" % (
@@ -0,0 +1,267 @@
+"""Summary reports rendered in the background
+
+Rendering a summary report to PDF takes too long for a request. A report
+job is keyed by its parameters and the reporting data version (see
+models.py), so identical requests share one job until an incident changes:
+the job is rendered once and every user that asked for it is notified over
+the websocket when it's done.
+
+Jobs run on a small pool of threads that build the html from the database
+and hand the rendering to a pool of processes (REPORT_RENDER_PROCESSES, 0
+renders in the job thread). GET reports/ goes through the same jobs: the
+request runs its job unless another worker already does, then waits up to
+REPORT_JOB_WAIT seconds for it. PDFs are stored by the sha256 of their content.
+Jobs lost with their worker are restarted by the next identical request
+after REPORT_JOB_TIMEOUT. Every incident change makes the next request a new
+job, `remove_old_reports` drops the jobs and PDFs older than
+REPORT_RETENTION_DAYS.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction, IntegrityError, close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .exceptions import ReportJobNotFoundException
+from .models import ReportJob, ReportJobStatus, get_report_data_version
+from .pdf import render_pdf
+from .serializers import ReportJobSerializer
+from .services import build_summary_report
+from ..custom_auth.services import user_can
+from ..incidents.permissions import CAN_VIEW_REPORTS
+from ..notifications.services import send_to_user
+
+logger = logging.getLogger(__name__)
+
+REPORT_DIRECTORY = "reports"
+# seconds between two looks at a job rendered by another worker
+WAIT_INTERVAL = 0.5
+
+_lock = threading.Lock()
+_executor = None
+_process_pool = None
+
+
+def get_job_key(parameters: dict) -> str:
+    data = json.dumps([parameters, get_report_data_version()], sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+def get_report_job_by_id(job_id, user) -> ReportJob:
+    """ the job, for the users that requested it or may view reports """
+    try:
+        job = ReportJob.objects.get(id=job_id)
+    except ReportJob.DoesNotExist:
+        raise ReportJobNotFoundException()
+
+    if not job.requested_by.filter(id=user.id).exists() and not user_can(user, CAN_VIEW_REPORTS):
+        # not told apart from a missing job
+        raise ReportJobNotFoundException()
+    return job
+
+def get_rendered_report(parameters: dict):
+    """ the done job of these parameters on the current data, if any """
+    job = ReportJob.objects.filter(key=get_job_key(parameters), status=ReportJobStatus.DONE.name).first()
+    if job is None or not default_storage.exists(job.file.name):
+        return None
+    return job
+
+def request_report(parameters: dict, user=None) -> ReportJob:
+    """ the job rendering the report of these parameters: a done one, the
+        one in progress for an identical request or a new one, queued after
+        the current transaction commits
+    """
+    key = get_job_key(parameters)
+    job = ReportJob.objects.filter(key=key).first()
+
+    if job is None:
+        try:
+            with transaction.atomic():
+                job = ReportJob.objects.create(key=key, report=parameters["report"],
+                                               parameters=json.dumps(parameters, sort_keys=True))
+        except IntegrityError:
+            # created by an identical request meanwhile
+            job = ReportJob.objects.get(key=key)
+        else:
+            job_id = job.id
+            transaction.on_commit(lambda: submit_job(job_id))
+    else:
+        restart_job(job)
+
+    # requesters are notified when the job is done and may fetch it
+    if user is not None and user.is_authenticated:
+        job.requested_by.add(user)
+
+    return job
+
+def restart_job(job: ReportJob) -> bool:
+    """ queues the job again if it failed, its worker was lost or its file is gone """
+    if job.status == ReportJobStatus.DONE.name:
+        if default_storage.exists(job.file.name):
+            return False
+        restartable = Q(status=ReportJobStatus.DONE.name)
+    else:
+        stale = timezone.now() - timedelta(seconds=settings.REPORT_JOB_TIMEOUT)
+        restartable = Q(status=ReportJobStatus.FAILED.name) | Q(
+            status__in=[ReportJobStatus.PENDING.name, ReportJobStatus.RUNNING.name], updated_date__lt=stale)
+
+    # conditional update, concurrent requests restart the job once
+    restarted = ReportJob.objects.filter(restartable, id=job.id).update(
+        status=ReportJobStatus.PENDING.name, error=None, file=None, finished_date=None,
+        updated_date=timezone.now())
+    job.refresh_from_db()
+    if restarted:
+        job_id = job.id
+        transaction.on_commit(lambda: submit_job(job_id))
+    return bool(restarted)
+
+
+def wait_for_report(job: ReportJob, timeout: float) -> ReportJob:
+    """ renders the pending job in the calling thread, or waits up to
+        `timeout` seconds for the worker that claimed it. Returns the job as
+        it is then, still pending or running when the wait timed out.
+    """
+    if job.status == ReportJobStatus.PENDING.name:
+        run_job(job.id)
+
+    deadline = time.monotonic() + timeout
+    job.refresh_from_db()
+    while job.status in (ReportJobStatus.PENDING.name, ReportJobStatus.RUNNING.name) and \
+            time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        job.refresh_from_db()
+    return job
+
+
+def _get_executor():
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.REPORT_JOB_WORKERS,
+                                           thread_name_prefix="report-job")
+        return _executor
+
+def _get_process_pool():
+    global _process_pool
+
+    with _lock:
+        if _process_pool is None:
+            # spawned, forking a process with threads and database connections isn't safe
+            _process_pool = ProcessPoolExecutor(max_workers=settings.REPORT_RENDER_PROCESSES,
+                                                mp_context=multiprocessing.get_context("spawn"))
+        return _process_pool
+
+def _reset_process_pool(pool):
+    global _process_pool
+
+    with _lock:
+        if _process_pool is pool:
+            _process_pool = None
+
+def submit_job(job_id):
+    try:
+        _get_executor().submit(_background_run, job_id)
+    except RuntimeError:
+        # interpreter shutting down, the next identical request restarts the job
+        pass
+
+def _background_run(job_id):
+    try:
+        run_job(job_id)
+    except Exception:
+        logger.exception("report job %s failed", job_id)
+    finally:
+        close_old_connections()
+
+
+def render(html: str) -> bytes:
+    if not settings.REPORT_RENDER_PROCESSES:
+        return render_pdf(html)
+
+    pool = _get_process_pool()
+    try:
+        return pool.submit(render_pdf, html).result()
+    except BrokenProcessPool:
+        # a renderer died (ex: out of memory), start a new pool for the next jobs
+        _reset_process_pool(pool)
+        raise
+
+def store_report(content: bytes) -> str:
+    """ stores the PDF by the hash of its content, identical reports share the file """
+    name = "%s/%s.pdf" % (REPORT_DIRECTORY, hashlib.sha256(content).hexdigest())
+    if default_storage.exists(name):
+        return name
+    return default_storage.save(name, ContentFile(content))
+
+def run_job(job_id) -> bool:
+    """ renders the job in the calling thread, False when it isn't pending
+        (another worker claimed it)
+    """
+    claimed = ReportJob.objects.filter(id=job_id, status=ReportJobStatus.PENDING.name).update(
+        status=ReportJobStatus.RUNNING.name, updated_date=timezone.now())
+    if not claimed:
+        return False
+
+    job = ReportJob.objects.get(id=job_id)
+    try:
+        report = build_summary_report(json.loads(job.parameters))
+        if report is None:
+            raise ValueError("Report not found")
+        html, job.title = report
+        job.file = store_report(render(html))
+        job.status = ReportJobStatus.DONE.name
+    except Exception as error:
+        logger.exception("report job %s failed", job.id)
+        job.status = ReportJobStatus.FAILED.name
+        job.error = str(error) or type(error).__name__
+    job.finished_date = timezone.now()
+    job.save(update_fields=["status", "title", "file", "error", "finished_date"])
+
+    notify_requesters(job)
+    return True
+
+def notify_requesters(job: ReportJob):
+    payload = {"type": "report_job", "job": ReportJobSerializer(job).data}
+    for user in job.requested_by.all():
+        try:
+            send_to_user(user, payload)
+        except Exception:
+            # the job is done either way, the client can poll it
+            logger.exception("report job %s notification failed", job.id)
+
+
+def remove_old_reports(retention_days: int = None) -> int:
+    """ drops the jobs not queued or rendered within the retention and the
+        stored PDFs (of jobs or daily reports) no job refers to anymore,
+        returns how many jobs
+    """
+    if retention_days is None:
+        retention_days = settings.REPORT_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=retention_days)
+
+    # counted per model, the requested_by rows go with the jobs
+    _, removed = ReportJob.objects.filter(updated_date__lt=cutoff).delete()
+
+    referenced = set(ReportJob.objects.exclude(file="").exclude(file=None).values_list("file", flat=True))
+    try:
+        _, names = default_storage.listdir(REPORT_DIRECTORY)
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        name = "%s/%s" % (REPORT_DIRECTORY, name)
+        if name not in referenced and default_storage.get_modified_time(name) < cutoff:
+            default_storage.delete(name)
+
+    return removed.get(ReportJob._meta.label, 0)
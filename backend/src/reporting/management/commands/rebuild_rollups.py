@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...rollups import rebuild_daily_rollups
+
+
+class Command(BaseCommand):
+    help = "Recount the daily incident rollups used by reports and the grafana dashboard"
+
+    def handle(self, *args, **options):
+        rows = rebuild_daily_rollups()
+        self.stdout.write(self.style.SUCCESS("Rebuilt %d daily rollup row(s)" % rows))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...jobs import remove_old_reports
+
+
+class Command(BaseCommand):
+    help = "Remove the report jobs and PDFs older than REPORT_RETENTION_DAYS days"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None)
+
+    def handle(self, *args, **options):
+        removed = remove_old_reports(options["days"])
+        self.stdout.write(self.style.SUCCESS("Removed %d report job(s)" % removed))
@@ -0,0 +1,79 @@
+# Generated by Django 2.2.12 on 2026-10-18 05:26
+
+import collections
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils.timezone import utc
+
+# frozen copies of models.ROLLUP_INCIDENT_FIELDS and models.get_rollup_key
+REPORTING_UTC_OFFSET = timedelta(hours=5, minutes=30)
+
+ROLLUP_INCIDENT_FIELDS = ("created_date", "district", "category", "infoChannel", "current_severity",
+                          "current_status", "incidentType")
+
+SEVERITY_SEGMENTS = {
+    "HIGH": "High",
+    "MEDIUM": "Medium",
+    "LOW": "Low",
+}
+
+
+def get_rollup_key(created_date, district, category, channel, severity, status, incident_type):
+    def segment(value):
+        return "" if value is None else str(value)[:50]
+
+    return (
+        (created_date.astimezone(utc) + REPORTING_UTC_OFFSET).date(),
+        segment(district),
+        segment(category),
+        segment(channel),
+        SEVERITY_SEGMENTS.get(segment(severity), "Low"),
+        segment(status),
+        segment(incident_type),
+    )
+
+
+def populate_daily_rollups(apps, schema_editor):
+    """ initial counts, later kept up to date by signals """
+    Incident = apps.get_model("incidents", "Incident")
+    DailyIncidentRollup = apps.get_model("reporting", "DailyIncidentRollup")
+
+    counts = collections.Counter()
+    for values in Incident.objects.order_by().values_list(*ROLLUP_INCIDENT_FIELDS).iterator(chunk_size=5000):
+        counts[get_rollup_key(*values)] += 1
+
+    DailyIncidentRollup.objects.bulk_create([
+        DailyIncidentRollup(day=day, district=district, category=category, channel=channel,
+                            severity=severity, status=status, incident_type=incident_type, count=count)
+        for (day, district, category, channel, severity, status, incident_type), count in counts.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0001_initial'),
+        ('incidents', '0004_userworkload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyIncidentRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('district', models.CharField(blank=True, default='', max_length=50)),
+                ('category', models.CharField(blank=True, default='', max_length=50)),
+                ('channel', models.CharField(blank=True, default='', max_length=50)),
+                ('severity', models.CharField(blank=True, default='', max_length=10)),
+                ('status', models.CharField(blank=True, default='', max_length=50)),
+                ('incident_type', models.CharField(blank=True, default='', max_length=50)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('day', 'district', 'category', 'channel', 'severity', 'status', 'incident_type')},
+            },
+        ),
+        migrations.RunPython(populate_daily_rollups, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,17 @@
-from django.db import models
+import enum
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction, IntegrityError
+from django.db.models import F
+from django.db.models.signals import post_init, pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.timezone import utc
+
+from ..custom_auth.caches import get_cache_version, bump_cache_version
+from ..incidents.models import Incident, SeverityType
 
 # Create your models here.
 
@@ -15,4 +28,168 @@ class StatusSegment(models.Model):
     name = models.CharField(max_length=30)
 
     class Meta:
-        ordering = ("id",)
\ No newline at end of file
+        ordering = ("id",)
+
+class DailyIncidentRollup(models.Model):
+    """ Number of incidents submitted on a day (in the +05:30 reporting
+        timezone) per district, category, channel, severity segment, status
+        and incident type. Kept up to date by the incident signals below,
+        see rollups.py for rebuilding and reading it.
+        Unknown values are stored as "" so that the unique key holds.
+    """
+    day = models.DateField()
+    district = models.CharField(max_length=50, default="", blank=True)
+    category = models.CharField(max_length=50, default="", blank=True)
+    channel = models.CharField(max_length=50, default="", blank=True)
+    severity = models.CharField(max_length=10, default="", blank=True)
+    status = models.CharField(max_length=50, default="", blank=True)
+    incident_type = models.CharField(max_length=50, default="", blank=True)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = (("day", "district", "category", "channel", "severity", "status", "incident_type"),)
+
+# offset of the timezone the reports are written in (Asia/Colombo)
+REPORTING_UTC_OFFSET = timedelta(hours=5, minutes=30)
+
+ROLLUP_INCIDENT_FIELDS = ("created_date", "district", "category", "infoChannel", "current_severity",
+                          "current_status", "incidentType")
+
+SEVERITY_SEGMENTS = {
+    SeverityType.HIGH.name: "High",
+    SeverityType.MEDIUM.name: "Medium",
+    SeverityType.LOW.name: "Low",
+}
+
+def get_reporting_day(created_date):
+    return (created_date.astimezone(utc) + REPORTING_UTC_OFFSET).date()
+
+def get_rollup_value(value) -> str:
+    """ value of an incident field as stored in DailyIncidentRollup """
+    return "" if value is None else str(value)[:50]
+
+def get_severity_segment(severity) -> str:
+    return SEVERITY_SEGMENTS.get(get_rollup_value(severity), "Low")
+
+def get_rollup_key(created_date, district, category, channel, severity, status, incident_type):
+    """ DailyIncidentRollup lookup of an incident with the given field values """
+    return (
+        get_reporting_day(created_date),
+        get_rollup_value(district),
+        get_rollup_value(category),
+        get_rollup_value(channel),
+        get_severity_segment(severity),
+        get_rollup_value(status),
+        get_rollup_value(incident_type),
+    )
+
+def get_incident_rollup_key(incident):
+    """ rollup key as last loaded or saved, None if any of the fields were deferred """
+    if any(field not in incident.__dict__ for field in ROLLUP_INCIDENT_FIELDS) or incident.created_date is None:
+        return None
+
+    return get_rollup_key(*(getattr(incident, field) for field in ROLLUP_INCIDENT_FIELDS))
+
+def add_to_rollup(key, count):
+    day, district, category, channel, severity, status, incident_type = key
+    lookup = dict(day=day, district=district, category=category, channel=channel,
+                  severity=severity, status=status, incident_type=incident_type)
+
+    updated = DailyIncidentRollup.objects.filter(**lookup).update(count=F("count") + count)
+    if updated == 0:
+        try:
+            with transaction.atomic():
+                DailyIncidentRollup.objects.create(count=count, **lookup)
+        except IntegrityError:
+            # created concurrently
+            DailyIncidentRollup.objects.filter(**lookup).update(count=F("count") + count)
+
+@receiver(post_init, sender=Incident)
+def remember_incident_rollup_key(sender, instance, **kwargs):
+    instance._rollup_key = get_incident_rollup_key(instance)
+
+@receiver(pre_save, sender=Incident)
+def load_incident_rollup_key(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding or instance._rollup_key is not None:
+        return
+
+    # loaded with deferred fields, check what is in the database
+    previous = Incident.objects.filter(pk=instance.pk).values_list(*ROLLUP_INCIDENT_FIELDS).first()
+    if previous is not None:
+        instance._rollup_key = get_rollup_key(*previous)
+
+@receiver(post_save, sender=Incident)
+def update_incident_rollup(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous_key = None if created else instance._rollup_key
+    # deferred fields are not written by save, so those are unchanged
+    key = get_incident_rollup_key(instance) or previous_key
+
+    if key != previous_key:
+        with transaction.atomic():
+            if previous_key is not None:
+                add_to_rollup(previous_key, -1)
+            if key is not None:
+                add_to_rollup(key, 1)
+
+    instance._rollup_key = key
+
+@receiver(post_delete, sender=Incident)
+def remove_incident_from_rollup(sender, instance, **kwargs):
+    if instance._rollup_key is not None:
+        add_to_rollup(instance._rollup_key, -1)
+
+
+class ReportJobStatus(enum.Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+
+    def __str__(self):
+        return self.name
+
+class ReportJob(models.Model):
+    """ A summary report rendered to PDF in the background, see jobs.py.
+        `key` hashes the parameters with the reporting data version, so the
+        job (and its file) answers identical requests until an incident
+        changes.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    key = models.CharField(max_length=64, unique=True)
+    report = models.CharField(max_length=100)
+    # json of the report parameters
+    parameters = models.TextField()
+    status = models.CharField(max_length=10, choices=[(tag.name, tag.value) for tag in ReportJobStatus],
+                              default=ReportJobStatus.PENDING.name)
+    title = models.CharField(max_length=500, blank=True, default="")
+    # named by the sha256 of the content, identical reports share the file
+    file = models.FileField(max_length=200, null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    # users notified when the job is done
+    requested_by = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name="report_jobs", blank=True)
+    created_date = models.DateTimeField(auto_now_add=True)
+    # set when the job is queued or claimed, to restart jobs lost with their worker
+    updated_date = models.DateTimeField(default=timezone.now)
+    finished_date = models.DateTimeField(null=True, blank=True)
+
+REPORT_DATA_VERSION_CACHE_KEY = "reporting:data_version"
+
+def get_report_data_version() -> str:
+    """ changes whenever an incident does. Kept in the django cache, which
+        must be shared by the workers (see CACHE_REDIS_URL) for a change made
+        through one of them to reach the reports served by the others. Starts
+        over with a new value when the cache loses it, so reports are never
+        served from older data
+    """
+    # without a working cache every request renders
+    return get_cache_version(REPORT_DATA_VERSION_CACHE_KEY) or uuid.uuid4().hex
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+def update_report_data_version(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(lambda: bump_cache_version(REPORT_DATA_VERSION_CACHE_KEY))
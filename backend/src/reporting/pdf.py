@@ -0,0 +1,15 @@
+"""PDF rendering for the report job process pool. Kept free of django
+imports, the spawned workers only need xhtml2pdf.
+"""
+
+import io
+
+from xhtml2pdf import pisa
+
+
+def render_pdf(html: str) -> bytes:
+    output = io.BytesIO()
+    result = pisa.CreatePDF(html, dest=output)
+    if result.err:
+        raise ValueError("PDF rendering failed with %d error(s)" % result.err)
+    return output.getvalue()
@@ -0,0 +1,184 @@
+"""Client of the external pdf service (https://github.com/ECLK/pdf-service)
+
+The service renders the template data it is posted and answers with the
+url of the PDF. Both calls go through a pooled session with connect and
+read timeouts and a circuit breaker: after PDF_SERVICE_FAILURE_THRESHOLD
+consecutive failures requests fail at once for PDF_SERVICE_RESET_TIMEOUT
+seconds instead of tying up workers on a service that is down. The PDF is
+streamed through to the client in chunks.
+
+The daily and weekly reports only depend on the day and the incidents, so
+their PDFs are stored (like the report jobs' ones) and served again until
+the day ends or an incident changes.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import date
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+
+from .exceptions import PdfServiceException, PdfServiceUnavailableException, PdfServiceResponseException
+from .jobs import store_report
+from .models import get_report_data_version
+from ..instrumentation import external_call
+
+logger = logging.getLogger(__name__)
+
+# templates of the daily and weekly reports, their only parameter is the language
+CACHED_TEMPLATES = (
+    "daily_category",
+    "daily_category_closed",
+    "weekly_closed_request_category",
+    "weekly_closed_request_organization",
+    "daily_closed_request_organization",
+)
+
+_lock = threading.Lock()
+_session = None
+_breaker = None
+
+
+class CircuitBreaker:
+    """ opens after `failure_threshold` consecutive failures, then lets a
+        single trial call through every `reset_timeout` seconds until one
+        succeeds. The state is per process.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if self.trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                raise PdfServiceUnavailableException()
+            self.trial = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.trial = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def _get_session():
+    global _session
+
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=settings.PDF_SERVICE_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+def _get_breaker():
+    global _breaker
+
+    with _lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker(settings.PDF_SERVICE_FAILURE_THRESHOLD, settings.PDF_SERVICE_RESET_TIMEOUT)
+        return _breaker
+
+def _call(method, url, **kwargs):
+    """ a request through the circuit breaker, raises unless the response is a 200 """
+    breaker = _get_breaker()
+    breaker.before_call()
+    try:
+        with external_call("pdf_service"):
+            response = _get_session().request(method, url, timeout=(settings.PDF_SERVICE_CONNECT_TIMEOUT,
+                                                                    settings.PDF_SERVICE_READ_TIMEOUT), **kwargs)
+    except requests.RequestException as error:
+        breaker.record_failure()
+        logger.warning("pdf service %s %s failed: %s", method, url, error)
+        raise PdfServiceException()
+
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    if response.status_code != 200:
+        # read before closing, a streamed response has no body afterwards
+        try:
+            content = response.content
+        except requests.RequestException:
+            content = b""
+        finally:
+            response.close()
+        raise PdfServiceResponseException(response.status_code, content)
+    return response
+
+
+def generate_pdf(data: dict) -> str:
+    """ renders the template data, returns the url of the PDF """
+    response = _call("post", settings.PDF_SERVICE_ENDPOINT, data=json.dumps(data),
+                     headers={'content-type': 'application/json'})
+    try:
+        return response.json()["url"]
+    except (ValueError, KeyError):
+        raise PdfServiceException("PDF service returned no url")
+
+def open_pdf(url: str):
+    """ the response of the PDF, its body isn't read yet """
+    return _call("get", url, stream=True)
+
+def iter_pdf(response, cache_key=None):
+    """ the body of the PDF response in chunks. With a cache key the PDF is
+        stored for the next identical request once it was read completely
+    """
+    chunks = [] if cache_key is not None else None
+    try:
+        for chunk in response.iter_content(settings.PDF_SERVICE_CHUNK_SIZE):
+            if chunks is not None:
+                chunks.append(chunk)
+            yield chunk
+    except requests.RequestException as error:
+        _get_breaker().record_failure()
+        logger.warning("pdf service download failed: %s", error)
+        raise
+    finally:
+        response.close()
+
+    if chunks is not None:
+        try:
+            cache.set(cache_key, store_report(b"".join(chunks)), settings.PDF_SERVICE_CACHE_TIMEOUT)
+        except Exception:
+            # the client has the PDF, the next request renders it again
+            logger.exception("storing the %s report failed", cache_key)
+
+
+def get_report_cache_key(template_type, language):
+    """ the cache key of a daily or weekly report, None for the other templates """
+    if template_type not in CACHED_TEMPLATES:
+        return None
+    data = json.dumps([template_type, language, date.today().isoformat(), get_report_data_version()])
+    return "reporting:pdf:%s" % hashlib.sha256(data.encode()).hexdigest()
+
+def get_cached_report(cache_key):
+    """ the storage name of the cached PDF, None if it isn't cached """
+    name = cache.get(cache_key)
+    if name is None or not default_storage.exists(name):
+        return None
+    return name
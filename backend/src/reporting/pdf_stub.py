@@ -0,0 +1,88 @@
+"""A local stand-in for the pdf service, for tests and benchmarks
+
+Answers a POST of template data with the url of a PDF it serves itself, like
+the real service. `delay` holds the answers back to exercise the timeouts,
+`status` makes the generate requests fail and `download_status` the
+downloads of the PDFs.
+
+    with StubPdfService() as pdf_service, override_settings(PDF_SERVICE_ENDPOINT=pdf_service.endpoint):
+        ...
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+from .pdf import render_pdf
+
+
+class StubPdfService:
+
+    def __init__(self, delay=0, status=200, download_status=200):
+        self.delay = delay
+        self.status = status
+        self.download_status = download_status
+        # template data of the generate requests
+        self.requests = []
+        self.pdfs = {}
+        self.server = None
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return "http://127.0.0.1:%d/generate" % self.server.server_port
+
+    def start(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                data = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "{}")
+                time.sleep(service.delay)
+                if service.status != 200:
+                    return self.send(service.status, b'{"error": "stub failure"}', "application/json")
+
+                with service._lock:
+                    service.requests.append(data)
+                    name = "%d.pdf" % len(service.requests)
+                    service.pdfs[name] = render_pdf("<h1>%s</h1>" % escape(str(data.get("file", {}).get("template"))))
+                url = "http://127.0.0.1:%d/files/%s" % (self.server.server_port, name)
+                self.send(200, json.dumps({"url": url}).encode(), "application/json")
+
+            def do_GET(self):
+                pdf = service.pdfs.get(self.path.rsplit("/", 1)[-1])
+                if pdf is None or service.download_status != 200:
+                    return self.send(service.download_status if pdf is not None else 404,
+                                     b'{"error": "stub download failure"}', "application/json")
+                self.send(200, pdf, "application/pdf")
+
+            def send(self, status, body, content_type):
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except ConnectionError:
+                    # the client timed out
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,184 @@
+"""Daily incident rollups
+
+DailyIncidentRollup keeps per day counts of incidents so that reports and
+the grafana dashboard don't need to scan the incident table. The counts are
+maintained incrementally by the incident signals in models.py, this module
+rebuilds them and answers report queries from them, reading only the partial
+days at the ends of a report from the incident table.
+"""
+
+import collections
+from datetime import datetime, timedelta
+
+import pandas as pd
+from django.db import transaction
+from django.db.models import Sum, Count
+from django.utils.timezone import utc
+
+from .models import DailyIncidentRollup, ROLLUP_INCIDENT_FIELDS, REPORTING_UTC_OFFSET, get_rollup_key, \
+    get_rollup_value, get_severity_segment
+from ..common.models import Channel, District
+from ..common.caches import get_categories
+from ..incidents.models import Incident, StatusType
+
+REBUILD_CHUNK_SIZE = 5000
+
+# incident field of each rollup field the reports group by
+ROLLUP_FIELD_SOURCES = {
+    "district": "district",
+    "category": "category",
+    "channel": "infoChannel",
+    "severity": "current_severity",
+    "status": "current_status",
+}
+
+UNASSIGNED_LABEL = "(Unassigned)"
+TOTAL_LABEL = "(Total No. of Incidents)"
+
+
+def rebuild_daily_rollups() -> int:
+    """ recounts the rollups from the incident table. Running it again gives
+        the same table, returns the number of rollup rows.
+    """
+    counts = collections.Counter()
+    for values in Incident.objects.order_by().values_list(*ROLLUP_INCIDENT_FIELDS).iterator(
+            chunk_size=REBUILD_CHUNK_SIZE):
+        counts[get_rollup_key(*values)] += 1
+
+    rollups = [
+        DailyIncidentRollup(day=day, district=district, category=category, channel=channel,
+                            severity=severity, status=status, incident_type=incident_type, count=count)
+        for (day, district, category, channel, severity, status, incident_type), count in counts.items()
+    ]
+
+    with transaction.atomic():
+        DailyIncidentRollup.objects.all().delete()
+        DailyIncidentRollup.objects.bulk_create(rollups, batch_size=500)
+
+    return len(rollups)
+
+
+def parse_report_date(value: str):
+    for date_format in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+        try:
+            return datetime.strptime(value.strip(), date_format)
+        except ValueError:
+            pass
+    return None
+
+
+def get_report_range(start_date: str, end_date: str):
+    """ (start, end) of the report bounds ('2020-04-20 16:00:00' in +05:30),
+        None when they can't be parsed
+    """
+    start = parse_report_date(start_date)
+    end = parse_report_date(end_date)
+    if start is None or end is None:
+        return None
+    return (start, end)
+
+
+def to_utc(report_date: datetime) -> datetime:
+    return (report_date - REPORTING_UTC_OFFSET).replace(tzinfo=utc)
+
+
+def get_incident_counts(field, start, end, incident_types, include_end=True) -> collections.Counter:
+    """ incident count per rollup value of the field, read from the incident
+        table for the part of a day the rollups can't answer
+    """
+    created_date = {"created_date__gte": to_utc(start)}
+    created_date["created_date__lte" if include_end else "created_date__lt"] = to_utc(end)
+
+    normalize = get_severity_segment if field == "severity" else get_rollup_value
+    counts = collections.Counter()
+    for value, total in Incident.objects.filter(incidentType__in=incident_types, **created_date).order_by(
+            ).values_list(ROLLUP_FIELD_SOURCES[field]).annotate(total=Count("id")):
+        counts[normalize(value)] += total
+    return counts
+
+
+def get_rollup_counts(field, report_range, incident_types) -> dict:
+    """ incident count per value of the given rollup field between the report
+        bounds, both included like the BETWEEN of the sql reports. The whole
+        days are read from the rollups, the partial first and last days
+        (the frontend asks from 16:00 to 15:59) from the incident table.
+    """
+    start, end = report_range
+    first_day = start.date() if start.time() == datetime.min.time() else start.date() + timedelta(days=1)
+    last_day = end.date()
+
+    counts = collections.Counter()
+    if first_day < last_day:
+        rollups = DailyIncidentRollup.objects.filter(
+            day__gte=first_day,
+            day__lt=last_day,
+            incident_type__in=incident_types
+        ).order_by().values_list(field).annotate(total=Sum("count"))
+        counts.update(dict(rollups))
+
+        first_midnight = datetime.combine(first_day, datetime.min.time())
+        if start < first_midnight:
+            counts.update(get_incident_counts(field, start, first_midnight, incident_types, include_end=False))
+        counts.update(get_incident_counts(field, datetime.combine(last_day, datetime.min.time()), end,
+                                          incident_types))
+    else:
+        counts.update(get_incident_counts(field, start, end, incident_types))
+
+    return { value: total for value, total in counts.items() if total }
+
+
+def get_rollup_report(field, labels, report_range, incident_types, ordered_labels=None):
+    """ report table in the layout of functions.get_general_report.
+        `labels` maps a rollup value to its row label, values without a
+        label are counted as unassigned.
+    """
+    totals = collections.OrderedDict((label, 0) for label in (ordered_labels or labels.values()))
+    unassigned = 0
+    for value, count in get_rollup_counts(field, report_range, incident_types).items():
+        label = labels.get(value)
+        if label is None:
+            unassigned += count
+        else:
+            totals[label] = totals.get(label, 0) + count
+
+    rows = list(totals.items())
+    if ordered_labels is None:
+        rows.sort(key=lambda row: row[1], reverse=True)
+        if unassigned:
+            rows.insert(0, (UNASSIGNED_LABEL, unassigned))
+    rows.append((TOTAL_LABEL, sum(totals.values()) + unassigned))
+
+    return rows
+
+
+def get_rollup_report_html(field_label, rows):
+    dataframe = pd.DataFrame(rows, columns=[field_label, "Total"])
+    return dataframe.to_html(index=False)
+
+
+def get_district_rollup_report(report_range, incident_types):
+    labels = dict(District.objects.values_list("code", "name"))
+    return get_rollup_report("district", labels, report_range, incident_types)
+
+
+def get_category_rollup_report(report_range, incident_types):
+    labels = { str(category.id): category.top_category for category in get_categories() }
+    return get_rollup_report("category", labels, report_range, incident_types)
+
+
+def get_mode_rollup_report(report_range, incident_types):
+    labels = { str(channel_id): name for channel_id, name in Channel.objects.values_list("id", "name") }
+    return get_rollup_report("channel", labels, report_range, incident_types)
+
+
+def get_severity_rollup_report(report_range, incident_types):
+    segments = ["High", "Medium", "Low"]
+    labels = { segment: segment for segment in segments }
+    return get_rollup_report("severity", labels, report_range, incident_types, segments)
+
+
+def get_status_rollup_report(report_range, incident_types):
+    labels = { status.name: "Unresolved" for status in StatusType }
+    labels[StatusType.CLOSED.name] = "Resolved"
+    labels[""] = "Unresolved"
+    return get_rollup_report("status", labels, report_range, incident_types, ["Resolved", "Unresolved"])
@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from .models import ReportJob, ReportJobStatus
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    createdDate = serializers.DateTimeField(source="created_date")
+    finishedDate = serializers.DateTimeField(source="finished_date")
+    downloadUrl = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = (
+            "id",
+            "report",
+            "status",
+            "title",
+            "error",
+            "createdDate",
+            "finishedDate",
+            "downloadUrl"
+        )
+
+    def get_downloadUrl(self, job):
+        if job.status != ReportJobStatus.DONE.name:
+            return None
+        return "/reports/jobs/%s/download" % job.id
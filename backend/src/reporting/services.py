@@ -8,12 +8,16 @@ from django.utils.timezone import get_current_timezone
 from django.utils.dateparse import parse_datetime
 
 from ..custom_auth.models import Profile, Organization
+from ..custom_auth.caches import get_hierarchy
+from ..common.caches import get_categories
 from ..common.models import Category, Channel, District
 from ..incidents.models import Incident, IncidentType, CloseWorkflow, StatusType
 from ..incidents.services import get_incident_by_id
 from .functions import get_detailed_report, get_general_report, encode_column_names, get_subcategory_report, \
-    incident_type_query, incident_list_query, date_list_query, encode_value, get_subcategory_categorized_report
-from ..common.data.Institutions import institutions
+    incident_type_query, incident_list_query, date_list_query, encode_value, get_subcategory_categorized_report, \
+    incident_type_names, incident_type_title, decode_column_names, apply_style
+from .rollups import get_report_range, get_rollup_report_html, get_district_rollup_report, \
+    get_category_rollup_report, get_mode_rollup_report, get_severity_rollup_report, get_status_rollup_report
 # from django.conf import settings
 from django.db.models import Count
 import collections, functools, operator
@@ -25,6 +29,15 @@ def get_total_opened_incident_count():
     count = Incident.objects.exclude(current_status=StatusType.CLOSED.name).exclude(current_status=StatusType.INVALIDATED.name).count()
     return count
 
+def get_incidents_by_action(actionType, start_date, end_date):
+    """ incidents opened / closed within the range. A closed incident
+        appears once per close action in the range.
+    """
+    if (actionType == "CLOSED"):
+        return Incident.objects.filter(incidents_closeworkflows__created_date__range=(start_date, end_date))
+
+    return Incident.objects.filter(created_date__range=(start_date, end_date))
+
 def get_daily_incidents(actionType = "OPENED"):
     """ List dialy incidents to the current date """
 
@@ -32,13 +45,7 @@ def get_daily_incidents(actionType = "OPENED"):
     start_date = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
     end_date = start_date + timedelta(1)
 
-    if (actionType == "CLOSED"):
-        incidents = []
-        closeIncidents = CloseWorkflow.objects.filter(created_date__range=(start_date, end_date))
-        for incident in closeIncidents:
-            incidents.append(incident.incident)
-    else:
-        incidents = Incident.objects.filter(created_date__range=(start_date, end_date))
+    incidents = get_incidents_by_action(actionType, start_date, end_date)
 
     return incidents
 
@@ -49,13 +56,7 @@ def get_weekly_incidents(actionType = "OPENED"):
     start_date = current_date - timedelta(current_date.weekday())
     end_date = start_date + timedelta(6)
 
-    if (actionType == "CLOSED"):
-        incidents = []
-        closeIncidents = CloseWorkflow.objects.filter(created_date__range=(start_date, end_date))
-        for incident in closeIncidents:
-            incidents.append(incident.incident)
-    else:
-        incidents = Incident.objects.filter(created_date__range=(start_date, end_date))
+    incidents = get_incidents_by_action(actionType, start_date, end_date)
 
     week_data = {}
     week_data["incidents"] = incidents
@@ -70,78 +71,66 @@ def parse_date_timezone(datetimeValue):
     return datetimeValue
 
 
-def get_category_dict(incidents):
-    """returns the category dictionary with counts on given incidents"""
+def get_category_counts(incidents):
+    """ incident count per category id, in one grouped query """
+    counts = incidents.order_by().values_list("category").annotate(count=Count("id"))
+    return { category: count for category, count in counts }
 
-    # get incident count per category
-    category_count = {}
-    for incident in incidents:
-        if incident.category in category_count:
-            category_count[incident.category] += 1
-        else:
-            category_count[incident.category] = 1
+def get_category_dict(category_count):
+    """returns the category dictionary with the given counts per category id"""
 
     # collecting all category data
     category_dict = []
-    categories = Category.objects.all()
+    categories = get_categories()
 
     temp_category_dict = {}
     top_categories = []
     for category in categories:
-        if category.top_category in temp_category_dict:
-            sub_cat = {}
-            sub_cat["nameEnglish"] = category.sub_category
-            sub_cat["nameSinhala"] = category.sn_sub_category
-            sub_cat["nameTamil"] = category.tm_sub_category
-            if str(category.id) in category_count:
-                sub_cat["count"] = category_count[str(category.id)]
-            else:
-                sub_cat["count"] = 0
-            temp_category_dict[category.top_category]["subCategories"].append( sub_cat)
-        else:
+        sub_cat = {}
+        sub_cat["nameEnglish"] = category.sub_category
+        sub_cat["nameSinhala"] = category.sn_sub_category
+        sub_cat["nameTamil"] = category.tm_sub_category
+        sub_cat["count"] = category_count.get(str(category.id), 0)
+
+        if category.top_category not in temp_category_dict:
             top_cat = {}
             top_cat["categoryNameEnglish"] = category.top_category
             top_cat["categoryNameSinhala"] = category.sn_top_category
             top_cat["categoryNameTamil"] = category.tm_top_category
-            top_categories.append(category.top_category)
-
-            sub_cat = {}
-            sub_cat["nameEnglish"] = category.sub_category
-            sub_cat["nameSinhala"] = category.sn_sub_category
-            sub_cat["nameTamil"] = category.tm_sub_category
-            if str(category.id) in category_count:
-                sub_cat["count"] = category_count[str(category.id)]
-            else:
-                sub_cat["count"] = 0
             top_cat["subCategories"] = []
-            top_cat["subCategories"].append(sub_cat)
+            top_categories.append(category.top_category)
             temp_category_dict[category.top_category] = top_cat
 
+        temp_category_dict[category.top_category]["subCategories"].append(sub_cat)
+
     for category in top_categories:
         category_dict.append(temp_category_dict[category])
 
     return category_dict
 
-def get_organization_dict(incidents, actionType = "OPENED"):
-    """ return organizations dict with count of incidents """
-
-    # get organizations with incident count
-    org_count = {}
-    for incident in incidents:
-        if actionType == "CLOSED" :
-            user = CloseWorkflow.objects.get(incident_id=incident).actioned_user
-        else:
-            user = incident.created_by
-        profile = Profile.objects.get(user=user)
-        if profile.organization_id in org_count:
-            org_count[profile.organization_id] += 1
-        else:
-            org_count[profile.organization_id] = 1
+def get_organization_counts(incidents, actionType = "OPENED"):
+    """ incident count per organization of the user who created (or closed)
+        the incident, in one grouped query
+    """
+    if actionType == "CLOSED":
+        organization_field = "incidents_closeworkflows__actioned_user__profile__organization"
+    else:
+        organization_field = "created_by__profile__organization"
+
+    counts = incidents.order_by().values_list(organization_field).annotate(count=Count("id"))
+    return { organization_id: count for organization_id, count in counts }
 
+def get_organization_dict(org_count):
+    """ return organizations dict with the given counts per organization id """
+
+    hierarchy = get_hierarchy()
     organizations = []
     for org_id, count in org_count.items():
+        org = hierarchy.organizations.get(org_id)
+        if org is None:
+            continue
+
         orgData = {}
-        org = Organization.objects.get(id=org_id)
         orgData["organizationNameEnglish"] = org.displayName
         orgData["organizationNameSinhala"] = org.sn_name
         orgData["organizationNameTamil"] = org.tm_name
@@ -151,6 +140,18 @@ def get_organization_dict(incidents, actionType = "OPENED"):
 
     return organizations
 
+def set_category_data(file_dict, incidents):
+    category_count = get_category_counts(incidents)
+    file_dict["total"] = sum(category_count.values())
+    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
+    file_dict["categories"] = get_category_dict(category_count)
+
+def set_organization_data(file_dict, incidents, actionType):
+    org_count = get_organization_counts(incidents, actionType)
+    file_dict["organizations"] = get_organization_dict(org_count)
+    file_dict["total"] = sum(org_count.values())
+    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
+
 def get_daily_category_data(language="sinhala"):
 
     file_dict = {}
@@ -159,10 +160,7 @@ def get_daily_category_data(language="sinhala"):
     file_dict["language"] = language
 
     incidents = get_daily_incidents()
-    file_dict["total"] = len(incidents)
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
-
-    file_dict["categories"] = get_category_dict(incidents)
+    set_category_data(file_dict, incidents)
 
     return file_dict
 
@@ -174,10 +172,7 @@ def get_closed_daily_category_data(language="sinhala"):
     file_dict["language"] = language
 
     incidents = get_daily_incidents("CLOSED")
-    file_dict["total"] = len(incidents)
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
-
-    file_dict["categories"] = get_category_dict(incidents)
+    set_category_data(file_dict, incidents)
 
     return file_dict
 
@@ -190,10 +185,7 @@ def get_category_data_by_date_range(start_time, end_time, language="sinhala"):
     file_dict["language"] = language
 
     incidents = Incident.objects.filter(created_date__range=(parse_date_timezone(start_time), parse_date_timezone(end_time)))
-    file_dict["total"] = len(incidents)
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
-
-    file_dict["categories"] = get_category_dict(incidents)
+    set_category_data(file_dict, incidents)
 
     return file_dict
 
@@ -208,10 +200,7 @@ def get_weekly_closed_complain_category_data(language="sinhala"):
     file_dict["language"] = language
 
     incidents = week_data["incidents"]
-    file_dict["total"] = len(incidents)
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
-
-    file_dict["categories"] = get_category_dict(incidents)
+    set_category_data(file_dict, incidents)
 
     return file_dict
 
@@ -224,10 +213,7 @@ def get_organizationwise_data_with_timefilter(start_time, end_time, language="si
     file_dict["language"] = language
 
     incidents = Incident.objects.filter(created_date__range=(parse_date_timezone(start_time), parse_date_timezone(end_time)))
-    file_dict["total"] = incidents.count()
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
-
-    file_dict["organizations"] = get_organization_dict(incidents, "OPENED")
+    set_organization_data(file_dict, incidents, "OPENED")
 
     return file_dict
 
@@ -244,10 +230,7 @@ def get_weekly_closed_complain_organization_data(language="sinhala"):
     file_dict["EndDate"] = week_data["end_date"]
 
     incidents = week_data["incidents"]
-    file_dict["organizations"] = get_organization_dict(incidents, "CLOSED")
-
-    file_dict["total"] = len(incidents)
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
+    set_organization_data(file_dict, incidents, "CLOSED")
 
     return file_dict
 
@@ -262,15 +245,17 @@ def get_daily_closed_complain_organization_data(language="sinhala"):
     end_datetime = date.today().strftime("%Y-%m-%d")
 
     incidents = get_daily_incidents("CLOSED")
-    file_dict["organizations"] = get_organization_dict(incidents, "CLOSED")
-
-    file_dict["total"] = len(incidents)
-    file_dict["totalOpenedCount"] = get_total_opened_incident_count()
+    set_organization_data(file_dict, incidents, "CLOSED")
 
     return file_dict
 
 
 def get_category_summary(start_date, end_date, detailed_report, complain, inquiry):
+    report_range = get_report_range(start_date, end_date)
+    if not detailed_report and report_range is not None:
+        rows = get_category_rollup_report(report_range, incident_type_names(complain, inquiry))
+        return get_rollup_report_html("Category", rows)
+
     sql3 = incident_type_query(complain, inquiry)
     incident_list = incident_list_query(start_date, end_date, sql3)
     if detailed_report:
@@ -314,6 +299,11 @@ def get_subcategory_summary(start_date, end_date, detailed_report, complain,
 
 
 def get_mode_summary(start_date, end_date, detailed_report, complain, inquiry):
+    report_range = get_report_range(start_date, end_date)
+    if not detailed_report and report_range is not None:
+        rows = get_mode_rollup_report(report_range, incident_type_names(complain, inquiry))
+        return get_rollup_report_html("Mode", rows)
+
     sql3 = incident_type_query(complain, inquiry)
     incident_list = incident_list_query(start_date, end_date, sql3)
     if detailed_report:
@@ -377,6 +367,11 @@ FROM   incidents_incident
 
 def get_district_summary(start_date, end_date, detailed_report, complain,
                          inquiry):
+    report_range = get_report_range(start_date, end_date)
+    if not detailed_report and report_range is not None:
+        rows = get_district_rollup_report(report_range, incident_type_names(complain, inquiry))
+        return get_rollup_report_html("District", rows)
+
     sql3 = incident_type_query(complain, inquiry)
     return get_general_report("name", "District", "common_district",
                               "district", "code", start_date, end_date, sql3)
@@ -384,6 +379,11 @@ def get_district_summary(start_date, end_date, detailed_report, complain,
 
 def get_severity_summary(start_date, end_date, detailed_report, complain,
                          inquiry):
+    report_range = get_report_range(start_date, end_date)
+    if not detailed_report and report_range is not None:
+        rows = get_severity_rollup_report(report_range, incident_type_names(complain, inquiry))
+        return get_rollup_report_html("Severity", rows)
+
     sql3 = incident_type_query(complain, inquiry)
     incident_list = incident_list_query(start_date, end_date, sql3)
     if detailed_report:
@@ -444,6 +444,11 @@ def get_severity_summary(start_date, end_date, detailed_report, complain,
 
 def get_status_summary(start_date, end_date, detailed_report, complain,
                        inquiry):
+    report_range = get_report_range(start_date, end_date)
+    if not detailed_report and report_range is not None:
+        rows = get_status_rollup_report(report_range, incident_type_names(complain, inquiry))
+        return get_rollup_report_html("Status", rows)
+
     sql3 = incident_type_query(complain, inquiry)
     incident_list = incident_list_query(start_date, end_date, sql3)
     if detailed_report:
@@ -529,3 +534,68 @@ def get_police_division_summary():
     dataframe.index.names = ["Province", "DI Division", "Police Division"]
 
     return dataframe.to_html()
+
+
+# report -> (builder, title, title of the detailed report, layout of the detailed report)
+SUMMARY_REPORTS = {
+    "category_wise_summary_report": (get_category_summary, "Category", "District and Category", "A4 portrait"),
+    "mode_wise_summary_report": (get_mode_summary, "Mode", "District and Mode", "A4 landscape"),
+    "district_wise_summary_report": (get_district_summary, "District", "District", "A4 portrait"),
+    "severity_wise_summary_report": (get_severity_summary, "Severity", "District and Severity", "A4 portrait"),
+    "subcategory_wise_summary_report": (get_subcategory_summary, "Subcategory", "District and Subcategory",
+                                        "A3 landscape"),
+    "incident_date_wise_summary_report": (get_incident_date_summary, "Incident Date", "Incident Date",
+                                          "A4 portrait"),
+    "status_wise_summary_report": (get_status_summary, "Status", "District and Status", "A4 portrait"),
+}
+
+def get_summary_report_parameters(params) -> dict:
+    """ parameters of a summary report request, dates default to today """
+    def get_date(name):
+        value = params.get(name, '')
+        if value == '':
+            return date.today().strftime("%Y-%m-%d 16:00:00")
+        return value.replace("T", " ", 1)
+
+    def get_flag(name):
+        # 'true' in query strings, true in json bodies
+        return str(params.get(name, 'false')).lower() == 'true'
+
+    return {
+        "report": params.get('report', None) or "",
+        "start_date": get_date('start_date'),
+        "end_date": get_date('end_date'),
+        "detailed_report": get_flag('detailed_report'),
+        "complain": get_flag('complain'),
+        "inquiry": get_flag('inquiry'),
+    }
+
+def build_summary_report(parameters: dict):
+    """ (styled html, title) of a summary report, None for an unknown report """
+    if parameters["report"] not in SUMMARY_REPORTS:
+        return None
+
+    start_date, end_date = parameters["start_date"], parameters["end_date"]
+    detailed_report, complain, inquiry = parameters["detailed_report"], parameters["complain"], parameters["inquiry"]
+    builder, title, detailed_title, detailed_layout = SUMMARY_REPORTS[parameters["report"]]
+
+    table_html = builder(start_date, end_date, detailed_report, complain, inquiry)
+    table_title = "from %s to %s by %s" % (start_date, end_date, detailed_title if detailed_report else title)
+    layout = detailed_layout if detailed_report else "A4 portrait"
+    incident_type_string = incident_type_title(complain, inquiry)
+
+    # Prepare report header
+    sql = """SELECT
+                 Count(id) as TotalCount
+             FROM   incidents_incident WHERE %s""" % incident_type_query(complain, inquiry)
+    total_count = pd.read_sql_query(sql, connection)['TotalCount'][0]
+
+    html = apply_style(
+        decode_column_names(table_html)
+            .replace(".0", "", -1)
+            .replace("(Total No. of Incidents)",
+                     """<strong>(Total No. of Incidents from %s to %s)</strong>""" % (start_date, end_date), -1)
+            .replace("(Unassigned)", "<strong>(Unassigned)</strong>", -1)
+        , table_title, incident_type_string, layout, total_count)
+
+    return html, "%s %s" % (table_title, incident_type_string)
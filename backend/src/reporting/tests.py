@@ -1,3 +1,333 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from unittest import mock
+from datetime import timedelta
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from .services import get_daily_category_data, get_closed_daily_category_data, \
+    get_daily_closed_complain_organization_data
+from ..common.models import Category
+from ..custom_auth.models import Organization
+from .models import DailyIncidentRollup, ReportJob, ReportJobStatus, get_report_data_version
+from .jobs import request_report, run_job, store_report, remove_old_reports
+from .pdf_stub import StubPdfService
+from . import pdf_client
+from .rollups import rebuild_daily_rollups, get_report_range, get_status_rollup_report, parse_report_date, to_utc
+from ..incidents.models import Incident, IncidentStatus, CloseWorkflow, StatusType
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def create_category(code, top_category, sub_category):
+    return Category.objects.create(code=code, top_category=top_category, sub_category=sub_category,
+                                   sn_top_category=top_category, sn_sub_category=sub_category,
+                                   tm_top_category=top_category, tm_sub_category=sub_category)
+
+
+class AggregateReportTest(TestCase):
+    """ report builders must use a fixed number of queries """
+
+    # grouped counts + total opened count, metadata comes from the caches
+    REPORT_QUERIES = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ec = Organization.objects.create(code="ec", displayName="Election Commission")
+        cls.police = Organization.objects.create(code="police", displayName="Police")
+        assault = create_category("1", "Violence", "Assault")
+        threat = create_category("2", "Violence", "Threat")
+        create_category("3", "Posters", "Illegal posters")
+
+        users = {}
+        for organization in [cls.ec, cls.police]:
+            user = User.objects.create(username=organization.code)
+            user.profile.organization = organization
+            user.profile.save()
+            users[organization.code] = user
+
+        for i in range(12):
+            creator = users["police"] if i % 3 == 0 else users["ec"]
+            category = assault if i % 2 == 0 else threat
+            incident = Incident.objects.create(title="incident %d" % i, description="description",
+                                               category=str(category.id), created_by=creator)
+            if i < 5:
+                CloseWorkflow.objects.create(incident=incident, actioned_user=users["ec"], assignees="",
+                                             entities="", departments="", individuals="", comment="closed")
+
+    def build(self, report, *args):
+        # warm up the category / organization caches
+        report(*args)
+
+        with self.assertNumQueries(self.REPORT_QUERIES):
+            return report(*args)
+
+    def test_category_report(self):
+        report = self.build(get_daily_category_data, "english")
+
+        self.assertEqual(report["total"], 12)
+        self.assertEqual(report["totalOpenedCount"], 12)
+        violence, posters = report["categories"]
+        self.assertEqual([(sub["nameEnglish"], sub["count"]) for sub in violence["subCategories"]],
+                         [("Assault", 6), ("Threat", 6)])
+        self.assertEqual(posters["subCategories"][0]["count"], 0)
+
+    def test_closed_category_report(self):
+        report = self.build(get_closed_daily_category_data, "english")
+
+        self.assertEqual(report["total"], 5)
+        counts = [sub["count"] for sub in report["categories"][0]["subCategories"]]
+        self.assertEqual(counts, [3, 2])
+
+    def test_closed_organization_report(self):
+        report = self.build(get_daily_closed_complain_organization_data, "english")
+
+        self.assertEqual(report["total"], 5)
+        self.assertEqual(report["organizations"], [{
+            "organizationNameEnglish": "Election Commission",
+            "organizationNameSinhala": None,
+            "organizationNameTamil": None,
+            "count": 5
+        }])
+
+
+class DailyRollupTest(TestCase):
+
+    def rollup_rows(self):
+        return sorted(DailyIncidentRollup.objects.filter(count__gt=0).values_list(
+            "day", "district", "category", "channel", "severity", "status", "incident_type", "count"))
+
+    def test_rollups_follow_incident_changes_and_match_rebuild(self):
+        for i in range(4):
+            Incident.objects.create(title="incident %d" % i, description="description", district="CMB",
+                                    current_status=StatusType.NEW.name)
+        incident = Incident.objects.first()
+        IncidentStatus(current_status=StatusType.CLOSED, incident=incident, approved=True).save()
+
+        incremental = self.rollup_rows()
+        self.assertEqual([(row[5], row[7]) for row in incremental], [("CLOSED", 1), ("NEW", 3)])
+
+        rebuild_daily_rollups()
+        self.assertEqual(self.rollup_rows(), incremental)
+        rebuild_daily_rollups()
+        self.assertEqual(self.rollup_rows(), incremental)
+
+    def test_reporting_day_is_in_colombo_time(self):
+        incident = Incident.objects.create(title="late", description="description")
+        # 20:00 UTC is 01:30 on the next day in Colombo
+        late_evening = incident.created_date.astimezone(timezone.utc).replace(hour=20, minute=0)
+        Incident.objects.filter(id=incident.id).update(created_date=late_evening)
+        rebuild_daily_rollups()
+
+        self.assertEqual(DailyIncidentRollup.objects.get().day, late_evening.date() + timedelta(days=1))
+
+    def test_status_report_reads_day_aligned_ranges_from_rollups(self):
+        Incident.objects.create(title="incident", description="description", current_status=StatusType.NEW.name)
+        today = DailyIncidentRollup.objects.get().day
+
+        report_range = get_report_range("%s 00:00" % today, "%s 00:00:00" % (today + timedelta(days=1)))
+        self.assertEqual(report_range[1] - report_range[0], timedelta(days=1))
+        self.assertIsNone(get_report_range("today", "%s 16:00:00" % today))
+
+        # the rollups and the end bound, included like in the sql reports
+        with self.assertNumQueries(2):
+            rows = get_status_rollup_report(report_range, ["COMPLAINT", "INQUIRY"])
+        self.assertEqual(rows, [("Resolved", 0), ("Unresolved", 1), ("(Total No. of Incidents)", 1)])
+
+    def test_partial_days_are_read_from_incidents(self):
+        # Colombo times of the incidents, the frontend reports from 16:00 to 15:59
+        times = ["2020-01-01 15:59", "2020-01-01 16:00", "2020-01-02 10:00", "2020-01-03 00:00",
+                 "2020-01-03 15:59", "2020-01-03 16:00"]
+        for index, created in enumerate(times):
+            incident = Incident.objects.create(title="incident %d" % index, description="description",
+                                               current_status=StatusType.CLOSED.name if index % 2 else "NEW")
+            Incident.objects.filter(id=incident.id).update(created_date=to_utc(parse_report_date(created)))
+        rebuild_daily_rollups()
+
+        def report(start, end):
+            return dict(get_status_rollup_report(get_report_range(start, end), ["COMPLAINT", "INQUIRY"]))
+
+        self.assertEqual(report("2020-01-01 16:00", "2020-01-03 15:59"),
+                         {"Resolved": 2, "Unresolved": 2, "(Total No. of Incidents)": 4})
+        self.assertEqual(report("2020-01-02 16:00", "2020-01-03 15:59"),
+                         {"Resolved": 1, "Unresolved": 1, "(Total No. of Incidents)": 2})
+        # the end bound is included
+        self.assertEqual(report("2020-01-01 00:00", "2020-01-03 00:00"),
+                         {"Resolved": 2, "Unresolved": 2, "(Total No. of Incidents)": 4})
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, REPORT_RENDER_PROCESSES=0)
+class ReportJobTest(TestCase):
+    parameters = {"report": "status_wise_summary_report", "start_date": "2020-01-01 00:00:00",
+                  "end_date": "2020-01-02 00:00:00", "detailed_report": False, "complain": False,
+                  "inquiry": False}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username="reporter")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_identical_requests_share_the_job(self):
+        other = User.objects.create(username="other")
+        job = request_report(self.parameters, self.user)
+
+        self.assertEqual(request_report(dict(self.parameters), other).id, job.id)
+        self.assertEqual(set(job.requested_by.all()), {self.user, other})
+        self.assertNotEqual(request_report(dict(self.parameters, complain=True), other).id, job.id)
+
+    def test_job_renders_and_downloads(self):
+        response = self.client.post("/reports/jobs", dict(self.parameters, report="unknown"), format="json")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post("/reports/jobs", self.parameters, format="json")
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data["id"]
+        self.assertTrue(run_job(job_id))
+        self.assertFalse(run_job(job_id))
+
+        job = ReportJob.objects.get(id=job_id)
+        self.assertEqual(job.status, ReportJobStatus.DONE.name)
+        self.assertEqual(job.file.name.count("/"), 1)
+
+        response = self.client.get("/reports/jobs/%s/download" % job_id)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"))
+
+        # the synchronous report streams the rendered job
+        response = self.client.get("/reports/", {"report": self.parameters["report"],
+                                                 "start_date": "2020-01-01T00:00:00",
+                                                 "end_date": "2020-01-02T00:00:00"})
+        self.assertTrue(response.streaming)
+
+    def test_report_is_rendered_once_through_its_job(self):
+        query = {"report": self.parameters["report"], "start_date": "2020-01-01T00:00:00",
+                 "end_date": "2020-01-02T00:00:00"}
+        response = self.client.get("/reports/", query)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"))
+        job = ReportJob.objects.get()
+        self.assertEqual(job.status, ReportJobStatus.DONE.name)
+
+        with mock.patch("src.reporting.jobs.render") as render:
+            response = self.client.get("/reports/", query)
+        self.assertEqual(response.status_code, 200)
+        render.assert_not_called()
+        self.assertEqual(ReportJob.objects.count(), 1)
+
+    @override_settings(REPORT_JOB_WAIT=0)
+    def test_report_rendered_elsewhere_answers_with_the_job(self):
+        job = request_report(self.parameters)
+        ReportJob.objects.filter(id=job.id).update(status=ReportJobStatus.RUNNING.name)
+
+        response = self.client.get("/reports/", {"report": self.parameters["report"],
+                                                 "start_date": "2020-01-01T00:00:00",
+                                                 "end_date": "2020-01-02T00:00:00"})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["id"], str(job.id))
+
+    def test_jobs_are_only_shown_to_their_requesters(self):
+        job = request_report(self.parameters, self.user)
+        run_job(job.id)
+        self.assertEqual(self.client.get("/reports/jobs/%s" % job.id).status_code, 200)
+
+        other = APIClient()
+        other.force_authenticate(user=User.objects.create(username="other"))
+        self.assertEqual(other.get("/reports/jobs/%s" % job.id).status_code, 404)
+        self.assertEqual(other.get("/reports/jobs/%s/download" % job.id).status_code, 404)
+
+    def test_incident_changes_start_a_new_job(self):
+        job = request_report(self.parameters, self.user)
+        version = get_report_data_version()
+
+        # TestCase never commits, run the callbacks right away
+        with mock.patch("src.reporting.models.transaction.on_commit", side_effect=lambda callback: callback()):
+            Incident.objects.create(title="incident", description="description")
+
+        self.assertNotEqual(get_report_data_version(), version)
+        self.assertNotEqual(request_report(self.parameters, self.user).id, job.id)
+
+    def test_old_reports_are_removed(self):
+        old_job = request_report(self.parameters, self.user)
+        run_job(old_job.id)
+        job = request_report(dict(self.parameters, complain=True), self.user)
+        run_job(job.id)
+        ReportJob.objects.filter(id=old_job.id).update(updated_date=timezone.now() - timedelta(days=8))
+        unused = store_report(b"%PDF unused")
+        eight_days_ago = (timezone.now() - timedelta(days=8)).timestamp()
+        os.utime(default_storage.path(unused), (eight_days_ago, eight_days_ago))
+
+        job.refresh_from_db()
+        os.utime(default_storage.path(job.file.name), (eight_days_ago, eight_days_ago))
+
+        self.assertEqual(remove_old_reports(7), 1)
+        self.assertEqual(list(ReportJob.objects.all()), [job])
+        # old files are kept while a job refers to them
+        self.assertTrue(default_storage.exists(job.file.name))
+        self.assertFalse(default_storage.exists(unused))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PDF_SERVICE_READ_TIMEOUT=0.5, PDF_SERVICE_FAILURE_THRESHOLD=2)
+class PdfServiceTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        # a circuit breaker of its own for every test
+        patcher = mock.patch.object(pdf_client, "_breaker", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_report(self, pdf_service, template_type="daily_category"):
+        with self.settings(PDF_SERVICE_ENDPOINT=pdf_service.endpoint):
+            return self.client.get("/pdfgen/", {"template_type": template_type, "language": "english"})
+
+    def test_daily_report_is_streamed_and_cached_until_incidents_change(self):
+        with StubPdfService() as pdf_service:
+            response = self.get_report(pdf_service)
+            self.assertEqual(response.status_code, 200)
+            content = b"".join(response.streaming_content)
+            self.assertTrue(content.startswith(b"%PDF"))
+            self.assertEqual(pdf_service.requests[0]["file"]["template"],
+                             "/incidents/complaints/daily_summery_report_categorywise.js")
+
+            response = self.get_report(pdf_service)
+            self.assertEqual(b"".join(response.streaming_content), content)
+            self.assertEqual(len(pdf_service.requests), 1)
+
+            with mock.patch("src.reporting.models.transaction.on_commit", side_effect=lambda callback: callback()):
+                Incident.objects.create(title="incident", description="description")
+            b"".join(self.get_report(pdf_service).streaming_content)
+            self.assertEqual(len(pdf_service.requests), 2)
+
+    def test_errors_are_passed_on(self):
+        with StubPdfService(status=422) as pdf_service:
+            response = self.get_report(pdf_service)
+        self.assertEqual(response.status_code, 422)
+
+        # the streamed download is read before it is closed
+        with StubPdfService(download_status=410) as pdf_service:
+            response = self.get_report(pdf_service)
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(response.content, b'{"error": "stub download failure"}')
+
+    def test_breaker_opens_after_timeouts(self):
+        with StubPdfService(delay=1) as pdf_service:
+            self.assertEqual(self.get_report(pdf_service).status_code, 502)
+            self.assertEqual(self.get_report(pdf_service).status_code, 502)
+            # fails at once, the service isn't called
+            with mock.patch.object(pdf_client._get_session(), "request") as request:
+                self.assertEqual(self.get_report(pdf_service).status_code, 503)
+            request.assert_not_called()
@@ -1,12 +1,12 @@
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.response import Response
-from django.http import HttpResponse
-from xhtml2pdf import pisa
+from django.core.files.storage import default_storage
+from django.http import HttpResponse, FileResponse, StreamingHttpResponse
+from django.utils import timezone
 import datetime
 from django.db import connection
 import pandas as pd
-import requests
 import json
 from django.conf import settings
 import urllib
@@ -16,8 +16,13 @@ from .services import get_police_division_summary, get_category_summary, \
     get_mode_summary, get_severity_summary, get_status_summary, get_subcategory_summary, get_district_summary, \
     get_incident_date_summary, get_daily_category_data, get_closed_daily_category_data, \
     get_weekly_closed_complain_category_data, get_weekly_closed_complain_organization_data, get_daily_closed_complain_organization_data, \
-    get_organizationwise_data_with_timefilter, get_category_data_by_date_range
-from .functions import apply_style, decode_column_names, incident_type_title, incident_type_query
+    get_organizationwise_data_with_timefilter, get_category_data_by_date_range, SUMMARY_REPORTS, \
+    get_summary_report_parameters
+from .exceptions import PdfServiceResponseException
+from .pdf_client import generate_pdf, open_pdf, iter_pdf, get_report_cache_key, get_cached_report
+from .jobs import request_report, get_rendered_report, get_report_job_by_id, wait_for_report
+from .models import ReportJobStatus
+from .serializers import ReportJobSerializer
 
 '''
 middleware to access PDF-service
@@ -36,10 +41,16 @@ class ReportingAccessView(APIView):
     permission_classes = []
 
     def get(self, request):
-        endpoint_uri = settings.PDF_SERVICE_ENDPOINT
         json_dict = {}
         template_type = request.query_params.get('template_type')
 
+        # daily and weekly reports are rendered once per day and data version
+        cache_key = get_report_cache_key(template_type, request.query_params.get('language'))
+        if cache_key is not None:
+            cached = get_cached_report(cache_key)
+            if cached is not None:
+                return self.pdf_response(FileResponse(default_storage.open(cached), content_type='application/pdf'))
+
         if (template_type == "daily_category"):
             """
             daily_summery_report_categorywise
@@ -100,20 +111,20 @@ class ReportingAccessView(APIView):
             language = request.query_params.get('language')
             json_dict["file"] = get_daily_closed_complain_organization_data(language)
 
-        request_data = json.dumps(json_dict)
-        # get the pdf
-        res = requests.post(url=endpoint_uri, data=request_data, headers={'content-type': 'application/json'})
-
-        if res.status_code == 200:
-            pdf_file = requests.get(res.json()["url"])
+        try:
+            pdf = open_pdf(generate_pdf(json_dict))
+        except PdfServiceResponseException as e:
+            return HttpResponse(status=e.service_status_code, content=e.content, content_type='application/json')
 
-            response = HttpResponse(content=pdf_file.content, content_type='application/pdf')
-            response['Access-Control-Expose-Headers'] = 'Title'
-            response['Title'] = 'report_' + datetime.date.today().strftime("%Y%m%d%H%M%S") + ".pdf"
+        response = StreamingHttpResponse(iter_pdf(pdf, cache_key), content_type='application/pdf')
+        if 'Content-Length' in pdf.headers:
+            response['Content-Length'] = pdf.headers['Content-Length']
+        return self.pdf_response(response)
 
-            return response
-        else:
-            return HttpResponse(status=res.status_code, content=res.text, content_type='application/json')
+    def pdf_response(self, response):
+        response['Access-Control-Expose-Headers'] = 'Title'
+        response['Title'] = 'report_' + datetime.date.today().strftime("%Y%m%d%H%M%S") + ".pdf"
+        return response
 
 
 class ReportingView(APIView):
@@ -123,104 +134,64 @@ class ReportingView(APIView):
 
     def get(self, request, format=None):
         """
-            Get incident by incident id
+            Summary report as a PDF. Rendered by the report job of these
+            parameters, which identical requests share until an incident
+            changes. Answers 202 with the job when it takes longer than
+            REPORT_JOB_WAIT, the client then polls reports/jobs/<id>
         """
-        param_report = self.request.query_params.get('report', None)
-        start_date = self.request.query_params.get('start_date', '')
-        end_date = self.request.query_params.get('end_date', '')
-        detailed_report = True if self.request.query_params.get('detailed_report', 'false') == 'true' else False
-        complain = True if self.request.query_params.get('complain', 'false') == 'true' else False
-        inquiry = True if self.request.query_params.get('inquiry', 'false') == 'true' else False
-
-        if start_date == '':
-            start_date = datetime.date.today().strftime("%Y-%m-%d 16:00:00")
-        else:
-            start_date = start_date.replace("T", " ", 1)
-        if end_date == '':
-            end_date = datetime.date.today().strftime("%Y-%m-%d 16:00:00")
-        else:
-            end_date = end_date.replace("T", " ", 1)
-
-        if param_report is None or param_report == "":
+        parameters = get_summary_report_parameters(self.request.query_params)
+        if parameters["report"] == "":
             return Response("No report specified", status=status.HTTP_400_BAD_REQUEST)
+        if parameters["report"] not in SUMMARY_REPORTS:
+            return Response("Report not found", status=status.HTTP_400_BAD_REQUEST)
+
+        job = get_rendered_report(parameters)
+        if job is None:
+            job = wait_for_report(request_report(parameters, request.user), settings.REPORT_JOB_WAIT)
+
+        if job.status == ReportJobStatus.DONE.name:
+            return get_report_file_response(job)
+        if job.status == ReportJobStatus.FAILED.name:
+            return Response("Report failed: %s" % job.error, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response(ReportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+def get_report_file_response(job):
+    response = FileResponse(job.file.open("rb"), content_type='application/pdf')
+    response['Access-Control-Expose-Headers'] = 'Title'
+    response['Title'] = """Incidents reported within the period %s %s.pdf""" % (
+        job.title, timezone.localtime(job.finished_date).strftime("%Y-%m-%d %H:%M:%S"))
+    return response
+
+
+class ReportJobList(APIView):
 
-        table_html = None
-        table_title = None
-        incident_type_string = incident_type_title(complain, inquiry)
-
-        # if param_report == "police_division_summary_report":
-        #     table_html = get_police_division_summary()
-        #     table_title = "Police Division Summary Report"
-
-        layout = "A4 portrait"
-        title = """from %s to %s by """ % (start_date, end_date)
-        if param_report == "category_wise_summary_report":
-            table_html = get_category_summary(start_date, end_date, detailed_report, complain, inquiry)
-            if detailed_report:
-                table_title = title + "District and Category"
-            else:
-                table_title = title + "Category"
-
-        elif param_report == "mode_wise_summary_report":
-            table_html = get_mode_summary(start_date, end_date, detailed_report, complain, inquiry)
-            if detailed_report:
-                layout = "A4 landscape"
-                table_title = title + "District and Mode"
-            else:
-                table_title = title + "Mode"
-
-        elif param_report == "district_wise_summary_report":
-            table_html = get_district_summary(start_date, end_date, detailed_report, complain, inquiry)
-            table_title = title + "District"
-
-        elif param_report == "severity_wise_summary_report":
-            table_html = get_severity_summary(start_date, end_date, detailed_report, complain, inquiry)
-            if detailed_report:
-                table_title = title + "District and Severity"
-            else:
-                table_title = title + "Severity"
-
-        elif param_report == "subcategory_wise_summary_report":
-            table_html = get_subcategory_summary(start_date, end_date, detailed_report, complain, inquiry)
-            if detailed_report:
-                layout = "A3 landscape"
-                table_title = title + "District and Subcategory"
-            else:
-                table_title = title + "Subcategory"
-
-        elif param_report == "incident_date_wise_summary_report":
-            table_html = get_incident_date_summary(start_date, end_date, detailed_report, complain, inquiry)
-            table_title = title + "Incident Date"
-
-        elif param_report == "status_wise_summary_report":
-            table_html = get_status_summary(start_date, end_date, detailed_report, complain, inquiry)
-            if detailed_report:
-                table_title = title + "District and Status"
-            else:
-                table_title = title + "Status"
-
-        if table_html is None:
+    def post(self, request, format=None):
+        """
+            Queues a summary report, takes the parameters of GET reports/.
+            The users that requested it are notified when it's done
+        """
+        parameters = get_summary_report_parameters(request.data)
+        if parameters["report"] not in SUMMARY_REPORTS:
             return Response("Report not found", status=status.HTTP_400_BAD_REQUEST)
 
-        # Prepare report header
-        sql3 = incident_type_query(complain, inquiry)
-        sql = """SELECT
-                     Count(id) as TotalCount
-                 FROM   incidents_incident WHERE %s""" % sql3
-        dataframe = pd.read_sql_query(sql, connection)
-        total_count = dataframe['TotalCount'][0]
-
-        table_html = apply_style(
-            decode_column_names(table_html)
-                .replace(".0", "", -1)
-                .replace("(Total No. of Incidents)",
-                         """<strong>(Total No. of Incidents from %s to %s)</strong>""" % (start_date, end_date), -1)
-                .replace("(Unassigned)", "<strong>(Unassigned)</strong>", -1)
-            , table_title, incident_type_string, layout, total_count)
-
-        response = HttpResponse(content_type='application/pdf')
-        response['Access-Control-Expose-Headers'] = 'Title'
-        response['Title'] = """Incidents reported within the period %s %s %s.pdf""" % (
-            table_title, incident_type_string, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        pisa.CreatePDF(table_html, dest=response)
-        return response
+        job = request_report(parameters, request.user)
+        serializer = ReportJobSerializer(job)
+        if job.status == ReportJobStatus.DONE.name:
+            return Response(serializer.data)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class ReportJobDetail(APIView):
+
+    def get(self, request, job_id, format=None):
+        return Response(ReportJobSerializer(get_report_job_by_id(job_id, request.user)).data)
+
+
+class ReportJobDownload(APIView):
+
+    def get(self, request, job_id, format=None):
+        job = get_report_job_by_id(job_id, request.user)
+        if job.status != ReportJobStatus.DONE.name:
+            return Response("Report is not ready", status=status.HTTP_400_BAD_REQUEST)
+        return get_report_file_response(job)
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/2.2/ref/settings/
 """
 
 import os
+import sys
 from datetime import timedelta
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -65,6 +66,7 @@ INSTALLED_APPS = [
     'src.reporting',
     'src.file_upload',
     'src.notifications',
+    'src.benchmarks',
 
     'channels',
 ]
@@ -72,6 +74,7 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'custom_auth.User'
 
 MIDDLEWARE = [
+    'src.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -88,12 +91,67 @@ ROOT_URLCONF = 'src.urls'
 MEDIA_URL = '/app/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
-# TODO: need to use redis channel layer in prod
-CHANNEL_LAYERS = {
-    "default": {
-        "BACKEND": "channels.layers.InMemoryChannelLayer"
+# resumable uploads, see file_upload/services.py
+FILE_UPLOAD_MAX_SIZE = int(env_var('FILE_UPLOAD_MAX_SIZE', 2 * 1024 * 1024 * 1024))
+FILE_UPLOAD_MAX_CHUNK_SIZE = int(env_var('FILE_UPLOAD_MAX_CHUNK_SIZE', 8 * 1024 * 1024))
+# hours an unfinished upload is kept after its last chunk
+FILE_UPLOAD_SESSION_EXPIRY = int(env_var('FILE_UPLOAD_SESSION_EXPIRY', 48))
+
+# seconds the count of a filtered incident list is reused by the cursor paginated list
+INCIDENT_LIST_COUNT_CACHE_TIMEOUT = int(env_var('INCIDENT_LIST_COUNT_CACHE_TIMEOUT', 60))
+
+# seconds a public status lookup by refId is cached, changes clear it earlier
+PUBLIC_STATUS_CACHE_TIMEOUT = int(env_var('PUBLIC_STATUS_CACHE_TIMEOUT', 60))
+
+# file downloads are streamed in chunks of this size (bytes)
+FILE_DOWNLOAD_CHUNK_SIZE = int(env_var('FILE_DOWNLOAD_CHUNK_SIZE', 64 * 1024))
+# let the front proxy send files: 'x-sendfile' (apache / lighttpd) or
+# 'x-accel-redirect' (nginx, with the internal location at FILE_DOWNLOAD_ACCEL_PREFIX)
+FILE_DOWNLOAD_OFFLOAD = env_var('FILE_DOWNLOAD_OFFLOAD')
+FILE_DOWNLOAD_ACCEL_PREFIX = env_var('FILE_DOWNLOAD_ACCEL_PREFIX', '/protected-media/')
+
+# the in memory layer only reaches sockets of the same process, set
+# CHANNEL_LAYER_REDIS_URL when running more than one worker
+CHANNEL_LAYER_REDIS_URL = env_var('CHANNEL_LAYER_REDIS_URL')
+
+if CHANNEL_LAYER_REDIS_URL:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.core.RedisChannelLayer",
+            "CONFIG": {
+                "hosts": [CHANNEL_LAYER_REDIS_URL],
+                "capacity": int(env_var('CHANNEL_LAYER_CAPACITY', 1500)),
+                "expiry": 60,
+            },
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels.layers.InMemoryChannelLayer"
+        }
+    }
+
+# version tokens of the per process caches (permissions, organizations,
+# reference data, reports...) and cached lookups. They must be shared by every
+# worker, the local memory cache only suits a single process: set
+# CACHE_REDIS_URL when running more than one worker
+CACHE_REDIS_URL = env_var('CACHE_REDIS_URL')
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+            "KEY_PREFIX": env_var('CACHE_KEY_PREFIX', 'request'),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
     }
-}
 
 TEMPLATES = [
     {
@@ -215,6 +273,16 @@ FIXTURE_DIRS = [
 
 # PDF endpoint for report generation
 PDF_SERVICE_ENDPOINT = env_var('PDF_SERVICE_ENDPOINT')
+# seconds, the read timeout bounds the wait for the rendered PDF
+PDF_SERVICE_CONNECT_TIMEOUT=float(env_var('PDF_SERVICE_CONNECT_TIMEOUT', 5))
+PDF_SERVICE_READ_TIMEOUT=float(env_var('PDF_SERVICE_READ_TIMEOUT', 60))
+PDF_SERVICE_POOL_SIZE=int(env_var('PDF_SERVICE_POOL_SIZE', 10))
+# consecutive failures after which the service isn't called for PDF_SERVICE_RESET_TIMEOUT seconds
+PDF_SERVICE_FAILURE_THRESHOLD=int(env_var('PDF_SERVICE_FAILURE_THRESHOLD', 5))
+PDF_SERVICE_RESET_TIMEOUT=int(env_var('PDF_SERVICE_RESET_TIMEOUT', 30))
+PDF_SERVICE_CHUNK_SIZE=int(env_var('PDF_SERVICE_CHUNK_SIZE', 64 * 1024))
+# seconds the daily and weekly reports are kept, they're rendered again sooner when an incident changes
+PDF_SERVICE_CACHE_TIMEOUT=int(env_var('PDF_SERVICE_CACHE_TIMEOUT', 24 * 3600))
 
 # Email parameters
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -229,6 +297,56 @@ EMAIL_FROM_ADDRESS = env_var('EMAIL_FROM_ADDRESS')
 SMS_GATEWAY_USER=env_var('SMS_GATEWAY_USER')
 SMS_GATEWAY_PASSWORD=env_var('SMS_GATEWAY_PASSWORD')
 SMS_GATEWAY_BASE_URL=env_var('SMS_GATEWAY_BASE_URL')
+SMS_GATEWAY_TIMEOUT=int(env_var('SMS_GATEWAY_TIMEOUT', 10))
+
+# email / sms outbox delivery
+OUTBOX_WORKERS=int(env_var('OUTBOX_WORKERS', 4))
+OUTBOX_BATCH_SIZE=int(env_var('OUTBOX_BATCH_SIZE', 50))
+OUTBOX_MAX_ATTEMPTS=int(env_var('OUTBOX_MAX_ATTEMPTS', 8))
+# seconds, doubled on every failed attempt up to OUTBOX_MAX_RETRY_DELAY
+OUTBOX_RETRY_DELAY=int(env_var('OUTBOX_RETRY_DELAY', 30))
+OUTBOX_MAX_RETRY_DELAY=int(env_var('OUTBOX_MAX_RETRY_DELAY', 3600))
+# seconds a worker may hold a message before another worker retries it
+OUTBOX_CLAIM_TIMEOUT=int(env_var('OUTBOX_CLAIM_TIMEOUT', 300))
+
+# summary reports rendered in the background (see src/reporting/jobs.py)
+REPORT_JOB_WORKERS=int(env_var('REPORT_JOB_WORKERS', 2))
+# processes rendering the PDFs, 0 renders in the job threads
+REPORT_RENDER_PROCESSES=int(env_var('REPORT_RENDER_PROCESSES', 2))
+# seconds after which a job that didn't finish is restarted by an identical request
+REPORT_JOB_TIMEOUT=int(env_var('REPORT_JOB_TIMEOUT', 600))
+# seconds GET reports/ waits for a report rendered by another request before answering 202 with the job
+REPORT_JOB_WAIT=int(env_var('REPORT_JOB_WAIT', 60))
+# days report jobs and their PDFs are kept, see the remove_old_reports command
+REPORT_RETENTION_DAYS=int(env_var('REPORT_RETENTION_DAYS', 7))
+
+# seconds browsers may use the reference lists (categories, districts...) without revalidating them
+REFERENCE_DATA_MAX_AGE=int(env_var('REFERENCE_DATA_MAX_AGE', 0))
 
 # set frontend APP_BASE_URL for notifications sent via sms and email
 APP_BASE_URL=env_var('APP_BASE_URL', 'http://localhost:3000')
+
+# request timing, metrics at /metrics and a json log line per request (see src/instrumentation.py)
+INSTRUMENTATION_ENABLED=env_var('INSTRUMENTATION_ENABLED', False)
+# when set, /metrics requires `Authorization: Bearer <token>`, otherwise a staff session
+INSTRUMENTATION_METRICS_TOKEN=env_var('INSTRUMENTATION_METRICS_TOKEN')
+# keep profiler traces of the slowest N sampled requests, 0 to disable
+INSTRUMENTATION_PROFILE_SLOWEST=int(env_var('INSTRUMENTATION_PROFILE_SLOWEST', 0))
+INSTRUMENTATION_PROFILE_RATE=float(env_var('INSTRUMENTATION_PROFILE_RATE', 0.01))
+INSTRUMENTATION_PROFILE_DIR=env_var('INSTRUMENTATION_PROFILE_DIR', os.path.join(BASE_DIR, 'profiles'))
+# cprofile or pyinstrument (not installed by requirements.txt)
+INSTRUMENTATION_PROFILER=env_var('INSTRUMENTATION_PROFILER', 'cprofile')
+
+# the test runner only shows warnings
+TESTING = sys.argv[1:2] == ['test']
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'src': {'handlers': ['console'], 'level': env_var('LOG_LEVEL', 'WARNING' if TESTING else 'INFO')},
+    },
+}
@@ -0,0 +1,68 @@
+import json
+import os
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from .instrumentation import SlowestProfiles, external_call, render_metrics, get_worker_label
+
+
+@override_settings(INSTRUMENTATION_ENABLED=True, INSTRUMENTATION_METRICS_TOKEN=None)
+class InstrumentationTest(TestCase):
+
+    def test_request_is_logged_and_counted(self):
+        with self.assertLogs("src.instrumentation", "INFO") as logs:
+            response = self.client.get("/categories/")
+        self.assertEqual(response.status_code, 200)
+
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record["view"], "/categories/")
+        self.assertEqual(record["status"], 200)
+        self.assertGreaterEqual(record["db_queries"], 1)
+        self.assertIn("render", record["sections_ms"])
+        self.assertEqual(record["response_bytes"], len(response.content))
+
+        self.client.force_login(get_user_model().objects.create(username="admin", is_staff=True))
+        metrics = self.client.get("/metrics").content.decode()
+        worker = get_worker_label()
+        self.assertIn('http_requests_total{worker="%s",view="/categories/",method="GET",status="200"}' % worker,
+                      metrics)
+        self.assertIn('http_request_db_queries_count{worker="%s",view="/categories/"}' % worker, metrics)
+
+    def test_external_calls_are_timed_by_outcome(self):
+        with self.assertRaises(ConnectionError):
+            with external_call("sms_gateway"):
+                raise ConnectionError()
+
+        self.assertIn('external_call_duration_seconds_count{worker="%s",service="sms_gateway",outcome="error"}'
+                      % get_worker_label(), render_metrics())
+
+    def test_metrics_are_staff_only_without_a_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        self.client.force_login(get_user_model().objects.create(username="user"))
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+
+    @override_settings(INSTRUMENTATION_METRICS_TOKEN="secret")
+    def test_metrics_require_the_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret").status_code, 200)
+
+
+class SlowestProfilesTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_keeps_the_slowest_traces(self):
+        profiles = SlowestProfiles(self.directory, 2)
+        for duration in (0.3, 0.1, 0.5, 0.2):
+            profiles.stop(profiles.start(), duration, "/incidents/")
+
+        self.assertEqual([duration for duration, _ in sorted(profiles.kept)], [0.3, 0.5])
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         sorted(os.path.basename(path) for _, path in profiles.kept))
@@ -31,6 +31,8 @@ from .reporting import views as report_views
 
 from .notifications import views as notification_views
 
+from .instrumentation import metrics_view
+
 # JWT
 from rest_framework_jwt.views import obtain_jwt_token, refresh_jwt_token
 
@@ -66,6 +68,8 @@ urlpatterns = [
     path("policestations/", common_views.PoliceStationList.as_view()),
     path("policedivisions/", common_views.PoliceDivisionList.as_view()),
     path("dsdivisions/", common_views.DSDivisionList.as_view()),
+    path("institutions/", common_views.InstitutionList.as_view()),
+    path("reference-data/", common_views.ReferenceDataBootstrap.as_view()),
     path("gndivisions/", common_views.GNDivisionList.as_view()),
     path(
         "politicalparties/",
@@ -87,6 +91,10 @@ urlpatterns = [
         "incidents/<uuid:incident_id>/events",
         event_views.get_event_trail
     ),
+    path(
+        "incidents/<uuid:incident_id>/events/trail",
+        event_views.get_event_trail_pages
+    ),
     path(
         "incidents/<uuid:incident_id>/comment",
         incident_views.IncidentCommentView.as_view(),
@@ -115,6 +123,18 @@ urlpatterns = [
         "incidents/files/download/<str:file_id>",
         file_views.FileDownload.as_view(),
     ),
+    path(
+        "incidents/<uuid:incident_id>/uploads",
+        file_views.UploadSessionView.as_view(),
+    ),
+    path(
+        "uploads/<uuid:upload_id>",
+        file_views.UploadChunkView.as_view(),
+    ),
+    path(
+        "uploads/<uuid:upload_id>/finalize",
+        file_views.UploadFinalizeView.as_view(),
+    ),
     path(
         "users/",
         user_views.UserList.as_view(),
@@ -134,6 +154,9 @@ urlpatterns = [
         "reports/",
         report_views.ReportingView.as_view(),
     ),
+    path("reports/jobs", report_views.ReportJobList.as_view()),
+    path("reports/jobs/<uuid:job_id>", report_views.ReportJobDetail.as_view()),
+    path("reports/jobs/<uuid:job_id>/download", report_views.ReportJobDownload.as_view()),
     path(
         "pdfgen/",
         report_views.ReportingAccessView.as_view(),
@@ -152,6 +175,7 @@ urlpatterns = [
     path("canned_response/",
         incident_views.CannedResponseList.as_view()
     ),
+    path("metrics", metrics_view),
 
     # public paths
     path("public/incidents/",